@@ -0,0 +1,134 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.code_decode module
+
+Microbenchmark of CESR code sniffing and size decode in Matter, Indexer and
+Counter ._exfil and ._bexfil. Builds a corpus of real attachments by scanning
+the string and bytes literals in the tests for qualified Base64 primitives,
+indexed signatures and counters, then times parsing the corpus in both text
+qb64b and binary qb2 domains with the precomputed .Decodes tables versus
+with empty tables which forces the full str keyed .Hards and .Sizes lookups.
+Also times "in" inclusion tests on codexes.
+
+Runs offline.
+
+Usage:
+    python benchmarks/code_decode.py --repeat 20
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import ast
+import json
+import pathlib
+import re
+import time
+
+from keri.core import coring
+from keri.core.coring import Counter, Indexer, Matter, MtrDex, IdrDex
+
+Classes = (Matter, Indexer, Counter)
+Reb64Token = re.compile(rb'[A-Za-z0-9_-]{4,}')
+
+
+def literals(root):
+    """
+    Yields bytes of each str and bytes literal in python files under root
+    """
+    for path in sorted(pathlib.Path(root).rglob("*.py")):
+        try:
+            tree = ast.parse(path.read_text())
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant):
+                if isinstance(node.value, str) and node.value.isascii():
+                    yield node.value.encode("utf-8")
+                elif isinstance(node.value, bytes):
+                    yield node.value
+
+
+def corpus(root):
+    """
+    Returns dict keyed by class of list of qb64b of distinct primitives of
+    that class found at the front of Base64 tokens of literals under root
+    """
+    found = {klas: set() for klas in Classes}
+    for literal in literals(root):
+        for token in Reb64Token.findall(literal):
+            for klas in Classes:
+                try:
+                    prim = klas(qb64b=token)
+                except Exception:
+                    continue
+                found[klas].add(prim.qb64b)
+    return {klas: sorted(qbs) for klas, qbs in found.items()}
+
+
+def timed(klas, items, repeat, binary=False):
+    """
+    Returns float seconds to parse all of items repeat times into klas
+    """
+    start = time.perf_counter()
+    if binary:
+        for _ in range(repeat):
+            for item in items:
+                klas(qb2=item)
+    else:
+        for _ in range(repeat):
+            for item in items:
+                klas(qb64b=item)
+    return time.perf_counter() - start
+
+
+def contains(repeat):
+    """
+    Returns float seconds per "in" inclusion test on codexes
+    """
+    codes = [MtrDex.Blake3_256, MtrDex.Ed25519, IdrDex.Ed25519_Sig, "zz"]
+    dexes = [coring.DigDex, coring.PreDex, coring.IdxSigDex, coring.IdxCrtSigDex]
+    count = repeat * 1000
+    start = time.perf_counter()
+    for _ in range(count):
+        for code, dex in zip(codes, dexes):
+            code in dex
+    return (time.perf_counter() - start) / (count * len(codes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CESR code decode microbenchmark")
+    parser.add_argument("--tests", default=str(pathlib.Path(__file__).parent.parent / "tests"),
+                        help="directory of tests to scan for attachments")
+    parser.add_argument("--repeat", type=int, default=20, help="passes over corpus")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    prims = corpus(args.tests)
+    results = dict(repeat=args.repeat, classes={}, contains=contains(args.repeat))
+    for klas in Classes:
+        qb64bs = prims[klas]
+        qb2s = [klas(qb64b=qb64b).qb2 for qb64b in qb64bs]
+        count = len(qb64bs) * args.repeat
+        tables = {}
+        decodes = klas.Decodes
+        for name, tabled in (("tables", decodes),
+                             ("lookup", ([None] * (coring.HeadSize ** 2), {}))):
+            klas.Decodes = tabled
+            try:
+                text = timed(klas, qb64bs, args.repeat)
+                bny = timed(klas, qb2s, args.repeat, binary=True)
+            finally:
+                klas.Decodes = decodes
+            tables[name] = dict(text=text / count if count else None,
+                                binary=bny / count if count else None)
+        results["classes"][klas.__name__] = dict(corpus=len(qb64bs), **tables)
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.escrow_partial module
+
+Benchmark of repeated partial signature escrow passes. Generates deterministic
+weighted 2 of 3 multisig inceptions each with only one of its signatures so
+every event stays in the partial signature escrow then times passes of
+Kevery.processEscrowPartialSigs which each reload every escrowed event and its
+signatures from the database. Reports the hits and misses of the Kevery
+memo of verified signatures over the timed passes.
+
+Runs offline against temp openDB environments.
+
+Usage:
+    python benchmarks/escrow_partial.py --aids 500 --passes 10
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import json
+import time
+
+from kel_ingest import kel, sign
+
+from keri.core import eventing, parsing
+from keri.core.coring import MtrDex, Salter
+from keri.db import basing
+
+
+def generate(aids):
+    """
+    Returns list of event messages of aids weighted multisig inceptions
+    each with only its first of three signatures
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    msgs = []
+    for i in range(aids):
+        flat = salter.signers(count=6, path=f"p{i}", temp=True)
+        signers = [flat[:3], flat[3:]]
+        serder, _ = kel(signers, 1, 1, isith=["1/2", "1/2", "1/2"],
+                        code=MtrDex.Blake3_256)[0]
+        msgs.append(eventing.messagize(serder, sigers=sign(serder, signers[0])[:1]))
+    return msgs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partial signature escrow benchmark")
+    parser.add_argument("--aids", type=int, default=500, help="escrowed identifiers")
+    parser.add_argument("--passes", type=int, default=10, help="escrow passes to time")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    msgs = generate(args.aids)
+    with basing.openDB(name="bench_partial") as db:
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        parsing.Parser(kvy=kvy).parse(ims=bytearray().join(msgs))
+        with db.env.begin() as txn:
+            escrowed = txn.stat(db.pses)["entries"]
+
+        hits, misses = kvy.verifier.hits, kvy.verifier.misses
+        start = time.perf_counter()
+        for _ in range(args.passes):
+            kvy.processEscrowPartialSigs()
+        elapsed = time.perf_counter() - start
+        hits, misses = kvy.verifier.hits - hits, kvy.verifier.misses - misses
+
+    results = dict(aids=args.aids,
+                   escrowed=escrowed,
+                   passes=args.passes,
+                   elapsed=elapsed,
+                   hits=hits,
+                   misses=misses,
+                   perEvent=elapsed / (args.passes * escrowed) if escrowed else None)
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
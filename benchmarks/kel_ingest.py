@@ -0,0 +1,271 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.kel_ingest module
+
+Reproducible KEL ingestion benchmark suite. Generates deterministic synthetic
+KELs for single sig, weighted multisig, delegated and witnessed identifiers
+then measures for each:
+
+    ingest: in order Parser.parse + Kevery.processEvent throughput
+    escrow: cost of draining the escrows of the same events received in
+        reverse order, both by full escrow scans and event driven. Delegated
+        identifiers only interact after inception since delegated rotations
+        need their own delegator anchors
+    disk: Baser LMDB growth in bytes after ingest
+
+Runs offline against temp openDB environments.
+
+Usage:
+    python benchmarks/kel_ingest.py --aids 20 --events 50
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import json
+import time
+
+from keri.core import coring, eventing, parsing
+from keri.core.coring import Counter, CtrDex, MtrDex, Salter
+from keri.db import basing
+
+Scenarios = ("single", "multisig", "delegated", "witnessed")
+
+
+def sign(serder, signers):
+    """
+    Returns list of Siger indexed signatures of serder by signers
+    """
+    return [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers)]
+
+
+def kel(signers, events, rotate, isith=None, wits=None, wigners=None,
+        delpre=None, code=None):
+    """
+    Returns list of (serder, msg) duples of one signed KEL of events events
+    where keys rotate through successive sets in signers every rotate events.
+
+    Parameters:
+        signers (list): of lists of Signers, one list per key set
+        events (int): number of events in KEL
+        rotate (int): rotate keys every rotate events
+        isith (str | list | None): signing threshold of each key set
+        wits (list | None): witness prefixes
+        wigners (list | None): witness Signers that witness every event
+        delpre (str | None): delegator prefix when delegated
+        code (str | None): derivation code of prefix
+    """
+    ndigs = lambda k: [coring.Diger(ser=s.verfer.qb64b).qb64 for s in signers[k]]
+    keys = lambda k: [s.verfer.qb64 for s in signers[k]]
+    toad = len(wits) if wits else 0
+
+    if delpre:
+        serder = eventing.delcept(keys=keys(0), delpre=delpre, isith=isith,
+                                  ndigs=ndigs(1), nsith=isith)
+    else:
+        serder = eventing.incept(keys=keys(0), isith=isith, ndigs=ndigs(1),
+                                 nsith=isith, toad=toad, wits=wits, code=code)
+    pre = serder.pre
+    entries = []
+    k = 0
+    for sn in range(events):
+        if sn:
+            if sn % rotate == 0:
+                k += 1
+                serder = eventing.rotate(pre=pre, keys=keys(k), isith=isith,
+                                         dig=serder.said, ndigs=ndigs(k + 1),
+                                         nsith=isith, toad=toad, wits=wits,
+                                         sn=sn)
+            else:
+                serder = eventing.interact(pre=pre, dig=serder.said, sn=sn)
+        wigers = sign(serder, wigners) if wigners else None
+        msg = eventing.messagize(serder, sigers=sign(serder, signers[k]),
+                                 wigers=wigers)
+        entries.append((serder, msg))
+    return entries
+
+
+def generate(scenario, aids, events, rotate=10):
+    """
+    Returns list of event messages (bytearray) of aids synthetic KELs of events
+    events each, interleaved round robin across KELs in valid order. When
+    delegated the delegator's KEL of anchoring events comes first.
+
+    Parameters:
+        scenario (str): one of Scenarios
+        aids (int): number of identifiers
+        events (int): events per identifier
+        rotate (int): rotate keys every rotate events
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    sets = events // rotate + 2
+    kels = []
+
+    if scenario == "single":
+        for i in range(aids):
+            signers = [[s] for s in salter.signers(count=sets, path=f"s{i}", temp=True)]
+            kels.append([msg for _, msg in kel(signers, events, rotate)])
+
+    elif scenario == "multisig":
+        isith = ["1/2", "1/2", "1/2"]  # weighted 2 of 3
+        for i in range(aids):
+            flat = salter.signers(count=3 * sets, path=f"m{i}", temp=True)
+            signers = [flat[j:j + 3] for j in range(0, len(flat), 3)]
+            kels.append([msg for _, msg in kel(signers, events, rotate,
+                                               isith=isith,
+                                               code=MtrDex.Blake3_256)])
+
+    elif scenario == "delegated":
+        # delegator anchors each delegated inception in one of its ixn events
+        dsigners = [[s] for s in salter.signers(count=2, path="dor", temp=True)]
+        dicp = kel(dsigners, 1, rotate)[0][0]
+        delpre = dicp.pre
+        dmsgs = [eventing.messagize(dicp, sigers=sign(dicp, dsigners[0]))]
+        prior = dicp
+        for i in range(aids):
+            signers = [[s] for s in salter.signers(count=2, path=f"d{i}", temp=True)]
+            # delegated rotation needs its own anchor so delegates only interact
+            entries = kel(signers, events, events, delpre=delpre)
+            dip = entries[0][0]
+            seal = eventing.SealEvent(i=dip.pre, s=dip.snh, d=dip.said)
+            prior = eventing.interact(pre=delpre, dig=prior.said, sn=i + 1,
+                                      data=[seal._asdict()])
+            dmsgs.append(eventing.messagize(prior, sigers=sign(prior, dsigners[0])))
+            msg = entries[0][1]  # attach source seal couple of delegating event
+            msg.extend(Counter(CtrDex.SealSourceCouples, count=1).qb64b)
+            msg.extend(coring.Seqner(sn=prior.sn).qb64b)
+            msg.extend(prior.saidb)
+            kels.append([msg for _, msg in entries])
+
+    elif scenario == "witnessed":
+        wigners = salter.signers(count=3, path="wit", transferable=False, temp=True)
+        wits = [w.verfer.qb64 for w in wigners]
+        for i in range(aids):
+            signers = [[s] for s in salter.signers(count=sets, path=f"w{i}", temp=True)]
+            kels.append([msg for _, msg in kel(signers, events, rotate,
+                                               wits=wits, wigners=wigners)])
+
+    else:
+        raise ValueError(f"Unsupported scenario={scenario}.")
+
+    msgs = dmsgs if scenario == "delegated" else []  # delegator anchors first
+    for sn in range(max(len(k) for k in kels)):
+        for k in kels:
+            if sn < len(k):
+                msgs.append(k[sn])
+    return msgs
+
+
+def disk(db):
+    """
+    Returns int bytes of LMDB pages in use by db
+    """
+    return (db.env.info()["last_pgno"] + 1) * db.env.stat()["psize"]
+
+
+def accepted(db):
+    """
+    Returns int number of first seen accepted events in db
+    """
+    return sum(1 for _ in db.getFelItemAllPreIter())
+
+
+def ingest(msgs, name):
+    """
+    Returns dict of results of parsing msgs in order into fresh temp database
+
+    Parameters:
+        msgs (list): of bytearray event messages
+        name (str): name of temp database
+    """
+    stream = bytearray().join(msgs)
+    with basing.openDB(name=name) as db:
+        base = disk(db)
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        parser = parsing.Parser(kvy=kvy)
+        start = time.perf_counter()
+        parser.parse(ims=stream)
+        elapsed = time.perf_counter() - start
+        count = accepted(db)
+        growth = disk(db) - base
+
+    return dict(events=len(msgs),
+                accepted=count,
+                bytes=sum(len(msg) for msg in msgs),
+                elapsed=elapsed,
+                rate=count / elapsed if elapsed else None,
+                disk=growth,
+                diskPerEvent=growth / count if count else None)
+
+
+def escrow(msgs, name, keep=0, fallback=None, passes=100):
+    """
+    Returns dict of results of draining the escrows of msgs received in
+    reverse order into fresh temp database
+
+    Parameters:
+        msgs (list): of bytearray event messages in valid order
+        name (str): name of temp database
+        keep (int): number of leading msgs kept in order. Delegated events
+            from an unknown delegator are dropped not escrowed so the
+            delegator's KEL must arrive first
+        fallback (float | None): Kevery event driven escrow fallback seconds
+            None means full escrow scans
+        passes (int): max escrow processing passes
+    """
+    with basing.openDB(name=name) as db:
+        kvy = eventing.Kevery(db=db, lax=True, local=False, fallback=fallback)
+        kvy.processEscrows()  # first pass so event driven not full scan
+        parser = parsing.Parser(kvy=kvy)
+        start = time.perf_counter()
+        parser.parse(ims=bytearray().join(msgs[:keep] + msgs[keep:][::-1]))
+        parsed = time.perf_counter() - start
+        escrowed = len(msgs) - accepted(db)
+
+        count = 0
+        start = time.perf_counter()
+        for count in range(1, passes + 1):
+            before = accepted(db)
+            kvy.processEscrows()
+            if accepted(db) == before:
+                break
+        elapsed = time.perf_counter() - start
+
+        return dict(escrowed=escrowed,
+                    accepted=accepted(db),
+                    passes=count,
+                    parse=parsed,
+                    elapsed=elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KEL ingestion benchmark suite")
+    parser.add_argument("--aids", type=int, default=20, help="identifiers per scenario")
+    parser.add_argument("--events", type=int, default=50, help="events per identifier")
+    parser.add_argument("--rotate", type=int, default=10, help="rotate every n events")
+    parser.add_argument("--scenarios", nargs="+", default=list(Scenarios),
+                        choices=Scenarios, help="scenarios to run")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    results = dict(aids=args.aids, events=args.events, rotate=args.rotate,
+                   scenarios={})
+    for scenario in args.scenarios:
+        msgs = generate(scenario, aids=args.aids, events=args.events,
+                        rotate=args.rotate)
+        keep = args.aids + 1 if scenario == "delegated" else 0
+        results["scenarios"][scenario] = dict(
+            ingest=ingest(msgs, name=f"bench_{scenario}"),
+            escrow=dict(scan=escrow(msgs, name=f"bench_{scenario}_scan",
+                                    keep=keep),
+                        driven=escrow(msgs, name=f"bench_{scenario}_driven",
+                                      keep=keep, fallback=3600)))
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
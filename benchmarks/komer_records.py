@@ -0,0 +1,117 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.komer_records module
+
+Benchmark of read and write cost per record of the Komer serializations of
+the dataclass records of Baser. For each of KeyStateRecord, EndpointRecord,
+LocationRecord, OobiRecord and HabitatRecord times serialize, deserialize,
+Komer.pin and Komer.get of a set of realistic records with named json, mgpk
+and cbor maps and with positional json, mgpk and cbor lists and reports the
+mean serialized size of each.
+
+Runs offline against a temp openLMDB environment.
+
+Usage:
+    python benchmarks/komer_records.py --records 1000 --repeat 5
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import json
+import time
+
+from keri.core import eventing  # noqa: F401 imported before basing to break import cycle
+from keri.core.coring import Salter, Serials
+from keri.db import basing, dbing, koming
+
+Kinds = (Serials.json, Serials.mgpk, Serials.cbor)
+
+
+def generate(records):
+    """
+    Returns dict keyed by record class of list of records instances
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    pres = [signer.verfer.qb64 for signer in salter.signers(count=8, temp=True)]
+    recs = {klas: [] for klas in (basing.KeyStateRecord, basing.EndpointRecord,
+                                  basing.LocationRecord, basing.OobiRecord,
+                                  basing.HabitatRecord)}
+    for i in range(records):
+        pre = pres[i % len(pres)]
+        recs[basing.KeyStateRecord].append(basing.KeyStateRecord(
+            vn=[1, 0], i=pre, s=f"{i:x}", p=pres[1], d=pres[2], f=f"{i:x}",
+            dt="2021-01-01T00:00:00.000000+00:00", et="rot", kt="1", k=pres[:3],
+            nt="1", n=pres[3:6], bt="2", b=pres[5:8], c=[],
+            ee=basing.StateEERecord(s=f"{i:x}", d=pres[2], br=[], ba=pres[5:7]),
+            di=""))
+        recs[basing.EndpointRecord].append(basing.EndpointRecord(
+            allowed=True, enabled=None, name=f"witness{i}"))
+        recs[basing.LocationRecord].append(basing.LocationRecord(
+            url=f"http://127.0.0.1:{5600 + i % 100}/"))
+        recs[basing.OobiRecord].append(basing.OobiRecord(
+            oobialias=f"alias{i}", cid=pre, eid=pres[1], role="witness",
+            date="2021-01-01T00:00:00.000000+00:00", state="resolved",
+            urls=[f"http://127.0.0.1:5642/oobi/{pre}/witness"]))
+        recs[basing.HabitatRecord].append(basing.HabitatRecord(
+            hid=pre, watchers=pres[6:]))
+    return recs
+
+
+def timed(fn, items, repeat):
+    """
+    Returns float mean seconds per call of fn on each of items over repeat passes
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (repeat * len(items))
+
+
+def measure(db, klas, recs, kind, positional, repeat):
+    """
+    Returns dict of per record costs of records recs of class klas with
+    serialization kind, named or positional
+    """
+    subkey = f"{klas.__name__}.{kind}.{'pos' if positional else 'map'}."
+    komer = koming.Komer(db=db, schema=klas, subkey=subkey, kind=kind,
+                         positional=positional)
+    sers = [komer.serializer(rec) for rec in recs]
+    items = list(enumerate(recs))
+    keys = [f"{i:032x}" for i in range(len(recs))]
+
+    results = dict(size=sum(len(ser) for ser in sers) / len(sers),
+                   serialize=timed(komer.serializer, recs, repeat),
+                   deserialize=timed(komer.deserializer, sers, repeat),
+                   pin=timed(lambda item: komer.pin(keys=keys[item[0]], val=item[1]),
+                             items, repeat),
+                   get=timed(lambda key: komer.get(keys=key), keys, repeat))
+    assert [komer.get(keys=key) for key in keys] == recs
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Komer record serialization benchmark")
+    parser.add_argument("--records", type=int, default=1000, help="records per record type")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes over records")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    results = dict(records=args.records, repeat=args.repeat, types={})
+    with dbing.openLMDB(name="bench_komer") as db:
+        for klas, recs in generate(args.records).items():
+            types = results["types"][klas.__name__] = {}
+            for positional in (False, True):
+                for kind in Kinds:
+                    name = f"{kind.lower()}_{'positional' if positional else 'named'}"
+                    types[name] = measure(db, klas, recs, kind, positional, args.repeat)
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.komer_states module
+
+Microbenchmark of Baser.states reads with the converters between records and
+their serialized dicts or lists built once per dataclass versus converters
+that reflect on the dataclass fields on every call as helping.datify,
+helping.dictify and the original recursive positional conversion do. Times
+Baser.states.get and pin of KeyStateRecord with nested StateEERecord for both
+the positional msgpack serialization of Baser.states and the named json
+serialization of databases not yet migrated, and times the bare conversions.
+
+Runs offline against a temp openDB environment.
+
+Usage:
+    python benchmarks/komer_states.py --records 1000 --repeat 5
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import dataclasses
+import functools
+import json
+import time
+
+from keri.core import eventing  # noqa: F401 imported before basing to break import cycle
+from keri.core.coring import Salter, Serials
+from keri.db import basing, koming
+from keri.help import helping
+
+
+def detuplify(schema, vals):
+    """
+    Returns instance of dataclass schema from vals reflecting on fields per call
+    """
+    kwa = dict()
+    for f, v in zip(dataclasses.fields(schema), vals):
+        if dataclasses.is_dataclass(f.type) and isinstance(v, list):
+            v = detuplify(f.type, v)
+        kwa[f.name] = v
+    return schema(**kwa)
+
+
+def tuplify(val):
+    """
+    Returns list of field values of val reflecting on fields per call
+    """
+    vals = []
+    for f in dataclasses.fields(val):
+        v = getattr(val, f.name)
+        vals.append(tuplify(v) if dataclasses.is_dataclass(v) else v)
+    return vals
+
+
+def reflect(komer):
+    """
+    Replaces memoized converters of komer with reflective ones
+    """
+    komer._datify = functools.partial(helping.datify, komer.schema)
+    komer._dictify = helping.dictify
+    komer._tuplify = tuplify
+    komer._detuplify = functools.partial(detuplify, komer.schema)
+
+
+def generate(records):
+    """
+    Returns list of KeyStateRecord instances
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    pres = [signer.verfer.qb64 for signer in salter.signers(count=8, temp=True)]
+    return [basing.KeyStateRecord(
+        vn=[1, 0], i=pres[i % len(pres)], s=f"{i:x}", p=pres[1], d=pres[2],
+        f=f"{i:x}", dt="2021-01-01T00:00:00.000000+00:00", et="rot", kt="1",
+        k=pres[:3], nt="1", n=pres[3:6], bt="2", b=pres[5:8], c=[],
+        ee=basing.StateEERecord(s=f"{i:x}", d=pres[2], br=[], ba=pres[5:7]),
+        di="") for i in range(records)]
+
+
+def timed(fn, items, repeat):
+    """
+    Returns float least mean seconds per call of fn on each of items over
+    repeat passes
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        elapsed = (time.perf_counter() - start) / len(items)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure(komer, recs, repeat):
+    """
+    Returns dict of per record seconds of get and pin of recs with komer
+    """
+    keys = [f"{i:032x}" for i in range(len(recs))]
+    items = list(zip(keys, recs))
+    results = dict(pin=timed(lambda item: komer.pin(keys=item[0], val=item[1]), items, repeat),
+                   get=timed(lambda key: komer.get(keys=key), keys, repeat))
+    assert [komer.get(keys=key) for key in keys] == recs
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Baser.states read microbenchmark")
+    parser.add_argument("--records", type=int, default=1000, help="key state records")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes over records")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    recs = generate(args.records)
+    dicts = [helping.dictify(rec) for rec in recs]
+    lists = [koming.tuplify(rec) for rec in recs]
+    schema = basing.KeyStateRecord
+    results = dict(records=args.records, repeat=args.repeat, states={}, convert={})
+
+    results["convert"] = dict(
+        datify=dict(reflective=timed(lambda d: helping.datify(schema, d), dicts, args.repeat),
+                    memoized=timed(helping.datifier(schema), dicts, args.repeat)),
+        dictify=dict(reflective=timed(helping.dictify, recs, args.repeat),
+                     memoized=timed(helping.dictifier(schema), recs, args.repeat)),
+        detuplify=dict(reflective=timed(lambda v: detuplify(schema, v), lists, args.repeat),
+                       memoized=timed(koming.detuplifier(schema), lists, args.repeat)),
+        tuplify=dict(reflective=timed(tuplify, recs, args.repeat),
+                     memoized=timed(koming.tuplifier(schema), recs, args.repeat)))
+
+    with basing.openDB(name="bench_states") as db:
+        for name, kind, positional in (("mgpk_positional", Serials.mgpk, True),
+                                       ("json_named", Serials.json, False)):
+            states = results["states"][name] = {}
+            for mode in ("reflective", "memoized"):
+                komer = koming.Komer(db=db, schema=schema, subkey=f"{name}.{mode}.",
+                                     kind=kind, positional=positional)
+                if mode == "reflective":
+                    reflect(komer)
+                states[mode] = measure(komer, recs, args.repeat)
+            states["speedup"] = dict(get=states["reflective"]["get"] / states["memoized"]["get"],
+                                     pin=states["reflective"]["pin"] / states["memoized"]["pin"])
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
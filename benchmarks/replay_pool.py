@@ -0,0 +1,127 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.replay_pool module
+
+Compares serial KEL replay through Parser and Kevery with batch mode replay
+that verifies saids and signatures in a concurrent.futures process pool.
+
+Usage:
+    python benchmarks/replay_pool.py --events 100000 --aids 100
+
+Prints machine readable JSON results to stdout.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from keri.core import coring, eventing, parsing
+from keri.core.coring import Counter, CtrDex, Salter
+from keri.db import basing
+
+
+def generate(events, aids, rotate=100):
+    """
+    Returns bytearray stream of signed key events for aids identifiers with
+    events total events interleaved round robin across identifiers so the
+    stream exercises per prefix ordering. Each identifier rotates every
+    rotate events and otherwise interacts.
+
+    Parameters:
+        events (int): total number of events in stream
+        aids (int): number of identifiers
+        rotate (int): rotate keys every rotate events per identifier
+    """
+    per = -(-events // aids)  # ceiling
+    count = per // rotate + 2
+    salter = Salter(raw=b'0123456789abcdef')
+    signers = [salter.signers(count=count, path=f"{i}", temp=True) for i in range(aids)]
+    kels = [[] for i in range(aids)]
+
+    for i in range(aids):
+        serder = eventing.incept(keys=[signers[i][0].verfer.qb64],
+                                 ndigs=[coring.Diger(ser=signers[i][1].verfer.qb64b).qb64])
+        kels[i].append((serder, signers[i][0]))
+        k = 0
+        for sn in range(1, per):
+            prior = kels[i][-1][0]
+            if sn % rotate == 0:
+                k += 1
+                serder = eventing.rotate(pre=serder.pre,
+                                         keys=[signers[i][k].verfer.qb64],
+                                         dig=prior.said,
+                                         ndigs=[coring.Diger(ser=signers[i][k + 1].verfer.qb64b).qb64],
+                                         sn=sn)
+            else:
+                serder = eventing.interact(pre=serder.pre, dig=prior.said, sn=sn)
+            kels[i].append((serder, signers[i][k]))
+
+    stream = bytearray()
+    total = 0
+    for sn in range(per):
+        for i in range(aids):
+            if total >= events:
+                break
+            serder, signer = kels[i][sn]
+            stream.extend(serder.raw)
+            stream.extend(Counter(CtrDex.ControllerIdxSigs).qb64b)
+            stream.extend(signer.sign(serder.raw, index=0).qb64b)
+            total += 1
+
+    return stream
+
+
+def replay(stream, name, batch=False, workers=None):
+    """
+    Returns dict of results of replaying stream into fresh temp database
+
+    Parameters:
+        stream (bytearray): of signed key events
+        name (str): name of temp database
+        batch (bool): True means batch mode with process pool
+        workers (int | None): number of process pool workers
+    """
+    with basing.openDB(name=name) as db:
+        kvy = eventing.Kevery(db=db, lax=True, batch=batch)
+        if batch:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parser = parsing.Parser(kvy=kvy, batch=True, executor=executor)
+                start = time.perf_counter()
+                parser.parse(ims=bytearray(stream))
+                elapsed = time.perf_counter() - start
+        else:
+            parser = parsing.Parser(kvy=kvy)
+            start = time.perf_counter()
+            parser.parse(ims=bytearray(stream))
+            elapsed = time.perf_counter() - start
+
+        accepted = sum(1 for _ in db.getFelItemAllPreIter())
+
+    return dict(elapsed=elapsed, accepted=accepted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs process pool KEL replay")
+    parser.add_argument("--events", type=int, default=100000, help="total events")
+    parser.add_argument("--aids", type=int, default=100, help="number of identifiers")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="process pool workers")
+    args = parser.parse_args()
+
+    stream = generate(events=args.events, aids=args.aids)
+    serial = replay(stream, name="bench_serial")
+    pooled = replay(stream, name="bench_pooled", batch=True, workers=args.workers)
+
+    print(json.dumps(dict(events=args.events,
+                          aids=args.aids,
+                          workers=args.workers,
+                          bytes=len(stream),
+                          serial=serial,
+                          pooled=pooled,
+                          speedup=serial["elapsed"] / pooled["elapsed"]),
+                     indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.wire_binary module
+
+Benchmark of text domain qb64 versus binary domain qb2 CESR attachments on
+the wire and in storage. Generates deterministic witnessed KELs then for
+each domain measures:
+
+    receipts: size and build time of witness receipt messages of every event
+        and parse time of those receipts by a Kevery that has the KELs
+    replay: size and clone time of a full first seen replay from a Baser
+        that stores indexed signatures in the same domain, parse time of
+        that replay into a fresh database and storage size of .sigs + .wigs
+
+Runs offline against temp openDB environments.
+
+Usage:
+    python benchmarks/wire_binary.py --aids 20 --events 50
+
+Prints machine readable JSON results to stdout or to --out file.
+"""
+import argparse
+import json
+import time
+
+from kel_ingest import generate
+
+from keri.core import eventing, parsing, serdering
+from keri.core.coring import Salter
+from keri.db import basing
+
+Domains = dict(text=False, binary=True)
+
+
+def stored(db):
+    """
+    Returns int total bytes of values in .sigs and .wigs of db
+    """
+    total = 0
+    for sub in (db.sigs, db.wigs):
+        with db.env.begin(db=sub) as txn:
+            total += sum(len(val) for _, val in txn.cursor().iternext())
+    return total
+
+
+def ingest(db, msgs):
+    """
+    Parses msgs into db with new Kevery. Returns Kevery
+    """
+    kvy = eventing.Kevery(db=db, lax=True, local=False)
+    parsing.Parser(kvy=kvy).parse(ims=bytearray().join(msgs))
+    return kvy
+
+
+def receipts(msgs, wigners, name, binary=False):
+    """
+    Returns dict of results of witness receipts of every event in msgs
+
+    Parameters:
+        msgs (list): of bytearray witnessed event messages
+        wigners (list): of witness Signers
+        name (str): name of temp database
+        binary (bool): True means attachments in binary domain
+    """
+    serders = [serdering.SerderKERI(raw=bytes(msg)) for msg in msgs]
+
+    start = time.perf_counter()
+    rcts = []
+    for serder in serders:
+        reserder = eventing.receipt(pre=serder.pre, sn=serder.sn, said=serder.said)
+        wigers = [wigner.sign(serder.raw, index=i) for i, wigner in enumerate(wigners)]
+        rcts.append(eventing.messagize(reserder, wigers=wigers, pipelined=True,
+                                       binary=binary))
+    built = time.perf_counter() - start
+
+    with basing.openDB(name=name) as db:
+        kvy = ingest(db, msgs)
+        parser = parsing.Parser(kvy=kvy)
+        start = time.perf_counter()
+        parser.parse(ims=bytearray().join(rcts))
+        parsed = time.perf_counter() - start
+
+    return dict(count=len(rcts),
+                bytes=sum(len(rct) for rct in rcts),
+                build=built,
+                parse=parsed)
+
+
+def replay(msgs, name, binary=False):
+    """
+    Returns dict of results of full replay of msgs ingested into Baser that
+    stores signatures in the same domain as the replay
+
+    Parameters:
+        msgs (list): of bytearray event messages
+        name (str): name of temp database
+        binary (bool): True means binary domain storage and attachments
+    """
+    with basing.openDB(name=name, binary=binary) as db:
+        ingest(db, msgs)
+        store = stored(db)
+        start = time.perf_counter()
+        clones = list(db.cloneAllPreIter(binary=binary))
+        cloned = time.perf_counter() - start
+
+    with basing.openDB(name=f"{name}_rx") as db:
+        start = time.perf_counter()
+        ingest(db, clones)
+        parsed = time.perf_counter() - start
+
+    return dict(count=len(clones),
+                bytes=sum(len(clone) for clone in clones),
+                attached=sum(len(clone) - serdering.SerderKERI(raw=bytes(clone)).size
+                             for clone in clones),
+                stored=store,
+                clone=cloned,
+                parse=parsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binary CESR wire benchmark")
+    parser.add_argument("--aids", type=int, default=20, help="identifiers")
+    parser.add_argument("--events", type=int, default=50, help="events per identifier")
+    parser.add_argument("--rotate", type=int, default=10, help="rotate every n events")
+    parser.add_argument("--out", default=None, help="write JSON results to file")
+    args = parser.parse_args()
+
+    msgs = generate("witnessed", aids=args.aids, events=args.events,
+                    rotate=args.rotate)
+    wigners = Salter(raw=b'0123456789abcdef').signers(count=3, path="wit",
+                                                       transferable=False,
+                                                       temp=True)
+
+    results = dict(aids=args.aids, events=args.events, rotate=args.rotate,
+                   domains={})
+    for domain, binary in Domains.items():
+        results["domains"][domain] = dict(
+            receipts=receipts(msgs, wigners, name=f"bench_rct_{domain}",
+                              binary=binary),
+            replay=replay(msgs, name=f"bench_replay_{domain}", binary=binary))
+
+    text, bny = results["domains"]["text"], results["domains"]["binary"]
+    results["savings"] = dict(
+        receiptBytes=1 - bny["receipts"]["bytes"] / text["receipts"]["bytes"],
+        replayAttached=1 - bny["replay"]["attached"] / text["replay"]["attached"],
+        replayBytes=1 - bny["replay"]["bytes"] / text["replay"]["bytes"],
+        stored=1 - bny["replay"]["stored"] / text["replay"]["stored"])
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ KERI
 keri.app.agenting module
 
 """
+import json
 import random
+from collections import deque
 from urllib.parse import urlparse, urljoin
 
 from hio.base import doing
@@ -12,7 +14,7 @@ from hio.core import http
 from hio.core.tcp import clienting
 from hio.help import decking, Hict
 
-from . import httping, forwarding
+from . import httping, forwarding, pooling
 from .. import help
 from .. import kering
 from ..core import eventing, parsing, coring, serdering
@@ -30,6 +32,7 @@ class Receiptor(doing.DoDoer):
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.gets = gets if gets is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.cursors = dict()  # first seen ordinal to resume catch up at keyed by (pre, wit)
         self.clienter = httping.Clienter()
 
         doers = [self.clienter, doing.doify(self.witDo), doing.doify(self.gitDo)]
@@ -81,16 +84,24 @@ class Receiptor(doing.DoDoer):
 
         rcts = dict()
         for wit, client in clients.items():
-            httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg), path="/receipts")
-            while not client.responses:
-                yield self.tock
+            binary = hab.db.binary  # negotiate binary falling back to text when refused
+            while True:
+                httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg),
+                                           path="/receipts", binary=binary)
+                while not client.responses:
+                    yield self.tock
+
+                rep = client.respond()
+                if not (binary and rep.status in httping.CESR_BINARY_REFUSALS):
+                    break
+                binary = False
 
-            rep = client.respond()
             if rep.status == 200:
                 rct = bytearray(rep.body)
                 hab.psr.parseOne(bytearray(rct))
                 rserder = serdering.SerderKERI(raw=rct)
                 del rct[:rserder.size]
+                rct = bytearray(httping.convertAttachments(rct))  # text domain
 
                 # pull off the count code
                 coring.Counter(qb64b=rct, strip=True)
@@ -174,10 +185,18 @@ class Receiptor(doing.DoDoer):
     def catchup(self, pre, wit):
         """ When adding a new Witness, use this method to catch the witness up to the current state of the KEL
 
+        First gets the witness's key state of pre from its /ksn endpoint and then
+        sends only the suffix of the KEL the witness is missing. When the witness
+        can not report its key state resumes from the cursor in .cursors left by
+        an earlier interrupted catch up if any otherwise sends the full KEL.
+
         Parameters:
             pre (str): qualified base64 AID of the KEL to send
             wit (str): qualified base64 AID of the witness to send the KEL to
 
+        Returns:
+            bool: True if witness was sent all missing events, False if interrupted
+
         """
         if pre not in self.hby.prefixes:
             raise kering.MissingEntryError(f"{pre} not a valid AID")
@@ -187,12 +206,33 @@ class Receiptor(doing.DoDoer):
         client, clientDoer = httpClient(hab, wit)
         self.extend([clientDoer])
 
-        for fmsg in hab.db.clonePreIter(pre=pre):
+        client.request(method="GET", path="/ksn", qargs=dict(pre=pre))
+        while not client.responses:
+            yield self.tock
+
+        rep = client.respond()
+        if rep.status == 200:
+            fn = catchupFn(hab.db, pre, json.loads(bytes(rep.body)))
+        else:
+            fn = self.cursors.get((pre, wit), 0)
+
+        for fmsg in hab.db.clonePreIter(pre=pre, fn=fn):
             httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(fmsg))
             while not client.responses:
                 yield self.tock
 
+            rep = client.respond()
+            if not 200 <= rep.status < 300:
+                logger.error(f"catch up of {wit} with {pre} interrupted at fn={fn} by status {rep.status}")
+                self.cursors[(pre, wit)] = fn
+                self.remove([clientDoer])
+                return False
+
+            fn += 1
+
+        self.cursors.pop((pre, wit), None)
         self.remove([clientDoer])
+        return True
 
     def witDo(self, tymth=None, tock=0.0):
         """
@@ -256,13 +296,34 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt.
+    Receipts events as a pipeline. Each event popped from .msgs is receipted by
+    its own flight doer so many events across local identifiers are in flight at
+    once and a slow witness of one identifier does not stall the others. Events
+    of the same identifier are flown one at a time in the order received to
+    preserve per identifier sn ordering.
+
+    Attributes:
+        hby (Habery): local environment of identifiers to receipt
+        force (bool): send witnesses all receipts even when already fully receipted
+        timeout (float | None): seconds to wait for full receipts before abandoning
+            event or None to wait forever
+        msgs (Deck): incoming events to receipt
+        cues (Deck): outgoing cues of fully receipted events
+        timeouts (Deck): outgoing events abandoned after .timeout
+        flights (dict): flight doers of events in flight keyed by identifier prefix
+        waiting (dict): deques of events waiting on an earlier event of same prefix
+        states (dict): completion state of each event in flight keyed by (pre, sn)
+            with start time, witnesses and set of witnesses that have receipted
+        latencies (dict): histograms of receipt latency keyed by witness prefix.
+            Each is list of counts of receipts within each of .Buckets seconds
 
     """
 
-    def __init__(self, hby, msgs=None, cues=None, force=False, **kwa):
+    Timeout = None  # default seconds to wait for full receipts, None waits forever
+    NegotiateTimeout = 10.0  # seconds to wait for key state of new witnesses
+    Buckets = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))  # latency upper bounds
+
+    def __init__(self, hby, msgs=None, cues=None, force=False, timeout=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
@@ -272,18 +333,28 @@ class WitnessReceiptor(doing.DoDoer):
             msgs (Deck): incoming messages to publish to witnesses
             cues (Deck): outgoing cues of successful messages
             force (bool): True means to send witnesses all receipts even if we have a full compliment.
+            timeout (float): seconds to wait for full receipts of an event before
+                abandoning it to .timeouts. Default .Timeout
 
         """
         self.hby = hby
         self.force = force
+        self.timeout = timeout if timeout is not None else self.Timeout
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.timeouts = decking.Deck()
+        self.flights = dict()
+        self.waiting = dict()
+        self.states = dict()
+        self.latencies = dict()
 
-        super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
+        super(WitnessReceiptor, self).__init__(doers=[pooling.PoolerDoer(pooler=self.hby.pooler),
+                                                      doing.doify(self.receiptDo)], **kwa)
 
     def receiptDo(self, tymth=None, tock=0.0):
         """
-        Returns doifiable Doist compatible generator method (doer dog)
+        Returns doifiable Doist compatible generator method (doer dog) that
+        dispatches events from .msgs to flight doers and reaps completed flights
 
         Usage:
             add result of doify on this method to doers list
@@ -306,103 +377,242 @@ class WitnessReceiptor(doing.DoDoer):
                 if pre not in self.hby.habs:
                     continue
 
-                hab = self.hby.habs[pre]
-
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
-
-                if len(wits) == 0:
+                if pre in self.flights or pre in self.waiting:  # keep sn order of pre
+                    self.waiting.setdefault(pre, deque()).append(evt)
                     continue
 
-                msg = hab.makeOwnEvent(sn=sn)
-                ser = serdering.SerderKERI(raw=msg)
+                self.fly(evt)
 
-                dgkey = dbing.dgKey(ser.preb, ser.saidb)
+            for pre, flight in list(self.flights.items()):
+                if flight.done:
+                    self.remove([flight])
+                    del self.flights[pre]
+                    if pre in self.waiting:
+                        self.fly(self.waiting[pre].popleft())
+                        if not self.waiting[pre]:
+                            del self.waiting[pre]
 
-                witers = []
-                for wit in wits:
-                    witer = messenger(hab, wit)
-                    witers.append(witer)
-                    self.extend([witer])
+            yield self.tock
 
-                # Check to see if we already have all the receipts we need for this event
-                wigs = hab.db.getWigs(dgkey)
-                completed = len(wigs) == len(wits)
-                if len(wigs) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
-
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
-
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre):
-                                witer.msgs.append(bytearray(fmsg))
-
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
-
-                    while True:
-                        wigs = hab.db.getWigs(dgkey)
-                        if len(wigs) == len(wits):
-                            break
-                        _ = yield self.tock
-
-                # If we started with all our recipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.push(evt)
-                    continue
+    def fly(self, evt):
+        """
+        Start flight doer to receipt event evt
 
-                # generate all rct msgs to send to all witnesses
-                awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
+        Parameters:
+            evt (dict): event to receipt with pre and optional sn
 
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
+        """
+        flight = doing.doify(self.flightDo, evt=evt)
+        self.flights[evt["pre"]] = flight
+        self.extend([flight])
 
-                    if len(wigers) == 0:
-                        continue
+    def witnessed(self, state, wigs):
+        """
+        Update state of event in flight with witnesses that have receipted and
+        record latency of each newly receipted witness in .latencies
 
-                    rctMsg = bytearray()
+        Parameters:
+            state (dict): completion state of event in flight from .states
+            wigs (list): indexed witness signatures of event from database
 
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
+        """
+        wits = state["wits"]
+        for wig in wigs:
+            index = coring.Siger(qb64b=bytes(wig)).index
+            if index >= len(wits) or wits[index] in state["receipted"]:
+                continue
 
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
+            wit = wits[index]
+            state["receipted"].add(wit)
+            latency = self.tyme - state["start"]
+            histogram = self.latencies.setdefault(wit, [0] * len(self.Buckets))
+            for i, bound in enumerate(self.Buckets):
+                if latency <= bound:
+                    histogram[i] += 1
+                    break
 
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+    def negotiate(self, hab, wits, state):
+        """
+        Returns generator that gets the key state of hab's identifier from the
+        http /ksn endpoint of each witness in wits concurrently and returns dict
+        keyed by witness of first seen ordinal of first event of KEL the witness
+        is missing. Ordinal is 0 to send full KEL when witness has no http
+        endpoint, does not know identifier or does not respond within
+        .NegotiateTimeout or before .timeout.
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+        Parameters:
+            hab (Hab): local habitat of identifier being receipted
+            wits (list): qb64 identifier prefixes of newly added witnesses
+            state (dict): completion state of event in flight from .states
 
-                self.remove(witers)
+        """
+        fns = {wit: 0 for wit in wits}
+        requests = {}  # (client, doer) of each witness negotiating keyed by witness
+        for wit in wits:
+            urls = hab.fetchUrls(eid=wit, scheme=kering.Schemes.http) or \
+                hab.fetchUrls(eid=wit, scheme=kering.Schemes.https)
+            if not urls:  # no synchronous key state api over tcp so send full KEL
+                continue
 
-                self.cues.push(evt)
+            url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
+            pooled = self.hby.pooler.lease(wit, url)
+            doer = pooling.PooledDoer(pooler=self.hby.pooler, pooled=pooled)
+            self.extend([doer])
+            pooled.client.request(method="GET", path="/ksn", qargs=dict(pre=hab.pre))
+            requests[wit] = (pooled.client, doer)
+
+        start = self.tyme
+        while requests:
+            for wit, (client, doer) in list(requests.items()):
+                if client.responses:
+                    rep = client.respond()
+                    self.remove([doer])
+                    del requests[wit]
+                    if rep.status == 200:
+                        fns[wit] = catchupFn(hab.db, hab.pre, json.loads(bytes(rep.body)))
+
+            if requests and (self.tyme - start > self.NegotiateTimeout or
+                             (self.timeout is not None and
+                              self.tyme - state["start"] > self.timeout)):
+                self.remove([doer for _, doer in requests.values()])
+                break
+
+            if requests:
                 yield self.tock
 
-            yield self.tock
+        return fns
+
+    def flightDo(self, tymth=None, tock=0.0, evt=None, **opts):
+        """
+        Returns doifiable Doist compatible generator method (doer dog) that
+        receipts one event evt. Returns True when fully receipted or abandoned.
+
+        Parameters:
+            tymth is injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock is injected initial tock value
+            evt (dict): event to receipt with pre and optional sn
+
+        """
+        _ = (yield tock)
+
+        pre = evt["pre"]
+        hab = self.hby.habs[pre]
+
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
+
+        if len(wits) == 0:
+            return True
+
+        msg = hab.makeOwnEvent(sn=sn)
+        ser = serdering.SerderKERI(raw=msg)
+
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
+
+        witers = []
+        for wit in wits:
+            witer = messenger(hab, wit, pooler=self.hby.pooler)
+            witers.append(witer)
+            self.extend([witer])
+
+        state = dict(start=self.tyme, wits=list(wits), receipted=set())
+        self.states[(pre, sn)] = state
+
+        # Check to see if we already have all the receipts we need for this event
+        wigs = hab.db.getWigs(dgkey)
+        completed = len(wigs) == len(wits)
+        if len(wigs) != len(wits):  # We have all the receipts, skip
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # KEL is inception
+                fns = {wit: 0 for wit in wits}
+            else:  # negotiate with newly added witnesses the missing KEL to catch up
+                adds = [wit for wit in wits if wit in ser.ked.get("ba", [])]
+                fns = (yield from self.negotiate(hab, adds, state)) if adds else {}
+
+            for idx, witer in enumerate(witers):
+                wit = wits[idx]
+
+                for dmsg in hab.db.cloneDelegation(hab.kever):
+                    witer.msgs.append(bytearray(dmsg))
+
+                if wit in fns:  # send missing KEL to catch up
+                    for fmsg in hab.db.clonePreIter(pre=pre, fn=fns[wit]):
+                        witer.msgs.append(bytearray(fmsg))
+
+                witer.msgs.append(bytearray(msg))  # make a copy
+                _ = (yield self.tock)
+
+            while True:
+                wigs = hab.db.getWigs(dgkey)
+                self.witnessed(state, wigs)
+                if len(wigs) == len(wits):
+                    break
+
+                if self.timeout is not None and self.tyme - state["start"] > self.timeout:
+                    missing = [wit for wit in wits if wit not in state["receipted"]]
+                    logger.error(f"timed out receipting {pre} sn={sn}, missing receipts from {missing}")
+                    self.remove(witers)
+                    del self.states[(pre, sn)]
+                    self.timeouts.push(evt)
+                    return True
+
+                _ = yield self.tock
+
+        # If we started with all our recipts, exit unless told to force resubmit of all receipts
+        if completed and not self.force:
+            self.remove(witers)
+            del self.states[(pre, sn)]
+            self.cues.push(evt)
+            return True
+
+        # generate all rct msgs to send to all witnesses
+        awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
+
+        # make sure all witnesses have fully receipted KERL and know about each other
+        for witer in witers:
+            ewits = []
+            wigers = []
+            for i, wit in enumerate(wits):
+                if wit == witer.wit:
+                    continue
+                ewits.append(wit)
+                wigers.append(awigers[i])
+
+            if len(wigers) == 0:
+                continue
+
+            rctMsg = bytearray()
+
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+            elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+
+            rserder = eventing.receipt(pre=ser.pre,
+                                       sn=sn,
+                                       said=ser.said)
+            rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
+
+            witer.msgs.append(rctMsg)
+            _ = (yield self.tock)
+
+        while True:
+            done = True
+            for witer in witers:
+                if not witer.idle:
+                    yield 1.0
+                    done = False
+                    break
+            if done:
+                break
+
+        self.remove(witers)
+        del self.states[(pre, sn)]
+
+        self.cues.push(evt)
+        return True
 
 
 class WitnessInquisitor(doing.DoDoer):
@@ -433,7 +643,8 @@ class WitnessInquisitor(doing.DoDoer):
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = decking.Deck()
 
-        super(WitnessInquisitor, self).__init__(doers=[doing.doify(self.msgDo)], **kwa)
+        super(WitnessInquisitor, self).__init__(doers=[pooling.PoolerDoer(pooler=self.hby.pooler),
+                                                       doing.doify(self.msgDo)], **kwa)
 
     def msgDo(self, tymth=None, tock=1.0, **opts):
         """
@@ -488,10 +699,10 @@ class WitnessInquisitor(doing.DoDoer):
                     logger.error(f"must have location in endpoint to query for pre={pre}")
                     continue
 
-                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, pooler=self.hby.pooler)
             else:
                 wit = random.choice(wits)
-                witer = messenger(hab, wit)
+                witer = messenger(hab, wit, pooler=self.hby.pooler)
 
             self.extend([witer])
 
@@ -507,6 +718,8 @@ class WitnessInquisitor(doing.DoDoer):
                 yield self.tock
 
             self.sent.append(witer.sent.popleft())
+            if isinstance(witer, HTTPMessenger):  # response received so return connection to pool
+                self.remove([witer])
 
             yield self.tock
 
@@ -569,7 +782,8 @@ class WitnessPublisher(doing.DoDoer):
         self.hby = hby
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
-        super(WitnessPublisher, self).__init__(doers=[doing.doify(self.sendDo)], **kwa)
+        super(WitnessPublisher, self).__init__(doers=[pooling.PoolerDoer(pooler=self.hby.pooler),
+                                                      doing.doify(self.sendDo)], **kwa)
 
     def sendDo(self, tymth=None, tock=0.0, **opts):
         """
@@ -596,7 +810,7 @@ class WitnessPublisher(doing.DoDoer):
 
                 witers = []
                 for wit in wits:
-                    witer = messenger(hab, wit)
+                    witer = messenger(hab, wit, pooler=self.hby.pooler)
                     witers.append(witer)
                     witer.msgs.append(bytearray(msg))  # make a copy so everyone munges their own
                     self.extend([witer])
@@ -636,18 +850,20 @@ class TCPMessenger(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, pooler=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            pooler (pooling.Pooler): optional pool to lease keep-alive connection from
 
         """
         self.hab = hab
         self.wit = wit
         self.url = url
+        self.pooler = pooler
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
@@ -675,12 +891,18 @@ class TCPMessenger(doing.DoDoer):
         if up.scheme != kering.Schemes.tcp:
             raise ValueError(f"invalid scheme {up.scheme} for TcpWitnesser")
 
-        client = clienting.Client(host=up.hostname, port=up.port)
+        if self.pooler is not None:
+            pooled = self.pooler.lease(self.wit, self.url)
+            client = pooled.client
+            clientDoer = pooling.PooledDoer(pooler=self.pooler, pooled=pooled)
+        else:
+            client = clienting.Client(host=up.hostname, port=up.port)
+            clientDoer = clienting.ClientDoer(client=client)
+
         self.parser = parsing.Parser(ims=client.rxbs,
                                      framed=True,
                                      kvy=self.kevery)
 
-        clientDoer = clienting.ClientDoer(client=client)
         self.extend([clientDoer, doing.doify(self.msgDo)])
 
         while True:
@@ -825,18 +1047,25 @@ class HTTPMessenger(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, pooler=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
+        Posts in binary domain qb2 when hab.db.binary until the endpoint refuses
+        a binary post after which the refused and later messages are posted in
+        text domain.
+
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            pooler (pooling.Pooler): optional pool to lease keep-alive connection from
 
         """
         self.hab = hab
         self.wit = wit
         self.posted = 0
+        self.binary = True if hab.db.binary else False
+        self.inflight = deque()  # [msg, responses pending, binary, refused] of each post
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -847,8 +1076,13 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != kering.Schemes.http and up.scheme != kering.Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
+        if pooler is not None:
+            pooled = pooler.lease(wit, url)
+            self.client = pooled.client
+            clientDoer = pooling.PooledDoer(pooler=pooler, pooled=pooled)
+        else:
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            clientDoer = http.clienting.ClientDoer(client=self.client)
 
         doers.extend([clientDoer])
 
@@ -870,7 +1104,7 @@ class HTTPMessenger(doing.DoDoer):
                 yield self.tock
 
             msg = self.msgs.popleft()
-            self.posted += httping.streamCESRRequests(client=self.client, dest=self.wit, ims=msg)
+            self.post(msg)
             while self.client.requests:
                 yield self.tock
 
@@ -888,10 +1122,37 @@ class HTTPMessenger(doing.DoDoer):
         while True:
             while self.client.responses:
                 rep = self.client.respond()
+                post = self.inflight[0] if self.inflight else None
+                if post is not None:
+                    post[1] -= 1
+                    if not post[1]:
+                        self.inflight.popleft()
+                    if post[2] and rep.status in httping.CESR_BINARY_REFUSALS:
+                        self.posted -= 1  # refused so not sent
+                        if not post[3]:  # repost in text domain
+                            post[3] = True
+                            if self.binary:
+                                logger.info(f"{self.wit} refused binary post, posting text domain")
+                            self.binary = False
+                            self.post(post[0])
+                        continue
                 self.sent.append(rep)
                 yield
             yield
 
+    def post(self, msg):
+        """
+        Posts each message in msg in binary domain qb2 when .binary else text
+
+        Parameters:
+            msg (bytes | bytearray): stream of messages with text domain attachments
+        """
+        count = httping.streamCESRRequests(client=self.client, dest=self.wit,
+                                           ims=bytearray(msg), binary=self.binary)
+        if count:
+            self.inflight.append([bytes(msg), count, self.binary, False])
+            self.posted += count
+
     @property
     def idle(self):
         return len(self.msgs) == 0 and self.posted == len(self.sent)
@@ -972,37 +1233,39 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre):
+def messenger(hab, pre, pooler=None):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
+        pooler (pooling.Pooler): optional pool of keep-alive connections to lease from
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls)
+    return messengerFrom(hab, pre, urls, pooler=pooler)
 
 
-def messengerFrom(hab, pre, urls):
+def messengerFrom(hab, pre, urls, pooler=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
+        pooler (pooling.Pooler): optional pool of keep-alive connections to lease from
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if kering.Schemes.http in urls or kering.Schemes.https in urls:
         url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, pooler=pooler)
     elif kering.Schemes.tcp in urls:
         url = urls[kering.Schemes.tcp]
-        witer = TCPMessenger(hab=hab, wit=pre, url=url)
+        witer = TCPMessenger(hab=hab, wit=pre, url=url, pooler=pooler)
     else:
         raise kering.ConfigurationError(f"unable to find a valid endpoint for witness {pre}")
 
@@ -1058,6 +1321,35 @@ def httpClient(hab, wit):
     return client, clientDoer
 
 
+def catchupFn(db, pre, ksn):
+    """ Returns first seen ordinal of first event of KEL of pre missing from remote key state
+
+    Parameters:
+        db (Baser): local database with KEL of pre
+        pre (str): qb64 identifier prefix
+        ksn (dict): remote key state record of pre as from KeyStateRecord._asdict()
+
+    Returns:
+        int: first seen ordinal in db to resume sending KEL at. 0 when remote key
+            state is not of a latest event in local KEL so full KEL must be sent
+
+    """
+    try:
+        if ksn["i"] != pre:
+            return 0
+        sn = int(ksn["s"], 16)
+        said = ksn["d"]
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+    dig = db.getKeLast(key=dbing.snKey(pre=pre, sn=sn))
+    if dig is None or bytes(dig).decode("utf-8") != said:
+        return 0
+
+    fner = db.fons.get(keys=dbing.dgKey(pre=pre, dig=said))
+    return fner.sn + 1 if fner is not None else 0
+
+
 def schemes(db, eids):
     msgs = bytearray()
     for eid in eids:
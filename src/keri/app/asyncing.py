@@ -0,0 +1,620 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.asyncing module
+
+Optional asyncio ASGI HTTP ingress for witnesses alongside hio Doers.
+
+The hio http.Server services every open connection from the Doist loop that
+also runs the Parser, Kevery escrows and receipting so long lived mailbox
+server sent event streams and slow clients add to the latency of every tock.
+In async mode an asyncio event loop on its own thread owns the sockets so
+thousands of idle subscribers cost one coroutine each. Requests are handed
+to the existing falcon WSGI app on the Doist thread by a Servicer Doer so the
+Parser, Kevery and databases are only ever touched by that one dedicated
+thread, and mailbox streams are polled on the event loop between chunks.
+
+Usage:
+    servicer = Servicer()
+    server = createServer(port, Bridge(app=app, servicer=servicer))
+    if not server.reopen():
+        raise RuntimeError(...)
+    doers.extend([servicer, ServerDoer(server=server)])
+"""
+import asyncio
+import concurrent.futures
+import http
+import io
+import queue
+import ssl
+import sys
+import threading
+from urllib import parse
+
+from hio.base import doing
+
+from .. import help
+
+logger = help.ogler.getLogger()
+
+
+class Servicer(doing.Doer):
+    """
+    Servicer is Doer that runs calls submitted from other threads such as an
+    asyncio event loop thread on the thread of its Doist. Each recur runs the
+    calls queued by its start so new calls wait at most one tock.
+
+    Attributes:
+        calls (queue.SimpleQueue): of (future, fn, args, kwa) pending calls
+        served (int): count of calls run
+
+    """
+
+    def __init__(self, **kwa):
+        """
+        Inherited Parameters:
+            tymth (function): injected wrapper closure of Tymist .tyme
+            tock (float): seconds initial value of .tock
+        """
+        super(Servicer, self).__init__(**kwa)
+        self.calls = queue.SimpleQueue()
+        self.served = 0
+
+    def submit(self, fn, *args, **kwa):
+        """
+        Returns concurrent.futures.Future of result of fn(*args, **kwa) once
+        run on the Doist thread. Thread safe.
+
+        Parameters:
+            fn (Callable): to call with args and kwa
+        """
+        future = concurrent.futures.Future()
+        self.calls.put((future, fn, args, kwa))
+        return future
+
+    def service(self):
+        """
+        Runs calls pending at start and resolves their futures with result or
+        raised exception. Calls submitted meanwhile run on next service.
+        """
+        for _ in range(self.calls.qsize()):
+            try:
+                future, fn, args, kwa = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            if not future.set_running_or_notify_cancel():  # cancelled
+                continue
+            try:
+                result = fn(*args, **kwa)
+            except BaseException as ex:
+                future.set_exception(ex)
+            else:
+                future.set_result(result)
+            self.served += 1
+
+    def recur(self, tyme):
+        """
+        Services pending calls. Never done.
+        """
+        self.service()
+        return False
+
+    def exit(self):
+        """
+        Cancels calls still pending so awaiting coroutines do not hang
+        """
+        while True:
+            try:
+                future, _, _, _ = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            future.cancel()
+
+
+class Bridge:
+    """
+    Bridge is ASGI app that serves a falcon WSGI app on the Doist thread of
+    a Servicer so existing resources run unchanged and single threaded.
+
+    Streamed responses are pulled in chunks of up to .Budget bytes per call.
+    Streams whose class has .Concurrent True such as mailbox streams are safe
+    to iterate concurrently with the Doist thread so are pulled on the event
+    loop. Others such as KEL replays are pulled on the Doist thread. An empty
+    chunk means the stream is idle so it is polled again after .poll seconds
+    until the stream ends or the client disconnects. Concurrent streams with
+    .watch such as mailbox streams instead wake the stream as soon as new
+    messages are stored and while .watching are only polled every .Idle
+    seconds.
+
+    Attributes:
+        app (falcon.App): WSGI app with routes
+        servicer (Servicer): runs app on Doist thread
+        poll (float): seconds between pulls of idle stream
+
+    """
+    Poll = 0.125  # seconds between pulls of idle stream
+    Idle = 30.0  # seconds between pulls of idle watching stream
+    Budget = 65536  # max bytes pulled from stream per call
+
+    def __init__(self, app, servicer, poll=None):
+        """
+        Parameters:
+            app (falcon.App): WSGI app with routes
+            servicer (Servicer): runs app on Doist thread
+            poll (float): seconds between pulls of idle stream. Default .Poll
+        """
+        self.app = app
+        self.servicer = servicer
+        self.poll = poll if poll is not None else self.Poll
+
+    async def __call__(self, scope, receive, send):
+        """
+        ASGI app entry point
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send(dict(type="lifespan.startup.complete"))
+                elif message["type"] == "lifespan.shutdown":
+                    await send(dict(type="lifespan.shutdown.complete"))
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.extend(message.get("body", b''))
+            if not message.get("more_body", False):
+                break
+
+        future = self.servicer.submit(self.respond, self.environ(scope, bytes(body)))
+        status, headers, data, stream = await asyncio.wrap_future(future)
+
+        await send(dict(type="http.response.start",
+                        status=int(status.split(" ", 1)[0]),
+                        headers=[(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                 for name, value in headers]))
+        if stream is None:
+            await send(dict(type="http.response.body", body=data, more_body=False))
+            return
+
+        await self.stream(stream, receive, send)
+
+    async def stream(self, stream, receive, send):
+        """
+        Sends chunks pulled from stream until stream ends or client disconnects
+
+        Parameters:
+            stream (Iterator): of bytes chunks of streamed response
+            receive (Callable): ASGI receive awaitable
+            send (Callable): ASGI send awaitable
+        """
+        offloop = getattr(stream, "Concurrent", False)
+        disconnect = asyncio.ensure_future(receive())
+        woken = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def wake(topic):
+            try:
+                loop.call_soon_threadsafe(woken.set)
+            except RuntimeError:  # loop closed
+                pass
+
+        if offloop and hasattr(stream, "watch"):
+            stream.watch(wake)
+        try:
+            while not disconnect.done():
+                woken.clear()  # wakes after clear are seen by next wait
+                if offloop:
+                    data, done = self.pull(stream)
+                else:
+                    data, done = await asyncio.wrap_future(
+                        self.servicer.submit(self.pull, stream))
+                if data:
+                    await send(dict(type="http.response.body", body=data,
+                                    more_body=not done))
+                if done:
+                    if not data:
+                        await send(dict(type="http.response.body", body=b'',
+                                        more_body=False))
+                    return
+                if not data:  # idle so wait for wake, poll or disconnect
+                    timeout = self.Idle if getattr(stream, "watching", False) else self.poll
+                    waiter = asyncio.ensure_future(woken.wait())
+                    await asyncio.wait([disconnect, waiter], timeout=timeout,
+                                       return_when=asyncio.FIRST_COMPLETED)
+                    waiter.cancel()
+        finally:
+            disconnect.cancel()
+            if offloop and hasattr(stream, "unwatch"):
+                stream.unwatch()
+            if hasattr(stream, "close"):
+                if offloop:
+                    stream.close()
+                else:
+                    self.servicer.submit(stream.close)
+
+    def pull(self, stream):
+        """
+        Returns tuple (data, done) of bytes data of chunks pulled from stream
+        until .Budget bytes or an empty chunk and done True when stream ended
+
+        Parameters:
+            stream (Iterator): of bytes chunks of streamed response
+        """
+        data = bytearray()
+        while len(data) < self.Budget:
+            try:
+                chunk = next(stream)
+            except StopIteration:
+                return bytes(data), True
+            if not chunk:
+                break
+            data.extend(chunk)
+        return bytes(data), False
+
+    def respond(self, environ):
+        """
+        Returns tuple (status, headers, data, stream) from app for environ.
+        Run on Doist thread. When the response is streamed data is None and
+        stream is iterator of its chunks. Otherwise stream is None.
+
+        Parameters:
+            environ (dict): WSGI environ of request
+        """
+        started = []
+
+        def start(status, headers, exc_info=None):
+            started[:] = [status, headers]
+
+        result = self.app(environ, start)
+        if isinstance(result, (list, tuple)):
+            return started[0], started[1], b''.join(result), None
+        return started[0], started[1], None, iter(result)
+
+    @staticmethod
+    def environ(scope, body):
+        """
+        Returns WSGI environ dict of ASGI http scope and request body bytes
+        """
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client")
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", ""),
+            "PATH_INFO": scope["path"],
+            "QUERY_STRING": scope.get("query_string", b'').decode("latin-1"),
+            "SERVER_NAME": str(server[0]),
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0] if client else "",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": False,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin-1").upper().replace("-", "_")
+            value = value.decode("latin-1")
+            if name == "CONTENT_TYPE":
+                environ[name] = value
+            elif name != "CONTENT_LENGTH":
+                key = f"HTTP_{name}"
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+class Server:
+    """
+    Server is minimal asyncio HTTP/1.1 server of an ASGI app that runs its
+    event loop on its own thread. Requests have Content-Length bodies.
+    Connections are kept alive for further requests such as from pooled
+    clients unless the client asks to close. Streamed responses such as
+    server sent events close the connection so end when either side closes.
+
+    Attributes:
+        app (Callable): ASGI app
+        host (str): interface to listen on. Empty means all interfaces
+        port (int): port to listen on. Zero means any free port which is
+            then replaced by the bound port
+        ssl (ssl.SSLContext | None): TLS context when HTTPS
+        opened (bool): True means listening
+        tasks (set): of connection tasks
+
+    """
+    MaxBody = 1 << 24  # max bytes of request body
+    Timeout = 30.0  # seconds to read request or await next before closing connection
+    Chunk = 1 << 16  # max bytes per read while awaiting client disconnect
+
+    def __init__(self, app, host="", port=5632, ssl=None):
+        """
+        Parameters:
+            app (Callable): ASGI app
+            host (str): interface to listen on. Empty means all interfaces
+            port (int): port to listen on. Zero means any free port
+            ssl (ssl.SSLContext | None): TLS context when HTTPS
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.opened = False
+        self.tasks = set()
+        self.loop = None
+        self.thread = None
+        self.server = None
+
+    def reopen(self):
+        """
+        Returns True if listening. Starts event loop thread when not opened.
+        """
+        if self.opened:
+            return True
+
+        ready = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.run, args=(ready,),
+                                       name=f"asgi:{self.port}", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if not self.opened:
+            self.thread.join()
+            self.thread = None
+        return self.opened
+
+    def run(self, ready):
+        """
+        Event loop thread target. Listens then runs loop until .close
+        """
+        asyncio.set_event_loop(self.loop)
+        try:
+            try:
+                self.server = self.loop.run_until_complete(
+                    asyncio.start_server(self.serve, host=self.host or None,
+                                         port=self.port, ssl=self.ssl))
+            except OSError as ex:
+                logger.error("Server: cannot listen on port=%s: %s", self.port, ex)
+            else:
+                self.port = self.server.sockets[0].getsockname()[1]
+                self.opened = True
+            finally:
+                ready.set()
+
+            if self.opened:
+                self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def close(self):
+        """
+        Stops listening, closes open connections and stops event loop thread
+        """
+        if not self.opened:
+            return
+
+        async def shutdown():
+            self.server.close()
+            for task in list(self.tasks):
+                task.cancel()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+        self.opened = False
+
+    async def serve(self, reader, writer):
+        """
+        Serves requests on connection of reader and writer until not kept alive
+        """
+        task = asyncio.current_task()
+        self.tasks.add(task)
+        try:
+            while await self.respond(reader, writer):
+                pass
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ConnectionError, ValueError) as ex:
+            logger.debug("Server: dropped connection: %s", ex)
+        finally:
+            self.tasks.discard(task)
+            writer.close()
+
+    async def respond(self, reader, writer):
+        """
+        Reads request from reader and writes response of .app to writer.
+        Returns True when connection is kept alive for next request.
+        """
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.Timeout)
+        except asyncio.IncompleteReadError as ex:
+            if not ex.partial:  # client closed kept alive connection
+                return False
+            raise
+        lines = head[:-4].decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = []
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers.append((name.strip().lower().encode("latin-1"),
+                            value.strip().encode("latin-1")))
+        fields = dict(headers)
+        connection = fields.get(b'connection', b'').lower()
+        if version.upper() == "HTTP/1.0":
+            alive = {"alive": b'keep-alive' in connection}
+        else:
+            alive = {"alive": b'close' not in connection}
+
+        if b'chunked' in fields.get(b'transfer-encoding', b'').lower():
+            await self.reply(writer, http.HTTPStatus.LENGTH_REQUIRED)
+            return False
+
+        length = int(fields.get(b'content-length', b'0'))
+        if length > self.MaxBody:
+            await self.reply(writer, http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return False
+        body = (await asyncio.wait_for(reader.readexactly(length), self.Timeout)
+                if length else b'')
+
+        path, _, query = target.partition("?")
+        scope = dict(type="http",
+                     asgi=dict(version="3.0", spec_version="2.3"),
+                     http_version=version.split("/")[-1],
+                     method=method.upper(),
+                     scheme="https" if self.ssl else "http",
+                     path=parse.unquote(path),
+                     raw_path=path.encode("latin-1"),
+                     query_string=query.encode("latin-1"),
+                     root_path="",
+                     headers=headers,
+                     client=(writer.get_extra_info("peername") or ("", 0))[:2],
+                     server=(self.host or "localhost", self.port))
+
+        requests = [dict(type="http.request", body=body, more_body=False)]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            alive["alive"] = False  # reads past request so can not be reused
+            while await reader.read(self.Chunk):  # bounded reads until client closes
+                pass
+            return dict(type="http.disconnect")
+
+        start = {}
+        state = {"head": False}  # True once response head written
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                data = message.get("body", b'')
+                more = message.get("more_body", False)
+                if not state["head"]:
+                    if more:  # streamed so ended by closing connection
+                        alive["alive"] = False
+                    self.head(writer, start["status"], start.get("headers", []),
+                              length=None if more else len(data),
+                              close=not alive["alive"])
+                    state["head"] = True
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as ex:
+            logger.error("Server: app failed on %s %s: %s", method, path, ex)
+            if not state["head"]:  # failed before response head written
+                await self.reply(writer, http.HTTPStatus.INTERNAL_SERVER_ERROR)
+            return False
+
+        if not start and not state["head"]:  # app returned without response
+            logger.error("Server: app sent no response on %s %s", method, path)
+            await self.reply(writer, http.HTTPStatus.INTERNAL_SERVER_ERROR)
+            return False
+
+        if not state["head"]:  # app started response without body
+            self.head(writer, start["status"], start.get("headers", []), length=0,
+                      close=not alive["alive"])
+            await writer.drain()
+
+        return alive["alive"]
+
+    @staticmethod
+    def head(writer, status, headers, length=None, close=True):
+        """
+        Writes response status line and headers to writer
+
+        Parameters:
+            writer (asyncio.StreamWriter): of connection
+            status (int): HTTP status code
+            headers (list): of (name, value) bytes header pairs
+            length (int | None): Content-Length when not in headers.
+                None means streamed response ended by closing connection
+            close (bool): True means connection closes after response.
+                False means kept alive for next request
+        """
+        try:
+            phrase = http.HTTPStatus(status).phrase
+        except ValueError:
+            phrase = ""
+        lines = [f"HTTP/1.1 {status} {phrase}".encode("latin-1")]
+        names = set()
+        for name, value in headers:
+            name = bytes(name).lower()
+            if name == b'connection':
+                continue
+            names.add(name)
+            lines.append(name + b': ' + bytes(value))
+        if length is not None and b'content-length' not in names:
+            lines.append(b'content-length: ' + str(length).encode("latin-1"))
+        if close or length is None:
+            lines.append(b'connection: close')
+        writer.write(b'\r\n'.join(lines) + b'\r\n\r\n')
+
+    async def reply(self, writer, status):
+        """
+        Writes empty response with status to writer
+        """
+        self.head(writer, int(status), [], length=0)
+        await writer.drain()
+
+
+class ServerDoer(doing.Doer):
+    """
+    ServerDoer is Doer that opens its asyncio Server on enter and closes it
+    on exit. The Server runs on its own event loop thread.
+
+    Attributes:
+        server (Server): asyncio HTTP server
+
+    """
+
+    def __init__(self, server, **kwa):
+        """
+        Parameters:
+            server (Server): asyncio HTTP server
+        """
+        super(ServerDoer, self).__init__(**kwa)
+        self.server = server
+
+    def enter(self):
+        """"""
+        self.server.reopen()
+
+    def recur(self, tyme):
+        """ Never done """
+        return False
+
+    def exit(self):
+        """"""
+        self.server.close()
+
+
+def createServer(port, app, host="", keypath=None, certpath=None, cafilepath=None):
+    """
+    Returns asyncio Server of ASGI app that is HTTPS when TLS key material
+    is present otherwise HTTP
+
+    Parameters:
+        port (int): port to listen on
+        app (Callable): ASGI app
+        host (str): interface to listen on. Empty means all interfaces
+        keypath (str): file path to the TLS private key
+        certpath (str): file path to the TLS signed certificate (public key)
+        cafilepath (str): file path to the TLS CA certificate chain file
+    """
+    context = None
+    if keypath is not None and certpath is not None and cafilepath is not None:
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH,
+                                             cafile=cafilepath)
+        context.load_cert_chain(certfile=certpath, keyfile=keypath)
+    return Server(app=app, host=host, port=port, ssl=context)
@@ -0,0 +1,57 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+import json
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Reverify integrity of stored events and serders offline')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+
+
+def handler(args):
+    """ Command line audit handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(audit, **kwa)]
+
+
+def audit(tymth, tock=0.0, **opts):
+    """ Reverify in bulk the saids of all events and serders that are loaded
+    trusted from the database and print JSON report of any that fail
+
+    """
+    _ = (yield tock)
+
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            failures = [dict(subkey=subkey, keys=list(keys), error=str(ex))
+                        for subkey, keys, ex in hby.db.getAuditIter()]
+
+            print(json.dumps(dict(failures=failures), indent=2))
+            return -1 if failures else 0
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
@@ -0,0 +1,61 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.db import koming
+from keri.kering import ConfigurationError
+from keri.vdr import credentialing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Rewrite database records in their configured compact serialization')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+
+
+def handler(args):
+    """ Command line migrate handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(migrate, **kwa)]
+
+
+def migrate(tymth, tock=0.0, **opts):
+    """ Rewrite the records of the key event and registry databases still
+    stored in an older serialization. Optional since records in older
+    serializations stay readable.
+
+    """
+    _ = (yield tock)
+
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            rgy = credentialing.Regery(hby=hby, name=name, base=base)
+            try:
+                for db in (hby.db, rgy.reger):
+                    for sub, count in koming.migrate(db).items():
+                        print(f"Migrated {count} {sub} records of {db.name}")
+            finally:
+                rgy.close()
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
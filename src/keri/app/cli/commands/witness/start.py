@@ -47,6 +47,10 @@ parser.add_argument('--config-file',
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument("--aio", action="store_true", required=False, default=False,
+                    help="Serve HTTP from an asyncio event loop thread. Default is hio http server.")
+parser.add_argument("--binary", action="store_true", required=False, default=False,
+                    help="Store signatures and post in binary domain qb2. Default is text domain qb64.")
 parser.add_argument("--loglevel", action="store", required=False, default="CRITICAL", help="Set log level to DEBUG | INFO | WARNING | ERROR | CRITICAL. Default is CRITICAL")
 
 
@@ -69,14 +73,17 @@ def launch(args):
                configFile=args.configFile,
                keypath=args.keypath,
                certpath=args.certpath,
-               cafilepath=args.cafilepath)
+               cafilepath=args.cafilepath,
+               aio=args.aio,
+               binary=args.binary)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
 def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
-               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None):
+               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None,
+               aio=False, binary=False):
     """
     Setup and run one witness
     """
@@ -97,6 +104,9 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
     else:
         hby = existing.setupHby(name=name, base=base, bran=bran, cf=cf)
 
+    if binary:
+        hby.db.binary = True
+
     hbyDoer = habbing.HaberyDoer(habery=hby)  # setup doer
     doers = [hbyDoer]
 
@@ -106,6 +116,7 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
                                           httpPort=http,
                                           keypath=keypath,
                                           certpath=certpath,
-                                          cafilepath=cafilepath))
+                                          cafilepath=cafilepath,
+                                          aio=aio))
 
     directing.runController(doers=doers, expire=expire)
@@ -410,6 +410,13 @@ class Directant(doing.DoDoer):
         Usage:
             add result of doify on this method to doers list
         """
+        for ca, ix in list(self.server.ixes.items()):  # remoters closed when server last closed
+            if ix.cs is None:
+                self.server.removeIx(ca, close=False)
+                if ca in self.rants:
+                    self.remove([self.rants[ca]])
+                    del self.rants[ca]
+
         yield  # enter context
         while True:
             for ca, ix in list(self.server.ixes.items()):
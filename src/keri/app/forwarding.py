@@ -12,7 +12,7 @@ from hio.base import doing
 from hio.help import decking, ogler
 
 from keri import kering
-from keri.app import agenting
+from keri.app import agenting, pooling
 from keri.app.habbing import GroupHab
 from keri.core import coring, eventing, serdering
 from keri.db import dbing
@@ -36,7 +36,7 @@ class Poster(doing.DoDoer):
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
 
-        doers = [doing.doify(self.deliverDo)]
+        doers = [pooling.PoolerDoer(pooler=self.hby.pooler), doing.doify(self.deliverDo)]
         super(Poster, self).__init__(doers=doers, **kwa)
 
     def deliverDo(self, tymth=None, tock=0.0):
@@ -155,7 +155,7 @@ class Poster(doing.DoDoer):
 
     def sendDirect(self, hab, ends, serder, atc):
         for ctrl, locs in ends.items():
-            witer = agenting.messengerFrom(hab=hab, pre=ctrl, urls=locs)
+            witer = agenting.messengerFrom(hab=hab, pre=ctrl, urls=locs, pooler=self.hby.pooler)
 
             msg = bytearray(serder.raw)
             if atc is not None:
@@ -192,7 +192,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox, pooler=self.hby.pooler)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -202,6 +202,9 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        if isinstance(witer, agenting.HTTPMessenger):  # response received so return connection to pool
+            self.remove([witer])
+
     def forwardToWitness(self, hab, ends, recp, serder, atc, topic):
         # If we are one of the mailboxes, just store locally in mailbox
         owits = oset(ends.keys())
@@ -225,7 +228,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox, pooler=self.hby.pooler)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -235,6 +238,9 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        if isinstance(witer, agenting.HTTPMessenger):  # response received so return connection to pool
+            self.remove([witer])
+
 
 class StreamPoster:
     """
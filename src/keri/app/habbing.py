@@ -13,7 +13,7 @@ from hio.base import doing
 from hio.help import hicting
 
 from keri.peer import exchanging
-from . import keeping, configing
+from . import keeping, configing, pooling
 from .. import help
 from .. import kering
 from ..core import coring, eventing, parsing, routing, serdering
@@ -127,6 +127,8 @@ class Habery:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pooler (pooling.Pooler): pool of keep-alive connections to remote
+            witness and controller endpoints shared by messengers
 
         habs (dict): Hab instances keyed by prefix.
             To look up Hab by name use use .habByName
@@ -225,6 +227,7 @@ class Habery:
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy,
                                   exc=self.exc, local=True)
+        self.pooler = pooling.Pooler()
         self.habs = {}  # empty .habs
         self.namespaces = {}  # empty .namespaces
         self._signator = None
@@ -735,6 +738,8 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        self.pooler.close()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
@@ -809,8 +814,12 @@ class Habery:
           dt: "isodatetime",
           curls: ["tcp://localhost:5620/"],
           iurls: ["tcp://localhost:5621/?name=eve"],
+          binary: true
         }
 
+        binary true means store indexed signatures and post to http endpoints
+        that accept it in binary domain qb2. See Baser.binary
+
         Config file is meant to be read only at init not changed by app at
         run time. Any dynamic app changes must go in database not config file
         that way we don't have to worry about multiple writers of cf.
@@ -819,6 +828,8 @@ class Habery:
 
         """
         conf = self.cf.get()
+        if "binary" in conf:  # wire and storage domain of attachments
+            self.db.binary = True if conf["binary"] else False
         if "dt" in conf:  # datetime of config file
             dt = help.fromIso8601(conf["dt"])  # raises error if not convert
             if "iurls" in conf:  # process OOBI URLs
@@ -1000,7 +1011,12 @@ class BaseHab:
         accepted (bool): True means accepted into local KEL.
                           False otherwise
 
+    Class Attributes:
+        ReplayChunkSize (int): default max bytes of each chunk of framed
+            messages yielded by .replayIter and .replayAllIter
+
     """
+    ReplayChunkSize = 1 << 16  # 64 KiB
 
     def __init__(self, ks, db, cf, mgr, rtr, rvy, kvy, psr, *,
                  name='test', ns=None, pre=None, temp=False):
@@ -1469,11 +1485,16 @@ class BaseHab:
 
         return msg
 
-    def receipt(self, serder):
+    def receipt(self, serder, binary=False):
         """
         Returns own receipt, rct, message of serder with count code and receipt
         couples (pre+cig)
         Builds msg and then processes it into own db to validate
+
+        Parameters:
+            serder (SerderKERI): event to receipt
+            binary (bool): True means attachments in binary domain qb2
+                False means text domain qb64
         """
         ked = serder.ked
         reserder = eventing.receipt(pre=ked["i"],
@@ -1487,17 +1508,18 @@ class BaseHab:
                                       d=self.kever.lastEst.d)
             sigers = self.sign(ser=serder.raw,
                                indexed=True)
-            msg = eventing.messagize(serder=reserder, sigers=sigers, seal=seal)
+            msg = eventing.messagize(serder=reserder, sigers=sigers, seal=seal,
+                                     binary=binary)
         else:
             cigars = self.sign(ser=serder.raw,
                                indexed=False)
-            msg = eventing.messagize(reserder, cigars=cigars)
+            msg = eventing.messagize(reserder, cigars=cigars, binary=binary)
 
         self.psr.parseOne(ims=bytearray(msg))  # process local copy into db
         return msg
 
 
-    def witness(self, serder):
+    def witness(self, serder, binary=False):
         """
         Returns own receipt, rct, message of serder with count code and witness
         indexed receipt signatures if key state of serder.pre shows that own pre
@@ -1508,6 +1530,11 @@ class BaseHab:
         being witnessed has been accepted as valid event into this hab
         controller's KEL
 
+        Parameters:
+            serder (SerderKERI): event to witness
+            binary (bool): True means attachments in binary domain qb2
+                False means text domain qb64
+
         """
         if self.kever.prefixer.transferable:  # not non-transferable prefix
             raise ValueError("Attempt to create witness receipt with"
@@ -1534,12 +1561,13 @@ class BaseHab:
                                pubs=[self.pre],
                                indices=[index])
 
-        msg = eventing.messagize(reserder, wigers=wigers, pipelined=True)
+        msg = eventing.messagize(reserder, wigers=wigers, pipelined=True,
+                                 binary=binary)
         self.psr.parseOne(ims=bytearray(msg))  # process local copy into db
         return msg
 
 
-    def replay(self, pre=None, fn=0):
+    def replay(self, pre=None, fn=0, binary=False):
         """
         Returns replay of FEL first seen event log for pre starting from fn
         Default pre is own .pre
@@ -1548,33 +1576,108 @@ class BaseHab:
             pre is qb64 str or bytes of identifier prefix.
                 default is own .pre
             fn is int first seen ordering number
+            binary (bool): True means attachments in binary domain qb2
+
+        """
+        return bytearray().join(chunk for _, chunk in self.replayIter(pre=pre,
+                                                                      fn=fn,
+                                                                      binary=binary))
+
+    def replayIter(self, pre=None, fn=0, size=None, binary=False):
+        """
+        Returns generator of replay of FEL first seen event log for pre starting
+        from fn in bounded chunks so replay of long KEL is not held in memory.
+        Starts with the delegation chain of pre if any.
+
+        Yields:
+            duple (fn, chunk): chunk is bytearray of whole framed messages with
+                attachments of at most size bytes unless a single message is
+                larger. fn is int first seen ordering number of the next event
+                after chunk from which to resume replay
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix. default is own .pre
+            fn (int): first seen ordering number at which to start
+            size (int | None): max bytes of each chunk. None means .ReplayChunkSize
+            binary (bool): True means attachments in binary domain qb2
+                False means text domain qb64
 
         """
         if not pre:
             pre = self.pre
+        if hasattr(pre, 'decode'):
+            pre = pre.decode("utf-8")
+        size = size if size is not None else self.ReplayChunkSize
 
-        msgs = bytearray()
+        chunk = bytearray()
         kever = self.kevers[pre]
-        for msg in self.db.cloneDelegation(kever=kever):
-            msgs.extend(msg)
+        for msg in self.db.cloneDelegation(kever=kever, binary=binary):
+            if chunk and len(chunk) + len(msg) > size:
+                yield fn, chunk
+                chunk = bytearray()
+            chunk.extend(msg)
+
+        for sn, dig in self.db.getFelItemPreIter(pre.encode("utf-8"), fn=fn):
+            try:
+                msg = self.db.cloneEvtMsg(pre=pre, fn=sn, dig=dig, binary=binary)
+            except Exception:
+                continue  # skip this event
+            if chunk and len(chunk) + len(msg) > size:
+                yield fn, chunk
+                chunk = bytearray()
+            chunk.extend(msg)
+            fn = sn + 1
+
+        if chunk:
+            yield fn, chunk
+
+    def replayAll(self, key=b'', binary=False):
+        """
+        Returns replay of FEL first seen event log for all pre starting at key
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
+        Parameters:
+            key (bytes): fnKey(pre, fn)
+            binary (bool): True means attachments in binary domain qb2
 
-        return msgs
+        """
+        return bytearray().join(chunk for _, chunk in self.replayAllIter(key=key,
+                                                                         binary=binary))
 
-    def replayAll(self, key=b''):
+    def replayAllIter(self, key=b'', size=None, binary=False):
         """
-        Returns replay of FEL first seen event log for all pre starting at key
+        Returns generator of replay of FEL first seen event logs for all pre
+        starting at key in bounded chunks so replay of entire database is not
+        held in memory.
+
+        Yields:
+            duple (key, chunk): chunk is bytearray of whole framed messages with
+                attachments of at most size bytes unless a single message is
+                larger. key is fnKey of the next event after chunk from which
+                to resume replay by passing it back as key
 
         Parameters:
-            key (bytes): fnKey(pre, fn)
+            key (bytes): fnKey(pre, fn) at which to start. Empty means first
+            size (int | None): max bytes of each chunk. None means .ReplayChunkSize
+            binary (bool): True means attachments in binary domain qb2
+                False means text domain qb64
 
         """
-        msgs = bytearray()
-        for msg in self.db.cloneAllPreIter(key=key):
-            msgs.extend(msg)
-        return msgs
+        size = size if size is not None else self.ReplayChunkSize
+
+        chunk = bytearray()
+        for pre, fn, dig in self.db.getFelItemAllPreIter(key=key):
+            try:
+                msg = self.db.cloneEvtMsg(pre=pre, fn=fn, dig=dig, binary=binary)
+            except Exception:
+                continue  # skip this event
+            if chunk and len(chunk) + len(msg) > size:
+                yield key, chunk
+                chunk = bytearray()
+            chunk.extend(msg)
+            key = dbing.fnKey(pre, fn + 1)
+
+        if chunk:
+            yield key, chunk
 
     def makeOtherEvent(self, pre, sn):
         """
@@ -1928,7 +2031,7 @@ class BaseHab:
                                            pipelined=True))
         return msgs
 
-    def replyEndRole(self, cid, role=None, eids=None, scheme=""):
+    def replyEndRole(self, cid, role=None, eids=None, scheme="", kel=True):
 
         """
         Returns a reply message stream composed of entries authed by the given
@@ -1962,6 +2065,8 @@ class BaseHab:
             role (str): authorized role for eid
             eids (list): when provided restrict returns to only eids in eids
             scheme (str): url scheme
+            kel (bool): True means lead with replay of KEL of cid.
+                False means caller replays KEL of cid itself such as streaming
         """
         msgs = bytearray()
 
@@ -1971,7 +2076,8 @@ class BaseHab:
         if cid not in self.kevers:
             return msgs
 
-        msgs.extend(self.replay(cid))
+        if kel:
+            msgs.extend(self.replay(cid))
 
         kever = self.kevers[cid]
         witness = self.pre in kever.wits  # see if we are cid's witness
@@ -1994,7 +2100,7 @@ class BaseHab:
 
         return msgs
 
-    def replyToOobi(self, aid, role, eids=None):
+    def replyToOobi(self, aid, role, eids=None, kel=True):
         """
         Returns a reply message stream composed of entries authed by the given
         aid from the appropriate reply database including associated attachments
@@ -2011,12 +2117,14 @@ class BaseHab:
             aid (str): qb64 of identifier in oobi, may be cid or eid
             role (str): authorized role for eid
             eids (list): when provided restrict returns to only eids in eids
+            kel (bool): True means lead with replay of KEL of aid.
+                False means caller replays KEL of aid itself such as streaming
 
         """
         # default logic is that if self.pre is witness of aid and has a loc url
         # for self then reply with loc scheme for all witnesses even if self
         # not permiteed in .habs.oobis
-        return self.replyEndRole(cid=aid, role=role, eids=eids)
+        return self.replyEndRole(cid=aid, role=role, eids=eids, kel=kel)
 
     def getOwnEvent(self, sn, allowPartiallySigned=False):
         """
@@ -2136,8 +2244,8 @@ class BaseHab:
                 yield msgs
 
             elif cueKin in ("replay",):
-                msgs = cue["msgs"]
-                yield msgs
+                for msg in cue["msgs"]:  # one at a time as lazily cloned
+                    yield msg
 
             elif cueKin in ("reply",):
                 data = cue["data"]
@@ -2477,7 +2585,7 @@ class SignifyHab(BaseHab):
             raise kering.ConfigurationError(f"Improper Habitat event type={serder.ked['t']} for "
                                             f"pre={self.pre}.")
 
-    def replyEndRole(self, cid, role=None, eids=None, scheme=""):
+    def replyEndRole(self, cid, role=None, eids=None, scheme="", kel=True):
 
         """
         Returns a reply message stream composed of entries authed by the given
@@ -2511,6 +2619,8 @@ class SignifyHab(BaseHab):
             role (str): authorized role for eid
             eids (list): when provided restrict returns to only eids in eids
             scheme (str): url scheme
+            kel (bool): True means lead with replay of KEL of cid.
+                False means caller replays KEL of cid itself such as streaming
         """
         msgs = bytearray()
 
@@ -2518,7 +2628,8 @@ class SignifyHab(BaseHab):
             eids = []
 
         # introduce yourself, please
-        msgs.extend(self.replay(cid))
+        if kel:
+            msgs.extend(self.replay(cid))
 
         if role == kering.Roles.witness:
             if kever := self.kevers[cid] if cid in self.kevers else None:
@@ -23,8 +23,10 @@ from keri.help import helping
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
+CESR_BINARY_CONTENT_TYPE = "application/cesr"  # whole message in body
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
 CESR_DESTINATION_HEADER = "CESR-DESTINATION"
+CESR_BINARY_REFUSALS = (406, 415)  # statuses of servers that refuse CESR_BINARY_CONTENT_TYPE
 
 
 class SignatureValidationComponent(object):
@@ -75,18 +77,61 @@ class SignatureValidationComponent(object):
 @dataclass
 class CesrRequest:
     payload: dict
-    attachments: str
+    attachments: str | bytes  # bytes when binary
+    binary: bool = False  # True means attachments may be binary domain qb2
+
+    @property
+    def atc(self):
+        """ Returns attachments as bytes """
+        return self.attachments if self.binary else self.attachments.encode("utf-8")
+
+
+def convertAttachments(atc, binary=False):
+    """
+    Returns attachments atc of one message converted to binary domain qb2 when
+    binary else to text domain qb64. Every CESR primitive and group is a whole
+    number of quadlets in text domain and triplets in binary domain whose
+    qb2 is its Base64 decode so the whole attachments convert at once.
+
+    Parameters:
+        atc (bytes | bytearray): attachments all in one domain
+        binary (bool): True means convert to qb2 else to qb64
+    """
+    if not atc:
+        return bytes(atc)
+    cold = kering.sniff(atc)
+    if binary and cold == parsing.Colds.txt:
+        return coring.decodeB64(bytes(atc))
+    if not binary and cold == parsing.Colds.bny:
+        return coring.encodeB64(bytes(atc))
+    return bytes(atc)
 
 
 def parseCesrHttpRequest(req):
     """
     Parse Falcon HTTP request and create a CESR message from the body of the request and the two
     CESR HTTP headers (Date, Attachment).
+    When content type is CESR_BINARY_CONTENT_TYPE the body is the whole message
+    so attachments may be in binary domain qb2.
 
     Parameters
         req (falcon.Request) http request object in CESR format:
 
     """
+    if req.content_type == CESR_BINARY_CONTENT_TYPE:
+        body = req.bounded_stream.read()
+        try:
+            sadder = coring.Sadder(raw=body)
+        except (kering.ExtractionError, ValueError):
+            raise falcon.HTTPError(falcon.HTTP_400,
+                                   title="Malformed CESR",
+                                   description="Could not extract message from "
+                                               "the request body.")
+
+        return CesrRequest(payload=sadder.ked,
+                           attachments=bytes(body[sadder.size:]),
+                           binary=True)
+
     if req.content_type != CESR_CONTENT_TYPE:
         raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
                                title="Content type error",
@@ -113,7 +158,7 @@ def parseCesrHttpRequest(req):
     return cr
 
 
-def createCESRRequest(msg, client, dest, path=None):
+def createCESRRequest(msg, client, dest, path=None, binary=False):
     """
     Turns a KERI message into a CESR http request against the provided hio http Client
 
@@ -122,6 +167,9 @@ def createCESRRequest(msg, client, dest, path=None):
        dest (str): qb64 identifier prefix of destination controller
        client: hio http Client that will send the message as a CESR request
        path (str): path to post to
+       binary (bool): True means post whole message in body with binary
+           domain qb2 attachments as CESR_BINARY_CONTENT_TYPE
+           False means attachments in text domain CESR_ATTACHMENT_HEADER
 
     """
     path = path if path is not None else "/"
@@ -136,13 +184,22 @@ def createCESRRequest(msg, client, dest, path=None):
     attachments = bytearray(msg)
     body = serder.raw
 
-    headers = Hict([
-        ("Content-Type", CESR_CONTENT_TYPE),
-        ("Content-Length", len(body)),
-        ("connection", "close"),
-        (CESR_ATTACHMENT_HEADER, attachments),
-        (CESR_DESTINATION_HEADER, dest)
-    ])
+    if binary:
+        body = serder.raw + convertAttachments(attachments, binary=True)
+        headers = Hict([
+            ("Content-Type", CESR_BINARY_CONTENT_TYPE),
+            ("Content-Length", len(body)),
+            ("connection", "close"),
+            (CESR_DESTINATION_HEADER, dest)
+        ])
+    else:
+        headers = Hict([
+            ("Content-Type", CESR_CONTENT_TYPE),
+            ("Content-Length", len(body)),
+            ("connection", "close"),
+            (CESR_ATTACHMENT_HEADER, attachments),
+            (CESR_DESTINATION_HEADER, dest)
+        ])
 
     client.request(
         method="POST",
@@ -152,15 +209,19 @@ def createCESRRequest(msg, client, dest, path=None):
     )
 
 
-def streamCESRRequests(client, ims, dest, path=None):
+def streamCESRRequests(client, ims, dest, path=None, binary=False):
     """
     Turns a stream of KERI messages into CESR http requests against the provided hio http Client
 
     Parameters
        client (Client): hio http Client that will send the message as a CESR request
-       ims (bytearray):  stream of KERI messages parsable as Serder.raw
+       ims (bytearray):  stream of KERI messages parsable as Serder.raw with
+           text domain attachments
        dest (str): qb64 identifier prefix of destination controller
        path (str): path to post to
+       binary (bool): True means post each whole message in body with binary
+           domain qb2 attachments as CESR_BINARY_CONTENT_TYPE
+           False means attachments in text domain CESR_ATTACHMENT_HEADER
 
     Returns
        int: Number of individual requests posted
@@ -191,12 +252,20 @@ def streamCESRRequests(client, ims, dest, path=None):
 
         body = serder.raw
 
-        headers = Hict([
-            ("Content-Type", CESR_CONTENT_TYPE),
-            ("Content-Length", len(body)),
-            (CESR_ATTACHMENT_HEADER, attachment),
-            (CESR_DESTINATION_HEADER, dest)
-        ])
+        if binary:
+            body = serder.raw + convertAttachments(attachment, binary=True)
+            headers = Hict([
+                ("Content-Type", CESR_BINARY_CONTENT_TYPE),
+                ("Content-Length", len(body)),
+                (CESR_DESTINATION_HEADER, dest)
+            ])
+        else:
+            headers = Hict([
+                ("Content-Type", CESR_CONTENT_TYPE),
+                ("Content-Length", len(body)),
+                (CESR_ATTACHMENT_HEADER, attachment),
+                (CESR_DESTINATION_HEADER, dest)
+            ])
 
         client.request(
             method="POST",
@@ -6,6 +6,7 @@ keri.app.indirecting module
 simple indirect mode demo support classes
 """
 import datetime
+import json
 
 import falcon
 import time
@@ -19,7 +20,7 @@ from hio.core.tcp import serving
 from hio.help import decking
 
 import keri.app.oobiing
-from . import directing, storing, httping, forwarding, agenting, oobiing
+from . import asyncing, directing, storing, httping, forwarding, agenting, oobiing
 from .habbing import GroupHab
 from .. import help, kering
 from ..core import eventing, parsing, routing, coring, serdering
@@ -35,10 +36,18 @@ logger = help.ogler.getLogger()
 
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
-                 keypath=None, certpath=None, cafilepath=None):
+                 keypath=None, certpath=None, cafilepath=None, fallback=None, aio=False):
     """
     Setup witness controller and doers
 
+    Parameters:
+        fallback (float | None): seconds between periodic full escrow scans
+            when witness Kevery reprocesses escrows event driven. None means
+            full scan of escrows on every pass
+        aio (bool): True means serve HTTP from an asyncio event loop thread
+            that hands requests to the Doist thread. See asyncing module.
+            False means serve HTTP from the Doist loop with hio http.Server
+
     """
     cues = decking.Deck()
     doers = []
@@ -67,7 +76,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                           lax=True,
                           local=False,
                           rvy=rvy,
-                          cues=cues)
+                          cues=cues,
+                          fallback=fallback)
     kvy.registerReplyRoutes(router=rvy.rtr)
 
     tvy = Tevery(reger=verfer.reger,
@@ -82,15 +92,26 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             exc=exchanger,
                             rvy=rvy)
 
-    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
+    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx, kvy=kvy)
     app.add_route("/", httpEnd)
     receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
     app.add_route("/receipts", receiptEnd)
+    app.add_route("/ksn", KeyStateEnd(hab=hab, aids=aids))
 
-    server = createHttpServer(httpPort, app, keypath, certpath, cafilepath)
-    if not server.reopen():
-        raise RuntimeError(f"cannot create http server on port {httpPort}")
-    httpServerDoer = http.ServerDoer(server=server)
+    if aio:
+        servicer = asyncing.Servicer()
+        server = asyncing.createServer(httpPort, asyncing.Bridge(app=app, servicer=servicer),
+                                       keypath=keypath, certpath=certpath,
+                                       cafilepath=cafilepath)
+        if not server.reopen():
+            raise RuntimeError(f"cannot create http server on port {httpPort}")
+        doers.append(servicer)
+        httpServerDoer = asyncing.ServerDoer(server=server)
+    else:
+        server = createHttpServer(httpPort, app, keypath, certpath, cafilepath)
+        if not server.reopen():
+            raise RuntimeError(f"cannot create http server on port {httpPort}")
+        httpServerDoer = http.ServerDoer(server=server)
 
     # setup doers
     regDoer = basing.BaserDoer(baser=verfer.reger)
@@ -838,8 +859,9 @@ class HttpEnd:
 
     TimeoutQNF = 30
     TimeoutMBX = 5
+    RetryAfter = 5  # seconds in Retry-After header of throttled response
 
-    def __init__(self, rxbs=None, mbx=None, qrycues=None):
+    def __init__(self, rxbs=None, mbx=None, qrycues=None, kvy=None):
         """
         Create the KEL HTTP server from the Habitat with an optional Falcon App to
         register the routes with.
@@ -848,12 +870,38 @@ class HttpEnd:
              rxbs (bytearray): output queue of bytes for message processing
              mbx (Mailboxer): Mailbox storage
              qrycues (Deck): inbound qry response queues
+             kvy (Kevery): optional Kevery whose full escrows throttle POST
+                with 503 Service Unavailable until there is room. See .throttle
 
         """
         self.rxbs = rxbs if rxbs is not None else bytearray()
 
         self.mbx = mbx
         self.qrycues = qrycues if qrycues is not None else decking.Deck()
+        self.kvy = kvy
+
+    def throttle(self, rep, sadder):
+        """
+        Returns True if .kvy is throttled for message sadder because an escrow
+        it may be escrowed into is full and it may not resolve any escrowed
+        entry in which case sets rep to 503 Service Unavailable with
+        Retry-After so the sender retries later. Otherwise returns False.
+        Throttles per message so traffic that may drain escrows still flows.
+
+        Parameters:
+              rep (Response) Falcon HTTP response
+              sadder (Sadder) message of request
+        """
+        if self.kvy is None or sadder.proto in ("ACDC",):
+            return False
+        ked = sadder.ked
+        pre = ked.get("q", {}).get("i") if ked.get("t") == Ilks.qry else ked.get("i")
+        if not self.kvy.throttled(ked.get("t"), pre):
+            return False
+
+        rep.set_header('Retry-After', str(self.RetryAfter))
+        rep.status = falcon.HTTP_503
+        return True
 
     def on_post(self, req, rep):
         """
@@ -880,18 +928,22 @@ class HttpEnd:
               description: Mailbox query response for server sent events
            204:
               description: KEL or EXN event accepted.
+           503:
+              description: Escrows full. Retry after Retry-After seconds.
         """
         if req.method == "OPTIONS":
             rep.status = falcon.HTTP_200
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         cr = httping.parseCesrHttpRequest(req=req)
         sadder = coring.Sadder(ked=cr.payload, kind=eventing.Serials.json)
+        if self.throttle(rep, sadder):
+            return
+
         msg = bytearray(sadder.raw)
-        msg.extend(cr.attachments.encode("utf-8"))
+        msg.extend(cr.atc)
 
         self.rxbs.extend(msg)
 
@@ -908,6 +960,7 @@ class HttpEnd:
                 rep.status = falcon.HTTP_204
             elif ilk in (Ilks.qry,):
                 if sadder.ked["r"] in ("mbx",):
+                    rep.set_header('connection', "close")  # stream ends by closing
                     rep.set_header('Content-Type', "text/event-stream")
                     rep.status = falcon.HTTP_200
                     rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=sadder.said)
@@ -946,8 +999,8 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
+        # not throttled since stream may hold messages that resolve escrows
         self.rxbs.extend(req.bounded_stream.read())
 
         rep.set_header('Content-Type', "application/json")
@@ -955,6 +1008,7 @@ class HttpEnd:
 
 
 class QryRpyMailboxIterable:
+    Concurrent = True  # safe to iterate concurrently with Doist thread
 
     def __init__(self, cues, mbx, said, retry=5000):
         self.mbx = mbx
@@ -962,6 +1016,7 @@ class QryRpyMailboxIterable:
         self.cues = cues
         self.said = said
         self.iter = None
+        self.watcher = None
 
     def __iter__(self):
         return self
@@ -976,6 +1031,8 @@ class QryRpyMailboxIterable:
                     if kin == "stream":
                         self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
                                                          retry=self.retry))
+                        if self.watcher is not None:
+                            self.iter.watch(self.watcher)
                 else:
                     self.cues.append(cue)
 
@@ -983,15 +1040,55 @@ class QryRpyMailboxIterable:
 
         return next(self.iter)
 
+    @property
+    def watching(self):
+        """
+        Returns True once mailbox stream of query watches its topics so
+        stream need not be polled. False while waiting for query response cue.
+        """
+        return self.iter is not None and self.iter.watching
+
+    def watch(self, watcher):
+        """
+        Calls watcher when a message is stored to topics of mailbox stream
+        once the query response cue starts it. See MailboxIterable.watch
+        """
+        self.watcher = watcher
+        if self.iter is not None:
+            self.iter.watch(watcher)
+
+    def unwatch(self):
+        """
+        Removes watcher if any
+        """
+        self.watcher = None
+        if self.iter is not None:
+            self.iter.unwatch()
+
 
 class MailboxIterable:
+    """
+    Iterable of server sent events of the messages stored to the topics of
+    pre in mailbox. Each next returns the events of new messages if any.
+    A topic is rescanned when its Mailboxer.mark has changed since its last
+    scan so idle streams seldom touch the database. Marks and watchers only
+    see messages stored by this process so all topics are also rescanned
+    every .Rescan seconds to pick up messages stored by other processes
+    sharing the mailbox database. Use .watch to be called back as soon as a
+    message is stored in process instead of polling.
+    """
     TimeoutMBX = 30000000
+    Rescan = 1.0  # seconds between scans of topics with unchanged marks
+    Concurrent = True  # safe to iterate concurrently with Doist thread
 
     def __init__(self, mbx, pre, topics, retry=5000):
         self.mbx = mbx
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.marks = dict()  # mbx topic marks at last scan keyed by topic
+        self.scanned = None  # time of last scan of all topics
+        self.watcher = None
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -1004,8 +1101,16 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
+            now = time.perf_counter()
+            rescan = self.scanned is None or now - self.scanned >= self.Rescan
+            if rescan:
+                self.scanned = now
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                mark = self.mbx.mark(key)
+                if not rescan and self.marks.get(topic) == mark:  # nothing stored in process
+                    continue
+                self.marks[topic] = mark
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -1020,6 +1125,36 @@ class MailboxIterable:
 
         raise StopIteration
 
+    @property
+    def watching(self):
+        """
+        Returns True if watcher is called back on new messages
+        """
+        return self.watcher is not None
+
+    def watch(self, watcher):
+        """
+        Calls watcher with bytes topic from the thread of Mailboxer.storeMsg
+        whenever a message is stored to one of .topics of .pre. Replaces any
+        prior watcher.
+
+        Parameters:
+            watcher (Callable): of topic that must not block
+        """
+        self.unwatch()
+        self.watcher = watcher
+        for topic in self.topics:
+            self.mbx.watch(self.pre + topic, watcher)
+
+    def unwatch(self):
+        """
+        Removes watcher if any
+        """
+        if self.watcher is not None:
+            for topic in self.topics:
+                self.mbx.unwatch(self.pre + topic, self.watcher)
+            self.watcher = None
+
 
 class ReceiptEnd(doing.DoDoer):
     """ Endpoint class for Witnessing receipting functionality
@@ -1056,7 +1191,6 @@ class ReceiptEnd(doing.DoDoer):
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         cr = httping.parseCesrHttpRequest(req=req)
         serder = serdering.SerderKERI(sad=cr.payload, kind=eventing.Serials.json)
@@ -1070,7 +1204,7 @@ class ReceiptEnd(doing.DoDoer):
             raise falcon.HTTPBadRequest(description=f"invalid event type ({ilk})for receipting")
 
         msg = bytearray(serder.raw)
-        msg.extend(cr.attachments.encode("utf-8"))
+        msg.extend(cr.atc)
 
         self.psr.parseOne(ims=msg, local=True)
 
@@ -1082,11 +1216,12 @@ class ReceiptEnd(doing.DoDoer):
                 raise falcon.HTTPBadRequest(description=f"{self.hab.pre} is not a valid witness for {pre} event at "
                                                         f"{serder.sn}: wits={wits}")
 
-            rct = self.hab.receipt(serder)
+            rct = self.hab.receipt(serder, binary=cr.binary)  # reply in kind
 
             self.psr.parseOne(bytes(rct))
 
-            rep.set_header('Content-Type', "application/json+cesr")
+            rep.set_header('Content-Type', httping.CESR_BINARY_CONTENT_TYPE if cr.binary
+                           else "application/json+cesr")
             rep.status = falcon.HTTP_200
             rep.data = rct
         else:
@@ -1178,3 +1313,63 @@ class ReceiptEnd(doing.DoDoer):
                 yield self.tock
 
             yield self.tock
+
+
+class KeyStateEnd:
+    """ Endpoint class for witness key state of witnessed identifiers
+
+    A controller adding this witness first GETs the witness's current key state
+    of its identifier so it only has to send the suffix of its KEL the witness
+    is missing instead of its full KEL.
+
+    """
+
+    def __init__(self, hab, aids=None):
+        """
+        Parameters:
+            hab (Hab): witness habitat
+            aids (list): qb64 identifier prefixes allowed to query or None for any
+
+        """
+        self.hab = hab
+        self.aids = aids
+
+    def on_get(self, req, rep):
+        """  Key state GET endpoint handler
+
+        Parameters:
+            req (Request): Falcon HTTP request object
+            rep (Response): Falcon HTTP response object
+
+        ---
+        summary:  Current key state of identifier as seen by witness
+        description:  Current key state of identifier as seen by witness
+        tags:
+           - Key State
+        parameters:
+          - in: query
+            name: pre
+            schema:
+              type: string
+            required: true
+            description: qb64 identifier prefix
+        responses:
+           200:
+              description: Key state record of identifier
+           404:
+              description: Witness has no key state for identifier
+        """
+        pre = req.get_param("pre")
+        if pre is None:
+            raise falcon.HTTPBadRequest(description="query param 'pre' is required")
+
+        if self.aids is not None and pre not in self.aids:
+            raise falcon.HTTPBadRequest(description=f"invalid AID={pre} for key state")
+
+        if pre not in self.hab.kevers:
+            raise falcon.HTTPNotFound(description=f"no key state for {pre}")
+
+        rep.set_header('Cache-Control', "no-cache")
+        rep.set_header('Content-Type', "application/json")
+        rep.status = falcon.HTTP_200
+        rep.data = json.dumps(self.hab.kevers[pre].state()._asdict()).encode("utf-8")
@@ -0,0 +1,313 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.pooling module
+
+Pool of persistent keep-alive connections to remote witness and controller endpoints
+"""
+import time
+from urllib.parse import urlparse
+
+from hio.base import doing
+from hio.core import http
+from hio.core.tcp import clienting
+
+from .. import help
+from .. import kering
+
+logger = help.ogler.getLogger()
+
+
+class Pooled:
+    """
+    Pooled keep-alive client connection to one endpoint url of a remote identifier.
+    Wraps either a hio http client (http and https schemes) or a hio tcp client
+    (tcp scheme) and reopens the connection with bounded exponential backoff when
+    it is cut off by the remote or refused.
+
+    Attributes:
+        eid (str): qb64 identifier prefix of remote endpoint
+        url (str): endpoint url
+        scheme (str): url scheme, one of kering.Schemes
+        client (http.clienting.Client | clienting.Client): pooled client
+        connector (clienting.Client): tcp connector of .client
+        failures (int): consecutive failed connection attempts
+        retry (float): monotonic time before which not to attempt reconnect
+        leased (bool): True means in use by a messenger, False means idle in pool
+
+    """
+
+    def __init__(self, eid, url):
+        """
+        Initialize instance.
+
+        Parameters:
+            eid (str): qb64 identifier prefix of remote endpoint
+            url (str): endpoint url of scheme http, https or tcp
+
+        """
+        self.eid = eid
+        self.url = url
+        up = urlparse(url)
+        self.scheme = up.scheme
+        if self.scheme in (kering.Schemes.http, kering.Schemes.https):
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            self.connector = self.client.connector
+        elif self.scheme == kering.Schemes.tcp:
+            self.client = clienting.Client(host=up.hostname, port=up.port)
+            self.connector = self.client
+        else:
+            raise kering.ConfigurationError(f"invalid scheme {up.scheme} for pooled connection")
+
+        self.failures = 0
+        self.retry = 0.0
+        self.leased = False
+
+    @property
+    def key(self):
+        """ Returns (eid, scheme) duple pool key of connection """
+        return self.eid, self.scheme
+
+    @property
+    def busy(self):
+        """
+        Returns True if connection has an exchange in flight so can not be handed
+        to another messenger, False otherwise
+        """
+        if self.scheme == kering.Schemes.tcp:
+            return True if self.client.txbs else False
+
+        return True if (self.client.requests or self.client.waited or self.client.responses) else False
+
+    def wind(self, tymth):
+        """ Inject tymth into pooled client """
+        self.client.wind(tymth)
+
+    def open(self):
+        """ Open connection socket if not already opened """
+        if not self.connector.opened:
+            self.client.reopen()
+
+    def close(self):
+        """ Close connection socket """
+        self.client.close()
+
+    def reconnect(self):
+        """
+        Reopen cut off connection.  Any http request in flight is requeued so it
+        is retransmitted once reconnected.
+        """
+        if self.scheme != kering.Schemes.tcp:
+            if self.client.waited and self.client.latest:
+                self.client.requests.appendleft(self.client.latest)
+            self.client.waited = False
+            self.client.latest = None
+            self.connector.txbs.clear()  # requeued request is rebuilt
+            self.connector.rxbs.clear()
+            self.client.respondent.makeParser()
+
+        self.client.reopen()
+
+    def service(self, now=None):
+        """
+        Service client connect, sends and receives.  Reconnects when cut off
+        and backs off reconnect attempts after each refused connect up to
+        Pooler.MaxBackoff.
+
+        Parameters:
+            now (float): monotonic time now, defaults to time.monotonic()
+
+        """
+        now = now if now is not None else time.monotonic()
+        if self.connector.cutoff:
+            logger.info("Pooled connection to %s at %s cut off, reconnecting", self.eid, self.url)
+            self.reconnect()
+
+        if not self.connector.connected and now < self.retry:
+            return
+
+        cs = self.connector.cs
+        self.client.service()
+
+        if self.connector.connected:
+            self.failures = 0
+        elif self.connector.cs is not cs:  # refused connect reopens socket so back off
+            self.failures += 1
+            self.retry = now + min(Pooler.Backoff * 2 ** (self.failures - 1), Pooler.MaxBackoff)
+
+
+class Pooler:
+    """
+    Per Habery pool of persistent keep-alive client connections keyed by
+    (eid, scheme).  Messengers lease a connection, service it while exchanging
+    messages and release it when removed so the next exchange with the same
+    remote identifier reuses the open connection instead of connecting anew.
+
+    Idle connections are only kept while some PoolerDoer of the pool is running
+    and are closed when the last one exits.
+
+    Attributes:
+        idle (dict): lists of idle Pooled connections keyed by (eid, scheme)
+        users (int): number of running PoolerDoers of this pool
+        leases (int): total connections leased
+        opens (int): total connections created
+
+    """
+
+    Backoff = 0.125  # delay in seconds before first reconnect retry after refusal
+    MaxBackoff = 8.0  # upper bound in seconds of reconnect retry delay
+    MaxIdle = 2  # maximum idle connections kept per (eid, scheme)
+
+    def __init__(self, maxIdle=None):
+        """
+        Initialize instance.
+
+        Parameters:
+            maxIdle (int): maximum idle connections kept per (eid, scheme)
+
+        """
+        self.maxIdle = maxIdle if maxIdle is not None else self.MaxIdle
+        self.idle = dict()
+        self.users = 0
+        self.leases = 0
+        self.opens = 0
+
+    def lease(self, eid, url):
+        """
+        Returns Pooled connection to url of eid for exclusive use, reusing an idle
+        pooled connection of the same (eid, scheme) and url when available
+
+        Parameters:
+            eid (str): qb64 identifier prefix of remote endpoint
+            url (str): endpoint url
+
+        """
+        key = (eid, urlparse(url).scheme)
+        pooled = None
+        conns = self.idle.get(key, [])
+        while conns:
+            conn = conns.pop()
+            if conn.url == url:
+                pooled = conn
+                break
+            conn.close()  # endpoint url changed so stale
+        if not conns:
+            self.idle.pop(key, None)
+
+        if pooled is None:
+            pooled = Pooled(eid=eid, url=url)
+            self.opens += 1
+        elif pooled.connector.connected:
+            pooled.connector.serviceReceives()  # detect remote close while idle
+
+        pooled.leased = True
+        self.leases += 1
+        return pooled
+
+    def release(self, pooled):
+        """
+        Returns leased connection to pool for reuse.  Connections with an
+        exchange still in flight or beyond .maxIdle are closed instead.
+
+        Parameters:
+            pooled (Pooled): connection from .lease
+
+        """
+        if not pooled.leased:
+            return
+
+        pooled.leased = False
+        conns = self.idle.setdefault(pooled.key, [])
+        if pooled.busy or len(conns) >= self.maxIdle:
+            pooled.close()
+            if not conns:
+                del self.idle[pooled.key]
+            return
+
+        conns.append(pooled)
+
+    def close(self):
+        """ Close all idle pooled connections """
+        for conns in self.idle.values():
+            for conn in conns:
+                conn.close()
+        self.idle = dict()
+
+
+class PooledDoer(doing.Doer):
+    """
+    Doer that services a leased Pooled connection in place of a hio ClientDoer
+    and releases it back to its Pooler on exit instead of closing it.
+
+    Attributes:
+        pooler (Pooler): pool that leased connection
+        pooled (Pooled): leased connection
+
+    """
+
+    def __init__(self, pooler, pooled, **kwa):
+        """
+        Initialize instance.
+
+        Parameters:
+            pooler (Pooler): pool that leased connection
+            pooled (Pooled): leased connection
+
+        """
+        super(PooledDoer, self).__init__(**kwa)
+        self.pooler = pooler
+        self.pooled = pooled
+
+    def wind(self, tymth):
+        """ Inject tymth into pooled client """
+        super(PooledDoer, self).wind(tymth)
+        self.pooled.wind(tymth)
+
+    def enter(self):
+        """ Open connection if new or closed """
+        self.pooled.open()
+
+    def recur(self, tyme):
+        """ Service connection """
+        self.pooled.service()
+
+    def exit(self):
+        """ Release connection back to pool """
+        self.pooler.release(self.pooled)
+
+
+class PoolerDoer(doing.Doer):
+    """
+    Doer run by each user of a Pooler that keeps the pool's idle connections
+    alive while any user runs and closes them when the last user exits.
+
+    Attributes:
+        pooler (Pooler): shared pool
+
+    """
+
+    def __init__(self, pooler, **kwa):
+        """
+        Initialize instance.
+
+        Parameters:
+            pooler (Pooler): shared pool
+
+        """
+        super(PoolerDoer, self).__init__(**kwa)
+        self.pooler = pooler
+
+    def enter(self):
+        """ Register as user of pool """
+        self.pooler.users += 1
+
+    def recur(self, tyme):
+        """ Nothing to do until exit """
+        return False
+
+    def exit(self):
+        """ Unregister as user of pool and close idle connections when last """
+        self.pooler.users -= 1
+        if self.pooler.users <= 0:
+            self.pooler.users = 0
+            self.pooler.close()
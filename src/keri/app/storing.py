@@ -3,6 +3,7 @@
 keri.app.storing module
 
 """
+import threading
 
 from hio.base import doing
 from hio.help import decking
@@ -21,6 +22,15 @@ class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Subscribers avoid rescanning idle topics by comparing the .mark of a topic
+    with the mark at their last scan and may .watch a topic to be called back
+    by .storeMsg as soon as a message is stored to that topic. Marks and
+    watchers are in memory so only see messages stored by this instance.
+
+    Attributes:
+        marks (dict): count of messages stored since open keyed by bytes topic
+        watchers (dict): of sets of watcher callables keyed by bytes topic
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
@@ -37,6 +47,9 @@ class Mailboxer(dbing.LMDBer):
         """
         self.tpcs = None
         self.msgs = None
+        self.marks = dict()
+        self.watchers = dict()
+        self._watchLock = threading.Lock()  # watchers change off Doist thread
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -114,7 +127,58 @@ class Mailboxer(dbing.LMDBer):
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
         self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        result = self.msgs.pin(keys=digb, val=msg)
+
+        self.marks[topic] = self.marks.get(topic, 0) + 1
+        with self._watchLock:
+            watchers = list(self.watchers.get(topic, ()))
+        for watcher in watchers:
+            watcher(topic)
+        return result
+
+    def mark(self, topic):
+        """
+        Returns int count of messages stored to topic by this process since
+        open. Changes whenever a message is stored to topic through this
+        Mailboxer. Messages stored by other processes sharing the database do
+        not change it so subscribers must still rescan topic periodically.
+
+        Parameters:
+            topic (str | bytes): identifier prefix/topic
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+        return self.marks.get(topic, 0)
+
+    def watch(self, topic, watcher):
+        """
+        Adds watcher to be called with bytes topic by .storeMsg on the thread
+        that stores each message to topic. Thread safe.
+
+        Parameters:
+            topic (str | bytes): identifier prefix/topic
+            watcher (Callable): of topic that must not block
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+        with self._watchLock:
+            self.watchers.setdefault(topic, set()).add(watcher)
+
+    def unwatch(self, topic, watcher):
+        """
+        Removes watcher of topic if any. Thread safe.
+
+        Parameters:
+            topic (str | bytes): identifier prefix/topic
+            watcher (Callable): added by .watch
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+        with self._watchLock:
+            if (watchers := self.watchers.get(topic)) is not None:
+                watchers.discard(watcher)
+                if not watchers:
+                    del self.watchers[topic]
 
     def cloneTopicIter(self, topic, fn=0):
         """
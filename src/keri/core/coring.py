@@ -8,11 +8,12 @@ import json
 from typing import Union
 from collections.abc import Sequence, Mapping
 
-from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
+from dataclasses import dataclass
+from collections import namedtuple, deque, OrderedDict
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from fractions import Fraction
+from math import lcm
 
 import cbor2 as cbor
 import msgpack
@@ -25,7 +26,7 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from cryptography.hazmat.primitives.asymmetric import ec, utils
 
-from ..kering import MaxON
+from ..kering import MaxON, codexCodes, inCodex
 
 from ..kering import (EmptyMaterialError, RawMaterialError, InvalidCodeError,
                       InvalidCodeSizeError, InvalidVarIndexError,
@@ -227,6 +228,121 @@ def nabSextets(b, l):
     return (i.to_bytes(n, 'big'))
 
 
+# Precomputed code decode tables so sniffing codes and decoding soft sizes
+# from streams need no str allocation nor str keyed dict lookups.
+# B64IdxByOrd maps byte ordinal to Base64 index. Non Base64 bytes map to 64
+B64IdxByOrd = bytes(B64IdxByChr.get(chr(o), 64) for o in range(256))
+HeadSize = 65  # stride of head table rows, 64 sextets plus 1 for non Base64
+
+
+def decodeTables(sizes):
+    """
+    Returns duple (heads, longs) of code decode tables generated from code
+    sizes table, sizes, whose values are namedtuples with hs field first.
+
+    heads (list): indexed by (first sextet * HeadSize) + second sextet of code.
+        Value is None when not a code start, tuple (hard, *sizes[hard]) when
+        hard size hs <= 2 else int hs of longer hard code
+    longs (dict): keyed by int of all hs sextets of hard codes longer than 2
+        with leading sentinel 1 bit above them. Value is tuple (hard, *sizes[hard])
+
+    Parameters:
+        sizes (dict): code sizes table such as Matter.Sizes
+    """
+    heads = [None] * (HeadSize * HeadSize)
+    longs = {}
+    for hard, sizage in sizes.items():
+        entry = (hard, *sizage)
+        i0 = B64IdxByChr[hard[0]]
+        if sizage.hs == 1:  # any second sextet
+            for i1 in range(64):
+                heads[i0 * HeadSize + i1] = entry
+        elif sizage.hs == 2:
+            heads[i0 * HeadSize + B64IdxByChr[hard[1]]] = entry
+        else:
+            heads[i0 * HeadSize + B64IdxByChr[hard[1]]] = sizage.hs
+            longs[(1 << (6 * sizage.hs)) | b64ToInt(hard)] = entry
+    return heads, longs
+
+
+def b64Sextets(qb64b, start, end):
+    """
+    Returns int value of Base64 chars from start to end of qb64b or None when
+    qb64b is too short or any char is not Base64
+
+    Parameters:
+        qb64b (bytes | bytearray | memoryview): Base64 chars
+        start (int): index of first char
+        end (int): index after last char
+    """
+    if len(qb64b) < end:
+        return None
+    i = 0
+    for k in range(start, end):
+        x = B64IdxByOrd[qb64b[k]]
+        if x > 63:
+            return None
+        i = (i << 6) | x
+    return i
+
+
+def b2Sextets(qb2, start, end):
+    """
+    Returns int value of sextets from start to end of front of qb2 or None
+    when qb2 is too short
+
+    Parameters:
+        qb2 (bytes | bytearray | memoryview): Base2 bytes
+        start (int): index of first sextet
+        end (int): index after last sextet
+    """
+    n = (end * 3 + 3) // 4  # min bytes to hold end sextets
+    if len(qb2) < n:
+        return None
+    i = int.from_bytes(qb2[:n], "big") >> (n * 8 - end * 6)
+    return i & ((1 << (6 * (end - start))) - 1)
+
+
+def sniffB64(qb64b, decodes):
+    """
+    Returns tuple (hard, *sizes) of code at front of Base64 qb64b from
+    decode tables, decodes, or None when not found in tables or too short
+    to tell. None means use full lookup which raises the appropriate error.
+
+    Parameters:
+        qb64b (bytes | bytearray | memoryview): Base64 chars
+        decodes (tuple): (heads, longs) from decodeTables
+    """
+    if len(qb64b) < 2:
+        return None
+    heads, longs = decodes
+    entry = heads[B64IdxByOrd[qb64b[0]] * HeadSize + B64IdxByOrd[qb64b[1]]]
+    if entry.__class__ is int:  # longer hard code
+        i = b64Sextets(qb64b, 0, entry)
+        entry = None if i is None else longs.get((1 << (6 * entry)) | i)
+    return entry
+
+
+def sniffB2(qb2, decodes):
+    """
+    Returns tuple (hard, *sizes) of code at front of Base2 qb2 from decode
+    tables, decodes, or None when not found in tables or too short to tell.
+    None means use full lookup which raises the appropriate error.
+
+    Parameters:
+        qb2 (bytes | bytearray | memoryview): Base2 bytes
+        decodes (tuple): (heads, longs) from decodeTables
+    """
+    if len(qb2) < 2:
+        return None
+    heads, longs = decodes
+    entry = heads[(qb2[0] >> 2) * HeadSize + (((qb2[0] & 0x03) << 4) | (qb2[1] >> 4))]
+    if entry.__class__ is int:  # longer hard code
+        i = b2Sextets(qb2, 0, entry)
+        entry = None if i is None else longs.get((1 << (6 * entry)) | i)
+    return entry
+
+
 def dumps(ked, kind=Serials.json):
     """
     utility function to handle serialization by kind
@@ -456,7 +572,10 @@ class MatterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(codexCodes(self))  # enables inclusion test with "in"
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 MtrDex = MatterCodex()  # Make instance
@@ -479,7 +598,10 @@ class SmallVarRawSizeCodex:
     Lead2: str = '6'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
@@ -500,7 +622,10 @@ class LargeVarRawSizeCodex:
     Lead2_Big: str = '9'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
@@ -522,7 +647,10 @@ class BextCodex:
     StrB64_Big_L2: str = '9AAA'  # String Base64 Only Big Leader Size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 BexDex = BextCodex()  # Make instance
@@ -544,7 +672,10 @@ class TextCodex:
     Bytes_Big_L2: str = '9AAB'  # Byte String big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 TexDex = TextCodex()  # Make instance
@@ -566,7 +697,10 @@ class CipherX25519VarCodex:
     X25519_Cipher_Big_L2: str = '9AAD'  # X25519 sealed box cipher bytes of sniffable plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 CiXVarDex = CipherX25519VarCodex()  # Make instance
@@ -584,7 +718,10 @@ class CipherX25519FixQB64Codex:
     X25519_Cipher_Salt:   str = '1AAH'  # X25519 sealed box 100 char qb64 Cipher of 24 char qb64 Salt
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 CiXFixQB64Dex = CipherX25519FixQB64Codex()  # Make instance
@@ -606,7 +743,10 @@ class CipherX25519VarQB64Codex:
     X25519_Cipher_QB64_Big_L2: str = '9AAD'  # X25519 sealed box cipher bytes of QB64 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 CiXVarQB64Dex = CipherX25519VarQB64Codex()  # Make instance
@@ -630,7 +770,10 @@ class CipherX25519AllQB64Codex:
     X25519_Cipher_QB64_Big_L2: str = '9AAD'  # X25519 sealed box cipher bytes of QB64 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 CiXAllQB64Dex = CipherX25519AllQB64Codex()  # Make instance
@@ -652,7 +795,10 @@ class CipherX25519QB2VarCodex:
     X25519_Cipher_Big_L2: str = '9AAE'  # X25519 sealed box cipher bytes of QB2 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 CiXVarQB2Dex = CipherX25519QB2VarCodex()  # Make instance
@@ -673,7 +819,10 @@ class NonTransCodex:
     ECDSA_256r1N: str = "1AAI"  # ECDSA secp256r1 verification key non-transferable, basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 NonTransDex = NonTransCodex()  # Make instance
@@ -699,7 +848,10 @@ class DigCodex:
     SHA2_512: str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 DigDex = DigCodex()  # Make instance
@@ -725,7 +877,10 @@ class NumCodex:
     Vast:    str = 'U'  # Vast 17 byte b2 number
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 NumDex = NumCodex()  # Make instance
@@ -780,8 +935,14 @@ class Matter:
         _exfil (types.MethodType): extracts .code and .raw from qb64b
                                    (fully qualified Base64)
 
+    Class Attributes:
+        Trusts (set): of (class, hard code) duples of each class and code of
+            which ._fromTrusted fully validated an instance so that later
+            instances of that class and code skip validation.
+
     """
     Codex = MtrDex
+    Trusts = set()  # shared by Indexer so keyed by class too
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
     # unless fs is None which allows for variable size multiple of 4, i.e.
@@ -886,6 +1047,9 @@ class Matter:
     # Bards table maps first code char. converted to binary sextext of hard size,
     # hs. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Decodes tables are generated from Sizes for sniffing codes by sextet
+    # values without str allocation. See decodeTables
+    Decodes = decodeTables(Sizes)
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -938,11 +1102,11 @@ class Matter:
                 if code[0] in SmallVrzDex:  # compute code with sizes
                     if size <= (64 ** 2 - 1):
                         hs = 2
-                        s = astuple(SmallVrzDex)[ls]
+                        s = codexCodes(SmallVrzDex)[ls]
                         code = f"{s}{code[1:hs]}"
                     elif size <= (64 ** 4 - 1):  # make big version of code
                         hs = 4
-                        s = astuple(LargeVrzDex)[ls]
+                        s = codexCodes(LargeVrzDex)[ls]
                         code = f"{s}{'A' * (hs - 2)}{code[1]}"
                     else:
                         raise InvalidVarRawSizeError(r"Unsupported raw size for "
@@ -950,7 +1114,7 @@ class Matter:
                 elif code[0] in LargeVrzDex:  # compute code with sizes
                     if size <= (64 ** 4 - 1):
                         hs = 4
-                        s = astuple(LargeVrzDex)[ls]
+                        s = codexCodes(LargeVrzDex)[ls]
                         code = f"{s}{code[1:hs]}"
                     else:
                         raise InvalidVarRawSizeError(r"Unsupported raw size for "
@@ -992,6 +1156,61 @@ class Matter:
             raise EmptyMaterialError(f"Improper initialization need either "
                                      f"(raw and code) or qb64b or qb64 or qb2.")
 
+    @classmethod
+    def _fromTrusted(cls, qb64b, strip=False):
+        """
+        Returns new instance of cls from qb64b of trusted source such as values
+        read back from own database that were validated when written.
+        Skips re-validation of code, sizes and pad bits and the code checks of
+        subclass init. The first instance of each class and hard code is
+        constructed and validated as usual. The rest are made without init
+        with .code, .size and .raw assigned here and the code derived
+        attributes, such as verification functions, assigned by ._bind.
+        Material whose code may not be sniffed is always fully validated.
+
+        Not for subclasses with attributes derived from raw such as Signer.
+
+        Parameters:
+            qb64b (bytes | bytearray | memoryview): trusted fully qualified
+                Base64 that starts with the primitive
+            strip (bool): True means strip (delete) primitive from qb64b
+                bytearray. False means do not strip
+        """
+        entry = sniffB64(qb64b, cls.Decodes)
+        if entry is None or (cls, entry[0]) not in Matter.Trusts:  # validate
+            if isinstance(qb64b, memoryview):
+                qb64b = bytes(qb64b)
+            inst = cls(qb64b=qb64b, strip=strip)
+            if entry is not None:
+                Matter.Trusts.add((cls, inst.code))
+            return inst
+
+        hard, hs, ss, fs, ls = entry
+        cs = hs + ss
+        size = None
+        if not fs:  # variable sized
+            size = b64Sextets(qb64b, hs, cs)
+            fs = (size * 4) + cs
+        ps = cs % 4  # when ps then not ls and vice versa
+        raw = decodeB64(ps * b'A' + bytes(qb64b[cs:fs]))[ps + ls:]
+        if strip:  # assumes bytearray
+            del qb64b[:fs]
+
+        inst = cls.__new__(cls)
+        inst._code = hard
+        inst._size = size
+        inst._raw = raw
+        inst._bind()
+        return inst
+
+    def _bind(self):
+        """
+        Assigns attributes derived from .code such as the cipher suite
+        functions of subclasses. Subclasses whose init assigns other
+        attributes override to assign them for ._fromTrusted instances
+        made without init.
+        """
+
     @classmethod
     def _rawSize(cls, code):
         """
@@ -1219,40 +1438,49 @@ class Matter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
-                raise UnexpectedCountCodeError("Unexpected count code start"
-                                               "while extracing Matter.")
-            elif first[0] == '_':
-                raise UnexpectedOpCodeError("Unexpected  op code start"
-                                            "while extracing Matter.")
-            else:
-                raise UnexpectedCodeError(f"Unsupported code start char={first}.")
+        # whole code is at most 8 chars so only convert those from str
+        head = qb64b[:8].encode("utf-8") if hasattr(qb64b, "encode") else qb64b
+        entry = sniffB64(head, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = qb64b[:1]  # extract first char code selector
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
+            if first not in self.Hards:
+                if first[0] == '-':
+                    raise UnexpectedCountCodeError("Unexpected count code start"
+                                                   "while extracing Matter.")
+                elif first[0] == '_':
+                    raise UnexpectedOpCodeError("Unexpected  op code start"
+                                                "while extracing Matter.")
+                else:
+                    raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
-        if len(qb64b) < hs:  # need more bytes
-            raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
+            hs = self.Hards[first]  # get hard code size
+            if len(qb64b) < hs:  # need more bytes
+                raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
-        hard = qb64b[:hs]  # extract hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # converts bytes/bytearray to str
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+            hard = qb64b[:hs]  # extract hard code
+            if hasattr(hard, "decode"):
+                hard = hard.decode("utf-8")  # converts bytes/bytearray to str
+            if hard not in self.Sizes:
+                raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+
+            hs, ss, fs, ls = self.Sizes[hard]  # assumes hs in both tables match
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs in both tables match
         cs = hs + ss  # both hs and ss
         size = None
         if not fs:  # compute fs from size chars in ss part of code
             if cs % 4:
                 raise ValidationError(f"Whole code size not multiple of 4 for "
                                       f"variable length material. cs={cs}.")
-            size = qb64b[hs:hs + ss]  # extract size chars
-            if hasattr(size, "decode"):
-                size = size.decode("utf-8")
-            size = b64ToInt(size)  # compute int size
+            size = b64Sextets(head, hs, cs)
+            if size is None:  # short or not Base64 so convert chars
+                size = qb64b[hs:hs + ss]  # extract size chars
+                if hasattr(size, "decode"):
+                    size = size.decode("utf-8")
+                size = b64ToInt(size)  # compute int size
             fs = (size * 4) + cs
 
         # assumes that unit tests on Matter and MatterCodex ensure that
@@ -1310,27 +1538,32 @@ class Matter:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bards:
-            if first[0] == b'\xf8':  # b64ToB2('-')
-                raise UnexpectedCountCodeError("Unexpected count code start"
-                                               "while extracing Matter.")
-            elif first[0] == b'\xfc':  # b64ToB2('_')
-                raise UnexpectedOpCodeError("Unexpected  op code start"
-                                            "while extracing Matter.")
-            else:
-                raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
+        entry = sniffB2(qb2, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = nabSextets(qb2, 1)  # extract first sextet as code selector
+            if first not in self.Bards:
+                if first[0] == b'\xf8':  # b64ToB2('-')
+                    raise UnexpectedCountCodeError("Unexpected count code start"
+                                                   "while extracing Matter.")
+                elif first[0] == b'\xfc':  # b64ToB2('_')
+                    raise UnexpectedOpCodeError("Unexpected  op code start"
+                                                "while extracing Matter.")
+                else:
+                    raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
 
-        hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
-        if len(qb2) < bhs:  # need more bytes
-            raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
+            hs = self.Bards[first]  # get code hard size equvalent sextets
+            bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+            if len(qb2) < bhs:  # need more bytes
+                raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
 
-        hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+            hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
+            if hard not in self.Sizes:
+                raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+
+            hs, ss, fs, ls = self.Sizes[hard]
 
-        hs, ss, fs, ls = self.Sizes[hard]
         cs = hs + ss  # both hs and ss
         bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
         size = None
@@ -1342,8 +1575,7 @@ class Matter:
             if len(qb2) < bcs:  # need more bytes
                 raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
-            both = codeB2ToB64(qb2, cs)  # extract and convert both hard and soft part of code
-            size = b64ToInt(both[hs:hs + ss])  # get size
+            size = b2Sextets(qb2, hs, cs)  # get size
             fs = (size * 4) + cs
 
         # assumes that unit tests on Matter and MatterCodex ensure that
@@ -2366,7 +2598,12 @@ class Verfer(Matter):
 
         """
         super(Verfer, self).__init__(**kwa)
+        self._bind()
 
+    def _bind(self):
+        """
+        Assign verification cipher suite function to ._verify given .code
+        """
         if self.code in [MtrDex.Ed25519N, MtrDex.Ed25519]:
             self._verify = self._ed25519
         elif self.code in [MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256r1]:
@@ -2388,6 +2625,31 @@ class Verfer(Matter):
         """
         return (self._verify(sig=sig, ser=ser, key=self.raw))
 
+    @staticmethod
+    def verifyBatch(triples):
+        """
+        Returns list of bools, one per triple in order, where True means
+        signature verified and False otherwise. Each triple is verified using
+        its verfer's cipher suite. Duplicate triples in the batch are only
+        verified once so repeated attachments across events cost nothing extra.
+        Failures are identified per item so one bad signature does not
+        invalidate the rest of the batch.
+
+        Parameters:
+            triples (Iterable): of (verfer, sig, ser) triples where
+                verfer is Verfer instance of public key
+                sig is bytes signature
+                ser is bytes serialization
+        """
+        results = []
+        memo = {}
+        for verfer, sig, ser in triples:
+            key = (verfer.qb64b, bytes(sig), bytes(ser))
+            if key not in memo:
+                memo[key] = verfer.verify(sig, ser)
+            results.append(memo[key])
+        return results
+
     @staticmethod
     def _ed25519(sig, ser, key):
         """
@@ -2501,6 +2763,12 @@ class Cigar(Matter):
         super(Cigar, self).__init__(**kwa)
         self._verfer = verfer
 
+    def _bind(self):
+        """
+        Assign no verfer to ._verfer of ._fromTrusted instance
+        """
+        self._verfer = None
+
     @property
     def verfer(self):
         """
@@ -2615,6 +2883,16 @@ class Signer(Matter):
 
         self._verfer = verfer
 
+    @classmethod
+    def _fromTrusted(cls, qb64b, strip=False):
+        """
+        Returns new fully constructed instance since .verfer is derived from
+        raw seed so may not be copied from template. See Matter._fromTrusted
+        """
+        if isinstance(qb64b, memoryview):
+            qb64b = bytes(qb64b)
+        return cls(qb64b=qb64b, strip=strip)
+
     @property
     def verfer(self):
         """
@@ -2885,6 +3163,12 @@ class Salter(Matter):
 
         self.tier = tier if tier is not None else self.Tier
 
+    def _bind(self):
+        """
+        Assign default .tier to ._fromTrusted instance
+        """
+        self.tier = self.Tier
+
     def stretch(self, *, size=32, path="", tier=None, temp=False):
         """
         Returns (bytes): raw binary seed (secret) derived from path and .raw
@@ -3060,7 +3344,12 @@ class Encrypter(Matter):
             raw = pysodium.crypto_sign_pk_to_box_pk(verfer.raw)
 
         super(Encrypter, self).__init__(raw=raw, code=code, **kwa)
+        self._bind()
 
+    def _bind(self):
+        """
+        Assign encrypting cipher suite function to ._encrypt given .code
+        """
         if self.code == MtrDex.X25519:
             self._encrypt = self._x25519
         else:
@@ -3181,6 +3470,12 @@ class Decrypter(Matter):
             else:
                 raise
 
+        self._bind()
+
+    def _bind(self):
+        """
+        Assign decrypting cipher suite function to ._decrypt given .code
+        """
         if self.code == MtrDex.X25519_Private:
             self._decrypt = self._x25519
         else:
@@ -3290,6 +3585,12 @@ class Diger(Matter):
 
             super(Diger, self).__init__(raw=dig, code=code, **kwa)
 
+        self._bind()
+
+    def _bind(self):
+        """
+        Assign digest verification function to ._verify given .code
+        """
         if self.code == MtrDex.Blake3_256:
             self._verify = self._blake3_256
         elif self.code == MtrDex.Blake2b_256:
@@ -3446,7 +3747,10 @@ class PreCodex:
     ECDSA_256r1:   str = "1AAJ"  # ECDSA secp256r1 verification or encryption key, basic derivation
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 PreDex = PreCodex()  # Make instance
@@ -3532,6 +3836,12 @@ class Prefixer(Matter):
             raw, code = self.derive(ked=ked)
             super(Prefixer, self).__init__(raw=raw, code=code, **kwa)
 
+        self._bind()
+
+    def _bind(self):
+        """
+        Assign prefix verification function to ._verify given .code
+        """
         if self.code in [MtrDex.Ed25519N, MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256k1N]:
             self._verify = self._verify_non_transferable
         elif self.code in [MtrDex.Ed25519, MtrDex.ECDSA_256r1, MtrDex.ECDSA_256k1]:
@@ -4065,7 +4375,10 @@ class IndexerCodex:
     TBD4: str = '4z'  # Test of index sig lead 1 big
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(codexCodes(self))  # enables inclusion test with "in"
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 IdrDex = IndexerCodex()
 
@@ -4095,7 +4408,10 @@ class IndexedSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 IdxSigDex = IndexedSigCodex()  # Make instance
 
@@ -4117,7 +4433,10 @@ class IndexedCurrentSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
 
@@ -4140,7 +4459,10 @@ class IndexedBothSigCodex:
     Ed448_Big_Sig: str = '3A'  # Ed448 signature appears in both lists.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 IdxBthSigDex = IndexedBothSigCodex()  # Make instance
 
@@ -4220,6 +4542,9 @@ class Indexer:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Decodes tables are generated from Sizes for sniffing codes by sextet
+    # values without str allocation. See decodeTables
+    Decodes = decodeTables(Sizes)
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0, ondex=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -4502,6 +4827,57 @@ class Indexer:
         return full
 
 
+    @classmethod
+    def _fromTrusted(cls, qb64b, strip=False):
+        """
+        Returns new instance of cls from qb64b of trusted source such as values
+        read back from own database that were validated when written.
+        Skips re-validation of code, indices and pad bits. See
+        Matter._fromTrusted
+
+        Parameters:
+            qb64b (bytes | bytearray | memoryview): trusted fully qualified
+                Base64 that starts with the primitive
+            strip (bool): True means strip (delete) primitive from qb64b
+                bytearray. False means do not strip
+        """
+        entry = sniffB64(qb64b, cls.Decodes)
+        if entry is None or (cls, entry[0]) not in Matter.Trusts:  # validate
+            if isinstance(qb64b, memoryview):
+                qb64b = bytes(qb64b)
+            inst = cls(qb64b=qb64b, strip=strip)
+            if entry is not None:
+                Matter.Trusts.add((cls, inst.code))
+            return inst
+
+        hard, hs, ss, os, fs, ls = entry
+        cs = hs + ss
+        ms = ss - os
+        index = b64Sextets(qb64b, hs, hs + ms)
+        if hard in IdxCrtSigDex:  # current only code
+            ondex = None
+        else:
+            ondex = b64Sextets(qb64b, hs + ms, cs) if os else index
+        if not fs:  # variable sized from index
+            fs = (index * 4) + cs
+        ps = cs % 4  # when ps then not ls and vice versa
+        raw = decodeB64(ps * b'A' + bytes(qb64b[cs:fs]))[ps + ls:]
+        if strip:  # assumes bytearray
+            del qb64b[:fs]
+
+        inst = cls.__new__(cls)
+        inst._code = hard
+        inst._index = index
+        inst._ondex = ondex
+        inst._raw = raw
+        inst._bind()
+        return inst
+
+    def _bind(self):
+        """
+        Assigns attributes derived from .code. See Matter._bind
+        """
+
     def _exfil(self, qb64b):
         """
         Extracts self.code, self.index, and self.raw from qualified base64 bytes qb64b
@@ -4513,30 +4889,37 @@ class Indexer:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
-                raise UnexpectedCountCodeError("Unexpected count code start"
-                                               "while extracing Indexer.")
-            elif first[0] == '_':
-                raise UnexpectedOpCodeError("Unexpected  op code start"
-                                            "while extracing Indexer.")
-            else:
-                raise UnexpectedCodeError(f"Unsupported code start char={first}.")
+        # whole code is at most 8 chars so only convert those from str
+        head = qb64b[:8].encode("utf-8") if hasattr(qb64b, "encode") else qb64b
+        entry = sniffB64(head, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, os, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = qb64b[:1]  # extract first char code selector
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
+            if first not in self.Hards:
+                if first[0] == '-':
+                    raise UnexpectedCountCodeError("Unexpected count code start"
+                                                   "while extracing Indexer.")
+                elif first[0] == '_':
+                    raise UnexpectedOpCodeError("Unexpected  op code start"
+                                                "while extracing Indexer.")
+                else:
+                    raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
-        if len(qb64b) < hs:  # need more bytes
-            raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
+            hs = self.Hards[first]  # get hard code size
+            if len(qb64b) < hs:  # need more bytes
+                raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+            hard = qb64b[:hs]  # get hard code
+            if hasattr(hard, "decode"):
+                hard = hard.decode("utf-8")
+            if hard not in self.Sizes:
+                raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+
+            hs, ss, os, fs, ls = self.Sizes[hard]  # assumes hs in both tables consistent
 
-        hs, ss, os, fs, ls = self.Sizes[hard]  # assumes hs in both tables consistent
         cs = hs + ss  # both hard + soft code size
         ms = ss - os
         # assumes that unit tests on Indexer and IndexerCodex ensure that
@@ -4547,23 +4930,26 @@ class Indexer:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
-        index = qb64b[hs:hs+ms]  # extract index/size chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
-        index = b64ToInt(index)  # compute int index
+        index = b64Sextets(head, hs, hs + ms)
+        ondex = b64Sextets(head, hs + ms, cs) if os else None
+        if index is None or (os and ondex is None):  # not Base64 so convert chars
+            index = qb64b[hs:hs+ms]  # extract index/size chars
+            if hasattr(index, "decode"):
+                index = index.decode("utf-8")
+            index = b64ToInt(index)  # compute int index
 
-        ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
-        if hasattr(ondex, "decode"):
-            ondex = ondex.decode("utf-8")
+            ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
+            if hasattr(ondex, "decode"):
+                ondex = ondex.decode("utf-8")
+            ondex = b64ToInt(ondex) if os else None
 
         if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
-            ondex = b64ToInt(ondex) if os else None  # compute ondex from code
             if ondex:  # not zero or None so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
             else:
                 ondex = None  # zero so set to None when current only
         else:
-            ondex = b64ToInt(ondex) if os else index
+            ondex = ondex if os else index
 
         # index is index for some codes and variable length for others
         if not fs:  # compute fs from index which means variable length
@@ -4633,27 +5019,32 @@ class Indexer:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bards:
-            if first[0] == b'\xf8':  # b64ToB2('-')
-                raise UnexpectedCountCodeError("Unexpected count code start"
-                                               "while extracing Matter.")
-            elif first[0] == b'\xfc':  # b64ToB2('_')
-                raise UnexpectedOpCodeError("Unexpected  op code start"
-                                            "while extracing Matter.")
-            else:
-                raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
+        entry = sniffB2(qb2, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, os, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = nabSextets(qb2, 1)  # extract first sextet as code selector
+            if first not in self.Bards:
+                if first[0] == b'\xf8':  # b64ToB2('-')
+                    raise UnexpectedCountCodeError("Unexpected count code start"
+                                                   "while extracing Matter.")
+                elif first[0] == b'\xfc':  # b64ToB2('_')
+                    raise UnexpectedOpCodeError("Unexpected  op code start"
+                                                "while extracing Matter.")
+                else:
+                    raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
+
+            hs = self.Bards[first]  # get code hard size equvalent sextets
+            bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+            if len(qb2) < bhs:  # need more bytes
+                raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
 
-        hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
-        if len(qb2) < bhs:  # need more bytes
-            raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
+            hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
+            if hard not in self.Sizes:
+                raise UnexpectedCodeError(f"Unsupported code ={hard}.")
 
-        hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+            hs, ss, os, fs, ls = self.Sizes[hard]
 
-        hs, ss, os, fs, ls = self.Sizes[hard]
         cs = hs + ss  # both hs and ss
         ms = ss - os
         # assumes that unit tests on Indexer and IndexerCodex ensure that
@@ -4664,17 +5055,16 @@ class Indexer:
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
-        both = codeB2ToB64(qb2, cs)  # extract and convert both hard and soft part of code
-        index = b64ToInt(both[hs:hs+ms])  # compute index
+        index = b2Sextets(qb2, hs, hs + ms)  # compute index
 
         if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
-            ondex = b64ToInt(both[hs+ms:hs+ms+os]) if os else None  # compute ondex from code
+            ondex = b2Sextets(qb2, hs + ms, cs) if os else None  # compute ondex from code
             if ondex:  # not zero or None so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
             else:
                 ondex = None  # zero so set to None when current only
         else:
-            ondex = b64ToInt(both[hs+ms:hs+ms+os]) if os else index
+            ondex = b2Sextets(qb2, hs + ms, cs) if os else index
 
         if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
             if ondex:  # not zero so error
@@ -4761,6 +5151,12 @@ class Siger(Indexer):
                                   "".format(self.code))
         self.verfer = verfer
 
+    def _bind(self):
+        """
+        Assign no verfer to ._verfer of ._fromTrusted instance
+        """
+        self._verfer = None
+
     @property
     def verfer(self):
         """
@@ -4801,7 +5197,10 @@ class CounterCodex:
     KERIProtocolStack: str = '--AAA'  # KERI ACDC Protocol Stack CESR Version
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(codexCodes(self))  # enables inclusion test with "in"
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 CtrDex = CounterCodex()
 
@@ -4818,10 +5217,14 @@ class ProtocolGenusCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(codexCodes(self))  # enables inclusion test with "in"
         # duplicate values above just result in multiple entries in tuple so
         # in inclusion still works
 
+    def __contains__(self, code):
+        return inCodex(self, code)
+
+
 ProDex = ProtocolGenusCodex()  # Make instance
 
 
@@ -4860,7 +5263,10 @@ class AltCounterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(codexCodes(self))  # enables inclusion test with "in"
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 class Counter:
@@ -4923,6 +5329,9 @@ class Counter:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first two code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Decodes tables are generated from Sizes for sniffing codes by sextet
+    # values without str allocation. See decodeTables
+    Decodes = decodeTables(Sizes)
 
     def __init__(self, code=None, count=None, countB64=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -5145,27 +5554,34 @@ class Counter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
-        first = qb64b[:2]  # extract first two char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '_':
-                raise UnexpectedOpCodeError("Unexpected op code start"
-                                            "while extracing Counter.")
-            else:
-                raise UnexpectedCodeError("Unsupported code start ={}.".format(first))
+        # whole code is at most 8 chars so only convert those from str
+        head = qb64b[:8].encode("utf-8") if hasattr(qb64b, "encode") else qb64b
+        entry = sniffB64(head, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = qb64b[:2]  # extract first two char code selector
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
+            if first not in self.Hards:
+                if first[0] == '_':
+                    raise UnexpectedOpCodeError("Unexpected op code start"
+                                                "while extracing Counter.")
+                else:
+                    raise UnexpectedCodeError("Unsupported code start ={}.".format(first))
+
+            hs = self.Hards[first]  # get hard code size
+            if len(qb64b) < hs:  # need more bytes
+                raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
-        hs = self.Hards[first]  # get hard code size
-        if len(qb64b) < hs:  # need more bytes
-            raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
+            hard = qb64b[:hs]  # get hard code
+            if hasattr(hard, "decode"):
+                hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
+            if hard not in self.Sizes:  # Sizes needs str not bytes
+                raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
-        if hard not in self.Sizes:  # Sizes needs str not bytes
-            raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
+            hs, ss, fs, ls = self.Sizes[hard]  # assumes hs consistent in both tables
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs consistent in both tables
         cs = hs + ss  # both hard + soft code size
 
         # assumes that unit tests on Counter and CounterCodex ensure that
@@ -5175,10 +5591,12 @@ class Counter:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
-        count = qb64b[hs:hs + ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
-        count = b64ToInt(count)  # compute int count
+        count = b64Sextets(head, hs, cs)
+        if count is None:  # not Base64 so convert chars
+            count = qb64b[hs:hs + ss]  # extract count chars
+            if hasattr(count, "decode"):
+                count = count.decode("utf-8")
+            count = b64ToInt(count)  # compute int count
 
         self._code = hard
         self._count = count
@@ -5191,24 +5609,29 @@ class Counter:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 2)  # extract first two sextets as code selector
-        if first not in self.Bards:
-            if first[0] == b'\xfc':  # b64ToB2('_')
-                raise UnexpectedOpCodeError("Unexpected  op code start"
-                                            "while extracing Matter.")
-            else:
-                raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
+        entry = sniffB2(qb2, self.Decodes)
+        if entry is not None:  # fast path from decode tables
+            hard, hs, ss, fs, ls = entry
+        else:  # full lookup raises appropriate error
+            first = nabSextets(qb2, 2)  # extract first two sextets as code selector
+            if first not in self.Bards:
+                if first[0] == b'\xfc':  # b64ToB2('_')
+                    raise UnexpectedOpCodeError("Unexpected  op code start"
+                                                "while extracing Matter.")
+                else:
+                    raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
+
+            hs = self.Bards[first]  # get code hard size equvalent sextets
+            bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+            if len(qb2) < bhs:  # need more bytes
+                raise ShortageError("Need {} more bytes.".format(bhs - len(qb2)))
 
-        hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
-        if len(qb2) < bhs:  # need more bytes
-            raise ShortageError("Need {} more bytes.".format(bhs - len(qb2)))
+            hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
+            if hard not in self.Sizes:
+                raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
 
-        hard = codeB2ToB64(qb2, hs)  # extract and convert hard part of code
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
+            hs, ss, fs, ls = self.Sizes[hard]
 
-        hs, ss, fs, ls = self.Sizes[hard]
         cs = hs + ss  # both hs and ss
         # assumes that unit tests on Counter and CounterCodex ensure that
         # .Codes and .Sizes are well formed.
@@ -5218,8 +5641,7 @@ class Counter:
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
-        both = codeB2ToB64(qb2, cs)  # extract and convert both hard and soft part of code
-        count = b64ToInt(both[hs:hs + ss])  # get count
+        count = b2Sextets(qb2, hs, cs)  # get count
 
         self._code = hard
         self._count = count
@@ -5558,9 +5980,28 @@ class Tholder:
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
-
+        ._compiled is Compiled form of weighted threshold or None until first
+            weighted satisfaction
+
+    Class Attributes:
+        Compiles (OrderedDict): LRU cache of Compiled forms of weighted
+            thresholds shared by all instances keyed by .limen
+        CompilesSize (int): max number of entries in .Compiles
+
+    Compiled weighted thresholds:
+        Weights are scaled to ints by the least common denominator .denom of
+        all weights in the threshold. Each key index i is bit 1 << i so the
+        verified signature indices become one int bitmask. Each clause is a
+        triple (mask, plain, nested) where mask is all bits of the clause,
+        plain is tuple of (bit, weight) of its weights and nested is tuple of
+        (weight, ((bit, weight), ...)) of its weighted sets. A clause whose
+        bits are all set is satisfied without summing since each clause sums
+        to at least 1.
 
     """
+    Compiles = OrderedDict()  # LRU of Compiled keyed by limen
+    CompilesSize = 1024  # max entries in .Compiles
+    Compiled = namedtuple("Compiled", "denom clauses")
 
     def __init__(self, *, thold=None , limen=None, sith=None, **kwa):
         """
@@ -5614,6 +6055,7 @@ class Tholder:
 
 
         """
+        self._compiled = None
         if thold is not None:
             self._processThold(thold=thold)
 
@@ -5956,6 +6398,8 @@ class Tholder:
     def _satisfy_weighted(self, indices):
         """
         Returns True if satifies fractional weighted threshold False otherwise
+        Evaluates the compiled form of the threshold with int weights and
+        bitmask of indices instead of Fraction arithmetic.
 
 
         Parameters:
@@ -5968,30 +6412,32 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
+            if self._compiled is None:
+                self._compiled = self._compile(limen=self.limen, thold=self.thold)
+            denom, clauses = self._compiled
+
+            size = self.size
+            sats = 0  # bitmask of verified signature indices
             for idx in indices:
-                sats[idx] = True  # set verified signature index to True
+                if not -size <= idx < size:  # out of range index
+                    return False
+                sats |= 1 << (idx % size)  # set verified signature index bit
 
-            wio = 0  # weight index offset
-            for clause in self.thold:
+            for mask, plain, nested in clauses:
+                if (sats & mask) == mask:  # all of clause verified
+                    continue
                 cw = 0  # init clause weight
-                for e in clause:
-                    if isinstance(e, tuple):
-                        vw = 0  # init element value weight
-                        for w in e[1]:   # sum weights of value
-                            if sats[wio]:
-                                vw += w
-                            wio += 1
-                        if vw >= 1:  # element true
-                            cw += e[0]  # add element key weight to clause weight
-                    else:
-                        w = e
-                        if sats[wio]:  # verified signature so weight applies
-                            cw += w
-                        wio += 1
-                if cw < 1:  # each clause must sum to at least 1
+                for bit, w in plain:
+                    if sats & bit:  # verified signature so weight applies
+                        cw += w
+                for kw, vws in nested:
+                    vw = 0  # init element value weight
+                    for bit, w in vws:  # sum weights of value
+                        if sats & bit:
+                            vw += w
+                    if vw >= denom:  # element true
+                        cw += kw  # add element key weight to clause weight
+                if cw < denom:  # each clause must sum to at least 1
                     return False
 
             return True  # all clauses have cw >= 1 including final one, AND true
@@ -6002,6 +6448,57 @@ class Tholder:
         return False
 
 
+    @classmethod
+    def _compile(cls, limen, thold):
+        """
+        Returns Compiled form of weighted threshold thold from .Compiles LRU
+        cache when present at limen else compiles and caches it.
+
+        Parameters:
+            limen (bytes): qb64b of weighted threshold as cache key
+            thold (list): weighted threshold clauses of Fractions
+        """
+        if (compiled := cls.Compiles.get(limen)) is not None:
+            cls.Compiles.move_to_end(limen)  # most recently used
+            return compiled
+
+        denoms = []
+        for clause in thold:
+            for e in clause:
+                if isinstance(e, tuple):
+                    denoms.append(e[0].denominator)
+                    denoms.extend(w.denominator for w in e[1])
+                else:
+                    denoms.append(e.denominator)
+        denom = lcm(*denoms)
+
+        clauses = []
+        wio = 0  # weight index offset
+        for clause in thold:
+            mask = 0
+            plain = []
+            nested = []
+            for e in clause:
+                if isinstance(e, tuple):
+                    vws = []
+                    for w in e[1]:
+                        vws.append((1 << wio, int(w * denom)))
+                        mask |= 1 << wio
+                        wio += 1
+                    nested.append((int(e[0] * denom), tuple(vws)))
+                else:
+                    plain.append((1 << wio, int(e * denom)))
+                    mask |= 1 << wio
+                    wio += 1
+            clauses.append((mask, tuple(plain), tuple(nested)))
+
+        compiled = cls.Compiled(denom=denom, clauses=tuple(clauses))
+        cls.Compiles[limen] = compiled
+        while len(cls.Compiles) > cls.CompilesSize:
+            cls.Compiles.popitem(last=False)  # least recently used
+        return compiled
+
+
 class Dicter:
     """ Dicter class is base class for objects that can be stored in a Suber
 
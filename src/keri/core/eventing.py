@@ -4,10 +4,11 @@ keri.core.eventing module
 
 """
 import datetime
+import itertools
 import json
 import logging
-from collections import namedtuple
-from dataclasses import dataclass, astuple, asdict, field
+from collections import namedtuple, OrderedDict
+from dataclasses import dataclass, asdict, field
 from urllib.parse import urlsplit
 from math import ceil
 from ordered_set import OrderedSet as oset
@@ -17,7 +18,7 @@ from . import coring, serdering
 from .coring import (versify, Serials, Ilks, MtrDex, PreDex, DigDex,
                      NonTransDex, CtrDex, Counter,
                      Number, Seqner, Siger, Cigar, Dater, Indexer, IdrDex,
-                     Verfer, Diger, Prefixer, Tholder, Saider)
+                     Verfer, Diger, Prefixer, Tholder, Saider, decodeB64)
 from . import serdering
 from .. import help
 from .. import kering
@@ -32,7 +33,7 @@ from ..kering import (MissingEntryError,
                       LikelyDuplicitousError, UnverifiedWitnessReceiptError,
                       UnverifiedReceiptError, UnverifiedTransferableReceiptError,
                       QueryNotFoundError, MisfitEventSourceError,
-                      MissingDelegableApprovalError)
+                      MissingDelegableApprovalError, EscrowCapacityError)
 from ..kering import Version, Versionage
 
 from ..help import helping
@@ -57,7 +58,10 @@ class TraitCodex:
     RegistrarBackers: str = 'RB' # Registrar backer provided in Registrar seal
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(kering.codexCodes(self))
+
+    def __contains__(self, code):
+        return kering.inCodex(self, code)
 
 
 TraitDex = TraitCodex()  # Make instance
@@ -160,7 +164,10 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(kering.codexCodes(self))
+
+    def __contains__(self, code):
+        return kering.inCodex(self, code)
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -416,7 +423,7 @@ def deTransReceiptQuintuple(data, strip=False):
 
 
 
-def verifySigs(raw, sigers, verfers):
+def verifySigs(raw, sigers, verfers, batcher=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -431,6 +438,8 @@ def verifySigs(raw, sigers, verfers):
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        batcher (Batcher | None): when provided look up batch verified results
+            from batcher and only verify individually on batch miss
 
     """
     if sigers is None:
@@ -453,13 +462,32 @@ def verifySigs(raw, sigers, verfers):
     vindices = []
     vsigers = []
     for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
+        if batcher is not None:
+            verified = batcher.verify(raw=raw, sig=siger.raw, verfer=siger.verfer)
+        else:
+            verified = siger.verfer.verify(siger.raw, raw)
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
     return (vsigers, vindices)
 
 
+def verifySig(key, sig, ser):
+    """
+    Returns True if signature sig verifies on serialization ser with public
+    key given by key, False otherwise. Module level function of plain bytes
+    arguments so it may be pickled and run in a worker process of a
+    concurrent.futures process pool.
+
+    Parameters:
+        key (bytes): qb64b of verifier public key
+        sig (bytes): raw signature
+        ser (bytes): signed serialization
+    """
+    return Verfer(qb64b=key).verify(sig, ser)
+
+
 def validateSigs(serder, sigers, verfers, tholder):
     """
     Validates signatures given by sigers using keys given by verfers on msg
@@ -506,6 +534,124 @@ def validateSigs(serder, sigers, verfers, tholder):
     return (sigers, valid)
 
 
+class Batcher:
+    """
+    Batcher collects signature verification triples of (raw, sig, verfer)
+    across many messages, such as all the events extracted in one parser pass,
+    and verifies them together in one batch with Verfer.verifyBatch.
+    The batch results are memoized in a bounded least recently used table so
+    that subsequent calls to verifySigs with this batcher for the same triple
+    are lookups instead of signature verifications. On a lookup miss the
+    triple is verified individually so any failure is always identified per
+    signature and never hides or spoils the result of any other signature.
+
+    Results are keyed by the full triple (verifier key, signature, signed raw)
+    so a memoized result never applies to a different serialization.
+
+    When .flush is given a concurrent.futures executor the batch is spread
+    across its workers in chunks of .Chunk triples via module function
+    verifySig so that verification uses all the cores of a process pool.
+
+    Attributes:
+        size (int): maximum number of memoized verification results
+        pending (list): of (verfer, sig, raw) triples collected but not yet
+            verified
+        results (OrderedDict): of memoized bool verification results keyed by
+            (verfer.qb64b, sig, raw) in least recently used order
+        hits (int): count of verify lookups satisfied from .results
+        misses (int): count of verify lookups verified individually
+
+    """
+    Size = 4096  # default max number of memoized verification results
+    Chunk = 64  # number of triples per executor task when flushed to executor
+
+    def __init__(self, size=None):
+        """
+        Initialize instance
+
+        Parameters:
+            size (int | None): maximum number of memoized verification results
+                None means use class default .Size
+        """
+        self.size = size if size is not None else self.Size
+        self.pending = []
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+    def add(self, raw, sig, verfer):
+        """
+        Collect triple to be verified on next .flush. Ignores triple whose
+        result is already memoized.
+
+        Parameters:
+            raw (bytes): signed serialization
+            sig (bytes): raw signature
+            verfer (Verfer): instance of public verification key
+        """
+        if (verfer.qb64b, bytes(sig), bytes(raw)) not in self.results:
+            self.pending.append((verfer, sig, raw))
+
+
+    def flush(self, executor=None):
+        """
+        Verify all pending triples together in one batch and memoize results
+
+        Returns:
+            count (int): number of triples verified in batch
+
+        Parameters:
+            executor (concurrent.futures.Executor | None): pool of workers to
+                verify batch in parallel. None means verify in this process.
+        """
+        pending, self.pending = self.pending, []
+        if executor is not None and pending:
+            keys, sigs, sers = zip(*[(verfer.qb64b, bytes(sig), bytes(raw))
+                                     for verfer, sig, raw in pending])
+            results = executor.map(verifySig, keys, sigs, sers, chunksize=self.Chunk)
+        else:
+            results = Verfer.verifyBatch(pending)
+
+        for (verfer, sig, raw), result in zip(pending, results):
+            self._memo((verfer.qb64b, bytes(sig), bytes(raw)), result)
+        return len(pending)
+
+
+    def verify(self, raw, sig, verfer):
+        """
+        Returns:
+            result (bool): True if sig verifies on raw with verfer False otherwise.
+                Uses memoized batch result when available otherwise falls back
+                to verifying individually and memoizes that result.
+
+        Parameters:
+            raw (bytes): signed serialization
+            sig (bytes): raw signature
+            verfer (Verfer): instance of public verification key
+        """
+        key = (verfer.qb64b, bytes(sig), bytes(raw))
+        if key in self.results:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        self.misses += 1
+        result = verfer.verify(sig, raw)
+        self._memo(key, result)
+        return result
+
+
+    def _memo(self, key, result):
+        """
+        Memoize result at key evicting least recently used results beyond .size
+        """
+        self.results[key] = result
+        self.results.move_to_end(key)
+        while len(self.results) > self.size:
+            self.results.popitem(last=False)
+
+
 def fetchTsgs(db, saider, snh=None):
     """
     Fetch tsgs for saider from .db.ssgs. When sn then only fetch if sn <= snh
@@ -1362,7 +1508,7 @@ def bare(route="",
 
 
 def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
-              pipelined=False):
+              pipelined=False, binary=False):
     """
     Attaches indexed signatures from sigers and/or cigars and/or wigers to
     KERI message data from serder
@@ -1383,6 +1529,10 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
             Each cigar.vefer.qb64 is pre of receiptor and cigar.qb64 is signature
         pipelined (bool), True means prepend pipelining count code to attachemnts
             False means to not prepend pipelining count code
+        binary (bool): True means attachments in binary domain qb2 which is
+            25% smaller and skips Base64 conversion. Parser cold starts each
+            attachment group so receivers accept either domain.
+            False means attachments in text domain qb64
 
     Returns: bytearray KERI event message
     """
@@ -1393,44 +1543,52 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
         raise ValueError("Missing attached signatures on message = {}."
                          "".format(serder.ked))
 
+    if binary:  # qb2 of any qb64 primitive is its Base64 decode
+        qb = lambda m: m.qb2
+        qbs = lambda s: decodeB64(s.encode("utf-8"))
+    else:
+        qb = lambda m: m.qb64b
+        qbs = lambda s: s.encode("utf-8")
+
     if sigers:
         if isinstance(seal, SealEvent):
-            atc.extend(Counter(CtrDex.TransIdxSigGroups, count=1).qb64b)
-            atc.extend(seal.i.encode("utf-8"))
-            atc.extend(Seqner(snh=seal.s).qb64b)
-            atc.extend(seal.d.encode("utf-8"))
+            atc.extend(qb(Counter(CtrDex.TransIdxSigGroups, count=1)))
+            atc.extend(qbs(seal.i))
+            atc.extend(qb(Seqner(snh=seal.s)))
+            atc.extend(qbs(seal.d))
 
         elif isinstance(seal, SealLast):
-            atc.extend(Counter(CtrDex.TransLastIdxSigGroups, count=1).qb64b)
-            atc.extend(seal.i.encode("utf-8"))
+            atc.extend(qb(Counter(CtrDex.TransLastIdxSigGroups, count=1)))
+            atc.extend(qbs(seal.i))
 
-        atc.extend(Counter(code=CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
+        atc.extend(qb(Counter(code=CtrDex.ControllerIdxSigs, count=len(sigers))))
         for siger in sigers:
-            atc.extend(siger.qb64b)
+            atc.extend(qb(siger))
 
     if wigers:
-        atc.extend(Counter(code=CtrDex.WitnessIdxSigs, count=len(wigers)).qb64b)
+        atc.extend(qb(Counter(code=CtrDex.WitnessIdxSigs, count=len(wigers))))
         for wiger in wigers:
             if wiger.verfer and wiger.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(wiger.verfer.qb64))
-            atc.extend(wiger.qb64b)
+            atc.extend(qb(wiger))
 
     if cigars:
-        atc.extend(Counter(code=CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
+        atc.extend(qb(Counter(code=CtrDex.NonTransReceiptCouples, count=len(cigars))))
         for cigar in cigars:
             if cigar.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(cigar.verfer.qb64))
-            atc.extend(cigar.verfer.qb64b)
-            atc.extend(cigar.qb64b)
+            atc.extend(qb(cigar.verfer))
+            atc.extend(qb(cigar))
 
     if pipelined:
-        if len(atc) % 4:
+        size = 3 if binary else 4  # triplets in binary quadlets in text
+        if len(atc) % size:
             raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        msg.extend(Counter(code=CtrDex.AttachedMaterialQuadlets,
-                           count=(len(atc) // 4)).qb64b)
+                             " {}.".format(len(atc), "triplets" if binary else "quadlets"))
+        msg.extend(qb(Counter(code=CtrDex.AttachedMaterialQuadlets,
+                              count=(len(atc) // size))))
 
     msg.extend(atc)
     return msg
@@ -1571,6 +1729,17 @@ class Kever:
         kevers (dict): reference to self.db.kevers
         transferable (bool): True if .digers is not empty and pre is transferable
 
+    Compact Representation:
+        Kever uses __slots__ and keeps its key state in compact form as qb64b
+        bytes, ints and sith expressions. The CESR objects .prefixer, .serder,
+        .sner, .fner, .dater, .tholder, .ntholder, .verfers, .ndigers and
+        .toader are properties materialized lazily from the compact form on
+        first access and then cached. Assigning any of them also updates the
+        compact form. A Kever reloaded from a KeyStateRecord only holds the
+        compact form until a new event for its KEL arrives. .compact()
+        releases the materialized objects. .state() is built from the compact
+        form without materializing.
+
 
 
     ToDo:
@@ -1583,9 +1752,16 @@ class Kever:
     EstOnly = False
     DoNotDelegate = False
 
+    __slots__ = ('db', 'cues', 'version', 'ilk', 'wits', 'cuts', 'adds',
+                 'estOnly', 'doNotDelegate', 'lastEst', 'delpre', 'delegated',
+                 '_prefixer', '_serder', '_sner', '_fner', '_dater', '_tholder',
+                 '_ntholder', '_verfers', '_ndigers', '_toader',  # materialized
+                 '_pre', '_dig', '_pig', '_sn', '_fn', '_dts', '_kt', '_nt',
+                 '_keys', '_ndigs', '_bt')  # compact
+
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delseqner=None, delsaider=None, firner=None,
-                 dater=None, cues=None, local=True, check=False):
+                 dater=None, cues=None, local=True, check=False, batcher=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1621,6 +1797,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            batcher (Batcher | None): batch verified signature results to use
+                when verifying sigers and wigers. None means verify individually
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1631,6 +1809,10 @@ class Kever:
         self.db = db
         self.cues = cues
         local = True if local else False
+        self.compact()  # nothing materialized yet
+        self._pre = self._dig = self._pig = self._dts = None
+        self._sn = self._fn = self._bt = self._kt = self._nt = None
+        self._keys = self._ndigs = ()
 
         if state:  # preload from state
             self.reload(state)
@@ -1661,7 +1843,8 @@ class Kever:
                                                         wits=self.wits,
                                                         local=local,
                                                         delseqner=delseqner,
-                                                        delsaider=delsaider)
+                                                        delsaider=delsaider,
+                                                        batcher=batcher)
 
         self.delpre = delpre  # may be None
         self.delegated = True if self.delpre else False
@@ -1670,15 +1853,18 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False,
-                                seqner=delseqner, saider=delsaider,
-                                firner=firner, dater=dater, local=local)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        staged = self.stage()  # applied only once accepted event commits
+        with self.db.txn():  # accept event atomically in one transaction
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False,
+                                    seqner=delseqner, saider=delsaider,
+                                    firner=firner, dater=dater, local=local)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                staged.fner = Number(num=fn)
+                staged.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=staged.state())
+        self.apply(staged)
 
 
     @property
@@ -1687,7 +1873,7 @@ class Kever:
         Returns:
             (int): .sner.num
         """
-        return self.sner.num
+        return self._sn
 
 
     @property
@@ -1696,7 +1882,7 @@ class Kever:
         Returns:
             (int): .fner.num
         """
-        return self.fner.num
+        return self._fn
 
 
     @property
@@ -1705,7 +1891,221 @@ class Kever:
         Returns:
             (list): digs of digers
         """
-        return [diger.qb64 for diger in self.ndigers]
+        return [dig.decode() for dig in self._ndigs]
+
+
+    @property
+    def prefixer(self):
+        """
+        Returns:
+            (Prefixer): of identifier prefix materialized from compact ._pre
+        """
+        if self._prefixer is None and self._pre is not None:
+            self._prefixer = Prefixer(qb64b=self._pre)
+        return self._prefixer
+
+
+    @prefixer.setter
+    def prefixer(self, prefixer):
+        self._prefixer = prefixer
+        self._pre = prefixer.qb64b
+
+
+    @property
+    def serder(self):
+        """
+        Returns:
+            (SerderKERI): of current event loaded from .db by compact ._dig
+
+        Raises:
+            MissingEntryError: when current event is missing from .db
+        """
+        if self._serder is None and self._dig is not None:
+            if (serder := self.db.getEvtSerder(self._pre, self._dig)) is None:
+                raise MissingEntryError(f"Missing current event for pre="
+                                        f"{bytes(self._pre).decode()} at dig="
+                                        f"{bytes(self._dig).decode()}.")
+            self._serder = serder
+        return self._serder
+
+
+    @serder.setter
+    def serder(self, serder):
+        self._serder = serder
+        self._dig = serder.saidb
+        self._pig = serder.prior
+
+
+    @property
+    def sner(self):
+        """
+        Returns:
+            (Number): of sequence number materialized from compact ._sn
+        """
+        if self._sner is None and self._sn is not None:
+            self._sner = Number(num=self._sn)
+        return self._sner
+
+
+    @sner.setter
+    def sner(self, sner):
+        self._sner = sner
+        self._sn = sner.num
+
+
+    @property
+    def fner(self):
+        """
+        Returns:
+            (Number): of first seen ordinal materialized from compact ._fn
+        """
+        if self._fner is None and self._fn is not None:
+            self._fner = Number(num=self._fn)
+        return self._fner
+
+
+    @fner.setter
+    def fner(self, fner):
+        self._fner = fner
+        self._fn = fner.num
+
+
+    @property
+    def dater(self):
+        """
+        Returns:
+            (Dater): of first seen datetime materialized from compact ._dts
+        """
+        if self._dater is None and self._dts is not None:
+            self._dater = Dater(dts=self._dts)
+        return self._dater
+
+
+    @dater.setter
+    def dater(self, dater):
+        self._dater = dater
+        self._dts = dater.dts
+
+
+    @property
+    def tholder(self):
+        """
+        Returns:
+            (Tholder): of signing threshold materialized from compact ._kt
+        """
+        if self._tholder is None and self._kt is not None:
+            self._tholder = Tholder(sith=self._kt)
+        return self._tholder
+
+
+    @tholder.setter
+    def tholder(self, tholder):
+        self._tholder = tholder
+        self._kt = tholder.sith
+
+
+    @property
+    def ntholder(self):
+        """
+        Returns:
+            (Tholder | None): of next threshold materialized from compact ._nt
+        """
+        if self._ntholder is None and self._nt is not None:
+            self._ntholder = Tholder(sith=self._nt)
+        return self._ntholder
+
+
+    @ntholder.setter
+    def ntholder(self, ntholder):
+        self._ntholder = ntholder
+        self._nt = ntholder.sith if ntholder is not None else None
+
+
+    @property
+    def verfers(self):
+        """
+        Returns:
+            (list): of Verfer of signing keys materialized from compact ._keys
+        """
+        if self._verfers is None:
+            self._verfers = [Verfer(qb64b=key) for key in self._keys]
+        return self._verfers
+
+
+    @verfers.setter
+    def verfers(self, verfers):
+        self._verfers = verfers
+        self._keys = tuple(verfer.qb64b for verfer in verfers)
+
+
+    @property
+    def ndigers(self):
+        """
+        Returns:
+            (list): of Diger of next key digests materialized from compact ._ndigs
+        """
+        if self._ndigers is None:
+            self._ndigers = [Diger(qb64b=dig) for dig in self._ndigs]
+        return self._ndigers
+
+
+    @ndigers.setter
+    def ndigers(self, ndigers):
+        self._ndigers = ndigers
+        self._ndigs = tuple(diger.qb64b for diger in ndigers)
+
+
+    @property
+    def toader(self):
+        """
+        Returns:
+            (Number): of witness threshold materialized from compact ._bt
+        """
+        if self._toader is None and self._bt is not None:
+            self._toader = Number(num=self._bt)
+        return self._toader
+
+
+    @toader.setter
+    def toader(self, toader):
+        self._toader = toader
+        self._bt = toader.num
+
+
+    def stage(self):
+        """
+        Returns shallow copy of this Kever on which to stage key state changes
+        of an event being accepted so this Kever is only changed by .apply once
+        the event's database transaction commits. When the transaction aborts
+        the staged copy is dropped and this Kever still matches .db.states.
+        """
+        staged = object.__new__(self.__class__)
+        for name in self.__slots__:
+            if hasattr(self, name):
+                setattr(staged, name, getattr(self, name))
+        return staged
+
+
+    def apply(self, staged):
+        """
+        Applies key state changes staged on copy staged from .stage
+
+        Parameters:
+            staged (Kever): copy from .stage with changes of committed event
+        """
+        for name in self.__slots__:
+            if hasattr(staged, name):
+                setattr(self, name, getattr(staged, name))
+
+
+    def compact(self):
+        """
+        Releases materialized CESR objects so only compact key state is held.
+        Each is materialized again on its next access.
+        """
+        self._prefixer = self._serder = self._sner = self._fner = None
+        self._dater = self._tholder = self._ntholder = self._toader = None
+        self._verfers = self._ndigers = None
 
 
     @property
@@ -1837,17 +2237,20 @@ class Kever:
             state (KeyStateRecord | None): instance for key state notice
 
         """
+        self.compact()  # materialize lazily from compact state below
         self.version = Versionage._make(state.vn)
-        self.prefixer = Prefixer(qb64=state.i)
-        self.sner = Number(numh=state.s)  # sequence number Number instance hex str
-        self.fner = Number(numh=state.f) # first seen ordinal Number hex str
-        self.dater = Dater(dts=state.dt)
+        self._pre = state.i.encode()
+        self._dig = state.d.encode()
+        self._pig = state.p if state.p else None
+        self._sn = int(state.s, 16)  # sequence number hex str
+        self._fn = int(state.f, 16)  # first seen ordinal hex str
+        self._dts = state.dt
         self.ilk = state.et
-        self.tholder = Tholder(sith=state.kt)
-        self.ntholder = Tholder(sith=state.nt)
-        self.verfers = [Verfer(qb64=key) for key in state.k]
-        self.ndigers = [Diger(qb64=dig) for dig in state.n]
-        self.toader = Number(numh=state.bt)  # auto converts from hex num
+        self._kt = state.kt
+        self._nt = state.nt
+        self._keys = tuple(key.encode() for key in state.k)
+        self._ndigs = tuple(dig.encode() for dig in state.n)
+        self._bt = int(state.bt, 16)
         self.wits = state.b
         self.cuts = state.ee.br
         self.adds = state.ee.ba
@@ -1859,11 +2262,9 @@ class Kever:
         self.delpre = state.di if state.di else None
         self.delegated = True if self.delpre else False
 
-        if (raw := self.db.getEvt(key=dgKey(pre=self.prefixer.qb64,
-                                            dig=state.d))) is None:
+        if self.db.getEvt(dgKey(self._pre, self._dig)) is None:  # serder lazy
             raise MissingEntryError(f"Corresponding event not found for state="
                                     f"{state}.")
-        self.serder = serdering.SerderKERI(raw=bytes(raw))
         # May want to do additional checks here
 
 
@@ -1962,7 +2363,7 @@ class Kever:
 
 
     def update(self, serder, sigers, wigers=None, delseqner=None, delsaider=None,
-               firner=None, dater=None, local=True, check=False):
+               firner=None, dater=None, local=True, check=False, batcher=None):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -1994,6 +2395,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            batcher (Batcher | None): batch verified signature results to use
+                when verifying sigers and wigers. None means verify individually
 
         """
         ked = serder.ked
@@ -2032,36 +2435,41 @@ class Kever:
                                                             wits=wits,
                                                             local=local,
                                                             delseqner=delseqner,
-                                                            delsaider=delsaider)
+                                                            delsaider=delsaider,
+                                                            batcher=batcher)
 
 
 
             # .valSigWigsDel above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=delseqner, saider=delsaider,
-                                    firner=firner, dater=dater, local=local)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.ndigers = serder.ndigers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
+            # nxt and signatures verify so stage state update applied only once
+            # accepted event commits
+            staged = self.stage()
+            staged.sner = sner  # sequence number Number instance
+            staged.serder = serder  # need whole serder for digest agility compare
+            staged.ilk = ilk
+            staged.tholder = tholder
+            staged.verfers = serder.verfers
+            staged.ndigers = serder.ndigers
+            staged.ntholder = serder.ntholder
+
+            staged.toader = toader
+            staged.wits = wits
+            staged.cuts = cuts
+            staged.adds = adds
 
             # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            staged.lastEst = LastEstLoc(s=sner.num, d=serder.said)
+
+            with self.db.txn():  # accept event atomically in one transaction
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=delseqner, saider=delsaider,
+                                        firner=firner, dater=dater, local=local)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    staged.fner = Number(num=fn)
+                    staged.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=staged.state())
+            self.apply(staged)
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2095,21 +2503,25 @@ class Kever:
                                                             wigers=wigers,
                                                             toader=self.toader,
                                                             wits=self.wits,
-                                                            local=local)
+                                                            local=local,
+                                                            batcher=batcher)
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            # validates so stage state update applied only once accepted event commits
+            staged = self.stage()
+            staged.sner = sner  # sequence number Number instance
+            staged.serder = serder  # need for digest agility includes .serder.diger
+            staged.ilk = ilk
+
+            with self.db.txn():  # accept event atomically in one transaction
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    staged.fner = Number(num=fn)
+                    staged.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=staged.state())
+            self.apply(staged)
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2167,11 +2579,10 @@ class Kever:
                     raise ValidationError("Invalid recovery attempt: "
                                           "Bad sn = {} for event = {}."
                                           "".format(psn, ked))
-                praw = self.db.getEvt(key=dgKey(pre=pre, dig=pdig))
-                if praw is None:
+                pserder = self.db.getEvtSerder(pre, pdig)  # prior event
+                if pserder is None:
                     raise ValidationError("Invalid recovery attempt: "
                                           " Bad dig = {}.".format(pdig))
-                pserder = serdering.SerderKERI(raw=bytes(praw))  # deserialize prior event raw
                 if not pserder.compare(said=prior):  # bad recovery event
                     raise ValidationError("Invalid recovery attempt:"
                                           "Mismatch recovery event prior dig"
@@ -2273,7 +2684,7 @@ class Kever:
 
     def valSigsWigsDel(self, serder, sigers, verfers, tholder,
                        wigers, toader, wits, local=True,
-                       delseqner=None, delsaider=None):
+                       delseqner=None, delsaider=None, batcher=None):
         """
         Returns triple (sigers, wigers, delegator) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -2306,6 +2717,8 @@ class Kever:
                 If this event is not delegated then seqner is ignored
             delsaider (Saider | None): instance of of delegating event said.
                 If this event is not delegated then saider is ignored
+            batcher (Batcher | None): batch verified signature results to use
+                when verifying sigers and wigers. None means verify individually
 
         """
         if len(verfers) < tholder.size:
@@ -2328,7 +2741,8 @@ class Kever:
                                               index=siger.index))
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers,
+                                     verfers=verfers, batcher=batcher)
         # sigers  now have .verfer assigned
 
         # check if minimally signed in order to continue processing
@@ -2351,7 +2765,8 @@ class Kever:
 
         werfers = [Verfer(qb64=wit) for wit in wits]  # get witness public key verifiers
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers,
+                                      verfers=werfers, batcher=batcher)
         # each wiger now has added to it a werfer of its wit in its .verfer property
 
         # escrow if not fully signed vs signing threshold
@@ -2787,14 +3202,11 @@ class Kever:
 
         # get the delegating event from dig
         ddig = bytes(raw)
-        key = dgKey(pre=delpre, dig=ddig)  # database key
-        raw = self.db.getEvt(key)
-        if raw is None:   # drop event
+        dserder = self.db.getEvtSerder(delpre, ddig)  # delegating event
+        if dserder is None:   # drop event
             raise ValidationError("Missing delegation from {} at event dig = {} for evt = {}."
                                   "".format(delpre, ddig, serder.ked))
 
-        dserder = serdering.SerderKERI(raw=bytes(raw))  # delegating event
-
 
         # compare digests to make sure they match here
         if not dserder.compare(said=delsaider.qb64):  # drop event
@@ -2892,14 +3304,12 @@ class Kever:
         dgkey = dgKey(pre=serder.preb, dig=serder.saidb)  # database key
         if (couple := self.db.getAes(dgkey)):  # delegation source couple
             seqner, saider = deSourceCouple(couple)
-            dgkey = dgKey(pre=delegator, dig=saider)  # event at its said
             # get event by dig not by sn at last event because may have been superceded
-            if not (raw := self.db.getEvt(dgkey)):
+            # original delegating event i.e. boss original
+            if not (dserder := self.db.getEvtSerder(delegator, saider.qb64b)):
                 # database broken this should never happen so do not supersede
                 raise ValidationError(f"Missing delegation event for {serder.ked}")
 
-            dserder = serdering.SerderKERI(raw=bytes(raw))  # original delegating event i.e. boss original
-
         else:  #try to find seal the hard way
             seal = SealEvent(i=serder.pre, s=serder.snh, d=serder.said)._asdict
             if not (dserder := self.db.findAnchoringSealEvent(pre=serder.delpre, seal=seal)):
@@ -2946,9 +3356,9 @@ class Kever:
         dtsb = helping.nowIso8601().encode("utf-8")
         self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
         if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            self.db.putSigs(dgkey, sigers)  # idempotent
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         if wits:
             self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
 
@@ -2968,6 +3378,7 @@ class Kever:
             self.db.pubs.add(keys=(verfer.qb64,), val=val)
         for diger in (serder.ndigers if serder.ndigers is not None else []):
             self.db.digs.add(keys=(diger.qb64,), val=val)
+        self.db.indexSeals(serder)  # so anchoring event found without KEL scan
         if first:  # append event dig to first seen database in order
             if seqner and saider:  # delegation for authorized delegated or issued event
                 couple = seqner.qb64b + saider.qb64b
@@ -3020,10 +3431,10 @@ class Kever:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         if seqner and saider:
             couple = seqner.qb64b + saider.qb64b
             self.db.putPde(dgkey, couple)  # idempotent
@@ -3061,10 +3472,10 @@ class Kever:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.info("Kever state: escrowed delegable event=\n%s\n",
@@ -3086,11 +3497,15 @@ class Kever:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
+        snkey = snKey(serder.preb, serder.sn)
+        if not local and not self.db.admitEscrow("pses", snkey, serder.saidb):
+            raise EscrowCapacityError(f"Full partial signature escrow dropped "
+                                      f"event = {serder.ked}.")
         dgkey = dgKey(serder.preb, serder.saidb)
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
 
         self.db.putEvt(dgkey, serder.raw)
         # update event source
@@ -3103,7 +3518,6 @@ class Kever:
             esr = basing.EventSourceRecord(local=local)
             self.db.esrs.put(keys=dgkey, val=esr)
 
-        snkey = snKey(serder.preb, serder.sn)
         self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
         logger.info("Kever state: Escrowed partially signed or delegated "
                     "event = %s\n", serder.ked)
@@ -3155,12 +3569,16 @@ class Kever:
 
         """
         local = True if local else False
+        snkey = snKey(serder.preb, serder.sn)
+        if not local and not self.db.admitEscrow("pwes", snkey, serder.saidb):
+            raise EscrowCapacityError(f"Full partial witness escrow dropped "
+                                      f"event = {serder.ked}.")
         dgkey = dgKey(serder.preb, serder.saidb)
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putSigs(dgkey, sigers)
         if seqner and saider:
             couple = seqner.qb64b + saider.qb64b
             self.db.putPde(dgkey, couple)
@@ -3178,7 +3596,7 @@ class Kever:
 
         logger.info("Kever state: Escrowed partially witnessed "
                     "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        return self.db.addPwe(snkey, serder.saidb)
 
 
     def state(self):
@@ -3197,19 +3615,20 @@ class Kever:
         if self.doNotDelegate:
             cnfg.append(TraitDex.DoNotDelegate)
 
-        return (state(pre=self.prefixer.qb64,
+        # from compact state so does not materialize CESR objects
+        return (state(pre=self._pre.decode(),
                       sn=self.sn, # property self.sner.num
-                      pig=(self.serder.prior if self.serder.prior is not None else ""),
-                      dig=self.serder.said,
+                      pig=(self._pig if self._pig is not None else ""),
+                      dig=self._dig.decode(),
                       fn=self.fn, # property self.fner.num
-                      stamp=self.dater.dts,  # need to add dater object for first seen dts
+                      stamp=self._dts,  # need to add dater object for first seen dts
                       eilk=self.ilk,
-                      keys=[verfer.qb64 for verfer in self.verfers],
+                      keys=[key.decode() for key in self._keys],
                       eevt=eevt,
-                      sith=self.tholder.sith,
-                      nsith=self.ntholder.sith if self.ntholder else '0',
-                      ndigs=[diger.qb64 for diger in self.ndigers],
-                      toad=self.toader.num,
+                      sith=self._kt,
+                      nsith=self._nt if self._nt is not None else '0',
+                      ndigs=self.ndigs,
+                      toad=self._bt,
                       wits=self.wits,
                       cnfg=cnfg,
                       dpre=self.delpre,
@@ -3243,9 +3662,7 @@ class Kever:
             sn = self.lastEst.s - 1
 
         for digb in self.db.getKelBackIter(pre, sn):
-            dgkey = dgKey(pre, digb)
-            raw = self.db.getEvt(dgkey)
-            serder = serdering.SerderKERI(raw=bytes(raw))
+            serder = self.db.getEvtSerder(pre, digb)
             if serder.estive:  # establishment event
                 return serder.ndigers
 
@@ -3391,6 +3808,21 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        batcher (Batcher | None): batch signature verifier when in batch mode
+                None means not batch mode so verify signatures individually
+        verifier (Batcher): bounded memo of signature verification results
+                used by all signature verification of events so that retries
+                of escrowed events only verify newly arrived signatures.
+                Same as .batcher when in batch mode. Only its .verify is
+                used when not in batch mode.
+        fallback (float | None): seconds between periodic full scans of the
+                event driven escrows when in event driven escrow mode.
+                None means not event driven so full scan every escrow on
+                every .processEscrows
+        wakes (Deck): of (pre, sn) duples of events accepted since last
+                .processEscrows that wake their dependent escrowed items
+        scanned (datetime | None): time of last full escrow scan in event
+                driven escrow mode. None means not yet scanned
 
 
     Properties:
@@ -3409,9 +3841,19 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    # escrows of .db into which messages of each ilk may be escrowed
+    IlkEscrows = {Ilks.icp: ("ooes", "pses", "pwes", "ldes"),
+                  Ilks.rot: ("ooes", "pses", "pwes", "ldes"),
+                  Ilks.ixn: ("ooes", "pses", "pwes", "ldes"),
+                  Ilks.dip: ("ooes", "pses", "pwes", "ldes"),
+                  Ilks.drt: ("ooes", "pses", "pwes", "ldes"),
+                  Ilks.rct: ("uwes", "ures", "vres"),
+                  Ilks.qry: ("qnfs", )}
+    VerifiedSize = 4096  # max memoized signature verification results
 
     def __init__(self, *, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 batch=False, fallback=None):
         """
         Initialize instance:
 
@@ -3433,6 +3875,14 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            batch (bool): True means batch mode so signatures prefetched via
+                .prefetchSigs are verified together in batches by .batcher
+                False means verify signatures individually
+            fallback (float | None): seconds between periodic full scans of
+                out of order and unverified receipt escrows. When not None
+                these escrows are reprocessed event driven, that is, only
+                the items woken by the acceptance of an event are retried
+                on each .processEscrows. None means full scan every time.
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -3444,6 +3894,13 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.batcher = Batcher() if batch else None  # batch verify mode
+        # memo of verified sigs so escrow retries only verify new sigs
+        self.verifier = (self.batcher if self.batcher is not None
+                         else Batcher(size=self.VerifiedSize))
+        self.fallback = fallback  # event driven escrow mode when not None
+        self.wakes = decking.Deck()  # (pre, sn) of accepted events
+        self.scanned = None  # datetime of last full escrow scan
 
     @property
     def kevers(self):
@@ -3459,6 +3916,25 @@ class Kevery:
         """
         return self.db.prefixes
 
+    def throttled(self, ilk, pre):
+        """
+        Returns True if ingress should push back on the source of a message of
+        ilk about identifier prefix pre until escrow processing makes room.
+        That is when an escrow of .db into which the message may be escrowed
+        is full and the message may not resolve any escrowed entry because pre
+        has neither accepted key state nor escrowed entries. False otherwise.
+
+        Parameters:
+            ilk (str): message type from Ilks
+            pre (str): identifier prefix the message is about
+        """
+        names = self.IlkEscrows.get(ilk)
+        if not names or not pre:
+            return False
+        if not any(name in names for name in self.db.fullEscrows()):
+            return False
+        return pre not in self.kevers and not self.db.escrowed(pre)
+
     def fetchWitnessState(self, pre, sn):
         """ Returns the list of witness for the identifier prefix at the sequence number
 
@@ -3479,8 +3955,7 @@ class Kevery:
         preb = pre.encode("utf-8")
         for digb in self.db.getKelBackIter(preb, sn):
             dgkey = dgKey(preb, digb)
-            raw = self.db.getEvt(dgkey)
-            serder = serdering.SerderKERI(raw=bytes(raw))
+            serder = self.db.getEvtSerder(preb, digb)
             if serder.estive:
                 wits = self.db.wits.get(dgkey)
                 return wits
@@ -3549,8 +4024,11 @@ class Kevery:
                               dater=dater if self.cloned else None,
                               cues=self.cues,
                               local=local,
-                              check=self.check)
+                              check=self.check,
+                              batcher=self.verifier)
                 self.kevers[pre] = kever  # not exception so add to kevers
+                if self.fallback is not None:  # wake escrows dependent on event
+                    self.wakes.push((pre, sn))
 
                 # At this point  the inceptive event (icp or dip) given by serder
                 # together with its attachments has been accepted as valid with finality.
@@ -3616,11 +4094,13 @@ class Kevery:
                     # get unique verified lists of sigers and indices from sigers
                     sigers, indices = verifySigs(raw=serder.raw,
                                                  sigers=sigers,
-                                                 verfers=eserder.verfers)
+                                                 verfers=eserder.verfers,
+                                                 batcher=self.verifier)
 
                     wigers, windices = verifySigs(raw=serder.raw,
                                                   sigers=wigers,
-                                                  verfers=eserder.berfers)
+                                                  verfers=eserder.berfers,
+                                                  batcher=self.verifier)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # this allows late arriving witness receipts or controller
@@ -3656,7 +4136,10 @@ class Kevery:
                                  delseqner=delseqner, delsaider=delsaider,
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
-                                 local=local, check=self.check)
+                                 local=local, check=self.check,
+                                 batcher=self.verifier)
+                    if self.fallback is not None:  # wake escrows dependent on event
+                        self.wakes.push((pre, sn))
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -3711,13 +4194,15 @@ class Kevery:
                         # get unique verified lists of sigers and indices from sigers
                         sigers, indices = verifySigs(raw=serder.raw,
                                                      sigers=sigers,
-                                                     verfers=eserder.verfers)
+                                                     verfers=eserder.verfers,
+                                                     batcher=self.verifier)
 
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
                         wigers, windices = verifySigs(raw=serder.raw,
                                                       sigers=wigers,
-                                                      verfers=werfers)
+                                                      verfers=werfers,
+                                                      batcher=self.verifier)
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # this allows late arriving witness receipts or controller
@@ -3731,6 +4216,49 @@ class Kevery:
                         raise LikelyDuplicitousError("Likely Duplicitous event={}.".format(ked))
 
 
+    def prefetchSigs(self, serder, sigers, wigers=None, cigars=None):
+        """
+        Collect signature verification triples of event serder into .batcher
+        for later batch verification by .batcher.flush. Keys are resolved from
+        the event itself for establishment events and from the current key
+        state otherwise. Triples whose keys turn out stale by the time the
+        event is processed are simply batch misses that get verified
+        individually, so prefetch never changes validation results.
+        Does nothing when not in batch mode.
+
+        Parameters:
+            serder (SerderKERI): instance of event
+            sigers (list[Siger]): instances of attached controller indexed sigs
+            wigers (list[Siger]|None): instances of attached witness indexed sigs
+            cigars (list[Cigar]|None): instances of attached receipt couples
+                signature in .raw and public key in .verfer
+        """
+        if self.batcher is None:
+            return
+
+        kever = self.kevers[serder.pre] if serder.pre in self.kevers else None
+        if serder.estive:  # keys are in the event itself
+            verfers = serder.verfers
+        else:
+            verfers = kever.verfers if kever is not None else []
+
+        if serder.ilk in (Ilks.icp, Ilks.dip):
+            wits = serder.backs
+        else:
+            wits = kever.wits if kever is not None else []
+        werfers = [Verfer(qb64=wit) for wit in wits]
+
+        for sigs, keys in ((sigers, verfers), (wigers, werfers)):
+            for siger in (sigs if sigs is not None else []):
+                if siger.index < len(keys):
+                    self.batcher.add(raw=serder.raw, sig=siger.raw,
+                                     verfer=keys[siger.index])
+
+        for cigar in (cigars if cigars is not None else []):
+            if not cigar.verfer.transferable:
+                self.batcher.add(raw=serder.raw, sig=cigar.raw, verfer=cigar.verfer)
+
+
     def processReceiptWitness(self, serder, wigers, local=None):
         """
         Process one witness receipt serder with attached witness wigers
@@ -3768,9 +4296,8 @@ class Kevery:
             ldig = bytes(ldig).decode("utf-8")
             # retrieve event by dig assumes if ldig is not None that event exists at ldig
             dgkey = dgKey(pre=pre, dig=ldig)
-            raw = bytes(self.db.getEvt(key=dgkey))  # retrieve receipted event at dig
-            # assumes db ensures that raw must not be none
-            lserder = serdering.SerderKERI(raw=raw)  # deserialize event raw
+            # assumes db ensures that receipted event at dig must not be none
+            lserder = self.db.getEvtSerder(pre, ldig)  # retrieve receipted event
 
             if not lserder.compare(said=ked["d"]):  # stale receipt at sn discard
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
@@ -3799,7 +4326,7 @@ class Kevery:
 
                 if wiger.verfer.verify(wiger.raw, lserder.raw):
                     # write receipt indexed sig to database
-                    self.db.addWig(key=dgkey, val=wiger.qb64b)
+                    self.db.addWig(key=dgkey, val=wiger)
 
         else:  # no events to be receipted yet at that sn so escrow
             # get digest from receipt message not receipted event
@@ -3845,9 +4372,8 @@ class Kevery:
             ldig = bytes(ldig).decode("utf-8")
             # retrieve event by dig assumes if ldig is not None that event exists at ldig
             dgkey = dgKey(pre=pre, dig=ldig)
-            raw = bytes(self.db.getEvt(key=dgkey))  # retrieve receipted event at dig
-            # assumes db ensures that raw must not be none
-            lserder = serdering.SerderKERI(raw=raw)  # deserialize event raw
+            # assumes db ensures that receipted event at dig must not be none
+            lserder = self.db.getEvtSerder(pre, ldig)  # retrieve receipted event
 
             if not lserder.compare(said=ked["d"]):  # stale receipt at sn discard
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
@@ -3876,7 +4402,7 @@ class Kevery:
                         index = wits.index(rpre)
                         # create witness indexed signature
                         wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.addWig(key=dgkey, val=wiger.qb64b)  # write to db
+                        self.db.addWig(key=dgkey, val=wiger)  # write to db
                     else:  # not witness rect write receipt couple to database .rcts
                         couple = cigar.verfer.qb64b + cigar.qb64b
                         self.db.addRct(key=dgkey, val=couple)
@@ -3950,14 +4476,17 @@ class Kevery:
                                 " on nonlocal event receipt=\n%s\n", serder.pretty())
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+            verified = self.verifier.verify(raw=serder.raw, sig=cigar.raw,
+                                            verfer=cigar.verfer)
+
+            if verified:
                 wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
                     index = wits.index(rpre)
                     # create witness indexed signature and write to db
                     wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                    self.db.addWig(key=dgKey(pre, ldig), val=wiger.qb64b)
+                    self.db.addWig(key=dgKey(pre, ldig), val=wiger)
                 else:  # write receipt couple to database
                     couple = cigar.verfer.qb64b + cigar.qb64b
                     self.db.addRct(key=dgKey(pre, ldig), val=couple)
@@ -4002,8 +4531,7 @@ class Kevery:
 
         # retrieve event by dig assumes if ldig is not None that event exists at ldig
         ldig = bytes(ldig).decode("utf-8")
-        lraw = self.db.getEvt(key=dgKey(pre=pre, dig=ldig))
-        lserder = serdering.SerderKERI(raw=bytes(lraw))
+        lserder = self.db.getEvtSerder(pre, ldig)
         # verify digs match
         if not lserder.compare(said=ldig):  # mismatch events problem with replay
             raise ValidationError("Mismatch receipt of event at sn = {} with db."
@@ -4032,9 +4560,8 @@ class Kevery:
                                                          "".format(ked))
 
             # retrieve last event itself of receiptor est evt from sdig.
-            sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = serdering.SerderKERI(raw=bytes(sraw))
+            # assumes db ensures that event must not be none because sdig was in KE
+            sserder = self.db.getEvtSerder(sprefixer.qb64b, bytes(sdig))
             if not sserder.compare(said=saider.qb64):  # endorser's dig not match event
                 raise ValidationError("Bad trans indexed sig group at sn = {}"
                                       " for ksn = {}."
@@ -4130,9 +4657,8 @@ class Kevery:
                                                              "".format(ked))
 
                 # retrieve last event itself of receipter
-                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                # assumes db ensures that sraw must not be none because sdig was in KE
-                sserder = serdering.SerderKERI(raw=bytes(sraw))
+                # assumes db ensures that event must not be none because sdig was in KE
+                sserder = self.db.getEvtSerder(sprefixer.qb64b, bytes(sdig))
                 if not sserder.compare(said=saider.qb64):  # seal dig not match event
                     raise ValidationError("Bad trans receipt quadruple at sn = {}"
                                           " for rct = {}."
@@ -4506,9 +5032,8 @@ class Kevery:
         if ldig is not None:  # escrow because event does not yet exist in database
             ldig = bytes(ldig)
             # retrieve last event itself of signer given sdig
-            sraw = self.db.getEvt(key=dgKey(pre=pre, dig=ldig))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = serdering.SerderKERI(raw=bytes(sraw))
+            # assumes db ensures that event must not be none because sdig was in KE
+            sserder = self.db.getEvtSerder(pre, ldig)
 
             if not sserder.compare(said=diger.qb64b):  # mismatch events problem with replay
                 raise ValidationError(f"Mismatch keystate at sn = {int(ksr.s,16)}"
@@ -4622,16 +5147,14 @@ class Kevery:
                     self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                     raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            msgs = list()  # outgoing messages
-            for msg in self.db.clonePreIter(pre=pre, fn=0):
-                msgs.append(msg)
-
-            if kever.delpre:
-                cloner = self.db.clonePreIter(pre=kever.delpre, fn=0)  # create iterator at 0
-                for msg in cloner:
-                    msgs.append(msg)
-
-            if msgs:
+            # outgoing messages cloned lazily as consumed so KEL not held in
+            # memory. Clone iterators are only created when cue is consumed so
+            # their reads neither join the transaction of the parser nor hold
+            # a read transaction open while cue waits
+            pres = [pre, kever.delpre] if kever.delpre else [pre]
+            if any(self.db.getFe(key=fnKey(pre=p, sn=0)) is not None for p in pres):
+                msgs = itertools.chain.from_iterable(
+                    self.db.clonePreIter(pre=p, fn=0) for p in pres)
                 self.cues.push(dict(kin="replay", src=src, msgs=msgs, dest=source.qb64))
 
         elif route == "ksn":
@@ -4646,7 +5169,7 @@ class Kevery:
 
             # get list of witness signatures to ensure we are presenting a fully witnessed event
             wigs = self.db.getWigs(dgKey(pre, kever.serder.saidb))  # list of wigs
-            wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+            wigers = [Siger._fromTrusted(wig) for wig in wigs]
 
             if len(wigers) < kever.toader.num:
                 self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
@@ -4692,11 +5215,10 @@ class Kevery:
                 return None
 
             # retrieve event by dig
-            raw = bytes(self.db.getEvt(key=dgKey(pre=pre, dig=dig)))
-            if not raw:
+            serder = self.db.getEvtSerder(pre, dig)
+            if serder is None:
                 return None
 
-            serder = serdering.SerderKERI(raw=raw)  # deserialize event raw
             if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
                 return serder  # establishment event so return
 
@@ -4733,10 +5255,10 @@ class Kevery:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         if seqner and saider:
             couple = seqner.qb64b + saider.qb64b
             self.db.putPde(dgkey, couple)  # idempotent
@@ -4762,6 +5284,10 @@ class Kevery:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
+        snkey = snKey(serder.preb, serder.sn)
+        if not self.db.admitEscrow("ooes", snkey, serder.saidb):
+            raise EscrowCapacityError(f"Full out of order escrow dropped "
+                                      f"event = {serder.ked}.")
         dgkey = dgKey(serder.preb, serder.saidb)
         if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
             if local and not esr.local:  # local overwrites prexisting remote
@@ -4773,14 +5299,14 @@ class Kevery:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
         if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putWigs(dgkey, wigers)
         if seqner and saider:
             couple = seqner.qb64b + saider.qb64b
             self.db.putPde(dgkey, couple)  # idempotent
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.addOoe(snkey, serder.saidb)
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4797,8 +5323,11 @@ class Kevery:
         """
         cigars = cigars if cigars is not None else []
         dgkey = dgKey(prefixer.qb64b, serder.saidb)
+        if not self.db.admitEscrow("qnfs", dgkey, serder.saidb):
+            raise EscrowCapacityError(f"Full query not found escrow dropped "
+                                      f"event = {serder.ked}.")
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
         self.db.addQnf(dgkey, serder.saidb)
 
@@ -4822,6 +5351,10 @@ class Kevery:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
+        snkey = snKey(serder.preb, serder.sn)
+        if not self.db.admitEscrow("ldes", snkey, serder.saidb):
+            raise EscrowCapacityError(f"Full likely duplicitous escrow dropped "
+                                      f"event = {serder.ked}.")
         dgkey = dgKey(serder.preb, serder.saidb)
         if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
             if local and not esr.local:  # local overwrites prexisting remote
@@ -4833,9 +5366,9 @@ class Kevery:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+        self.db.putSigs(dgkey, sigers)
         self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.addLde(snkey, serder.saidb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4871,7 +5404,12 @@ class Kevery:
             # if wiger.verfer.transferable:  # skip transferable verfers
             # continue  # skip invalid triplets
             couple = said.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            snkey = snKey(serder.preb, serder.sn)
+            if not self.db.admitEscrow("uwes", snkey, couple):
+                raise EscrowCapacityError(f"Full unverified witness receipt "
+                                          f"escrow dropped receipt of pre="
+                                          f"{serder.pre} sn={serder.sn}.")
+            self.db.addUwe(key=snkey, val=couple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4902,7 +5440,12 @@ class Kevery:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
             triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            snkey = snKey(serder.preb, serder.sn)
+            if not self.db.admitEscrow("ures", snkey, triple):
+                raise EscrowCapacityError(f"Full unverified receipt escrow "
+                                          f"dropped receipt of pre="
+                                          f"{serder.pre} sn={serder.sn}.")
+            self.db.addUre(key=snkey, val=triple)  # should be snKey
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                     " sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4946,7 +5489,12 @@ class Kevery:
                       seqner.qb64b + saider.qb64b)
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
-                self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+                snkey = snKey(serder.preb, serder.sn)
+                if not self.db.admitEscrow("vres", snkey, quintuple):
+                    raise EscrowCapacityError(f"Full unverified transferable "
+                                              f"receipt escrow dropped receipt "
+                                              f"of pre={serder.pre} sn={serder.sn}.")
+                self.db.addVre(key=snkey, val=quintuple)
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4988,7 +5536,12 @@ class Kevery:
                   seqner.qb64b + saider.qb64b)
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
-            self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            snkey = snKey(serder.preb, serder.sn)
+            if not self.db.admitEscrow("vres", snkey, quintuple):
+                raise EscrowCapacityError(f"Full unverified transferable "
+                                          f"receipt escrow dropped receipt "
+                                          f"of pre={serder.pre} sn={serder.sn}.")
+            self.db.addVre(key=snkey, val=quintuple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -5021,7 +5574,12 @@ class Kevery:
         self.db.putDts(dgKey(serder.preb, serder.said), helping.nowIso8601().encode("utf-8"))
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
-        self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        snkey = snKey(serder.preb, serder.sn)
+        if not self.db.admitEscrow("vres", snkey, quintuple):
+            raise EscrowCapacityError(f"Full unverified transferable receipt "
+                                      f"escrow dropped receipt of pre="
+                                      f"{serder.pre} sn={serder.sn}.")
+        self.db.addVre(key=snkey, val=quintuple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
@@ -5031,14 +5589,32 @@ class Kevery:
         """
         Iterate throush escrows and process any that may now be finalized
 
+        When in event driven escrow mode, i.e. .fallback is not None, the out
+        of order and unverified receipt escrows are only fully scanned every
+        .fallback seconds. Otherwise only their items woken by newly accepted
+        events are reprocessed via .processWakes.
+
         Parameters:
         """
 
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
+            if self.fallback is not None:  # event driven escrow mode
+                dtnow = helping.nowUTC()
+                if (self.scanned is None or (dtnow - self.scanned) >
+                        datetime.timedelta(seconds=self.fallback)):
+                    self.scanned = dtnow
+                    self.wakes.clear()  # full scan below covers woken items
+                    self.processEscrowOutOfOrders()
+                    self.processEscrowUnverWitness()
+                    self.processEscrowUnverNonTrans()
+                    self.processEscrowUnverTrans()
+                else:
+                    self.processWakes()
+            else:
+                self.processEscrowOutOfOrders()
+                self.processEscrowUnverWitness()
+                self.processEscrowUnverNonTrans()
+                self.processEscrowUnverTrans()
             self.processEscrowPartialWigs()
             self.processEscrowPartialSigs()
             self.processEscrowDuplicitous()
@@ -5051,7 +5627,23 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+    def processWakes(self):
+        """
+        Reprocess only the escrowed items woken by events accepted since the
+        last call instead of walking the whole escrow tables. Accepting the
+        event at pre, sn wakes the out of order events escrowed at pre, sn + 1
+        and the unverified receipts escrowed at pre, sn. Events accepted while
+        reprocessing push further wakes so out of order chains unwind in one
+        call.
+        """
+        while self.wakes:
+            pre, sn = self.wakes.pull()
+            self.processEscrowOutOfOrders(wake=snKey(pre, sn + 1))
+            self.processEscrowUnverWitness(wake=snKey(pre, sn))
+            self.processEscrowUnverNonTrans(wake=snKey(pre, sn))
+            self.processEscrowUnverTrans(wake=snKey(pre, sn))
+
+    def processEscrowOutOfOrders(self, wake=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -5070,7 +5662,7 @@ class Kevery:
         Original Escrow steps:
             dgkey = dgKey(pre, serder.dig)
             self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putSigs(dgkey, sigers)
             self.db.putEvt(dgkey, serder.raw)
             self.db.addOoe(snKey(pre, sn), serder.dig)
             where:
@@ -5087,11 +5679,20 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            wake (bytes | None): snKey of escrowed items woken by acceptance
+                of an event so only reprocess escrowed items at this key.
+                None means full scan of whole escrow.
         """
 
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
+            if wake is None:  # full scan walks whole escrow
+                items = self.db.getOoeItemsNextIter(key=key)
+            else:  # event driven so only escrowed items at wake key
+                items = [(wake, edig) for edig in self.db.getOoes(wake)]
+            for ekey, edig in items:
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     dgkey = dgKey(pre, bytes(edig))
@@ -5122,8 +5723,8 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
+                    eserder = self.db.getEvtSerder(pre, bytes(edig))  # escrowed event
+                    if eserder is None:
                         # no event so raise ValidationError which unescrows below
                         logger.info("Kevery unescrow error: Missing event at."
                                     "dig = %s\n", bytes(edig))
@@ -5131,7 +5732,6 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt at dig = {}."
                                               "".format(bytes(edig)))
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
 
                     #  get sigs and attach
                     sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
@@ -5144,11 +5744,11 @@ class Kevery:
                                               "dig = {}.".format(bytes(edig)))
 
                     # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                    sigers = [Siger._fromTrusted(sig) for sig in sigs]
 
                     #  get wigs
                     wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+                    wigers = [Siger._fromTrusted(wig) for wig in wigs]
 
                     self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, local=esr.local)
 
@@ -5189,7 +5789,7 @@ class Kevery:
                     logger.info("Kevery unescrow succeeded in valid event: "
                                 "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-            if ekey == key:  # still same so no escrows found on last while iteration
+            if wake is not None or ekey == key:  # woken key done or no escrows found
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
@@ -5209,7 +5809,7 @@ class Kevery:
         Original Escrow steps:
             dgkey = dgKey(pre, serder.digb)
             .db.putDts(dgkey, nowIso8601().encode("utf-8"))
-            .db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            .db.putSigs(dgkey, sigers)
             .db.putEvt(dgkey, serder.raw)
             .db.addPse(snKey(pre, sn), serder.digb)
             where:
@@ -5262,8 +5862,8 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgkey)
-                    if eraw is None:
+                    eserder = self.db.getEvtSerder(pre, bytes(edig))  # escrowed event
+                    if eserder is None:
                         # no event so so raise ValidationError which unescrows below
                         logger.info("Kevery unescrow error: Missing event at."
                                     "dig = %s\n", bytes(edig))
@@ -5271,7 +5871,6 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt at dig = {}."
                                               "".format(bytes(edig)))
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
                     #  get sigs and attach
                     sigs = self.db.getSigs(dgkey)
                     if not sigs:  # otherwise its a list of sigs
@@ -5302,7 +5901,7 @@ class Kevery:
                             self.db.putPde(dgkey, couple)
 
                     # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                    sigers = [Siger._fromTrusted(sig) for sig in sigs]
                     self.processEvent(serder=eserder, sigers=sigers,
                                       delseqner=delseqner, delsaider=delsaider, local=esr.local)
 
@@ -5374,7 +5973,7 @@ class Kevery:
         Original Escrow steps:
             dgkey = dgKey(pre, serder.digb)
             .db.putDts(dgkey, nowIso8601().encode("utf-8"))
-            .db.putWigs(dgkey, [siger.qb64b for siger in sigers])
+            .db.putWigs(dgkey, sigers)
             .db.putEvt(dgkey, serder.raw)
             .db.addPwe(snKey(pre, sn), serder.digb)
             where:
@@ -5427,8 +6026,8 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
+                    eserder = self.db.getEvtSerder(pre, bytes(edig))  # escrowed event
+                    if eserder is None:
                         # no event so so raise ValidationError which unescrows below
                         logger.info("Kevery unescrow error: Missing event at."
                                     "dig = %s\n", bytes(edig))
@@ -5436,7 +6035,6 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt at dig = {}."
                                               "".format(bytes(edig)))
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
 
                     #  get sigs
                     sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
@@ -5463,8 +6061,8 @@ class Kevery:
                         # "dig = {}.".format(bytes(edig)))
 
                     # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+                    sigers = [Siger._fromTrusted(sig) for sig in sigs]
+                    wigers = [Siger._fromTrusted(wig) for wig in wigs]
 
                     # seal source (delegator issuer if any)
                     delseqner = delsaider = None
@@ -5519,7 +6117,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, wake=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -5566,12 +6164,21 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            wake (bytes | None): snKey of escrowed items woken by acceptance
+                of an event so only reprocess escrowed items at this key.
+                None means full scan of whole escrow.
         """
 
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
+            if wake is None:  # full scan walks whole escrow
+                items = self.db.getUweItemsNextIter(key=key)
+            else:  # event driven so only escrowed items at wake key
+                items = [(wake, ecouple) for ecouple in self.db.getUwes(wake)]
+            for ekey, ecouple in items:
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
 
@@ -5639,11 +6246,11 @@ class Kevery:
                     logger.info("Kevery unescrow succeeded for event pre=%s "
                                 "sn=%s\n", pre, sn)
 
-            if ekey == key:  # still same so no escrows found on last while iteration
+            if wake is not None or ekey == key:  # woken key done or no escrows found
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, wake=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -5688,12 +6295,21 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            wake (bytes | None): snKey of escrowed items woken by acceptance
+                of an event so only reprocess escrowed items at this key.
+                None means full scan of whole escrow.
         """
 
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
+            if wake is None:  # full scan walks whole escrow
+                items = self.db.getUreItemsNextIter(key=key)
+            else:  # event driven so only escrowed items at wake key
+                items = [(wake, etriplet) for etriplet in self.db.getUres(wake)]
+            for ekey, etriplet in items:
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
@@ -5782,7 +6398,7 @@ class Kevery:
                             index = wits.index(rpre)
                             # create witness indexed signature and write to db
                             wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger)
                         else:  # write receipt couple to database
                             couple = cigar.verfer.qb64b + cigar.qb64b
                             self.db.addRct(key=dgKey(pre, serder.said), val=couple)
@@ -5812,7 +6428,7 @@ class Kevery:
                     logger.info("Kevery unescrow succeeded for event pre=%s "
                                 "sn=%s\n", pre, sn)
 
-            if ekey == key:  # still same so no escrows found on last while iteration
+            if wake is not None or ekey == key:  # woken key done or no escrows found
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
@@ -5870,8 +6486,8 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
+                    eserder = self.db.getEvtSerder(pre, bytes(edig))  # escrowed event
+                    if eserder is None:
                         # no event so raise ValidationError which unescrows below
                         logger.info("Kevery unescrow error: Missing event at."
                                     "dig = %s\n", bytes(edig))
@@ -5879,7 +6495,6 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt at dig = {}."
                                               "".format(bytes(edig)))
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
 
                     #  get sigs and attach
                     sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
@@ -5892,7 +6507,7 @@ class Kevery:
                                               "dig = {}.".format(bytes(edig)))
 
                     # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                    sigers = [Siger._fromTrusted(sig) for sig in sigs]
 
                     # ToDo XXXX get wigs and attach
                     # getWigs
@@ -5968,7 +6583,7 @@ class Kevery:
         for dig in self.db.getPwesIter(key=snKey(pre, sn)):  # search entries
             dig = bytes(dig)  # database dig of receipted event
             # get the escrowed event using database dig in .Pwes
-            serder = serdering.SerderKERI(raw=bytes(self.db.getEvt(dgKey(pre, dig))))  # receipted event
+            serder = self.db.getEvtSerder(pre, dig)  # receipted event
             #  compare digs to ensure database dig and rdiger (receipt's dig) match
             if rsaider.qb64b != dig:
                 continue  # not match keep looking
@@ -6031,7 +6646,8 @@ class Kevery:
                 break  # done with search have caller add wig.
 
         if found:  # verify signature and if verified write to .Wigs
-            if not wiger.verfer.verify(wiger.raw, serder.raw):  # not verify
+            if not self.verifier.verify(raw=serder.raw, sig=wiger.raw,
+                                        verfer=wiger.verfer):  # not verify
                 # raise ValidationError which unescrows .Uwes or .Ures in caller
                 logger.info("Kevery unescrow error: Bad witness receipt"
                             " wig. pre=%s sn=%x\n", pre, sn)
@@ -6039,13 +6655,13 @@ class Kevery:
                 raise ValidationError("Bad escrowed witness receipt wig"
                                       " at pre={} sn={:x}."
                                       "".format(pre, sn))
-            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+            self.db.addWig(key=dgKey(pre, serder.said), val=wiger)
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.delPwe(snkey, dig)
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, wake=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -6088,12 +6704,21 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            wake (bytes | None): snKey of escrowed items woken by acceptance
+                of an event so only reprocess escrowed items at this key.
+                None means full scan of whole escrow.
         """
 
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
+            if wake is None:  # full scan walks whole escrow
+                items = self.db.getVreItemsNextIter(key=key)
+            else:  # event driven so only escrowed items at wake key
+                items = [(wake, equinlet) for equinlet in self.db.getVres(wake)]
+            for ekey, equinlet in items:
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
@@ -6163,9 +6788,8 @@ class Kevery:
                                                                  " sn={:x}".format(pre, sn))
 
                     # retrieve last event itself of receipter
-                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                    # assumes db ensures that sraw must not be none because sdig was in KE
-                    sserder = serdering.SerderKERI(raw=bytes(sraw))
+                    # assumes db ensures that event must not be none because sdig was in KE
+                    sserder = self.db.getEvtSerder(sprefixer.qb64b, bytes(sdig))
                     if not sserder.compare(said=ssaider.qb64):  # seal dig not match event
                         # this unescrows
                         raise ValidationError("Bad chit seal at sn = {} for rct = {}."
@@ -6186,7 +6810,8 @@ class Kevery:
                                               "".format(siger.index))
 
                     siger.verfer = verfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                    if not self.verifier.verify(raw=serder.raw, sig=siger.raw,
+                                                verfer=siger.verfer):  # verify sig
                         logger.info("Kevery unescrow error: Bad trans receipt sig."
                                     "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
@@ -6222,7 +6847,7 @@ class Kevery:
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
                     logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
 
-            if ekey == key:  # still same so no escrows found on last while iteration
+            if wake is not None or ekey == key:  # woken key done or no escrows found
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
@@ -6244,7 +6869,7 @@ class Kevery:
         Original Escrow steps:
             dgkey = dgKey(pre, serder.dig)
             self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putSigs(dgkey, sigers)
             self.db.putEvt(dgkey, serder.raw)
             self.db.addLde(snKey(pre, sn), serder.digb)
             where:
@@ -6295,8 +6920,8 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
+                    eserder = self.db.getEvtSerder(pre, bytes(edig))  # escrowed event
+                    if eserder is None:
                         # no event so raise ValidationError which unescrows below
                         logger.info("Kevery unescrow error: Missing event at."
                                     "dig = %s\n", bytes(edig))
@@ -6304,7 +6929,6 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt at dig = {}."
                                               "".format(bytes(edig)))
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
 
                     #  get sigs and attach
                     sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
@@ -6316,7 +6940,7 @@ class Kevery:
                         raise ValidationError("Missing escrowed evt sigs at "
                                               "dig = {}.".format(bytes(edig)))
 
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                    sigers = [Siger._fromTrusted(sig) for sig in sigs]
                     self.processEvent(serder=eserder, sigers=sigers, local=esr.local)
 
                     # If process does NOT validate event with sigs, becasue it is
@@ -6387,10 +7011,9 @@ def loadEvent(db, preb, dig):
     """
     event = dict()
     dgkey = dbing.dgKey(preb, dig)  # get message
-    if not (raw := db.getEvt(key=dgkey)):
+    if (serder := db.getEvtSerder(preb, dig)) is None:
         raise ValueError("Missing event for dig={}.".format(dig))
 
-    serder = serdering.SerderKERI(raw=bytes(raw))
     event["ked"] = serder.ked
 
     sn = serder.sn
@@ -6403,7 +7026,7 @@ def loadEvent(db, preb, dig):
     sigs = db.getSigs(key=dgkey)
     dsigs = []
     for s in sigs:
-        sig = coring.Siger(qb64b=bytes(s))
+        sig = coring.Siger._fromTrusted(s)
         dsigs.append(dict(index=sig.index, signature=sig.qb64))
     event["signatures"] = dsigs
 
@@ -6415,7 +7038,7 @@ def loadEvent(db, preb, dig):
     dwigs = []
     if wigs := db.getWigs(key=dgkey):
         for w in wigs:
-            sig = coring.Siger(qb64b=bytes(w))
+            sig = coring.Siger._fromTrusted(w)
             dwigs.append(dict(index=sig.index, signature=sig.qb64))
     event["witness_signatures"] = dwigs
 
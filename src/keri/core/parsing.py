@@ -20,6 +20,108 @@ from ..kering import ColdDex, Colds, sniff
 logger = help.ogler.getLogger()
 
 
+def verifySaid(raw):
+    """
+    Returns True if the said(s) of the serialized message raw verify, False
+    otherwise. Module level function so it may be pickled and run in a worker
+    process of a concurrent.futures process pool.
+
+    Parameters:
+        raw (bytes): serialized message without attachments
+    """
+    try:
+        serdering.Serdery(version=kering.Version).reap(ims=bytearray(raw))
+    except Exception:
+        return False
+    return True
+
+
+class Cursor:
+    """
+    Cursor is a read cursor over a zero copy memoryview of a fixed message
+    stream buffer. It quacks like the bytearray streams the Parser extractors
+    consume, but stripping extracted bytes from the front of the stream with
+    del only advances the cursor's offset into the view. Neither the stream
+    nor its unconsumed remainder is ever copied or moved. Only the bytes of
+    each requested slice, that is, the primitive or message being extracted,
+    are copied out. The consumed front of the underlying buffer is compacted
+    only on .compact which the Parser calls once a fixed stream has been
+    parsed, even when parsing fails.
+
+    Because the buffer is exported to a memoryview it may not be resized
+    until compacted so Cursor is only for fixed (non-live) streams. Compact
+    releases the view so the producer of the buffer may extend it again.
+
+    Attributes:
+        buf (bytes | bytearray | memoryview): underlying stream buffer
+        view (memoryview): zero copy view of .buf
+        offset (int): index into .view of front of unconsumed stream
+
+    """
+
+    def __init__(self, buf):
+        """
+        Initialize instance
+
+        Parameters:
+            buf (bytes | bytearray | memoryview): stream buffer
+        """
+        self.buf = buf
+        self.view = memoryview(buf)
+        self.offset = 0
+
+
+    def __len__(self):
+        return len(self.view) - self.offset
+
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+    def __getitem__(self, key):
+        """
+        Returns int when key is index or bytearray copy of only the sliced
+        bytes when key is slice, both relative to front of unconsumed stream
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return bytearray(self.view[self.offset + start:self.offset + stop:step])
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Cursor index out of range.")
+        return self.view[self.offset + key]
+
+
+    def __delitem__(self, key):
+        """
+        Strips bytes from front of unconsumed stream by advancing offset.
+        Only supports front slices such as del cursor[:n] or del cursor[:]
+        """
+        if not (isinstance(key, slice) and key.start in (None, 0) and key.step is None):
+            raise TypeError("Cursor only supports deleting front slices.")
+        _, stop, _ = key.indices(len(self))
+        self.offset += stop
+
+
+    def compact(self):
+        """
+        Compacts underlying buffer by releasing view and deleting consumed
+        bytes from front of .buf when it is a bytearray. The view is not
+        reexported so .buf may be resized afterwards. Done so make a new
+        Cursor of .buf to extract more.
+        """
+        if self.view is None:  # already compacted
+            return
+        self.view.release()
+        self.view = None
+        if isinstance(self.buf, bytearray):
+            del self.buf[:self.offset]
+            self.offset = 0
+
+
 class Parser:
     """
     Parser is stream parser that processes an incoming message stream.
@@ -47,11 +149,25 @@ class Parser:
         vry (Verfifier): credential verifier with wallet storage
         local (bool): True means event source is local (protected) for validation
                          False means event source is remote (unprotected) for validation
+        batch (bool): True means .allParsator extracts messages in batches of up
+                to .BatchSize and batch verifies their signatures via kvy.batcher
+                before dispatching them in order. Requires kvy in batch mode.
+                False means extract and dispatch one message at a time.
+        executor (concurrent.futures.Executor | None): pool of workers used in
+                batch mode to verify the saids and signatures of each batch in
+                parallel before dispatching the batch in order on this thread.
+                None means verify in this process.
+        cursor (bool): True means .parse and .parseOne extract from a Cursor,
+                a zero copy view of the fixed stream that strips by advancing
+                an offset and compacts the stream only when done parsing.
+                False means extract from a bytearray (copy) of the stream.
 
     """
+    BatchSize = 256  # max number of messages extracted per batch in batch mode
 
     def __init__(self, ims=None, framed=True, pipeline=False, kvy=None,
-                 tvy=None, exc=None, rvy=None, vry=None, local=False):
+                 tvy=None, exc=None, rvy=None, vry=None, local=False, batch=False,
+                 executor=None, cursor=False):
         """
         Initialize instance:
 
@@ -68,6 +184,12 @@ class Parser:
             vry (Verfifier): credential verifier with wallet storage
             local (bool): True means event source is local (protected) for validation
                          False means event source is remote (unprotected) for validation
+            batch (bool): True means batch verify signatures of extracted
+                messages when kvy is in batch mode
+            executor (concurrent.futures.Executor | None): pool of workers to
+                verify saids and signatures in parallel when in batch mode
+            cursor (bool): True means .parse and .parseOne use zero copy
+                Cursor extraction on fixed streams
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
@@ -78,6 +200,9 @@ class Parser:
         self.rvy = rvy
         self.vry = vry
         self.local = True if local else False
+        self.batch = True if batch else False
+        self.executor = executor
+        self.cursor = True if cursor else False
 
 
     @staticmethod
@@ -299,22 +424,29 @@ class Parser:
         local = local if local is not None else self.local
         local = True if local else False
 
+        if self.cursor:  # zero copy extraction from fixed stream
+            ims = Cursor(ims if ims is not None else self.ims)
+
+        try:
+            parsator = self.allParsator(ims=ims,
+                                        framed=framed,
+                                        pipeline=pipeline,
+                                        kvy=kvy,
+                                        tvy=tvy,
+                                        exc=exc,
+                                        rvy=rvy,
+                                        vry=vry,
+                                        local=local)
+
+            while True:
+                try:
+                    next(parsator)
+                except StopIteration:
+                    break
 
-        parsator = self.allParsator(ims=ims,
-                                    framed=framed,
-                                    pipeline=pipeline,
-                                    kvy=kvy,
-                                    tvy=tvy,
-                                    exc=exc,
-                                    rvy=rvy,
-                                    vry=vry,
-                                    local=local)
-
-        while True:
-            try:
-                next(parsator)
-            except StopIteration:
-                break
+        finally:  # release view and compact even when parsing raises
+            if self.cursor:
+                ims.compact()
 
 
     def parseOne(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None,
@@ -351,20 +483,28 @@ class Parser:
         local = local if local is not None else self.local
         local = True if local else False
 
-        parsator = self.onceParsator(ims=ims,
-                                     framed=framed,
-                                     pipeline=pipeline,
-                                     kvy=kvy,
-                                     tvy=tvy,
-                                     exc=exc,
-                                     rvy=rvy,
-                                     vry=vry,
-                                     local=local)
-        while True:
-            try:
-                next(parsator)
-            except StopIteration:
-                break
+        if self.cursor:  # zero copy extraction from fixed stream
+            ims = Cursor(ims if ims is not None else self.ims)
+
+        try:
+            parsator = self.onceParsator(ims=ims,
+                                         framed=framed,
+                                         pipeline=pipeline,
+                                         kvy=kvy,
+                                         tvy=tvy,
+                                         exc=exc,
+                                         rvy=rvy,
+                                         vry=vry,
+                                         local=local)
+            while True:
+                try:
+                    next(parsator)
+                except StopIteration:
+                    break
+
+        finally:  # release view and compact even when parsing raises
+            if self.cursor:
+                ims.compact()
 
 
     def allParsator(self, ims=None, framed=None, pipeline=None, kvy=None,
@@ -400,7 +540,7 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not isinstance(ims, (bytearray, Cursor)):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
@@ -415,6 +555,18 @@ class Parser:
         local = local if local is not None else self.local
         local = True if local else False
 
+        if self.batch and kvy is not None and kvy.batcher is not None:
+            done = yield from self.batchParsator(ims=ims,
+                                                 framed=framed,
+                                                 pipeline=pipeline,
+                                                 kvy=kvy,
+                                                 tvy=tvy,
+                                                 exc=exc,
+                                                 rvy=rvy,
+                                                 vry=vry,
+                                                 local=local)
+            return done
+
         while ims:  # only process until ims empty
             try:
                 done = yield from self.msgParsator(ims=ims,
@@ -453,6 +605,167 @@ class Parser:
         return True
 
 
+    def batchParsator(self, ims=None, framed=None, pipeline=None, kvy=None,
+                      tvy=None, exc=None, rvy=None, vry=None, local=None):
+        """
+        Returns generator to parse all messages from incoming message stream,
+        ims, in batches until ims is exhausted (empty) then returns.
+        Each batch extracts up to .BatchSize messages, then collects the
+        signatures of all the key event messages in the batch into kvy.batcher
+        and verifies them together, then dispatches each message in stream
+        order so that processing (state change) order is unchanged.
+        The dispatches of each batch join one bulk transaction of kvy.db so the
+        whole batch commits with one sync. When the stream runs short of bytes
+        the messages already extracted are dispatched before waiting for more
+        so a partial batch is never held back by a slow stream.
+        If ims not provided then parse messages from .ims
+
+        When .executor is provided the crypto checks of each batch, that is the
+        said verification of each message and the verification of collected
+        signatures, are done in parallel by the executor's workers. Messages
+        whose saids do not verify are dropped. Only the stateless checks are
+        offloaded, all state changes are applied by dispatch in stream order
+        on this thread so per prefix event ordering is preserved.
+
+        Parameters:
+            ims is bytearray of incoming message stream. May contain one or more
+                sets each of a serialized message with attached cryptographic
+                material such as signatures or receipts.
+
+            framed is Boolean, True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+
+            pipeline is Boolean, True means use pipeline processor to process
+                ims msgs when stream incpyludes pipelined count codes.
+
+            kvy (Kevery): route KERI KEL message types to this instance.
+                Must be in batch mode i.e. have .batcher
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verfifier): credential verifier with wallet storage
+            local (bool): True means event source is local (protected) for validation
+                          False means event source is remote (unprotected) for validation
+                          None means use default .local
+        """
+        if ims is not None:  # needs bytearray not bytes since deletes as processes
+            if not isinstance(ims, (bytearray, Cursor)):
+                ims = bytearray(ims)  # so make bytearray copy
+        else:
+            ims = self.ims  # use instance attribute by default
+
+        framed = framed if framed is not None else self.framed
+        pipeline = pipeline if pipeline is not None else self.pipeline
+        kvy = kvy if kvy is not None else self.kvy
+        tvy = tvy if tvy is not None else self.tvy
+        exc = exc if exc is not None else self.exc
+        rvy = rvy if rvy is not None else self.rvy
+        vry = vry if vry is not None else self.vry
+        local = local if local is not None else self.local
+        local = True if local else False
+
+        while ims:  # only process until ims empty
+            msgs = []
+            while ims and len(msgs) < self.BatchSize:  # extract batch
+                extractor = self.msgExtractor(ims=ims,
+                                              framed=framed,
+                                              pipeline=pipeline,
+                                              verify=self.executor is None)
+                try:
+                    while True:  # drive extractor so batch not held while it waits
+                        try:
+                            next(extractor)  # yields when shortage of bytes
+                        except StopIteration as ex:
+                            msg = ex.value
+                            break
+                        if msgs:  # dispatch extracted msgs before waiting for more
+                            self.dispatchBatch(msgs, kvy=kvy, tvy=tvy, exc=exc,
+                                               rvy=rvy, vry=vry, local=local)
+                            msgs = []
+                        yield
+
+                except kering.SizedGroupError as ex:  # error inside sized group
+                    # msgExtractor already flushed group so do not flush stream
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Parser msg extraction error: %s\n", ex.args[0])
+
+                except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Parser msg extraction error: %s\n", ex.args[0])
+                    del ims[:]  # delete rest of stream to force cold restart
+
+                except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg non-extraction error: %s\n", ex)
+                    else:
+                        logger.error("Parser msg non-extraction error: %s\n", ex)
+
+                else:
+                    if msg is not None:
+                        msgs.append(msg)
+
+            self.dispatchBatch(msgs, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry,
+                               local=local)
+            yield  # after transaction so never suspended with it open
+
+        return True
+
+
+    def dispatchBatch(self, msgs, kvy, tvy=None, exc=None, rvy=None, vry=None,
+                      local=False):
+        """
+        Verifies together the signatures of the key event messages in batch
+        msgs then dispatches each of msgs in stream order in one bulk
+        transaction of kvy.db. See .batchParsator
+
+        Parameters:
+            msgs (list): of duples (serder, exts) of extracted messages
+            kvy (Kevery): route KERI KEL message types to this instance.
+                Must be in batch mode i.e. have .batcher
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verfifier): credential verifier with wallet storage
+            local (bool): True means event source is local (protected) for validation
+                          False means event source is remote (unprotected) for validation
+        """
+        if self.executor is not None and msgs:  # verify saids in parallel
+            saids = self.executor.map(verifySaid,
+                                      [serder.raw for serder, exts in msgs],
+                                      chunksize=kvy.batcher.Chunk)
+            vmsgs = []
+            for (serder, exts), verified in zip(msgs, saids):
+                if verified:
+                    vmsgs.append((serder, exts))
+                else:
+                    logger.error("Parser msg non-extraction error: Invalid "
+                                 "said for msg = %s\n", serder.sad)
+            msgs = vmsgs
+
+        for serder, exts in msgs:  # collect sigs of key events in batch
+            if (isinstance(serder, serdering.SerderKERI) and
+                    serder.ilk in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt)):
+                kvy.prefetchSigs(serder, sigers=exts["sigers"],
+                                 wigers=exts["wigers"], cigars=exts["cigars"])
+        kvy.batcher.flush(executor=self.executor)  # verify whole batch together
+
+        with kvy.db.txn():  # commit whole batch in one transaction
+            for serder, exts in msgs:  # dispatch in stream order
+                try:
+                    self.dispatch(serder, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy,
+                                  vry=vry, local=local, **exts)
+
+                except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg non-extraction error: %s\n", ex)
+                    else:
+                        logger.error("Parser msg non-extraction error: %s\n", ex)
+
+
     def onceParsator(self, ims=None, framed=None, pipeline=None, kvy=None,
                      tvy=None, exc=None, rvy=None, vry=None, local=None):
         """
@@ -484,7 +797,7 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not isinstance(ims, (bytearray, Cursor)):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
@@ -575,7 +888,7 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not isinstance(ims, (bytearray, Cursor)):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
@@ -680,6 +993,45 @@ class Parser:
         local = local if local is not None else self.local
         local = True if local else False
 
+        msg = yield from self.msgExtractor(ims=ims, framed=framed, pipeline=pipeline)
+        if msg is None:  # extracted pipelined group passed to pipeline processor
+            return
+
+        serder, exts = msg
+        return self.dispatch(serder, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy,
+                             vry=vry, local=local, **exts)
+
+
+    def msgExtractor(self, ims=None, framed=True, pipeline=False, verify=True):
+        """
+        Returns generator that extracts one msg with its attached crypto
+        material (signatures etc) from incoming message stream, ims, without
+        dispatching it for processing. Uses .ims when ims is not provided.
+
+        Iterator yields when not enough bytes in ims to finish one msg plus
+        attachments. Returns (which raises StopIteration) when finished with
+        return value of the extracted msg.
+
+        Returns:
+            msg (tuple | None): (serder, exts) where serder is extracted message
+                instance and exts is dict of extracted attachment lists keyed by
+                the parameter names of .dispatch. None when extracted pipelined
+                group is passed to pipeline processor
+
+        Parameters:
+            ims (bytearray) of serialized incoming message stream.
+                May contain one or more sets each of a serialized message with
+                attached cryptographic material such as signatures or receipts.
+
+            framed (bool) True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+
+            pipeline (bool) True means use pipeline processor to process
+                ims msgs when stream includes pipelined count codes.
+
+            verify (bool) True means verify said(s) of extracted message.
+                False means caller must verify said(s) before dispatch.
+        """
         serdery = serdering.Serdery(version=kering.Version)
 
         if ims is None:
@@ -697,7 +1049,7 @@ class Parser:
 
         while True:  # extract, deserialize, and strip message from ims
             try:
-                serder = serdery.reap(ims=ims)  # can set version here
+                serder = serdery.reap(ims=ims, verify=verify)  # can set version here
             except kering.ShortageError as ex:  # need more bytes
                 yield
             else: # extracted and stripped successfully
@@ -745,7 +1097,7 @@ class Parser:
 
                     if pipeline:
                         pass  # pass extracted ims to pipeline processor
-                        return
+                        return None
 
                     ctr = yield from self._extractor(ims=ims,
                                                      klas=Counter,
@@ -974,6 +1326,45 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        exts = dict(sigers=sigers, wigers=wigers, cigars=cigars, trqs=trqs,
+                    tsgs=tsgs, ssgs=ssgs, frcs=frcs, sscs=sscs, ssts=ssts,
+                    sadtsgs=sadtsgs, sadcigs=sadcigs, pathed=pathed)
+        return (serder, exts)
+
+
+    def dispatch(self, serder, *, sigers, wigers, cigars, trqs, tsgs, ssgs,
+                 frcs, sscs, ssts, sadtsgs, sadcigs, pathed, kvy=None, tvy=None,
+                 exc=None, rvy=None, vry=None, local=False):
+        """
+        Dispatches processing of extracted message serder with its extracted
+        attachments to the appropriate message processor based on the message
+        protocol and ilk.
+
+        Returns:
+            done (bool): True when dispatched
+
+        Parameters:
+            serder (Serder): instance of extracted message
+            sigers (list): of Siger instances of attached controller indexed sigs
+            wigers (list): of Siger instances of attached witness indexed sigs
+            cigars (list): of Cigar instances of nontrans rct couplets
+            trqs (list): of (prefixer, seqner, diger, siger) trans receipt quadruples
+            tsgs (list): of (prefixer, seqner, diger, sigers) trans indexed sig groups
+            ssgs (list): of (prefixer, sigers) signer seal sig groups
+            frcs (list): of (seqner, dater) first seen replay couples
+            sscs (list): of (seqner, diger) source seal couples
+            ssts (list): of (prefixer, seqner, diger) source seal triples
+            sadtsgs (list): of SAD path trans indexed sig groups
+            sadcigs (list): of SAD path nontrans sig groups
+            pathed (list): of pathed material groups
+            kvy (Kevery) route KERI KEL message types to this instance
+            tvy (Tevery) route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier) ACDC credential processor
+            local (bool): True means event source is local (protected) for validation
+                          False means event source is remote (unprotected) for validation
+        """
         if isinstance(serder, serdering.SerderKERI):
             ilk = serder.ilk  # dispatch abased on ilk
 
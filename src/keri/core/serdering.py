@@ -60,7 +60,7 @@ class Serdery:
         self.version = version  # default version
 
 
-    def reap(self, ims, *, version=None):
+    def reap(self, ims, *, version=None, verify=True):
         """Extract and return Serder subclass based on protocol type reaped from
         version string inside serialized raw of Serder.
 
@@ -73,15 +73,20 @@ class Serdery:
                 of stream is raw Serder.
             version (Versionage | None): instance supported protocol version
                 None means do not enforce a supported version
+            verify (bool): True means verify said(s) of reaped Serder.
+                False means caller is responsible for verifying said(s) later
+                such as in a process pool.
         """
         version = version if version is not None else self.version
 
         smellage = smell(ims, version=version)
 
         if smellage.protocol == Protos.keri:
-            return SerderKERI(raw=ims, strip=True, version=version, smellage=smellage)
+            return SerderKERI(raw=ims, strip=True, version=version,
+                              smellage=smellage, verify=verify)
         elif smellage.protocol == Protos.acdc:
-            return SerderACDC(raw=ims, strip=True, version=version, smellage=smellage)
+            return SerderACDC(raw=ims, strip=True, version=version,
+                              smellage=smellage, verify=verify)
         else:
             raise ProtocolError(f"Unsupported protocol type = {smellage.proto}.")
 
@@ -931,6 +936,30 @@ class Serder:
         return json.dumps(self._sad, indent=1)[:size]
 
 
+    def clone(self):
+        """Utility method to copy self without deserializing .raw
+        Returns:
+            serder (Serder): new instance of same class as self that shares
+                immutable .raw but has its own copy of the nested dicts and
+                lists of .sad so changing one never changes the other.
+                Skips said verification so only for verified instances such
+                as those shared from a cache.
+        """
+        serder = copy.copy(self)
+        serder._sad = self._copy(self._sad)
+        return serder
+
+
+    @classmethod
+    def _copy(clas, val):
+        """Returns copy of val with its nested dicts and lists copied"""
+        if isinstance(val, dict):
+            return {k: clas._copy(v) for k, v in val.items()}
+        if isinstance(val, list):
+            return [clas._copy(v) for v in val]
+        return val
+
+
     @property
     def raw(self):
         """raw property getter
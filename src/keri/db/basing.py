@@ -21,7 +21,7 @@ need to call it
 
 import os
 import shutil
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 import json
@@ -45,6 +45,9 @@ from ..help import helping
 
 logger = help.ogler.getLogger()
 
+# bytes values of Base64 characters. First byte of qb64b of an indexed signature
+# is always one and first byte of its qb2 never is
+B64Bytes = frozenset(ord(c) for c in coring.B64_CHARS)
 
 
 # ToDo XXXX maybe
@@ -78,16 +81,49 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .cap is not None the resident set is bounded to .cap kevers by clock
+    (second chance) eviction. Each insert or hit marks its key as referenced. Eviction
+    sweeps from oldest insertion, giving referenced or pinned kevers a second
+    chance by reinserting them and evicting the first unreferenced unpinned
+    kever. Referenced unpinned kevers given a second chance are compacted to
+    release their materialized CESR objects. Kevers of local habs in .db.prefixes or .db.groups are pinned and
+    never evicted. Evicted kevers are rebuilt from .db.states on demand.
+    Since a read that misses may evict, iteration over a bounded dbdict is
+    over a snapshot of its keys so loops may read items as they go.
+
+    Attributes:
+        db (Baser | None): database for read through from states
+        cap (int | None): max resident kevers. None means unbounded
+        refs (set): keys referenced since last eviction sweep
+        hits (int): count of lookups found resident
+        misses (int): count of lookups rebuilt from .db.states
+        evictions (int): count of kevers evicted
+
+    Properties:
+        resident (int): number of resident kevers
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'cap', 'refs', 'hits', 'misses', 'evictions')  # no .__dict__
 
     def __init__(self, *pa, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.cap = None
+        self.refs = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def resident(self):
+        """
+        Returns number of resident kevers in memory
+        """
+        return len(self)
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            item = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
             if not self.db:
                 raise ex  # reraise KeyError
@@ -97,8 +133,30 @@ class dbdict(dict):
                 kever = eventing.Kever(state=ksr, db=self.db)
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
+            self.misses += 1
             self.__setitem__(k, kever)
             return kever
+        self.hits += 1
+        if self.cap is not None:
+            self.refs.add(k)
+        return item
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self.cap is not None:
+            self.refs.add(k)  # new kever gets a chance to be used
+            if len(self) > self.cap:
+                self.evict()
+
+    def __delitem__(self, k):
+        super(dbdict, self).__delitem__(k)
+        self.refs.discard(k)
+
+    def __iter__(self):
+        if self.cap is None:
+            return super(dbdict, self).__iter__()
+        # snapshot of keys since reads in loop may evict
+        return iter(list(super(dbdict, self).__iter__()))
 
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
@@ -121,13 +179,44 @@ class dbdict(dict):
             kever: converted from underlying dict or database
 
         """
-        if not super(dbdict, self).__contains__(k):
-            return default
-        else:
+        try:
             return self.__getitem__(k)
+        except KeyError:
+            return default
 
+    def clear(self):
+        """Override of dict clear method that also clears references"""
+        super(dbdict, self).clear()
+        self.refs.clear()
 
+    def pinned(self, k):
+        """
+        Returns True if kever at k is pinned resident because its prefix is
+        a local hab or group hab prefix in .db. False otherwise.
 
+        Parameters:
+            k (str): key for dict
+        """
+        return (True if self.db is not None and
+                (k in self.db.prefixes or k in self.db.groups) else False)
+
+    def evict(self):
+        """
+        Evicts unreferenced unpinned kevers by clock sweep until no more than
+        .cap kevers are resident or every resident kever is pinned.
+        """
+        sweeps = 2 * len(self)  # every ref cleared by one sweep so two suffice
+        while len(self) > self.cap and sweeps > 0:
+            sweeps -= 1
+            k = next(super(dbdict, self).__iter__())  # oldest
+            v = super(dbdict, self).pop(k)
+            if k in self.refs or self.pinned(k):  # second chance
+                if k in self.refs and not self.pinned(k):
+                    v.compact()  # aging so release materialized CESR objects
+                self.refs.discard(k)
+                super(dbdict, self).__setitem__(k, v)
+            else:
+                self.evictions += 1
 
 
 @dataclass
@@ -623,6 +712,8 @@ class Baser(dbing.LMDBer):
             dgKey
             DB is keyed by identifier prefix plus digest of serialized event
             More than one value per DB key is allowed
+            Values are qb64b or when .binary qb2. Readers accept either so
+            databases may hold a mix of both
 
         .wigs is named sub DB of indexed witness signatures of event that may
             come directly or derived from a witness receipt message.
@@ -632,6 +723,7 @@ class Baser(dbing.LMDBer):
             dgKey
             DB is keyed by identifier prefix plus digest of serialized event
             More than one value per DB key is allowed
+            Values are qb64b or when .binary qb2 same as .sigs
 
         .rcts is named sub DB of event receipt couplets from nontransferable
             signers.
@@ -847,15 +939,53 @@ class Baser(dbing.LMDBer):
         the events's prefix and sequence number so can look up an event by any
         of its next public signing key digests. Updated by Kever.logEvent
 
+        .ancs is CatCesrIoSetSuber with subkey="ancs." of concatenated tuples
+        (qb64 snh, qb64 said) of the anchoring events indexed by the keys
+        (anchoring pre, qb64 digest of seal) of each seal anchored in those
+        events. So can look up the events that anchor a given seal
+        without scanning the anchoring KEL. Updated by Kever.logEvent.
+        Rebuilt by .reindexSeals on open of databases created before the index.
+
+        .idxs is Suber with subkey="idxs." of the datetime each index was
+        completely built keyed by the subkey of the index such as "ancs.".
+        Indices without entry are incomplete so not trusted on a miss.
+
         Missing ToDo XXXX other attributes as sub dbs not documented here
             such as .wits etc
 
+        serders (OrderedDict): LRU cache of verified SerderKERI instances of
+            events in .evts keyed by dgKey(pre, dig). Bounded by both
+            .SerderCacheSize entries and .SerderCacheBytes total raw size
+        serdersBytes (int): total size of raw of serders in .serders
+        serderHits (int): count of .getEvtSerder lookups found in .serders
+        serderMisses (int): count of .getEvtSerder lookups loaded from .evts
+        binary (bool): True means store indexed signatures in .sigs and .wigs
+            in binary qb2 which is 25% smaller than qb64b and may be cloned
+            into binary wire messages without conversion
+            False means store in qb64b
+        escrowLimit (int): max entries in each of the .Escrows escrows
+        prefixLimit (int): max entries per identifier prefix in each of the
+            .Escrows escrows
+        evict (bool): True means a full escrow evicts the oldest entry of the
+            same identifier prefix as the new entry to make room for it.
+            False means a full escrow drops the new entry
+        escrowDrops (dict): count of entries dropped keyed by escrow name
+        escrowEvicts (dict): count of entries evicted keyed by escrow name
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
+            bounded to .KeverCacheSize resident kevers with local habs pinned
 
     """
+    SerderCacheSize = 4096  # max number of event serders in .serders
+    SerderCacheBytes = 1 << 24  # max total raw size of event serders in .serders
+    KeverCacheSize = 65536  # max resident non-local kevers in .kevers
+    EscrowLimit = 65536  # max entries in each escrow of .Escrows
+    PrefixLimit = 1024  # max entries per identifier prefix in each escrow
+    Escrows = ("ooes", "pses", "pwes", "ldes", "uwes", "ures", "vres", "qnfs")
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, binary=False,
+                 escrowLimit=None, prefixLimit=None, evict=True, **kwa):
         """
         Setup named sub databases.
 
@@ -870,6 +1000,13 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            binary (bool): True means store indexed signatures in binary qb2
+                False means store in qb64b. See .binary
+            escrowLimit (int): max entries in each escrow. Default .EscrowLimit
+            prefixLimit (int): max entries per identifier prefix in each escrow.
+                Default .PrefixLimit
+            evict (bool): True means evict oldest entry of same prefix when
+                full. False means drop new entry when full. See .evict
 
 
         """
@@ -877,6 +1014,20 @@ class Baser(dbing.LMDBer):
         self.groups = oset()  # group hab ids
         self._kevers = dbdict()
         self._kevers.db = self  # assign db for read through cache of kevers
+        self._kevers.cap = self.KeverCacheSize  # bound resident kevers
+        self.serders = OrderedDict()  # LRU cache of event serders
+        self.serdersBytes = 0
+        self.serderHits = 0
+        self.serderMisses = 0
+        self.binary = True if binary else False
+        self.escrowLimit = (escrowLimit if escrowLimit is not None
+                            else self.EscrowLimit)
+        self.prefixLimit = (prefixLimit if prefixLimit is not None
+                            else self.PrefixLimit)
+        self.evict = True if evict else False
+        self.sealsIndexed = False  # True means .ancs complete so trusted on miss
+        self.escrowDrops = {name: 0 for name in self.Escrows}
+        self.escrowEvicts = {name: 0 for name in self.Escrows}
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -904,6 +1055,7 @@ class Baser(dbing.LMDBer):
 
         """
         super(Baser, self).reopen(**kwa)
+        self.clearEvtSerders()  # reopened db may not match cached events
 
         # Create by opening first time named sub DBs within main DB instance
         # Names end with "." as sub DB name must include a non Base64 character
@@ -943,9 +1095,12 @@ class Baser(dbing.LMDBer):
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=coring.Seqner)
         # Kever state made of KeyStateRecord key states
+        # read on almost every message so compact positional msgpack
         self.states = koming.Komer(db=self,
                                    schema=KeyStateRecord,
-                                   subkey='stts.')
+                                   subkey='stts.',
+                                   kind=coring.Serials.mgpk,
+                                   positional=True)
 
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
 
@@ -978,7 +1133,7 @@ class Baser(dbing.LMDBer):
         # all reply messages. Maps reply said to serialization. Replys are
         # versioned sads ( with version string) so use Serder to deserialize and
         # use  .sdts, .ssgs, and .scgs for datetimes and signatures
-        self.rpys = subing.SerderSuber(db=self, subkey='rpys.')
+        self.rpys = subing.SerderSuber(db=self, subkey='rpys.', verify=False)
 
         # all reply escrows indices of partially signed reply messages. Maps
         # route in reply to single (Saider,)  of escrowed reply.
@@ -997,13 +1152,17 @@ class Baser(dbing.LMDBer):
         # service endpoint identifier (eid) auths keyed by controller cid.role.eid
         # data extracted from reply /end/role/add or /end/role/cut
         self.ends = koming.Komer(db=self, subkey='ends.',
-                                 schema=EndpointRecord, )
+                                 schema=EndpointRecord,
+                                 kind=coring.Serials.mgpk,
+                                 positional=True)
 
         # service endpont locations keyed by eid.scheme  (endpoint identifier)
         # data extracted from reply loc
         self.locs = koming.Komer(db=self,
                                  subkey='locs.',
-                                 schema=LocationRecord, )
+                                 schema=LocationRecord,
+                                 kind=coring.Serials.mgpk,
+                                 positional=True)
 
         # index of last retrieved message from witness mailbox
         self.tops = koming.Komer(db=self,
@@ -1027,16 +1186,16 @@ class Baser(dbing.LMDBer):
                                      klas=coring.Saider)
 
         # exchange message partial signature escrow
-        self.epse = subing.SerderSuber(db=self, subkey="epse.")
+        self.epse = subing.SerderSuber(db=self, subkey="epse.", verify=False)
 
         # exchange messages
-        self.exns = subing.SerderSuber(db=self, subkey="exns.")
+        self.exns = subing.SerderSuber(db=self, subkey="exns.", verify=False)
 
         # Forward pointer to a provided reply message
         self.erpy = subing.CesrSuber(db=self, subkey="erpy.", klas=coring.Saider)
 
         # exchange messages
-        self.sxns = subing.SerderSuber(db=self, subkey="sxns.")
+        self.sxns = subing.SerderSuber(db=self, subkey="sxns.", verify=False)
 
         # exchange message signatures
         self.esigs = subing.CesrIoSetSuber(db=self, subkey='esigs.', klas=coring.Siger)
@@ -1142,10 +1301,10 @@ class Baser(dbing.LMDBer):
 
         # Delegation escrow dbs #
         # delegated partial witness escrow
-        self.dpwe = subing.SerderSuber(db=self, subkey='dpwe.')
+        self.dpwe = subing.SerderSuber(db=self, subkey='dpwe.', verify=False)
 
         # delegated unanchored escrow
-        self.dune = subing.SerderSuber(db=self, subkey='dune.')
+        self.dune = subing.SerderSuber(db=self, subkey='dune.', verify=False)
 
         # completed group multisig
         self.cdel = subing.CesrSuber(db=self, subkey='cdel.',
@@ -1163,12 +1322,26 @@ class Baser(dbing.LMDBer):
         self.digs = subing.CatCesrIoSetSuber(db=self, subkey="digs.",
                                              klas=(coring.Prefixer, coring.Seqner))
 
+        # anchored seals mapped to the event seq no and said of the events in
+        # the anchoring KEL that anchor them so can look up anchoring event
+        # updated by Kever.logEvent.
+        self.ancs = subing.CatCesrIoSetSuber(db=self, subkey="ancs.",
+                                             klas=(coring.Seqner, coring.Saider))
+
+        # datetime each index was completely built keyed by subkey of index
+        self.idxs = subing.Suber(db=self, subkey="idxs.")
+
         # multisig sig embed payload SAID mapped to containing exn messages across group multisig participants
         self.meids = subing.CesrIoSetSuber(db=self, subkey="meids.", klas=coring.Saider)
 
         # multisig sig embed payload SAID mapped to group multisig participants AIDs
         self.maids = subing.CesrIoSetSuber(db=self, subkey="maids.", klas=coring.Prefixer)
 
+        # index anchored seals of databases created before the index existed
+        self.sealsIndexed = self.idxs.get(keys="ancs.") is not None
+        if not self.sealsIndexed and not self.readonly:
+            self.reindexSeals()
+
         self.reload()
 
         return self.env
@@ -1189,6 +1362,7 @@ class Baser(dbing.LMDBer):
                 except kering.MissingEntryError as ex:  # no kel event for keystate
                     removes.append(keys)  # remove from .habs
                     continue
+                _ = kever.serder  # local habs are hot so load current event now
                 self.kevers[kever.prefixer.qb64] = kever
                 self.prefixes.add(kever.prefixer.qb64)
                 if data.mid:  # group hab
@@ -1211,6 +1385,7 @@ class Baser(dbing.LMDBer):
                 except kering.MissingEntryError as ex:  # no kel event for keystate
                     removes.append(keys)  # remove from .habs
                     continue
+                _ = kever.serder  # local habs are hot so load current event now
                 self.kevers[kever.prefixer.qb64] = kever
                 self.prefixes.add(kever.prefixer.qb64)
                 if data.mid:  # group hab
@@ -1290,10 +1465,13 @@ class Baser(dbing.LMDBer):
                 raise ValueError("Error cloning, unable to move {} to {}."
                                  "".format(copy.path, self.path))
 
+            self.clearEvtSerders()  # cleaned events replace cached events
+
             # replace own kevers with copy kevers by clear and copy
             # future do this by loading kever from .stts  key state subdb
             self.kevers.clear()
             for pre, kever in copy.kevers.items():
+                kever.db = self  # copy closes so lazy loads must use self
                 self.kevers[pre] = kever
 
             # replace prefixes with cloned copy prefixes
@@ -1316,24 +1494,30 @@ class Baser(dbing.LMDBer):
             shutil.rmtree(copy.path)
 
 
-    def clonePreIter(self, pre, fn=0):
+    def clonePreIter(self, pre, fn=0, binary=False):
         """
         Returns iterator of first seen event messages with attachments for the
         identifier prefix pre starting at first seen order number, fn.
         Essentially a replay in first seen order with attachments
+
+        Parameters:
+            pre (bytes | str): identifier prefix
+            fn (int): first seen ordinal to start at
+            binary (bool): True means attachments in binary domain qb2
+                False means in text domain qb64. See .cloneEvtMsg
         """
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
         for fn, dig in self.getFelItemPreIter(pre, fn=fn):
             try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig, binary=binary)
             except Exception:
                 continue  # skip this event
             yield msg
 
 
-    def cloneAllPreIter(self, key=b''):
+    def cloneAllPreIter(self, key=b'', binary=False):
         """
         Returns iterator of first seen event messages with attachments for all
         identifier prefixes starting at key. If key == b'' then rstart at first
@@ -1343,16 +1527,18 @@ class Baser(dbing.LMDBer):
 
         Parameters:
             key (bytes): fnKey(pre, fn)
+            binary (bool): True means attachments in binary domain qb2
+                False means in text domain qb64. See .cloneEvtMsg
         """
         for pre, fn, dig in self.getFelItemAllPreIter(key=key):
             try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig, binary=binary)
             except Exception:
                 continue  # skip this event
             yield msg
 
 
-    def cloneEvtMsg(self, pre, fn, dig):
+    def cloneEvtMsg(self, pre, fn, dig, binary=False):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
 
@@ -1360,90 +1546,167 @@ class Baser(dbing.LMDBer):
             pre (bytes): identifier prefix of event
             fn (int): first seen number (ordinal) of event
             dig (bytes): digest of event
+            binary (bool): True means attachments in binary domain qb2 which
+                is 25% smaller. Signatures stored as qb2 when .binary are
+                attached as is without conversion.
+                False means attachments in text domain qb64
 
         Returns:
             bytearray: message body with attachments
         """
         msg = bytearray()  # message
         atc = bytearray()  # attachments
+        if binary:  # qb2 of any qb64 primitive or group is its Base64 decode
+            qb = lambda m: m.qb2
+            qbs = coring.decodeB64
+            sig = self.sigQb2
+        else:
+            qb = lambda m: m.qb64b
+            qbs = bytes
+            sig = self.sigQb64b
+
         dgkey = dbing.dgKey(pre, dig)  # get message
         if not (raw := self.getEvt(key=dgkey)):
             raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
         msg.extend(raw)
 
         # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
+        if not (sigs := self.getVals(self.sigs, dgkey)):
             raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
-                                  count=len(sigs)).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
+        atc.extend(qb(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
+                                     count=len(sigs))))
+        for val in sigs:
+            atc.extend(sig(val))
 
         # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                      count=len(wigs)).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
+        if wigs := self.getVals(self.wigs, dgkey):
+            atc.extend(qb(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
+                                         count=len(wigs))))
+            for val in wigs:
+                atc.extend(sig(val))
 
         # add authorizer (delegator/issuer) source seal event couple to attachments
         couple = self.getAes(dgkey)
         if couple is not None:
-            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1).qb64b)
-            atc.extend(couple)
+            atc.extend(qb(coring.Counter(code=coring.CtrDex.SealSourceCouples,
+                                         count=1)))
+            atc.extend(qbs(couple))
 
         # add trans endorsement quadruples to attachments not controller
         # may have been originally key event attachments or receipted endorsements
         if quads := self.getVrcs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
-                                      count=len(quads)).qb64b)
+            atc.extend(qb(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
+                                         count=len(quads))))
             for quad in quads:
-                atc.extend(quad)
+                atc.extend(qbs(quad))
 
         # add nontrans endorsement couples to attachments not witnesses
         # may have been originally key event attachments or receipted endorsements
         if coups := self.getRcts(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
-                                      count=len(coups)).qb64b)
+            atc.extend(qb(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
+                                         count=len(coups))))
             for coup in coups:
-                atc.extend(coup)
+                atc.extend(qbs(coup))
 
         # add first seen replay couple to attachments
         if not (dts := self.getDts(key=dgkey)):
             raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
-                                  count=1).qb64b)
-        atc.extend(coring.Seqner(sn=fn).qb64b)
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+        atc.extend(qb(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
+                                     count=1)))
+        atc.extend(qb(coring.Seqner(sn=fn)))
+        atc.extend(qb(coring.Dater(dts=bytes(dts))))
 
         # prepend pipelining counter to attachments
-        if len(atc) % 4:
+        size = 3 if binary else 4  # triplets in binary quadlets in text
+        if len(atc) % size:
             raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                              count=(len(atc) // 4)).qb64b
+                             " {}.".format(len(atc), "triplets" if binary else "quadlets"))
+        pcnt = qb(coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
+                                 count=(len(atc) // size)))
         msg.extend(pcnt)
         msg.extend(atc)
         return msg
 
 
-    def cloneDelegation(self, kever):
+    def cloneDelegation(self, kever, binary=False):
         """
         Recursively clone delegation chain from AID of Kever if one exits.
 
         Parameters:
             kever (Kever): Kever from which to clone the delegator's AID.
+            binary (bool): True means attachments in binary domain qb2
 
         """
         if kever.delegated:
             dkever = self.kevers[kever.delpre]
-            yield from self.cloneDelegation(dkever)
+            yield from self.cloneDelegation(dkever, binary=binary)
 
-            for dmsg in self.clonePreIter(pre=kever.delpre, fn=0):
+            for dmsg in self.clonePreIter(pre=kever.delpre, fn=0, binary=binary):
                 yield dmsg
 
 
+    @staticmethod
+    def _sealKeys(pre, seal):
+        """
+        Returns keys tuple (pre, seal digest) into .ancs of seal anchored in
+        KEL of pre or None when seal is not indexable because any of its values
+        is not a str. The digest is of the compact json of seal in field order
+        so the key has fixed size whatever the size or content of seal values.
+
+        Parameters:
+            pre (bytes|str): identifier of the anchoring KEL
+            seal (dict): dict form of anchored seal
+        """
+        if not seal or not all(isinstance(val, str) for val in seal.values()):
+            return None
+        if hasattr(pre, 'decode'):
+            pre = pre.decode("utf-8")
+        ser = json.dumps(seal, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return (pre, coring.Diger(ser=ser).qb64)
+
+
+    def indexSeals(self, serder):
+        """
+        Index each seal anchored in event serder in .ancs so its anchoring
+        event may be found without scanning the KEL. Idempotent.
+
+        Parameters:
+            serder (SerderKERI): instance of event in KEL
+        """
+        val = None
+        for seal in serder.seals or []:
+            if not isinstance(seal, dict):
+                continue
+            if (keys := self._sealKeys(serder.pre, seal)) is None:
+                continue
+            if val is None:
+                val = (coring.Seqner(sn=serder.sn), coring.Saider(qb64=serder.said))
+            self.ancs.add(keys=keys, val=val)
+
+
+    def reindexSeals(self):
+        """
+        Rebuild .ancs index of anchored seals from every event in every KEL
+        with key state in .states and mark it complete in .idxs. Run on open
+        of databases created before the index existed. Idempotent.
+
+        Returns:
+            count (int): number of events indexed
+        """
+        count = 0
+        with self.txn():
+            self.ancs.trim()
+            for (pre, ), _ in self.states.getItemIter():
+                for dig in self.getKelIter(pre):  # includes disputed & superseded
+                    if (srdr := self.getEvtSerder(pre, dig)) is None:
+                        continue
+                    self.indexSeals(srdr)
+                    count += 1
+            self.idxs.pin(keys="ancs.", val=helping.nowIso8601())
+        self.sealsIndexed = True
+        return count
+
+
     def findAnchoringSealEvent(self, pre, seal, sn=0):
         """
         Search through a KEL for the event that contains a specific anchored
@@ -1452,6 +1715,8 @@ class Baser(dbing.LMDBer):
         KEL of pre including disputed and/or superseded events.
         Returns the Serder of the first event with the anchored SealEvent seal,
             None if not found
+        Looks up seal in .ancs index when complete per .sealsIndexed
+        otherwise scans KEL.
 
 
         Parameters:
@@ -1464,10 +1729,25 @@ class Baser(dbing.LMDBer):
         if tuple(seal.keys()) != eventing.SealEvent._fields:  # wrong type of seal
             return None
 
+        if self.sealsIndexed and (keys := self._sealKeys(pre, seal)) is not None:
+            for seqner, saider in sorted(self.ancs.get(keys=keys),
+                                         key=lambda couple: couple[0].sn):
+                if seqner.sn < sn:
+                    continue
+                if (srdr := self.getEvtSerder(pre, saider.qb64b)) is None:
+                    continue  # skip missing event
+                if self.fullyWitnessed(srdr):
+                    return srdr
+            return None
+
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
-        for evt in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        for dig in self.getKelIter(pre, sn=sn):  # includes disputed & superseded
+            if (srdr := self.getEvtSerder(pre, dig)) is None:
+                continue  # skip missing event
             for eseal in srdr.seals or []:
                 if tuple(eseal.keys()) == eventing.SealEvent._fields:
                     eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
@@ -1484,6 +1764,8 @@ class Baser(dbing.LMDBer):
         sn therefore does not search any disputed or superseded events.
         Returns the Serder of the first event with the anchored Seal seal,
             None if not found
+        Looks up seal in .ancs index when complete per .sealsIndexed
+        otherwise scans KEL.
 
         Parameters:
             pre (bytes|str): identifier of the KEL to search
@@ -1492,11 +1774,30 @@ class Baser(dbing.LMDBer):
             sn (int): beginning sn to search
 
         """
+        if self.sealsIndexed and (keys := self._sealKeys(pre, seal)) is not None:
+            for seqner, saider in sorted(self.ancs.get(keys=keys),
+                                         key=lambda couple: couple[0].sn):
+                if seqner.sn < sn:
+                    continue
+                dig = self.getKeLast(dbing.snKey(keys[0], seqner.sn))
+                if dig is None or bytes(dig) != saider.qb64b:
+                    continue  # only last evt at sn
+                if (srdr := self.getEvtSerder(keys[0], saider.qb64b)) is None:
+                    continue  # skip missing event
+                if self.fullyWitnessed(srdr):
+                    return srdr
+            return None
+
         # create generic Seal namedtuple class using keys from provided seal dict
         Seal = namedtuple('Seal', seal.keys())  # matching type
+        seal = Seal(**seal)  # convert to namedtuple to compare
+
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
 
-        for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+        for dig in self.getKelLastIter(pre, sn=sn):  # only last evt at sn
+            if (srdr := self.getEvtSerder(pre, dig)) is None:
+                continue  # skip missing event
             for eseal in srdr.seals or []:
                 if tuple(eseal.keys()) == Seal._fields:  # same type of seal
                     eseal = Seal(**eseal)  #convert to namedtuple
@@ -1605,9 +1906,8 @@ class Baser(dbing.LMDBer):
                 raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
                                              "".format(sn, pre))
             # retrieve last event itself of receipter est evt from sdig
-            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = serdering.SerderKERI(raw=bytes(sraw))
+            # assumes db ensures that event must not be none because sdig was in KE
+            sserder = self.getEvtSerder(prefixer.qb64b, bytes(sdig))
             if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
                 raise kering.ValidationError("Bad proof sig group at sn = {}"
                                              " for ksn = {}."
@@ -1639,6 +1939,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self.forgetEvtSerder(key)
         return self.setVal(self.evts, key, val)
 
     def getEvt(self, key):
@@ -1656,9 +1957,195 @@ class Baser(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self.forgetEvtSerder(key)
         return self.delVal(self.evts, key)
 
 
+    def getEvtSerder(self, pre, dig):
+        """
+        Returns SerderKERI instance of event at pre, dig from LRU cache
+        .serders when cached otherwise from event in .evts which is then
+        cached. Returns None if no event at pre, dig.
+        Returns a clone of the cached instance so changes by the caller to
+        the nested containers of its sad never change the cache.
+        Events are verified before they are logged so are loaded trusted
+        without reverifying their said. Use .getAuditIter to reverify.
+
+        Parameters:
+            pre (bytes|str): identifier prefix of event
+            dig (bytes|str): digest of event
+        """
+        key = dbing.dgKey(pre, dig)
+        if (serder := self.serders.get(key)) is not None:
+            self.serders.move_to_end(key)  # most recently used
+            self.serderHits += 1
+            return serder.clone()
+
+        if (raw := self.getEvt(key=key)) is None:
+            return None
+
+        serder = serdering.SerderKERI(raw=bytes(raw), verify=False)  # trusted
+        self.serderMisses += 1
+        self.serders[key] = serder
+        self.serdersBytes += serder.size
+        while self.serders and (len(self.serders) > self.SerderCacheSize or
+                                self.serdersBytes > self.SerderCacheBytes):
+            _, old = self.serders.popitem(last=False)  # least recently used
+            self.serdersBytes -= old.size
+        return serder.clone()
+
+
+    def forgetEvtSerder(self, key):
+        """
+        Removes event serder at key from .serders if any
+
+        Parameters:
+            key (bytes): dgKey of event
+        """
+        if (serder := self.serders.pop(bytes(key), None)) is not None:
+            self.serdersBytes -= serder.size
+
+
+    def clearEvtSerders(self):
+        """
+        Clears .serders cache of event serders. Does not reset hit and miss
+        counters.
+        """
+        self.serders.clear()
+        self.serdersBytes = 0
+
+
+    def admitEscrow(self, name, key, val):
+        """
+        Returns True if escrow sub db named name has room for dup val at key
+        else False. Always admits val already escrowed at key so that escrow
+        processors may re-escrow. When full either because the identifier
+        prefix of key has .prefixLimit entries or the escrow has .escrowLimit
+        entries then when .evict evicts the oldest entry of that same prefix
+        to make room, otherwise drops val. So a noisy source may only displace
+        its own entries. Counts evictions in .escrowEvicts and drops in
+        .escrowDrops.
+
+        The oldest entry is the one with the oldest datetime stamp in .dtss
+        at dgKey of prefix and the said at the front of its val. Entries
+        without a stamp are oldest.
+
+        Parameters:
+            name (str): attribute name of escrow sub db in .Escrows such as "ooes"
+            key (bytes): snKey or dgKey of escrow entry whose front is prefix
+            val (bytes): escrow entry without insertion ordering proem
+        """
+        db = getattr(self, name)
+        val = bytes(val)
+        top = key[:key.index(b'.') + 1]  # prefix plus separator
+        oldest = None  # (dts, key, val) of oldest entry of prefix
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor()
+            if cursor.set_key(key):  # moves to first_dup
+                for dup in cursor.iternext_dup():
+                    if bytes(dup[33:]) == val:  # already escrowed
+                        return True
+
+            if txn.stat(db)["entries"] < self.escrowLimit:
+                count = 0
+                if cursor.set_range(top):
+                    for ckey in cursor.iternext(values=False):
+                        if not bytes(ckey).startswith(top):
+                            break
+                        count += 1
+                        if count >= self.prefixLimit:
+                            break  # count no further
+                if count < self.prefixLimit:
+                    return True
+
+            # only at limit read stamps to find oldest entry of prefix
+            if self.evict and cursor.set_range(top):
+                for ckey, cval in cursor.iternext():
+                    ckey = bytes(ckey)
+                    if not ckey.startswith(top):
+                        break
+                    cval = bytes(cval[33:])
+                    sizes = coring.sniffB64(cval, coring.Matter.Decodes)
+                    said = cval[:sizes[3]] if sizes and sizes[3] else cval
+                    dts = txn.get(dbing.dgKey(top[:-1], said), db=self.dtss)
+                    dts = bytes(dts) if dts is not None else b''
+                    if oldest is None or dts < oldest[0]:
+                        oldest = (dts, ckey, cval)
+
+        if oldest is not None:  # evict oldest of same prefix
+            self.delIoVal(db, oldest[1], oldest[2])
+            self.escrowEvicts[name] += 1
+            logger.info("Baser: evicted oldest entry of pre=%s from full "
+                        "escrow %s.", top[:-1].decode(), name)
+            return True
+
+        self.escrowDrops[name] += 1
+        logger.info("Baser: dropped entry of pre=%s at full escrow %s.",
+                    top[:-1].decode(), name)
+        return False
+
+
+    def escrowed(self, pre):
+        """
+        Returns True if any escrow in .Escrows has an entry of identifier
+        prefix pre. False otherwise.
+
+        Parameters:
+            pre (bytes|str): identifier prefix
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+        top = pre + b'.'  # prefix plus separator
+        for name in self.Escrows:
+            with self._begin(db=getattr(self, name), write=False) as txn:
+                cursor = txn.cursor()
+                if cursor.set_range(top) and bytes(cursor.key()).startswith(top):
+                    return True
+        return False
+
+
+    def fullEscrows(self):
+        """
+        Returns list of names of escrows in .Escrows that have .escrowLimit
+        or more entries. Empty list when none are full.
+        """
+        full = []
+        for name in self.Escrows:
+            if self.cnt(getattr(self, name)) >= self.escrowLimit:
+                full.append(name)
+        return full
+
+
+    def getAuditIter(self):
+        """
+        Reverifies in bulk the trusted serialized events in .evts and serders
+        in the SerderSuber subdbs loaded with verify False such as for an
+        offline integrity audit.
+        Each event must verify and its said and prefix must match its key.
+
+        Returns:
+            iterator (Iterator): of triples (subkey, keys, ex) for each stored
+                serder that fails to verify where subkey is name of subdb,
+                keys is tuple of key strs and ex is raised exception
+        """
+        for key, raw in self.getTopItemIter(db=self.evts):
+            pre, dig = dbing.splitKey(key)
+            try:
+                serder = serdering.SerderKERI(raw=bytes(raw))  # verifies said
+                if serder.preb != pre or serder.saidb != dig:
+                    raise kering.ValidationError(f"Mismatch of event pre="
+                                                 f"{serder.pre} said={serder.said}"
+                                                 f" with key={key}.")
+            except Exception as ex:
+                yield "evts.", (pre.decode(), dig.decode()), ex
+
+        subers = (("rpys.", self.rpys), ("epse.", self.epse), ("exns.", self.exns),
+                  ("sxns.", self.sxns), ("dpwe.", self.dpwe), ("dune.", self.dune))
+        for subkey, suber in subers:
+            for keys, ex in suber.getAuditIter():
+                yield subkey, keys, ex
+
+
     def getEvtPreIter(self, pre, sn=0):
         """
         Returns iterator of event messages without attachments
@@ -1869,44 +2356,100 @@ class Baser(dbing.LMDBer):
         """
         return self.delVal(self.aess, key)
 
+    def packSig(self, val):
+        """
+        Returns indexed signature val as stored in .sigs or .wigs given .binary
+
+        Parameters:
+            val (bytes | Indexer): indexed signature qb64b, qb2 or instance
+        """
+        if isinstance(val, coring.Indexer):
+            return val.qb2 if self.binary else val.qb64b
+        return self.sigQb2(val) if self.binary else self.sigQb64b(val)
+
+    def unstoredSigs(self, db, key, vals):
+        """
+        Returns list of indexed signatures vals packed given .binary less those
+        already stored at key of db in either domain so a signature is never
+        stored twice as both qb64b and qb2 such as after .binary changed.
+
+        Parameters:
+            db (lmdb._Database): .sigs or .wigs
+            key (bytes): dgKey of event
+            vals (Iterable): of bytes qb64b or qb2 or Indexer instances
+        """
+        packed = [self.packSig(val) for val in vals]
+        if packed:
+            stored = {self.packSig(val) for val in self.getValsIter(db, key)}
+            packed = [val for val in packed if val not in stored]
+        return packed
+
+    @staticmethod
+    def sigQb64b(val):
+        """
+        Returns qb64b of stored indexed signature val that may be either qb64b
+        or qb2. The first byte of qb2 of every indexed code is never a Base64
+        character so the two are distinguishable.
+
+        Parameters:
+            val (bytes | memoryview): stored indexed signature
+        """
+        val = bytes(val)
+        return val if val[0] in B64Bytes else coring.encodeB64(val)
+
+    @staticmethod
+    def sigQb2(val):
+        """
+        Returns qb2 of stored indexed signature val that may be either qb64b
+        or qb2. See .sigQb64b
+
+        Parameters:
+            val (bytes | memoryview): stored indexed signature
+        """
+        val = bytes(val)
+        return val if val[0] not in B64Bytes else coring.decodeB64(val)
+
     def getSigs(self, key):
         """
         Use dgKey()
-        Return list of signatures at key
+        Return list of signatures qb64b at key
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.sigs, key)
+        return [self.sigQb64b(val) for val in self.getVals(self.sigs, key)]
 
     def getSigsIter(self, key):
         """
         Use dgKey()
-        Return iterator of signatures at key
+        Return iterator of signatures qb64b at key
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.sigs, key)
+        return (self.sigQb64b(val) for val in self.getValsIter(self.sigs, key))
 
     def putSigs(self, key, vals):
         """
         Use dgKey()
         Write each entry from list of bytes signatures vals to key
         Adds to existing signatures at key if any
+        Stored as qb2 when .binary else qb64b unless stored in either domain
         Returns True If no error
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.sigs, key, vals)
+        return self.putVals(self.sigs, key, self.unstoredSigs(self.sigs, key, vals))
 
     def addSig(self, key, val):
         """
         Use dgKey()
         Add signature val bytes as dup to key in db
         Adds to existing values at key if any
-        Returns True if written else False if dup val already exists
+        Stored as qb2 when .binary else qb64b
+        Returns True if written else False if dup val already exists in either domain
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.sigs, key, val)
+        vals = self.unstoredSigs(self.sigs, key, [val])
+        return self.addVal(self.sigs, key, vals[0]) if vals else False
 
     def cntSigs(self, key):
         """
@@ -1919,49 +2462,56 @@ class Baser(dbing.LMDBer):
     def delSigs(self, key, val=b''):
         """
         Use dgKey()
-        Deletes all values at key if val = b'' else deletes dup val = val.
+        Deletes all values at key if val = b'' else deletes dup val = val
+        as given or as stored given .binary
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.sigs, key, val)
+        if not val:
+            return self.delVals(self.sigs, key)
+        return (self.delVals(self.sigs, key, val) or
+                self.delVals(self.sigs, key, self.packSig(val)))
 
     def getWigs(self, key):
         """
         Use dgKey()
-        Return list of indexed witness signatures at key
+        Return list of indexed witness signatures qb64b at key
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.wigs, key)
+        return [self.sigQb64b(val) for val in self.getVals(self.wigs, key)]
 
     def getWigsIter(self, key):
         """
         Use dgKey()
-        Return iterator of indexed witness signatures at key
+        Return iterator of indexed witness signatures qb64b at key
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.wigs, key)
+        return (self.sigQb64b(val) for val in self.getValsIter(self.wigs, key))
 
     def putWigs(self, key, vals):
         """
         Use dgKey()
         Write each entry from list of bytes indexed witness signatures vals to key
         Adds to existing signatures at key if any
+        Stored as qb2 when .binary else qb64b unless stored in either domain
         Returns True If no error
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.wigs, key, vals)
+        return self.putVals(self.wigs, key, self.unstoredSigs(self.wigs, key, vals))
 
     def addWig(self, key, val):
         """
         Use dgKey()
         Add indexed witness signature val bytes as dup to key in db
         Adds to existing values at key if any
-        Returns True if written else False if dup val already exists
+        Stored as qb2 when .binary else qb64b
+        Returns True if written else False if dup val already exists in either domain
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.wigs, key, val)
+        vals = self.unstoredSigs(self.wigs, key, [val])
+        return self.addVal(self.wigs, key, vals[0]) if vals else False
 
     def cntWigs(self, key):
         """
@@ -1974,10 +2524,14 @@ class Baser(dbing.LMDBer):
     def delWigs(self, key, val=b''):
         """
         Use dgKey()
-        Deletes all values at key if val = b'' else deletes dup val = val.
+        Deletes all values at key if val = b'' else deletes dup val = val
+        as given or as stored given .binary
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.wigs, key, val)
+        if not val:
+            return self.delVals(self.wigs, key)
+        return (self.delVals(self.wigs, key, val) or
+                self.delVals(self.wigs, key, self.packSig(val)))
 
     def putRcts(self, key, vals):
         """
@@ -48,6 +48,8 @@ l
 import os
 import shutil
 import stat
+import functools
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -60,6 +62,7 @@ from hio.base import filing
 from hio.base import filing
 
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
+from ..kering import DatabaseError
 
 from ..help import helping
 
@@ -257,6 +260,75 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+def bounded(method):
+    """
+    Decorator of LMDBer read generator method so that a generator that joined
+    a bulk transaction of LMDBer.txn can not escape its context. The
+    generator's reads see the uncommitted writes of the bulk transaction but
+    its cursor is only valid while that transaction is open. Resuming the
+    generator after the transaction committed or aborted raises DatabaseError
+    instead of an lmdb error on a closed cursor. A generator first advanced
+    outside any bulk transaction reads in its own read transaction as before.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *pa, **kwa):
+        stack = self.txns
+        txn = stack[-1] if stack else None  # bulk txn joined on first next
+        for item in method(self, *pa, **kwa):
+            yield item
+            if txn is not None and not any(t is txn for t in stack):
+                raise DatabaseError(f"Iterator {method.__name__} resumed after "
+                                    f"its bulk transaction ended.")
+
+    return wrapper
+
+
+class Joint:
+    """
+    Joint is the context of a helper's reads and writes on one named sub db
+    that have joined an enclosing bulk write transaction opened by LMDBer.txn.
+    Provides the subset of the lmdb.Transaction interface used by the LMDBer
+    helpers with .db as the default named sub db. Exiting the context does
+    not commit or abort because the enclosing transaction owns the commit.
+
+    Attributes:
+        txn (lmdb.Transaction): enclosing bulk write transaction
+        db (lmdb._Database): named sub db of helper
+    """
+
+    def __init__(self, txn, db):
+        """
+        Parameters:
+            txn (lmdb.Transaction): enclosing bulk write transaction
+            db (lmdb._Database): named sub db of helper
+        """
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False  # enclosing transaction commits or aborts
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+    def stat(self, db=None):
+        return self.txn.stat(db if db is not None else self.db)
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default=default,
+                            db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -280,6 +352,14 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        txns (list): stack of open (nested) bulk write transactions from
+            .txn of the calling thread that helper reads and writes of that
+            thread join. Empty means each helper runs in its own transaction.
+            Kept per thread since an lmdb write transaction may only be used
+            by the thread that began it. Write transactions of other threads
+            wait until the outermost bulk transaction commits or aborts.
+            Read generators that joined a bulk transaction raise
+            DatabaseError when resumed after it ends. See bounded
 
     Properties:
 
@@ -347,9 +427,24 @@ class LMDBer(filing.Filer):
         """
         self.env = None
         self.readonly = True if readonly else False
+        self._local = threading.local()  # per thread stack of bulk txns
+        self._writing = threading.RLock()  # serializes write txns across threads
+        self._bulk = 0  # count of open outermost bulk txns across threads
         super(LMDBer, self).__init__(**kwa)
 
 
+    @property
+    def txns(self):
+        """
+        Returns stack (list) of open bulk write transactions of calling thread
+        """
+        try:
+            return self._local.txns
+        except AttributeError:
+            self._local.txns = []
+            return self._local.txns
+
+
     def reopen(self, readonly=False, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
@@ -400,10 +495,90 @@ class LMDBer(filing.Filer):
                 pass
 
         self.env = None
+        self._local = threading.local()
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @contextmanager
+    def txn(self):
+        """
+        Context manager of bulk write transaction. All the reads and writes of
+        the LMDBer helpers, and so of the Suber and Komer subdbs that use them,
+        within the context join this one transaction instead of each opening
+        and committing its own. The whole context commits atomically with one
+        sync on exit or aborts when exiting with an exception. Read generators
+        advanced within the context must be consumed within it since their
+        cursors close with the transaction. See bounded.
+
+        Nested contexts open nested (child) transactions so a failed inner
+        context aborts only its own writes.
+
+        Usage:
+            with db.txn():
+                db.putEvt(key, raw)
+                db.states.pin(keys=pre, val=state)
+
+        Yields:
+            txn (lmdb.Transaction): the bulk write transaction
+        """
+        with self._writing:  # writers of other threads wait for commit
+            parent = self.txns[-1] if self.txns else None
+            # buffers False since buffers from a write txn are invalidated by later writes
+            txn = self.env.begin(write=True, buffers=False, parent=parent)
+            self.txns.append(txn)
+            if parent is None:
+                self._bulk += 1
+            try:
+                yield txn
+            except BaseException:
+                self.txns.pop()
+                txn.abort()
+                raise
+            else:
+                self.txns.pop()
+                txn.commit()
+            finally:
+                if parent is None:
+                    self._bulk -= 1
+
+
+    def _begin(self, db, write=False):
+        """
+        Returns context manager of transaction on named sub db for helper.
+        Joins the innermost bulk transaction from .txn when one is open.
+        Otherwise begins new transaction that commits on exit. A new write
+        transaction only waits on the write lock while a bulk transaction of
+        some thread is open so plain helper writes otherwise take no lock.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+            write (bool): True means write transaction. False means read only
+        """
+        if self.txns:
+            return Joint(txn=self.txns[-1], db=db)
+        if write:
+            if self._bulk:  # bulk txn of other thread holds the write txn
+                return self._write(db=db)
+            return self.env.begin(db=db, write=True, buffers=True)
+        return self.env.begin(db=db, write=False, buffers=True)
+
+
+    @contextmanager
+    def _write(self, db):
+        """
+        Context manager of write transaction on named sub db for helper that
+        waits while another thread holds a write transaction since lmdb
+        allows only one at a time per environment.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+        """
+        with self._writing:
+            with self.env.begin(db=db, write=True, buffers=True) as txn:
+                yield txn
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -417,7 +592,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -436,7 +611,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -454,7 +629,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -471,7 +646,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -482,18 +657,16 @@ class LMDBer(filing.Filer):
     def cnt(self, db):
         """
         Return count of values in db, or zero otherwise
+        Counts each dup. Reads count from db stats so does not scan db.
 
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            count = 0
-            for _, _ in cursor:
-                count += 1
-            return count
+        with self._begin(db=db, write=False) as txn:
+            return txn.stat(db)["entries"]
 
 
+    @bounded
     def getAllItemIter(self, db, key=b'', split=True, sep=b'.'):
         """
         Returns iterator of item duple (key, val), at each key over all
@@ -512,7 +685,7 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -526,6 +699,7 @@ class LMDBer(filing.Filer):
                 yield tuple(splits)
 
 
+    @bounded
     def getTopItemIter(self, db, key=b''):
         """
         Iterates over branch of db given by key
@@ -547,7 +721,7 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -581,7 +755,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -616,7 +790,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -648,6 +822,7 @@ class LMDBer(filing.Filer):
             return on
 
 
+    @bounded
     def getAllOrdItemPreIter(self, db, pre, on=0):
         """
         Returns iterator of duple item, (on, dig), at each key over all ordinal
@@ -663,7 +838,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -676,6 +851,7 @@ class LMDBer(filing.Filer):
                 yield (cn, val)  # (on, dig) of event
 
 
+    @bounded
     def getAllOrdItemAllPreIter(self, db, key=b''):
         """
         Returns iterator of triple item, (pre, on, dig), at each key over all
@@ -691,7 +867,7 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -728,7 +904,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -768,7 +944,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -807,7 +983,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -831,7 +1007,7 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -881,7 +1057,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -894,6 +1070,7 @@ class LMDBer(filing.Filer):
             return vals
 
 
+    @bounded
     def getIoSetValsIter(self, db, key, *, ion=0, sep=b'.'):
         """
         Returns:
@@ -909,7 +1086,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -937,7 +1114,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -1003,7 +1180,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1046,7 +1223,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1072,7 +1249,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1085,6 +1262,7 @@ class LMDBer(filing.Filer):
             return items
 
 
+    @bounded
     def getIoSetItemsIter(self, db, key, *, ion=0, sep=b'.'):
         """
         Returns:
@@ -1100,7 +1278,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1124,7 +1302,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return txn.delete(iokey)
             except lmdb.BadValsizeError as ex:
@@ -1149,7 +1327,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -1182,7 +1360,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -1203,7 +1381,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1226,7 +1404,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1239,6 +1417,7 @@ class LMDBer(filing.Filer):
             return val
 
 
+    @bounded
     def getValsIter(self, db, key):
         """
         Return iterator of all dup values at key in db
@@ -1250,7 +1429,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1270,7 +1449,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1293,7 +1472,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
@@ -1320,7 +1499,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -1356,7 +1535,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -1416,7 +1595,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1429,6 +1608,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @bounded
     def getIoValsIter(self, db, key):
         """
         Return iterator of all duplicate values at key in db in insertion order
@@ -1447,7 +1627,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1471,7 +1651,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1505,7 +1685,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
@@ -1518,6 +1698,7 @@ class LMDBer(filing.Filer):
             return items
 
 
+    @bounded
     def getIoItemsNextIter(self, db, key=b"", skip=True):
         """
         Return iterator of all dup items at next key after key in db in insertion order.
@@ -1539,7 +1720,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1560,7 +1741,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1582,7 +1763,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -1619,7 +1800,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1632,6 +1813,7 @@ class LMDBer(filing.Filer):
         return False
 
 
+    @bounded
     def getIoValsAllPreIter(self, db, pre, on=0):
         """
         Returns iterator of all dup vals in insertion order for all entries
@@ -1658,7 +1840,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): ordinal number to begin iteration at
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_key(key):  # moves to first_dup
@@ -1668,6 +1850,7 @@ class LMDBer(filing.Filer):
                 key = snKey(pre, cnt:=cnt+1)
 
 
+    @bounded
     def getIoValsAllPreBackIter(self, db, pre, on=0):
         """
         Returns iterator of all dup vals in insertion order for all entries
@@ -1695,7 +1878,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): is ordinal number to begin iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt := on)
             # set_key returns True if exact key else false
@@ -1706,6 +1889,7 @@ class LMDBer(filing.Filer):
                 key = snKey(pre, cnt:=cnt-1)
 
 
+    @bounded
     def getIoValLastAllPreIter(self, db, pre, on=0):
         """
         Returns iterator of last only of dup vals of each key in insertion order
@@ -1732,7 +1916,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): ordinal number to being iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_key(key):  # moves to first_dup
@@ -1741,6 +1925,7 @@ class LMDBer(filing.Filer):
                 key = snKey(pre, cnt:=cnt+1)
 
 
+    @bounded
     def getIoValsAnyPreIter(self, db, pre, on=0):
         """
         Returns iterator of all dup vals in insertion order for any entries
@@ -1770,7 +1955,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): beginning ordinal number to start iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_range(key):  #  moves to first dup of key >= key
@@ -4,6 +4,10 @@ KERI
 keri.db.koming module
 
 """
+import dataclasses
+import functools
+import hashlib
+import operator
 import types
 import json
 from dataclasses import dataclass
@@ -23,6 +27,150 @@ from ..help import helping
 logger = help.ogler.getLogger()
 
 
+@functools.lru_cache(maxsize=None)
+def layout(schema: Type[dataclass], size: int = None):
+    """
+    Returns layout str of names of first size fields of dataclass schema in
+    field order. Field whose type is itself a dataclass includes the full
+    layout of its nested fields in parentheses. Returns None when schema has
+    fewer than size fields.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+        size (int): number of leading fields to include, None means all
+    """
+    fields = dataclasses.fields(schema)
+    size = len(fields) if size is None else size
+    if size > len(fields):
+        return None
+    names = []
+    for f in fields[:size]:
+        if dataclasses.is_dataclass(f.type):
+            names.append(f"{f.name}({layout(f.type)})")
+        else:
+            names.append(f.name)
+    return ",".join(names)
+
+
+@functools.lru_cache(maxsize=None)
+def fingerprint(schema: Type[dataclass], size: int):
+    """
+    Returns 4 byte schema version fingerprint of layout of first size fields
+    of dataclass schema or None when schema has fewer than size fields.
+    Appending fields to a schema leaves the fingerprint of its leading
+    fields unchanged so positional records written before the append stay
+    readable.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+        size (int): number of leading fields serialized
+    """
+    if (lay := layout(schema, size)) is None:
+        return None
+    return hashlib.blake2b(lay.encode("utf-8"), digest_size=4).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def tuplifier(schema: Type[dataclass]):
+    """
+    Returns function that tuplifies instances of dataclass schema built once
+    per schema so each call skips reflection on its fields.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+    """
+    fields = dataclasses.fields(schema)
+    getter = operator.attrgetter(*[f.name for f in fields])
+    if len(fields) == 1:
+        single = getter
+        getter = lambda val: (single(val), )
+    nested = [(i, tuplifier(f.type)) for i, f in enumerate(fields)
+              if dataclasses.is_dataclass(f.type)]
+
+    def tuplify(val):
+        vals = list(getter(val))
+        for i, convert in nested:
+            if dataclasses.is_dataclass(vals[i]):
+                vals[i] = convert(vals[i])
+        return vals
+
+    return tuplify
+
+
+@functools.lru_cache(maxsize=None)
+def detuplifier(schema: Type[dataclass]):
+    """
+    Returns function that detuplifies list of field values into instance of
+    dataclass schema built once per schema so each call skips reflection on
+    its fields and field types.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+    """
+    fields = dataclasses.fields(schema)
+    nested = [(i, detuplifier(f.type)) for i, f in enumerate(fields)
+              if dataclasses.is_dataclass(f.type)]
+    if all(f.init for f in fields):
+        build = lambda vals: schema(*vals)
+    else:
+        names = [f.name for f in fields]
+        build = lambda vals: schema(**dict(zip(names, vals)))
+
+    def detuplify(vals):
+        if nested:
+            vals = list(vals)
+            for i, convert in nested:
+                if i < len(vals) and isinstance(vals[i], list):
+                    vals[i] = convert(vals[i])
+        return build(vals)
+
+    return detuplify
+
+
+def tuplify(val: dataclass):
+    """
+    Returns list of field values of dataclass instance val in field order
+    without field names. Nested dataclass values are tuplified recursively.
+
+    Parameters:
+        val (dataclass): instance to convert
+    """
+    return tuplifier(val.__class__)(val)
+
+
+def detuplify(schema: Type[dataclass], vals: list):
+    """
+    Returns instance of dataclass schema from list vals of its leading field
+    values in field order as from tuplify. Missing trailing fields take their
+    defaults.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+        vals (list): field values in field order
+    """
+    return detuplifier(schema)(vals)
+
+
+def migrate(db: dbing.LMDBer):
+    """
+    Migrates every Komer sub db attribute of db to the serialization configured
+    for it by rewriting entries stored in any other supported serialization.
+    Komers read all supported serializations so migration may run online while
+    the database is in use and may be interrupted and rerun. Idempotent.
+
+    Returns:
+        counts (dict): number of entries rewritten keyed by attribute name of
+            each Komer with at least one entry rewritten
+
+    Parameters:
+        db (dbing.LMDBer): database such as Baser or Reger with Komer attributes
+    """
+    counts = dict()
+    for name, komer in vars(db).items():
+        if isinstance(komer, KomerBase) and (count := komer.migrate()):
+            counts[name] = count
+    return counts
+
 
 class KomerBase:
     """
@@ -38,11 +186,32 @@ class KomerBase:
         sdb (lmdb._Database): instance of named sub db lmdb for this Komer
         schema (Type[dataclass]): class reference of dataclass subclass
         kind (str): serialization/deserialization type from coring.Serials
+        positional (bool): True means serialize field values positionally
         serializer (types.MethodType): serializer method
         deserializer (types.MethodType): deserializer method
         sep (str): separator for combining keys tuple of strs into key bytes
+
+    Conversions between .schema instances and the dicts or lists serialized
+    use converters built once per schema class and shared by all Komers.
+
+    Positional serialization stores a list of field values in field order
+    without field names prefixed with a header of .Marker, the one byte code
+    of kind from .Codes and the 4 byte schema version fingerprint of the
+    fields serialized. Appending fields with defaults to the schema keeps
+    earlier records readable. Any other schema change makes earlier
+    positional records unreadable so migrate them to a named serialization
+    before the change.
+
+    Values are deserialized from whichever supported serialization they were
+    written in, named or positional, so changing .kind or .positional of an
+    existing sub db is safe and .migrate rewrites older entries online.
     """
     Sep = '.'  # separator for combining key iterables
+    Marker = b'\x00'  # leading byte of positional serialization never leads a named map
+    Codes = {coring.Serials.json: b'J',
+             coring.Serials.mgpk: b'M',
+             coring.Serials.cbor: b'C'}  # one byte codes of positional kinds
+    Kinds = {code: kind for kind, code in Codes.items()}
 
     def __init__(self, db: dbing.LMDBer, *,
                  subkey: str = 'docs.',
@@ -50,6 +219,7 @@ class KomerBase:
                  kind: str = coring.Serials.json,
                  dupsort: bool = False,
                  sep: str = None,
+                 positional: bool = False,
                  **kwa):
         """
         Parameters:
@@ -62,14 +232,25 @@ class KomerBase:
                                each key
             sep (str): separator to convert keys iterator to key bytes for db key
                        default is self.Sep == '.'
+            positional (bool): True means serialize field values positionally
+                               without field names. False (default) means
+                               serialize as map of field names to values
         """
         super(KomerBase, self).__init__()
+        if positional and (hasattr(schema, "_ser") or hasattr(schema, "_der")):
+            raise ValueError("Positional serialization unsupported for schema={} "
+                             "with custom _ser or _der.".format(schema))
         self.db = db
         self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.schema = schema
         self.kind = kind
-        self.serializer = self._serializer(kind)
-        self.deserializer = self._deserializer(kind)
+        self.positional = True if positional else False
+        self._dictify = helping.dictifier(schema)
+        self._datify = helping.datifier(schema)
+        self._tuplify = tuplifier(schema) if dataclasses.is_dataclass(schema) else None
+        self._detuplify = detuplifier(schema) if dataclasses.is_dataclass(schema) else None
+        self.serializer = self._serializer(kind, positional=self.positional)
+        self.deserializer = self.__deserialize
         self.sep = sep if sep is not None else self.Sep
 
 
@@ -128,11 +309,50 @@ class KomerBase:
             yield (self._tokeys(key), self.deserializer(val))
 
 
-    def _serializer(self, kind):
+    def migrate(self):
+        """
+        Rewrites every entry not serialized with .kind and .positional in one
+        transaction. Entries in other supported serializations stay readable
+        until rewritten so may be migrated online. Scan and rewrite share the
+        transaction so a concurrent write between them is never overwritten
+        with the stale value scanned before it.
+
+        Returns:
+            count (int): number of entries rewritten
+        """
+        with self.db.txn():
+            stale = []
+            for key, val in self.db.getTopItemIter(db=self.sdb):
+                raw = bytes(val)
+                ser = self.serializer(self.deserializer(raw))
+                if ser != raw:
+                    stale.append((key, raw, ser))
+
+            for key, raw, ser in stale:
+                self._rewrite(key, raw, ser)
+        return len(stale)
+
+
+    def _rewrite(self, key, raw, ser):
+        """
+        Replaces serialization raw of entry at key with serialization ser
+
+        Parameters:
+            key (bytes): actual database key of entry
+            raw (bytes): stale serialization of entry
+            ser (bytes): serialization of entry to replace raw
+        """
+        self.db.setVal(db=self.sdb, key=key, val=ser)
+
+
+    def _serializer(self, kind, positional=False):
         """
         Parameters:
             kind (str): serialization
+            positional (bool): True means serialize field values positionally
         """
+        if positional:
+            return self._positional(kind)
         if kind == coring.Serials.mgpk:
             return self.__serializeMGPK
         elif kind == coring.Serials.cbor:
@@ -154,9 +374,77 @@ class KomerBase:
             return self.__deserializeJSON
 
 
+    def _positional(self, kind):
+        """
+        Returns positional serializer method for kind
+
+        Parameters:
+            kind (str): serialization of list of field values
+        """
+        if kind == coring.Serials.mgpk:
+            dumps = msgpack.dumps
+        elif kind == coring.Serials.cbor:
+            dumps = cbor2.dumps
+        else:
+            kind = coring.Serials.json
+            dumps = lambda vals: json.dumps(vals,
+                                            separators=(",", ":"),
+                                            ensure_ascii=False).encode("utf-8")
+        head = self.Marker + self.Codes[kind]
+
+        def serialize(val):
+            if val is not None:
+                if not isinstance(val, self.schema):
+                    raise ValueError("Invalid schema type={} of value={}, expected {}."
+                                     "".format(type(val), val, self.schema))
+                vals = self._tuplify(val)
+                val = head + fingerprint(self.schema, len(vals)) + dumps(vals)
+            return val
+
+        return serialize
+
+
+    def __deserialize(self, val):
+        """
+        Returns instance of .schema deserialized from val in whichever
+        supported serialization val was written, named or positional.
+        Named serializations are told apart by the leading byte of their map.
+        """
+        if val is not None:
+            val = bytes(val)
+            lead = val[:1]
+            if lead == self.Marker:
+                return self.__deserializePositional(val)
+            if lead == b'{':
+                return self.__deserializeJSON(val)
+            if 0x80 <= val[0] <= 0x8f or lead in (b'\xde', b'\xdf'):  # mgpk map
+                return self.__deserializeMGPK(val)
+            if 0xa0 <= val[0] <= 0xbf:  # cbor map
+                return self.__deserializeCBOR(val)
+            return self._deserializer(self.kind)(val)
+        return val
+
+
+    def __deserializePositional(self, val):
+        if (kind := self.Kinds.get(val[1:2])) is None:
+            raise ValueError("Invalid positional serialization code={} of value={}."
+                             "".format(val[1:2], val))
+        body = val[6:]
+        if kind == coring.Serials.mgpk:
+            vals = msgpack.loads(body)
+        elif kind == coring.Serials.cbor:
+            vals = cbor2.loads(body)
+        else:
+            vals = json.loads(body.decode("utf-8"))
+        if not isinstance(vals, list) or fingerprint(self.schema, len(vals)) != val[2:6]:
+            raise ValueError("Invalid positional schema version of value={}, expected {}."
+                             "".format(val, self.schema))
+        return self._detuplify(vals)
+
+
     def __deserializeJSON(self, val):
         if val is not None:
-            val = helping.datify(self.schema, json.loads(bytes(val).decode("utf-8")))
+            val = self._datify(json.loads(bytes(val).decode("utf-8")))
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
@@ -165,7 +453,7 @@ class KomerBase:
 
     def __deserializeMGPK(self, val):
         if val is not None:
-            val = helping.datify(self.schema, msgpack.loads(bytes(val)))
+            val = self._datify(msgpack.loads(bytes(val)))
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
@@ -174,7 +462,7 @@ class KomerBase:
 
     def __deserializeCBOR(self, val):
         if val is not None:
-            val = helping.datify(self.schema, cbor2.loads(bytes(val)))
+            val = self._datify(cbor2.loads(bytes(val)))
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
@@ -186,7 +474,7 @@ class KomerBase:
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
-            val = json.dumps(helping.dictify(val),
+            val = json.dumps(self._dictify(val),
                           separators=(",", ":"),
                           ensure_ascii=False).encode("utf-8")
         return val
@@ -197,7 +485,7 @@ class KomerBase:
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
-            val = msgpack.dumps(helping.dictify(val))
+            val = msgpack.dumps(self._dictify(val))
         return val
 
 
@@ -206,7 +494,7 @@ class KomerBase:
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.schema))
-            val = cbor2.dumps(helping.dictify(val))
+            val = cbor2.dumps(self._dictify(val))
         return val
 
 
@@ -226,6 +514,7 @@ class Komer(KomerBase):
             schema (Type[dataclass]):  reference to Class definition for dataclass sub class
             subkey (str):  LMDB sub database key
             kind (str): serialization/deserialization type
+            positional (bool): True means serialize field values positionally
         """
         super(Komer, self).__init__(db=db, subkey=subkey, schema=schema,
                                     kind=kind, dupsort=False, **kwa)
@@ -678,6 +967,19 @@ class DupKomer(KomerBase):
                                        kind=kind, dupsort=True, **kwa)
 
 
+    def _rewrite(self, key, raw, ser):
+        """
+        Replaces dup serialization raw at key with serialization ser
+
+        Parameters:
+            key (bytes): database key of dup
+            raw (bytes): stale serialization of dup
+            ser (bytes): serialization of dup to replace raw
+        """
+        self.db.delVals(db=self.sdb, key=key, val=raw)
+        self.db.addVal(db=self.sdb, key=key, val=ser)
+
+
 
     def put(self, keys: Union[str, Iterable], vals: list):
         """
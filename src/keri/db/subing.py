@@ -49,6 +49,23 @@ from . import dbing
 logger = help.ogler.getLogger()
 
 
+def trusted(klas, qb64b, strip=False):
+    """
+    Returns instance of klas from trusted qb64b read back from database.
+    Uses fast path klas._fromTrusted that skips re-validation when klas
+    provides it such as Matter and Indexer subclasses else klas(qb64b=qb64b)
+
+    Parameters:
+        klas (Type[coring.Matter]): class of Matter or Indexer or Counter or
+            any ducktyped class of Matter
+        qb64b (bytes | bytearray): fully qualified Base64 of instance
+        strip (bool): True means strip (delete) instance from qb64b bytearray
+    """
+    if (fromTrusted := getattr(klas, "_fromTrusted", None)) is not None:
+        return fromTrusted(qb64b, strip=strip)
+    return klas(qb64b=qb64b, strip=strip) if strip else klas(qb64b=qb64b)
+
+
 class SuberBase():
     """
     Base class for Sub DBs of LMDBer
@@ -311,7 +328,7 @@ class CesrSuberBase(SuberBase):
         """
         if isinstance(val, memoryview):  # memoryview is always bytes
             val = bytes(val)  # convert to bytes
-        return self.klas(qb64b=val)  # converts to bytes
+        return trusted(self.klas, val)  # written by .put so trusted
 
 
 class CesrSuber(CesrSuberBase, Suber):
@@ -405,7 +422,7 @@ class CatCesrSuberBase(CesrSuberBase):
         """
         if not isinstance(val, bytearray):  # is memoryview or bytes
             val = bytearray(val)  # convert so may strip
-        return tuple(klas(qb64b=val, strip=True) for klas in self.klas)
+        return tuple(trusted(klas, val, strip=True) for klas in self.klas)
 
 
 class CatCesrSuber(CatCesrSuberBase, Suber):
@@ -1044,10 +1061,16 @@ class SerderSuber(Suber):
     given by .klas
     Automatically serializes and deserializes using .klas Serder methods
 
+    Serders are verified when loaded unless .verify is False for stores whose
+    serders are verified before they are stored so may be loaded trusted
+    without reverifying their said. Use .getAuditIter to reverify trusted
+    stored serders in bulk offline.
+
     """
 
     def __init__(self, *pa,
                  klas: Type[serdering.Serder] = serdering.SerderKERI,
+                 verify: bool = True,
                  **kwa):
         """
         Inherited Parameters:
@@ -1056,9 +1079,12 @@ class SerderSuber(Suber):
 
         Parameters:
             klas (Type[serdering.Serder]): Class reference to subclass of Serder
+            verify (bool): True means verify said of each serder loaded from db
+                False means trust serialization verified before it was stored
         """
         super(SerderSuber, self).__init__(*pa, **kwa)
         self.klas = klas
+        self.verify = True if verify else False
 
 
     def put(self, keys: Union[str, Iterable], val: serdering.SerderKERI):
@@ -1113,7 +1139,8 @@ class SerderSuber(Suber):
 
         """
         val = self.db.getVal(db=self.sdb, key=self._tokey(keys))
-        return self.klas(raw=bytes(val)) if val is not None else None
+        return (self.klas(raw=bytes(val), verify=self.verify)
+                if val is not None else None)
 
 
     def rem(self, keys: Union[str, Iterable]):
@@ -1145,7 +1172,29 @@ class SerderSuber(Suber):
 
         """
         for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            yield self._tokeys(iokey), self.klas(raw=bytes(val))
+            yield self._tokeys(iokey), self.klas(raw=bytes(val), verify=self.verify)
+
+
+    def getAuditIter(self, keys: Union[str, Iterable]=b""):
+        """
+        Reverifies stored serders in bulk such as for an offline integrity
+        audit of the trusted serders loaded by .get and .getItemIter
+
+        Returns:
+            iterator (Iterator): tuple (keys, ex) over all the items in subdb
+            whose key startswith key made from keys and whose serialization
+            fails to verify where ex is the raised exception
+
+        Parameters:
+            keys (Iterator): tuple of bytes or strs that may be a truncation of
+                a full keys tuple. If keys is empty then audits all items.
+
+        """
+        for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
+            try:
+                self.klas(raw=bytes(val), verify=True)
+            except Exception as ex:
+                yield self._tokeys(iokey), ex
 
 
 class SchemerSuber(Suber):
@@ -1505,7 +1554,7 @@ class CesrDupSuber(DupSuber):
                           empty list if no entry at keys
 
         """
-        return [self.klas(qb64b=bytes(val)) for val in
+        return [trusted(self.klas, bytes(val)) for val in
                         self.db.getValsIter(db=self.sdb, key=self._tokey(keys))]
 
 
@@ -1522,7 +1571,7 @@ class CesrDupSuber(DupSuber):
         """
         val = self.db.getValLast(db=self.sdb, key=self._tokey(keys))
         if val is not None:
-            val = self.klas(qb64b=bytes(val))
+            val = trusted(self.klas, bytes(val))
         return val
 
 
@@ -1541,7 +1590,7 @@ class CesrDupSuber(DupSuber):
 
         """
         for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys)):
-            yield self.klas(qb64b=bytes(val))
+            yield trusted(self.klas, bytes(val))
 
 
     def rem(self, keys: Union[str, Iterable], val=None):
@@ -1581,4 +1630,4 @@ class CesrDupSuber(DupSuber):
 
         """
         for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            yield (self._tokeys(key), self.klas(qb64b=bytes(val)))
+            yield (self._tokeys(key), trusted(self.klas, bytes(val)))
@@ -5,6 +5,7 @@ keri.end.ending module
 ReST API endpoints
 
 """
+import itertools
 import json
 import os
 import re
@@ -591,19 +592,48 @@ class OOBIEnd:
         if eid:
             eids.append(eid)
 
-        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
-        if not msgs and role is None:
-            msgs = hab.replyToOobi(aid=aid, role=kering.Roles.witness, eids=eids)
-            msgs.extend(hab.replay(aid))
+        # binary domain KEL only when client explicitly accepts application/cesr
+        accept = req.get_header("Accept") or ""
+        binary = Mimes.cesr in [a.split(";")[0].strip() for a in accept.split(",")]
+
+        # KEL of aid is streamed in chunks ahead of the other reply messages.
+        # First chunk read ahead so witness fallback and not found only when
+        # both KEL and replies are empty as when KEL was in replies
+        chunks = hab.replayIter(pre=aid, binary=binary)
+        first = next(chunks, None)
+        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids, kel=False)
+        if first is None and not msgs and role is None:
+            msgs = hab.replyToOobi(aid=aid, role=kering.Roles.witness, eids=eids,
+                                   kel=False)
+
+        if first is None and not msgs:
+            rep.status = falcon.HTTP_NOT_FOUND
+            return
 
-        if msgs:
-            rep.status = falcon.HTTP_200  # This is the default status
-            rep.set_header(OOBI_AID_HEADER, aid)
-            rep.content_type = "application/json+cesr"
-            rep.data = bytes(msgs)
+        if first is not None:
+            chunks = itertools.chain([first], chunks)
 
-        else:
-            rep.status = falcon.HTTP_NOT_FOUND
+        rep.status = falcon.HTTP_200  # This is the default status
+        rep.set_header(OOBI_AID_HEADER, aid)
+        rep.content_type = Mimes.cesr if binary else "application/json+cesr"
+        rep.stream = streamReplay(chunks=chunks, tail=msgs)
+
+
+def streamReplay(chunks, tail=b''):
+    """
+    Returns generator of bytes for chunked streaming response of the replay
+    of a KEL followed by tail so that the KEL is never held in memory as a
+    whole.
+
+    Parameters:
+        chunks (Iterable): of duples (fn, chunk) from BaseHab.replayIter
+        tail (bytes | bytearray): messages to send after the KEL if any
+
+    """
+    for _, chunk in chunks:
+        yield bytes(chunk)
+    if tail:
+        yield bytes(tail)
 
 
 WEB_DIR_PATH = os.path.dirname(
@@ -6,6 +6,7 @@ keri.help.helping module
 import base64
 import dataclasses
 import datetime
+import functools
 import re
 from collections.abc import Iterable, Sequence, Mapping
 
@@ -77,6 +78,95 @@ def datify(cls, d):
         return d  # Not a dataclass.
 
 
+Scalars = (str, int, bool, float, type(None))  # types serializable as is
+
+
+def plainify(val):
+    """
+    Returns plain serializable value of val the way dataclasses.asdict converts
+    field values but without copying, so use only to serialize at once.
+    Nested dataclass instances become dicts via dictifier of their class.
+    """
+    if val.__class__ in Scalars:
+        return val
+    if dataclasses.is_dataclass(val) and not isinstance(val, type):
+        return dictifier(val.__class__, ser=False)(val)
+    if isinstance(val, list):
+        return [plainify(v) for v in val]
+    if isinstance(val, tuple):
+        if hasattr(val, "_fields"):  # namedtuple
+            return val.__class__(*[plainify(v) for v in val])
+        return val.__class__(plainify(v) for v in val)
+    if isinstance(val, dict):
+        return {k: plainify(v) for k, v in val.items()}
+    return val
+
+
+@functools.lru_cache(maxsize=None)
+def dictifier(cls, ser=True):
+    """
+    Returns function that dictifies instances of dataclass cls like dictify
+    but built once per class so each call skips the reflection on fields that
+    dataclasses.asdict repeats per instance. Returned dict shares mutable
+    field values with the instance so serialize it at once. Uses `_ser`
+    method of cls when ser and cls has one.
+
+    Parameters:
+        cls (Type[dataclass]): dataclass class
+        ser (bool): True means use cls._ser if any. False means ignore it as
+            does dataclasses.asdict for nested dataclasses
+    """
+    if ser and callable(getattr(cls, "_ser", None)):
+        return cls._ser
+    if not dataclasses.is_dataclass(cls):
+        return dictify  # resolve per instance
+
+    names = tuple(f.name for f in dataclasses.fields(cls))
+
+    def dictifyFields(val):
+        return {name: plainify(getattr(val, name)) for name in names}
+
+    return dictifyFields
+
+
+@functools.lru_cache(maxsize=None)
+def datifier(cls):
+    """
+    Returns function that converts dict to instance of dataclass cls like
+    datify but built once per class so each call skips the reflection on
+    fields and field types that datify repeats per instance. Field values of
+    nested dataclass type are converted with the datifier of their class.
+    Like datify the returned function returns its argument as is when it does
+    not convert to an instance.
+
+    Parameters:
+        cls (Type[dataclass]): dataclass class
+    """
+    der = getattr(cls, "_der", None)
+    if not callable(der):
+        if not dataclasses.is_dataclass(cls):
+            return lambda d: d  # not a dataclass
+
+        nested = {f.name: datifier(f.type) for f in dataclasses.fields(cls)
+                  if dataclasses.is_dataclass(f.type) or callable(getattr(f.type, "_der", None))}
+        names = frozenset(f.name for f in dataclasses.fields(cls))
+
+        def der(d):
+            if not names.issuperset(d):
+                raise KeyError(f"Unexpected fields of {cls}.")
+            if nested:
+                d = {f: (nested[f](v) if f in nested else v) for f, v in d.items()}
+            return cls(**d)
+
+    def datifyFields(d):
+        try:
+            return der(d)
+        except Exception:
+            return d  # not convertible
+
+    return datifyFields
+
+
 def klasify(sers: Iterable, klases: Iterable, args: Iterable = None):
     """
     Convert each qb64 serialization ser  in sers to instance of corresponding
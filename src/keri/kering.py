@@ -141,7 +141,8 @@ def smell(raw, *, version=None):
     if len(raw) < SMELLSIZE:
         raise ShortageError(f"Need more raw bytes to smell full version string.")
 
-    match = Rever.search(raw)  # Rever regex takes bytes/bytearray not str
+    # only search where version string may start so never scan rest of stream
+    match = Rever.search(raw[:SMELLSIZE])  # Rever regex takes bytes/bytearray not str
     if not match or match.start() > MAXVSOFFSET:
         raise VersionError(f"Invalid version string from smelled raw = "
                            f"{raw[: SMELLSIZE]}.")
@@ -176,6 +177,45 @@ def smell(raw, *, version=None):
     return Smellage(protocol=protocol, version=vrsn, kind=kind, size=size)
 
 
+def codexCodes(codex):
+    """
+    Returns tuple of code values of frozen dataclass codex instance codex.
+    Computed once then cached on codex since astuple deep copies on each call.
+    Used by codex .__iter__.
+
+    Parameters:
+        codex (dataclass): frozen codex instance such as ColdDex
+    """
+    try:
+        return codex.__dict__["_codes"]
+    except KeyError:
+        codes = astuple(codex)
+        object.__setattr__(codex, "_codes", codes)  # frozen so bypass
+        object.__setattr__(codex, "_codeset", frozenset(codes))
+        return codes
+
+
+def inCodex(codex, code):
+    """
+    Returns True if code is a code value of frozen dataclass codex instance
+    codex, False otherwise. Hashed lookup in cached frozenset of codexCodes.
+    Used by codex .__contains__ for inclusion test with "in".
+
+    Parameters:
+        codex (dataclass): frozen codex instance such as ColdDex
+        code (any): code to test
+    """
+    try:
+        codeset = codex.__dict__["_codeset"]
+    except KeyError:
+        codexCodes(codex)
+        codeset = codex.__dict__["_codeset"]
+    try:
+        return code in codeset
+    except TypeError:  # unhashable so not a code
+        return False
+
+
 @dataclass(frozen=True)
 class ColdCodex:
     """
@@ -215,7 +255,10 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(codexCodes(self))
+
+    def __contains__(self, code):
+        return inCodex(self, code)
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -544,6 +587,14 @@ class OutOfOrderError(ValidationError):
     """
 
 
+class EscrowCapacityError(ValidationError):
+    """
+    Error escrow is full so event or receipt was dropped not escrowed
+    Usage:
+        raise EscrowCapacityError("error message")
+    """
+
+
 class LikelyDuplicitousError(ValidationError):
     """
     Error event is likely duplicitous
@@ -313,7 +313,9 @@ class Reger(dbing.LMDBer):
         # Each registry has registry event log keyed by registry identifier
         self.states = koming.Komer(db=self,
                                    schema=RegStateRecord,
-                                   subkey='stts.')
+                                   subkey='stts.',
+                                   kind=coring.Serials.mgpk,
+                                   positional=True)
         #self.states = subing.SerderSuber(db=self, subkey='stts.')  # registry event state
 
         # Holds the credential
@@ -11,7 +11,7 @@ from keri import kering
 from keri.core import coring, serdering
 from keri.core.coring import Counter, CtrDex, Seqner
 from keri.help import nowIso8601
-from keri.app import habbing, indirecting, agenting, directing
+from keri.app import habbing, indirecting, agenting, directing, httping
 from keri.db import dbing
 from keri.vdr import eventing, viring
 
@@ -108,10 +108,249 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        # rotation reused pooled connections to wan and wil and only connected to new wes
+        assert self.hby.pooler.leases == 5
+        assert self.hby.pooler.opens == 3
+
         self.remove([witDoer])
+        assert self.hby.pooler.idle == {}  # last pool user exited
         return True
 
 
+def test_witness_receiptor_pipeline(seeder):
+    with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wanDoers = indirecting.setupWitness(alias="wan", hby=wanHby, tcpPort=5632, httpPort=5642)
+        wilDoers = indirecting.setupWitness(alias="wil", hby=wilHby, tcpPort=5633, httpPort=5643)
+
+        wanHab = wanHby.habByName(name="wan")
+        wilHab = wilHby.habByName(name="wil")
+        wesHab = wesHby.makeHab(name="wes", transferable=False)  # never started so never receipts
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab, wilHab, wesHab], protocols=[kering.Schemes.tcp])
+
+        slowHab = palHby.makeHab(name="slow", wits=[wanHab.pre, wesHab.pre], transferable=True)
+        fastHab = palHby.makeHab(name="fast", wits=[wanHab.pre, wilHab.pre], transferable=True)
+        fastHab.interact()
+
+        witDoer = agenting.WitnessReceiptor(hby=palHby, timeout=2.0)
+        assert witDoer.timeout == 2.0
+
+        def negotiate(hab, wits, state):
+            raise AssertionError("inception and no new witnesses need no negotiation")
+
+        witDoer.negotiate = negotiate
+        witDoer.msgs.append(dict(pre=slowHab.pre))
+        witDoer.msgs.append(dict(pre=fastHab.pre, sn=0))
+        witDoer.msgs.append(dict(pre=fastHab.pre, sn=1))
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wanDoers + wilDoers + [witDoer])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+
+        # fast identifier is receipted while slow one is still waiting on wes
+        while not (len(witDoer.cues) == 2 or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        assert [(cue["pre"], cue["sn"]) for cue in witDoer.cues] == [(fastHab.pre, 0), (fastHab.pre, 1)]
+        assert list(witDoer.flights) == [slowHab.pre]
+        state = witDoer.states[(slowHab.pre, 0)]
+        assert state["receipted"] == {wanHab.pre}
+        assert not witDoer.timeouts
+
+        while not (witDoer.timeouts or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        doist.exit()
+
+        assert witDoer.timeouts.popleft() == dict(pre=slowHab.pre)
+        assert witDoer.flights == {}
+        assert witDoer.waiting == {}
+        assert witDoer.states == {}
+        # fast ixn was sent with full KEL when fast icp was receipted so is already receipted
+        assert sum(witDoer.latencies[wanHab.pre]) == 2
+        assert sum(witDoer.latencies[wilHab.pre]) == 1
+        assert wesHab.pre not in witDoer.latencies
+        assert len(witDoer.latencies[wanHab.pre]) == len(agenting.WitnessReceiptor.Buckets)
+
+
+def test_catchup_fn():
+    with habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        palHab.interact()
+        palHab.interact()
+        ksn = palHab.kever.state()._asdict()
+
+        assert agenting.catchupFn(palHby.db, palHab.pre, ksn) == 3  # up to date
+
+        icp = palHab.makeOwnInception()
+        serder = serdering.SerderKERI(raw=bytes(icp))
+        ksn = dict(i=palHab.pre, s="0", d=serder.said)
+        assert agenting.catchupFn(palHby.db, palHab.pre, ksn) == 1  # missing both ixns
+
+        assert agenting.catchupFn(palHby.db, palHab.pre, dict(ksn, d=palHab.kever.serder.said)) == 0
+        assert agenting.catchupFn(palHby.db, palHab.pre, dict(ksn, s="9")) == 0
+        assert agenting.catchupFn(palHby.db, palHab.pre, dict(ksn, i=palHab.kever.serder.said)) == 0
+        assert agenting.catchupFn(palHby.db, palHab.pre, dict(ksn, s="zz")) == 0
+        assert agenting.catchupFn(palHby.db, palHab.pre, dict(i=palHab.pre)) == 0
+        assert agenting.catchupFn(palHby.db, palHab.pre, None) == 0
+
+    """Done Test"""
+
+
+def test_receiptor_catchup(seeder, monkeypatch):
+    with habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wilDoers = indirecting.setupWitness(alias="wil", hby=wilHby, tcpPort=None, httpPort=5643)
+        wilHab = wilHby.habByName(name="wil")
+        seeder.seedWitEnds(palHby.db, witHabs=[wilHab], protocols=[kering.Schemes.http])
+
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        palHab.interact()
+        wilHab.psr.parse(ims=bytearray(palHab.replay()), local=False)  # witness already has icp and ixn
+        assert wilHab.kevers[palHab.pre].sn == 1
+        palHab.interact()
+        palHab.interact()
+
+        sent = []
+        stream = agenting.httping.streamCESRRequests
+
+        def spy(client, ims, dest, **kwa):
+            sent.append(serdering.SerderKERI(raw=bytes(ims)).sn)
+            return stream(client=client, ims=ims, dest=dest, **kwa)
+
+        monkeypatch.setattr(agenting.httping, "streamCESRRequests", spy)
+
+        receiptor = agenting.Receiptor(hby=palHby)
+        results = []
+
+        def catchupDo(tymth=None, tock=0.0):
+            results.append((yield from receiptor.catchup(palHab.pre, wilHab.pre)))
+            return True
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wilDoers + [receiptor, doing.doify(catchupDo)])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        while not (results or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        while not (wilHab.kevers[palHab.pre].sn == 3 or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        doist.exit()
+
+        assert results == [True]
+        assert sent == [2, 3]  # only missing suffix of KEL
+        assert wilHab.kevers[palHab.pre].sn == 3
+        assert receiptor.cursors == {}
+
+    """Done Test"""
+
+
+def test_receiptor_negotiate(seeder):
+    with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wilDoers = indirecting.setupWitness(alias="wil", hby=wilHby, tcpPort=None, httpPort=5643)
+        wilHab = wilHby.habByName(name="wil")
+        wanHab = wanHby.makeHab(name="wan", transferable=False)  # never started so never responds
+        wesHab = wesHby.makeHab(name="wes", transferable=False)  # never started so never responds
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab, wilHab, wesHab], protocols=[kering.Schemes.http])
+
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        palHab.interact()
+        wilHab.psr.parse(ims=bytearray(palHab.replay()), local=False)  # witness already has icp and ixn
+        palHab.interact()
+
+        receiptor = agenting.WitnessReceiptor(hby=palHby)
+        assert receiptor.timeout is None  # negotiation still times out
+        receiptor.NegotiateTimeout = 1.0
+        state = dict(start=0.0, wits=[], receipted=set())
+        results = []
+
+        def negotiateDo(tymth=None, tock=0.0):
+            results.append((yield from receiptor.negotiate(palHab, [wanHab.pre, wilHab.pre, wesHab.pre],
+                                                           state)))
+            return True
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wilDoers + [receiptor, doing.doify(negotiateDo)])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        while not (results or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+        doist.exit()
+
+        # unresponsive witnesses are negotiated concurrently so time out together
+        assert results == [{wanHab.pre: 0, wilHab.pre: 2, wesHab.pre: 0}]
+        assert tymer.elapsed < 2 * receiptor.NegotiateTimeout
+
+    """Done Test"""
+
+
+def test_http_messenger_binary():
+    with habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        wilHab = wilHby.makeHab(name="wil", transferable=False)
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        msg = palHab.makeOwnEvent(sn=0)
+
+        def respond(messenger, status):
+            messenger.client.requests.popleft()
+            messenger.client.responses.append(dict(version=(1, 1), status=status, reason="",
+                                                   headers={}, body=b"", data=None,
+                                                   request=None, errored=False, error=None))
+            next(dog)
+
+        # text domain unless binary mode
+        messenger = agenting.HTTPMessenger(hab=palHab, wit=wilHab.pre, url="http://127.0.0.1:5644/")
+        assert not messenger.binary
+        messenger.post(msg)
+        assert messenger.client.requests[0]["headers"]["Content-Type"] == httping.CESR_CONTENT_TYPE
+
+        palHby.db.binary = True
+        messenger = agenting.HTTPMessenger(hab=palHab, wit=wilHab.pre, url="http://127.0.0.1:5644/")
+        assert messenger.binary
+        dog = messenger.responseDo()
+        next(dog)
+
+        messenger.post(msg)
+        assert messenger.posted == 1
+        assert messenger.client.requests[0]["headers"]["Content-Type"] == httping.CESR_BINARY_CONTENT_TYPE
+
+        # refused binary post reposted in text domain and later posts in text domain
+        respond(messenger, 406)
+        assert not messenger.binary
+        assert messenger.posted == 1 and not messenger.sent
+        assert messenger.client.requests[0]["headers"]["Content-Type"] == httping.CESR_CONTENT_TYPE
+        respond(messenger, 204)
+        assert messenger.posted == len(messenger.sent) == 1
+
+        messenger.post(msg)
+        assert messenger.client.requests[0]["headers"]["Content-Type"] == httping.CESR_CONTENT_TYPE
+        respond(messenger, 204)
+        assert messenger.idle
+
+        # accepted binary post stays binary
+        messenger = agenting.HTTPMessenger(hab=palHab, wit=wilHab.pre, url="http://127.0.0.1:5644/")
+        dog = messenger.responseDo()
+        next(dog)
+        messenger.post(msg)
+        respond(messenger, 204)
+        assert messenger.binary and messenger.idle
+
+    """Done Test"""
+
+
 def test_witness_sender(seeder):
     with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
             habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
@@ -0,0 +1,316 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.asyncing module
+
+"""
+import concurrent.futures
+import http.client
+import socket
+import time
+
+import falcon
+import pytest
+from hio.base import doing, tyming
+
+from keri import kering
+from keri.app import agenting, asyncing, habbing, indirecting, storing
+from keri.core import coring, eventing
+from keri.db import dbing
+
+
+def runUntil(doist, future, limit=5.0):
+    """
+    Recurs doist until future is done. Returns future result
+    """
+    end = time.perf_counter() + limit
+    while not future.done():
+        assert time.perf_counter() < end
+        doist.recur()
+        time.sleep(doist.tock)
+    return future.result()
+
+
+class Hello:
+    def on_get(self, req, rep):
+        rep.status = falcon.HTTP_200
+        rep.data = f"hello {req.get_param('name')}".encode("utf-8")
+
+    def on_post(self, req, rep):
+        rep.status = falcon.HTTP_200
+        rep.data = req.bounded_stream.read()[::-1]
+
+
+class Replay:
+    def on_get(self, req, rep):
+        rep.status = falcon.HTTP_200
+        rep.stream = (bytes([65 + i]) * 10 for i in range(3))
+
+
+class Mailbox:
+    def __init__(self, mbx):
+        self.mbx = mbx
+
+    def on_get(self, req, rep):
+        rep.status = falcon.HTTP_200
+        rep.set_header('Content-Type', "text/event-stream")
+        rep.stream = indirecting.MailboxIterable(mbx=self.mbx, pre=req.get_param("pre"),
+                                                 topics={"/receipt": 0})
+
+
+def test_servicer():
+    """
+    Test Servicer runs submitted calls on Doist thread
+    """
+    servicer = asyncing.Servicer()
+    doist = doing.Doist(tock=0.01, real=True, doers=[servicer])
+    doist.enter()
+
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        future = pool.submit(lambda: servicer.submit(lambda x: (x, time.monotonic()), 3))
+        future = future.result()  # submitted from other thread
+        assert not future.done()
+        assert runUntil(doist, future)[0] == 3
+        assert servicer.served == 1
+
+    future = servicer.submit(lambda: 1 / 0)
+    doist.recur()
+    with pytest.raises(ZeroDivisionError):
+        future.result()
+
+    future = servicer.submit(lambda: None)
+    doist.exit()
+    assert future.cancelled()
+
+    """Done Test"""
+
+
+def test_server_bridge():
+    """
+    Test Server of Bridge of falcon WSGI app against loopback clients
+    """
+    mbx = storing.Mailboxer(temp=True)
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    rxbs = bytearray()
+
+    app = falcon.App()
+    app.add_route("/hello", Hello())
+    app.add_route("/replay", Replay())
+    app.add_route("/mbx", Mailbox(mbx=mbx))
+    app.add_route("/", indirecting.HttpEnd(rxbs=rxbs, mbx=mbx))
+
+    servicer = asyncing.Servicer()
+    server = asyncing.Server(app=asyncing.Bridge(app=app, servicer=servicer, poll=10.0),
+                             host="127.0.0.1", port=0)
+    assert server.reopen()
+    assert server.port != 0
+    doist = doing.Doist(tock=0.01, real=True,
+                        doers=[servicer, asyncing.ServerDoer(server=server)])
+    doist.enter()
+
+    def get(path, method="GET", body=None, conn=None):
+        if conn is None:  # one request per connection
+            conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+            conn.request(method, path, body=body, headers={"Connection": "close"})
+        else:
+            conn.request(method, path, body=body)
+        rep = conn.getresponse()
+        return rep.status, rep.getheader("Connection"), rep.read()
+
+    subscribers = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            assert runUntil(doist, pool.submit(get, "/hello?name=bob")) == (200, "close", b'hello bob')
+            assert runUntil(doist, pool.submit(get, "/hello", "POST", b'abc')) == (200, "close", b'cba')
+            assert runUntil(doist, pool.submit(get, "/replay")) == (200, "close",
+                                                                    b'A' * 10 + b'B' * 10 + b'C' * 10)
+            assert runUntil(doist, pool.submit(get, "/missing"))[0] == 404
+
+            # connection kept alive for next request until response streamed
+            conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+            for body in (b'abc', b'def'):
+                assert runUntil(doist, pool.submit(get, "/", "PUT", body, conn)) == (204, None, b'')
+                assert len(server.tasks) == 1  # same connection
+            assert runUntil(doist, pool.submit(get, "/hello?name=sue", conn=conn)) == (200, None,
+                                                                                     b'hello sue')
+            assert runUntil(doist, pool.submit(get, "/replay", conn=conn))[1] == "close"
+            conn.close()
+            assert rxbs == bytearray(b'abcdef')
+            rxbs.clear()
+            end = time.perf_counter() + 5.0
+            while server.tasks:
+                assert time.perf_counter() < end
+                doist.recur()
+                time.sleep(doist.tock)
+
+            # many idle mailbox subscribers do not hold up other requests
+            for _ in range(100):
+                sock = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+                sock.sendall(f"GET /mbx?pre={pre} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+                subscribers.append(sock)
+
+            start = time.perf_counter()
+            status, _, _ = runUntil(doist, pool.submit(get, "/", "PUT", b'{"v":"KERI10JSON000000_"}'))
+            assert status == 204
+            assert time.perf_counter() - start < 1.0
+            assert rxbs == bytearray(b'{"v":"KERI10JSON000000_"}')
+
+            # idle subscribers wait on watch not poll so store wakes them promptly
+            start = time.perf_counter()
+            mbx.storeMsg(topic=pre + "/receipt", msg=b'{"t":"rct"}')
+
+            def events(sock):
+                data = bytearray()
+                while b'data: {"t":"rct"}' not in data:
+                    data.extend(sock.recv(4096))
+                return bytes(data)
+
+            data = runUntil(doist, pool.submit(events, subscribers[-1]))
+            assert time.perf_counter() - start < 1.0
+            assert data.startswith(b'HTTP/1.1 200 OK\r\n')
+            assert b'content-type: text/event-stream\r\n' in data
+            assert b'retry: 5000\n\n' in data
+            assert b'event: /receipt\nretry: 5000\ndata: {"t":"rct"}\n\n' in data
+            assert len(server.tasks) == 100
+            assert len(mbx.watchers[(pre + "/receipt").encode("utf-8")]) == 100
+
+            # disconnected subscribers are dropped
+            for sock in subscribers:
+                sock.close()
+            end = time.perf_counter() + 5.0
+            while server.tasks:
+                assert time.perf_counter() < end
+                doist.recur()
+                time.sleep(doist.tock)
+    finally:
+        for sock in subscribers:
+            sock.close()
+        doist.exit()
+        mbx.close(clear=True)
+
+    assert not server.opened
+    assert server.tasks == set()
+    assert mbx.watchers == {}
+
+    """Done Test"""
+
+
+def test_server_app_failure():
+    """
+    Test Server replies 500 when ASGI app fails before response head written
+    and drains disconnect reads in bounded chunks
+    """
+    reads = []
+
+    async def app(scope, receive, send):
+        await receive()
+        if scope["path"] == "/raise":
+            raise ValueError("before start")
+        if scope["path"] == "/started":
+            await send(dict(type="http.response.start", status=200, headers=[]))
+            raise ValueError("after start")
+        if scope["path"] == "/streamed":
+            await send(dict(type="http.response.start", status=200, headers=[]))
+            await send(dict(type="http.response.body", body=b'abc', more_body=True))
+            raise ValueError("after body")
+        if scope["path"] == "/wait":
+            reads.append(await receive())
+            await send(dict(type="http.response.start", status=200, headers=[]))
+            await send(dict(type="http.response.body", body=b'done'))
+        # "/none" returns without response
+
+    server = asyncing.Server(app=app, host="127.0.0.1", port=0)
+    server.Chunk = 8
+    assert server.reopen()
+
+    def get(path):
+        sock = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        if path == "/wait":  # extra bytes past request then half close
+            sock.sendall(b'x' * 100)
+            sock.shutdown(socket.SHUT_WR)
+        data = bytearray()
+        while chunk := sock.recv(4096):
+            data.extend(chunk)
+        sock.close()
+        return bytes(data)
+
+    try:
+        for path in ("/raise", "/started", "/none"):
+            data = get(path)
+            assert data.startswith(b'HTTP/1.1 500 Internal Server Error\r\n')
+            assert b'connection: close\r\n' in data
+
+        data = get("/streamed")  # head written so no 500 just closed
+        assert data.startswith(b'HTTP/1.1 200 OK\r\n')
+        assert data.endswith(b'abc')
+
+        data = get("/wait")
+        assert data.startswith(b'HTTP/1.1 200 OK\r\n')
+        assert data.endswith(b'done')
+        assert reads == [dict(type="http.disconnect")]
+    finally:
+        server.close()
+
+    assert not server.opened
+
+    """Done Test"""
+
+
+def test_witness_aio(seeder):
+    """
+    Test witnesses with asyncio HTTP ingress receipt over loopback http
+    """
+    with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wanDoers = indirecting.setupWitness(alias="wan", hby=wanHby, tcpPort=None,
+                                            httpPort=5642, aio=True)
+        wilDoers = indirecting.setupWitness(alias="wil", hby=wilHby, tcpPort=None,
+                                            httpPort=5643, aio=True)
+        assert [doer for doer in wanDoers if isinstance(doer, asyncing.ServerDoer)]
+
+        wanHab = wanHby.habByName(name="wan")
+        wilHab = wilHby.habByName(name="wil")
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab, wilHab], protocols=[kering.Schemes.http])
+
+        palHab = palHby.makeHab(name="pal", wits=[wanHab.pre, wilHab.pre], transferable=True)
+        witDoer = agenting.WitnessReceiptor(hby=palHby)
+        witDoer.msgs.append(dict(pre=palHab.pre))
+        dgkey = dbing.dgKey(palHab.kever.serder.preb, palHab.kever.serder.saidb)
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wanDoers + wilDoers + [witDoer])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+
+        def receipt(port):
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            conn.request("GET", f"/receipts?pre={palHab.pre}&sn=0")
+            rep = conn.getresponse()
+            return rep.status, rep.read()
+
+        try:
+            # witnesses accept and receipt event posted to async ingress
+            while not tymer.expired:
+                if wanHab.db.getWigs(dgkey) and wilHab.db.getWigs(dgkey):
+                    break
+                doist.recur()
+                time.sleep(doist.tock)
+            assert wanHab.db.getWigs(dgkey) and wilHab.db.getWigs(dgkey)
+
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                status, rct = runUntil(doist, pool.submit(receipt, 5642))
+        finally:
+            doist.exit()
+
+        assert status == 200
+        assert rct.startswith(eventing.receipt(pre=palHab.pre, sn=0,
+                                               said=palHab.kever.serder.said).raw)
+        assert bytes(wanHab.db.getWigs(dgkey)[0]) in rct
+
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_servicer()
+    test_server_bridge()
@@ -823,6 +823,77 @@ def test_make_other_event():
                        b'p8Sc4CcESKA-q5O0O5CmpCbSrA29UpqZnfvUagrwm8w3M1a1WJKy64OQYXIG')
 
 
+def test_replay_iter():
+    with habbing.openHby() as hby:
+        hab = hby.makeHab(name="test")
+        other = hby.makeHab(name="other")
+        for _ in range(4):
+            hab.interact()
+        msgs = [bytes(msg) for msg in hby.db.clonePreIter(pre=hab.pre)]
+        assert len(msgs) == 5
+
+        # chunks of whole messages bounded by size
+        size = len(msgs[0]) + len(msgs[1])
+        chunks = list(hab.replayIter(size=size))
+        assert [fn for fn, _ in chunks] == [2, 4, 5]
+        assert [bytes(chunk) for _, chunk in chunks] == [msgs[0] + msgs[1],
+                                                         msgs[2] + msgs[3],
+                                                         msgs[4]]
+        assert hab.replay() == bytearray().join(chunk for _, chunk in chunks)
+        assert hab.replay(fn=3) == b''.join(msgs[3:])
+
+        # resume from cursor
+        fn, chunk = next(hab.replayIter(size=size))
+        assert [bytes(chunk) for _, chunk in hab.replayIter(fn=fn)] == [b''.join(msgs[2:])]
+
+        # message larger than size is its own chunk
+        chunks = list(hab.replayIter(pre=other.pre, size=1))
+        assert len(chunks) == 1
+        assert chunks[0][1] == other.replay()
+
+        # all prefixes resumable from fnKey cursor
+        alls = list(hby.db.cloneAllPreIter())  # includes signator
+        full = hab.replayAll()
+        assert full == bytearray().join(alls)
+        chunks = list(hab.replayAllIter(size=1))
+        assert len(chunks) == len(alls)
+        assert bytearray().join(chunk for _, chunk in chunks) == full
+        key, _ = chunks[2]
+        assert hab.replayAll(key=key) == bytearray().join(chunk for _, chunk in chunks[3:])
+
+
+def test_replay_query_cue():
+    with habbing.openHby() as hby:
+        hab = hby.makeHab(name="test")
+        other = hby.makeHab(name="other")
+        hab.interact()
+        kvy = eventing.Kevery(db=hby.db, lax=False, local=False)
+        psr = parsing.Parser(kvy=kvy)
+        msgs = [bytes(msg) for msg in hby.db.clonePreIter(pre=hab.pre)]
+        assert len(msgs) == 2
+
+        psr.parse(ims=other.query(pre=hab.pre, src=hab.pre, route="logs"))
+        cue = kvy.cues.popleft()
+        assert cue["kin"] == "replay"
+        assert [bytes(msg) for msg in cue["msgs"]] == msgs
+
+        # batch mode cue consumed after batch transaction commits
+        bkvy = eventing.Kevery(db=hby.db, lax=False, local=False, batch=True)
+        bpsr = parsing.Parser(kvy=bkvy, batch=True)
+        bpsr.parse(ims=other.query(pre=hab.pre, src=hab.pre, route="logs"))
+        cue = bkvy.cues.popleft()
+        assert cue["kin"] == "replay"
+        assert hby.db.txns == []
+        assert [bytes(msg) for msg in cue["msgs"]] == msgs
+
+        # nothing to replay so no cue
+        hby.db.getFe = lambda key: None
+        psr.parse(ims=other.query(pre=hab.pre, src=hab.pre, route="logs"))
+        assert not kvy.cues
+
+    """Done Test"""
+
+
 def test_hab_by_pre():
     with habbing.openHby() as hby:
         # Create two habs in the default namespace
@@ -958,6 +1029,24 @@ def test_postman_endsfor():
         }
 
 
+def test_habery_reconfigure_binary():
+    """
+    Test .reconfigure sets binary domain storage and wire mode from config
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    with habbing.openHby(name="bny", salt=salt) as hby:
+        assert not hby.db.binary
+        hby.cf.put(dict(binary=True))
+        hby.reconfigure()
+        assert hby.db.binary
+
+        hby.cf.put(dict(binary=False))
+        hby.reconfigure()
+        assert not hby.db.binary
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     pass
     test_habery()
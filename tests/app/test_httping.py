@@ -197,3 +197,38 @@ def test_stream_cesr_request(mockHelpingNowUTC):
 
 if __name__ == '__main__':
     test_parse_cesr_request()
+
+
+def test_binary_cesr_request(mockHelpingNowUTC):
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+        msg = hab.makeOwnEvent(sn=0)
+        serder = serdering.SerderKERI(raw=msg)
+        atc = bytes(msg[serder.size:])
+
+        client = MockClient()
+        httping.streamCESRRequests(client, bytearray(msg), dest=wit, binary=True)
+        args = client.args.pop()
+        headers = args["headers"]
+        assert headers["Content-Type"] == httping.CESR_BINARY_CONTENT_TYPE
+        assert httping.CESR_ATTACHMENT_HEADER not in headers
+        assert args["body"] == serder.raw + coring.decodeB64(atc)
+        assert headers["Content-Length"] == len(serder.raw) + len(atc) * 3 // 4
+
+        client = MockClient()
+        httping.createCESRRequest(bytearray(msg), client, dest=wit, binary=True)
+        assert client.args.pop()["body"] == args["body"]
+
+        req = helpers.create_req(headers=dict(Content_Type=httping.CESR_BINARY_CONTENT_TYPE),
+                                 body=args["body"])
+        cr = httping.parseCesrHttpRequest(req=req)
+        assert cr.binary
+        assert cr.payload == serder.ked
+        assert cr.atc == coring.decodeB64(atc)
+        assert httping.convertAttachments(cr.atc) == atc  # back to text domain
+        assert httping.convertAttachments(atc, binary=True) == cr.atc
+
+        req = helpers.create_req(headers=dict(Content_Type=httping.CESR_BINARY_CONTENT_TYPE),
+                                 body=b'{"i": 1234}')
+        with pytest.raises(falcon.HTTPError):
+            httping.parseCesrHttpRequest(req=req)
@@ -7,12 +7,14 @@ import json
 
 import falcon
 import hio
+from falcon import testing
 import pytest
 from hio.core import tcp, http
 from hio.help import decking
 
-from keri.app import indirecting, storing, habbing
-from keri.core import coring, serdering
+from keri.app import httping, indirecting, storing, habbing
+from keri.core import coring, eventing, serdering
+from keri.db import basing, dbing
 
 
 def test_mailbox_iter():
@@ -100,6 +102,70 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_iter_watch():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mbx = storing.Mailboxer(temp=True)
+    scans = []
+    clone = mbx.cloneTopicIter
+
+    def cloneTopicIter(topic, fn=0):
+        scans.append(topic)
+        return clone(topic, fn)
+
+    mbx.cloneTopicIter = cloneTopicIter
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/multisig": 0},
+                                     retry=1000)
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+    assert next(mbi) == b''
+    assert scans == [f"{pre}/receipt", f"{pre}/multisig"]  # first scan of each topic
+
+    # idle topics are not rescanned
+    for _ in range(10):
+        assert next(mbi) == b''
+    assert len(scans) == 2
+
+    woken = []
+    mb.watch(woken.append)
+    assert mb.watching
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=b'{"t":"rct"}')
+    assert woken == [f"{pre}/receipt".encode("utf-8")]
+    assert next(mbi) == b'id: 0\nevent: /receipt\nretry: 1000\ndata: {"t":"rct"}\n\n'
+    assert scans[2:] == [f"{pre}/receipt"]  # only changed topic rescanned
+
+    mb.unwatch()
+    assert not mb.watching
+    assert mbx.watchers == {}
+
+    # messages stored by other process leave mark unchanged so picked up by rescan
+    msg = b'{"t":"exn"}'
+    digb = coring.Diger(ser=msg, code=coring.MtrDex.Blake3_256).qb64b
+    mbx.appendToTopic(topic=f"{pre}/multisig".encode("utf-8"), val=digb)
+    mbx.msgs.pin(keys=digb, val=msg)
+    assert next(mbi) == b''  # not yet due for rescan
+    mb.scanned -= mb.Rescan
+    assert next(mbi) == b'id: 0\nevent: /multisig\nretry: 1000\ndata: {"t":"exn"}\n\n'
+    assert scans[3:] == [f"{pre}/receipt", f"{pre}/multisig"]  # all topics rescanned
+
+    # query response stream watches once cue starts its mailbox stream
+    said = "EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3"
+    cues = decking.Deck()
+    qmb = indirecting.QryRpyMailboxIterable(cues=cues, mbx=mbx, said=said)
+    qmb.watch(woken.append)
+    assert not qmb.watching
+    assert next(iter(qmb)) == b''
+    cues.append(dict(serder=coring.Sadder(ked=dict(v=coring.versify(size=0), d=said)),
+                     kin="stream", pre=pre, topics={"/multisig": 0}))
+    assert next(qmb) == b''
+    assert qmb.watching
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=b'{"t":"exn"}')
+    assert woken[-1] == f"{pre}/multisig".encode("utf-8")
+    qmb.unwatch()
+    assert mbx.watchers == {}
+
+    mbx.close(clear=True)
+
+
 def test_qrymailbox_iter():
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -177,6 +243,103 @@ def test_createHttpServer(monkeypatch):
     assert isinstance(server.servant, MockServerTls)
 
 
+def test_httpend_throttle():
+    """
+    Test HttpEnd pushes back with 503 Service Unavailable on messages that
+    may only add to full escrows
+    """
+    signers = coring.Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+    icp = eventing.incept(keys=[signers[0].verfer.qb64],
+                          ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+    headers = {"Content-Type": httping.CESR_CONTENT_TYPE,
+               httping.CESR_ATTACHMENT_HEADER: ""}
+
+    with basing.openDB(name="throttle", escrowLimit=0) as db:
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        assert kvy.throttled(eventing.Ilks.icp, icp.pre)  # every escrow at zero limit is full
+        assert kvy.throttled(eventing.Ilks.rct, icp.pre)
+        assert not kvy.throttled(eventing.Ilks.exn, icp.pre)  # never escrowed
+        assert not kvy.throttled(eventing.Ilks.icp, None)
+
+        rxbs = bytearray()
+        end = indirecting.HttpEnd(rxbs=rxbs, kvy=kvy)
+        app = falcon.App()
+        app.add_route("/", end)
+        client = testing.TestClient(app)
+
+        rep = client.simulate_post(path="/", body=icp.raw, headers=headers)
+        assert rep.status == falcon.HTTP_503
+        assert rep.headers["Retry-After"] == str(indirecting.HttpEnd.RetryAfter)
+        assert rxbs == bytearray()
+
+        # put stream may hold messages that resolve escrows so never throttled
+        rep = falcon.Response()
+        end.on_put(testing.create_req(method="PUT", path="/", body=icp.raw), rep)
+        assert rep.status == falcon.HTTP_204
+        assert rxbs == icp.raw
+        rxbs.clear()
+
+        # prefix with escrowed entries may resolve them so not throttled
+        assert db.addOoe(dbing.snKey(icp.preb, 1), icp.saidb)
+        assert db.escrowed(icp.pre)
+        assert not kvy.throttled(eventing.Ilks.icp, icp.pre)
+        rep = falcon.Response()
+        end.on_post(testing.create_req(method="POST", path="/", body=icp.raw,
+                                       headers=headers), rep)
+        assert rep.status == falcon.HTTP_204
+        assert rxbs == icp.raw
+        rxbs.clear()
+        assert db.delOoes(dbing.snKey(icp.preb, 1))
+        assert not db.escrowed(icp.pre)
+
+        # prefix with accepted key state may resolve escrows so not throttled
+        kvy.processEvent(serder=icp, sigers=[signers[0].sign(icp.raw, index=0)])
+        assert icp.pre in kvy.kevers
+        assert not kvy.throttled(eventing.Ilks.ixn, icp.pre)
+
+        db.escrowLimit = basing.Baser.EscrowLimit
+        other = eventing.incept(keys=[signers[1].verfer.qb64])
+        assert not kvy.throttled(eventing.Ilks.icp, other.pre)
+        rep = falcon.Response()
+        assert not indirecting.HttpEnd(rxbs=rxbs, kvy=kvy).throttle(rep, other)
+        assert indirecting.HttpEnd(rxbs=rxbs).throttle(rep, other) is False
+
+    """End Test"""
+
+
+def test_keystate_end():
+    """
+    Test KeyStateEnd reports witness key state of identifier
+    """
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b'wann-the-witness').qb64) as witHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        witHab = witHby.makeHab(name="wit", transferable=False)
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        palHab.interact()
+
+        app = falcon.App()
+        app.add_route("/ksn", indirecting.KeyStateEnd(hab=witHab))
+        client = testing.TestClient(app)
+
+        rep = client.simulate_get(path="/ksn")
+        assert rep.status == falcon.HTTP_400
+        rep = client.simulate_get(path="/ksn", params=dict(pre=palHab.pre))
+        assert rep.status == falcon.HTTP_404
+
+        witHab.psr.parse(ims=bytearray(palHab.replay()), local=False)
+        rep = client.simulate_get(path="/ksn", params=dict(pre=palHab.pre))
+        assert rep.status == falcon.HTTP_200
+        assert rep.headers["Content-Type"] == "application/json"
+        assert rep.json["i"] == palHab.pre
+        assert rep.json["s"] == "1"
+        assert rep.json["d"] == palHab.kever.serder.said
+
+        app.add_route("/only", indirecting.KeyStateEnd(hab=witHab, aids=[witHab.pre]))
+        rep = client.simulate_get(path="/only", params=dict(pre=palHab.pre))
+        assert rep.status == falcon.HTTP_400
+
+    """End Test"""
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,200 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.pooling module
+
+"""
+import time
+
+import falcon
+import pytest
+from hio.base import doing
+from hio.core import http
+from hio.core.tcp import serving
+
+from keri import kering
+from keri.app import indirecting, pooling
+
+Eid = "BOigXdxpp1r43JhO--czUTwrCXzoWrIwW8i41KWDlr8s"
+
+
+def serviceUntil(server, pooled, predicate, limit=2.0):
+    """ Services server and pooled connection until predicate is True """
+    end = time.monotonic() + limit
+    while not predicate():
+        assert time.monotonic() < end
+        server.service()
+        pooled.service()
+        time.sleep(0.01)
+
+
+def test_pooler():
+    """
+    Test Pooler leases and releases keep-alive connections keyed by (eid, scheme)
+    """
+    url = "tcp://127.0.0.1:5661/"
+    server = serving.Server(host="", port=5661)
+    assert server.reopen()
+    pooler = pooling.Pooler()
+    try:
+        pooled = pooler.lease(Eid, url)
+        assert pooled.key == (Eid, kering.Schemes.tcp)
+        assert pooled.leased
+        assert (pooler.leases, pooler.opens) == (1, 1)
+        pooled.open()
+        serviceUntil(server, pooled, lambda: pooled.connector.connected and server.ixes)
+
+        pooler.release(pooled)
+        assert not pooled.leased
+        assert pooler.idle == {(Eid, kering.Schemes.tcp): [pooled]}
+        pooler.release(pooled)  # releasing twice is noop
+        assert pooler.idle == {(Eid, kering.Schemes.tcp): [pooled]}
+
+        # next lease reuses open connection
+        again = pooler.lease(Eid, url)
+        assert again is pooled
+        assert again.connector.connected
+        assert (pooler.leases, pooler.opens) == (2, 1)
+        assert pooler.idle == {}
+
+        # concurrent lease of same key gets its own connection
+        other = pooler.lease(Eid, url)
+        assert other is not pooled
+        assert (pooler.leases, pooler.opens) == (3, 2)
+
+        # connection with data still to send is not pooled
+        other.open()
+        other.client.tx(b"abc")
+        pooler.release(other)
+        assert not other.connector.opened
+        assert pooler.idle == {}
+
+        # remote close while idle is detected on lease and reconnected
+        pooler.release(pooled)
+        assert len(server.ixes) == 1
+        for ca in list(server.ixes):
+            server.removeIx(ca)
+        time.sleep(0.05)
+        pooled = pooler.lease(Eid, url)
+        assert pooled.connector.cutoff
+        serviceUntil(server, pooled, lambda: pooled.connector.connected and not pooled.connector.cutoff)
+        serviceUntil(server, pooled, lambda: server.ixes)
+
+        # changed endpoint url closes stale pooled connection
+        pooler.release(pooled)
+        moved = pooler.lease(Eid, "tcp://127.0.0.1:5662/")
+        assert moved is not pooled
+        assert not pooled.connector.opened
+        assert pooler.idle == {}
+        pooler.release(moved)
+
+        pooler.close()
+        assert pooler.idle == {}
+    finally:
+        pooler.close()
+        server.close()
+
+    with pytest.raises(kering.ConfigurationError):
+        pooler.lease(Eid, "ftp://127.0.0.1:5661/")
+
+    """Done Test"""
+
+
+def test_pooled_backoff():
+    """
+    Test Pooled backs off reconnect attempts to refused endpoint up to bound
+    """
+    pooled = pooling.Pooled(eid=Eid, url="http://127.0.0.1:5663/")
+    assert pooled.scheme == kering.Schemes.http
+    pooled.open()
+    now = 0.0
+    delays = []
+    try:
+        while len(delays) < 10:
+            failures = pooled.failures
+            pooled.service(now=now)
+            assert not pooled.connector.connected
+            if pooled.failures > failures:
+                delays.append(pooled.retry - now)
+                now = pooled.retry  # skip ahead to next retry
+            else:
+                pooled.service(now=pooled.retry - 0.001)  # too soon so no attempt
+                assert pooled.failures == failures
+                time.sleep(0.01)
+
+        assert delays[:4] == [0.125, 0.25, 0.5, 1.0]
+        assert max(delays) == pooling.Pooler.MaxBackoff
+    finally:
+        pooled.close()
+
+    """Done Test"""
+
+
+def test_pooled_keepalive():
+    """
+    Test pooled http connection to witness HttpEnd is reused across requests
+    """
+    rxbs = bytearray()
+    app = falcon.App()
+    app.add_route("/", indirecting.HttpEnd(rxbs=rxbs))
+    server = http.Server(port=5665, app=app)
+    assert server.reopen()
+    pooler = pooling.Pooler()
+    url = "http://127.0.0.1:5665/"
+    try:
+        pooled = pooler.lease(Eid, url)
+        pooled.open()
+        cas = []
+        for body in (b'abc', b'def'):
+            pooled.client.request(method="PUT", path="/", body=body)
+            serviceUntil(server, pooled, lambda: pooled.client.responses)
+            rep = pooled.client.respond()
+            assert rep.status == 204
+            assert "Connection" not in rep.headers  # keep-alive
+            cas.append(list(server.servant.ixes))
+            pooler.release(pooled)
+            again = pooler.lease(Eid, url)
+            assert again is pooled
+            assert pooled.connector.connected and not pooled.connector.cutoff
+
+        assert rxbs == bytearray(b'abcdef')
+        assert len(cas[0]) == 1 and cas[0] == cas[1]  # one server side connection
+        assert (pooler.leases, pooler.opens) == (3, 1)
+        pooler.release(pooled)
+    finally:
+        pooler.close()
+        server.close()
+
+    """Done Test"""
+
+
+def test_pooler_doer():
+    """
+    Test PoolerDoer closes idle pooled connections when last pool user exits
+    """
+    pooler = pooling.Pooler()
+    pooled = pooler.lease(Eid, "tcp://127.0.0.1:5664/")
+    pooled.open()
+    pooler.release(pooled)
+    assert pooler.idle
+
+    doers = [pooling.PoolerDoer(pooler=pooler), pooling.PoolerDoer(pooler=pooler)]
+    doist = doing.Doist(tock=0.03125, limit=0.125, doers=doers)
+    doist.enter()
+    assert pooler.users == 2
+    doist.recur()
+    doers[0].exit()
+    assert pooler.users == 1
+    assert pooler.idle  # still has a user
+    doers[1].exit()
+    assert pooler.users == 0
+    assert pooler.idle == {}
+    assert not pooled.connector.opened
+
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_pooler()
+    test_pooled_backoff()
+    test_pooled_keepalive()
+    test_pooler_doer()
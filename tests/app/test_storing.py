@@ -110,5 +110,38 @@ def test_mailboxing():
 
 
 
+def test_mailbox_watch():
+    """
+    Test Mailboxer topic marks and watchers notified by storeMsg
+    """
+    pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        assert mber.marks == {}
+        assert mber.mark(f"{pre}/receipt") == 0
+
+        woken = []
+        mber.watch(f"{pre}/receipt", woken.append)
+        mber.watch(f"{pre}/receipt".encode("utf-8"), woken.append)  # same watcher once
+        assert mber.watchers == {f"{pre}/receipt".encode("utf-8"): {woken.append}}
+
+        mber.storeMsg(topic=f"{pre}/receipt", msg=b'{"t":"rct"}')
+        assert mber.mark(f"{pre}/receipt") == 1
+        assert woken == [f"{pre}/receipt".encode("utf-8")]
+
+        mber.storeMsg(topic=f"{pre}/challenge", msg=b'{"t":"exn"}')  # other topic
+        assert mber.mark(f"{pre}/challenge".encode("utf-8")) == 1
+        assert mber.mark(f"{pre}/receipt") == 1
+        assert len(woken) == 1
+
+        mber.unwatch(f"{pre}/receipt", woken.append)
+        assert mber.watchers == {}
+        mber.unwatch(f"{pre}/receipt", woken.append)  # already removed
+        mber.storeMsg(topic=f"{pre}/receipt", msg=b'{"t":"rct","s":"1"}')
+        assert mber.mark(f"{pre}/receipt") == 2
+        assert len(woken) == 1
+
+    """Done Test"""
+
+
 if __name__ == '__main__':
     test_mailboxing()
@@ -42,7 +42,8 @@ from keri.help import helping
 from keri.kering import (EmptyMaterialError, RawMaterialError, DerivationError,
                          ShortageError, InvalidCodeSizeError, InvalidVarIndexError,
                          InvalidValueError, DeserializeError, ValidationError,
-                         InvalidVarRawSizeError)
+                         InvalidVarRawSizeError, UnexpectedCodeError,
+                         UnexpectedCountCodeError)
 from keri.kering import Version, Versionage, VersionError
 #from keri.kering import (ICP_LABELS, DIP_LABELS, ROT_LABELS, DRT_LABELS, IXN_LABELS,
                       #RPY_LABELS)
@@ -232,6 +233,63 @@ def test_b64_conversions():
     """End Test"""
 
 
+def test_decode_tables():
+    """
+    Test precomputed code decode tables and sextet helpers
+    """
+    assert len(coring.B64IdxByOrd) == 256
+    assert coring.B64IdxByOrd[ord('A')] == 0
+    assert coring.B64IdxByOrd[ord('_')] == 63
+    assert coring.B64IdxByOrd[ord('=')] == 64
+
+    assert coring.b64Sextets(b'AB-_', 0, 4) == b64ToInt('AB-_')
+    assert coring.b64Sextets(b'AB-_', 1, 3) == b64ToInt('B-')
+    assert coring.b64Sextets(b'AB=_', 0, 4) is None  # not Base64
+    assert coring.b64Sextets(b'AB', 0, 4) is None  # too short
+    assert coring.b2Sextets(decodeB64(b'AB-_'), 0, 4) == b64ToInt('AB-_')
+    assert coring.b2Sextets(decodeB64(b'AB-_'), 1, 3) == b64ToInt('B-')
+    assert coring.b2Sextets(codeB64ToB2('-0V'), 0, 3) == b64ToInt('-0V')
+    assert coring.b2Sextets(b'\x00', 0, 4) is None  # too short
+
+    # every code in Sizes sniffs to its sizes in both domains
+    for klas in (Matter, Indexer, Counter):
+        heads, longs = klas.Decodes
+        assert len(heads) == coring.HeadSize ** 2
+        for hard, sizage in klas.Sizes.items():
+            qb64b = (hard + 'A' * (8 - len(hard))).encode("utf-8")
+            assert coring.sniffB64(qb64b, klas.Decodes) == (hard, *sizage)
+            assert coring.sniffB64(bytearray(qb64b), klas.Decodes) == (hard, *sizage)
+            qb2 = decodeB64(qb64b)
+            assert coring.sniffB2(qb2, klas.Decodes) == (hard, *sizage)
+        assert len(longs) == len([h for h in klas.Sizes if len(h) > 2])
+
+    assert coring.sniffB64(b'-AAB', Matter.Decodes) is None  # counter
+    assert coring.sniffB64(b'_AAB', Matter.Decodes) is None  # op code
+    assert coring.sniffB64(b'1AA', Matter.Decodes) is None  # short
+    assert coring.sniffB64(b'1AAZ', Matter.Decodes) is None  # unsupported
+    assert coring.sniffB64(b'E', Matter.Decodes) is None  # short
+    assert coring.sniffB64(b'E=', Matter.Decodes) is None  # not Base64
+    assert coring.sniffB2(codeB64ToB2('-A'), Matter.Decodes) is None
+    assert coring.sniffB64(b'A', Counter.Decodes) is None
+
+    # errors still come from full lookup
+    with pytest.raises(UnexpectedCountCodeError):
+        Matter(qb64b=b'-AAB')
+    with pytest.raises(ShortageError):
+        Matter(qb64b=b'1AA')
+    with pytest.raises(UnexpectedCodeError):
+        Matter(qb64='\u00e9AAA')
+
+    # codex inclusion from cached codes
+    assert tuple(MtrDex) == dataclasses.astuple(MtrDex)
+    assert MtrDex.Blake3_256 in DigDex
+    assert MtrDex.Ed25519 not in DigDex
+    assert None not in DigDex
+    assert [] not in DigDex  # unhashable
+    assert IdrDex.Ed25519_Crt_Sig in IdxCrtSigDex
+    """ Done Test """
+
+
 def test_matter():
     """
     Test Matter class
@@ -4441,6 +4499,13 @@ def test_verfer():
     result = verfer.verify(sig, ser)
     assert result == True
 
+    # batch verify with per item results and duplicates
+    results = Verfer.verifyBatch([(verfer, sig, ser),
+                                  (verfer, sig, b'ABC'),
+                                  (verfer, sig, ser)])
+    assert results == [True, False, True]
+    assert Verfer.verifyBatch([]) == []
+
     with pytest.raises(ValueError):
         verfer = Verfer(raw=verkey, code=MtrDex.Blake3_256)
 
@@ -5888,6 +5953,79 @@ def test_siger():
     """ Done Test """
 
 
+def test_from_trusted():
+    """
+    Test ._fromTrusted fast construction of Matter and Indexer subclasses
+    from trusted qb64b matches full validated construction
+    """
+    Matter.Trusts.clear()
+    signer = Signer(raw=b'0123456789abcdef0123456789abcdef')
+    verkey = signer.verfer.raw
+
+    prims = [Verfer(raw=verkey, code=MtrDex.Ed25519),
+             Diger(ser=b'abc'),
+             Prefixer(raw=verkey, code=MtrDex.Ed25519),
+             Seqner(sn=15),
+             Saider(raw=blake3.blake3(b'abc').digest(), code=MtrDex.Blake3_256),
+             Texter(text=b'trusted'),
+             Texter(text=b'trusted but longer text'),
+             signer.sign(b'abc', index=3),
+             signer.sign(b'abc', index=2, ondex=5),
+             signer.sign(b'abc', index=4, only=True)]
+
+    for _ in range(2):  # first validates and makes template, then trusted
+        for prim in prims:
+            klas = type(prim)
+            for qb64b in (prim.qb64b, bytearray(prim.qb64b), memoryview(prim.qb64b)):
+                trusted = klas._fromTrusted(qb64b)
+                assert type(trusted) == klas
+                assert trusted.qb64b == prim.qb64b
+                assert trusted.code == prim.code
+                assert trusted.raw == prim.raw
+                if isinstance(prim, Indexer):
+                    assert trusted.index == prim.index
+                    assert trusted.ondex == prim.ondex
+
+            ims = bytearray(prim.qb64b + b'extra')
+            trusted = klas._fromTrusted(ims, strip=True)
+            assert trusted.qb64b == prim.qb64b
+            assert ims == bytearray(b'extra')
+
+    assert (Verfer, MtrDex.Ed25519) in Matter.Trusts
+    assert (Prefixer, MtrDex.Ed25519) in Matter.Trusts
+    assert (Siger, IdrDex.Ed25519_Crt_Sig) in Matter.Trusts
+
+    # code derived attributes assigned to each trusted instance
+    prefixer = Prefixer._fromTrusted(prims[2].qb64b)
+    assert prefixer._verify.__self__ is prefixer
+    assert prefixer.__dict__.keys() == {"_code", "_size", "_raw", "_verify"}
+    siger = Siger._fromTrusted(prims[7].qb64b)
+    assert siger.verfer is None
+    siger.verfer = verfer = Verfer(raw=verkey, code=MtrDex.Ed25519)
+    assert Siger._fromTrusted(prims[7].qb64b).verfer is None
+    assert verfer.verify(siger.raw, b'abc')
+    assert prefixer.verify(ked=dict(t=Ilks.icp, i=prefixer.qb64, k=[prefixer.qb64], n=[]))
+    verfer = Verfer._fromTrusted(prims[0].qb64b)
+    sig = signer.sign(b'abc').raw
+    assert verfer.verify(sig, b'abc')
+    assert not verfer.verify(sig, b'abd')
+
+    # Signer always fully constructs since verfer derives from raw
+    other = Signer(raw=b'abcdef0123456789abcdef0123456789')
+    for s in (signer, other, signer):
+        trusted = Signer._fromTrusted(s.qb64b)
+        assert trusted.qb64b == s.qb64b
+        assert trusted.verfer.qb64b == s.verfer.qb64b
+    assert not any(key[0] is Signer for key in Matter.Trusts)
+
+    # material with code that may not be sniffed is never trusted
+    for _ in range(2):
+        with pytest.raises(UnexpectedCountCodeError):
+            Verfer._fromTrusted(b'-AAB' + prims[0].qb64b)
+    assert len(Matter.Trusts) == len({(type(prim), prim.code) for prim in prims})
+    """ Done Test """
+
+
 def test_saider():
     """
     Test Saider object
@@ -6647,6 +6785,42 @@ def test_tholder():
                             '["1/2", ''{"1/2": ["1", "1"]}]]')
     assert tholder.num == None
 
+    # compiled weighted threshold shared by limen across instances
+    assert tholder._compiled is None  # compiled on first weighted satisfy
+    assert tholder.satisfy(indices=[3, 4, 5, 6, 8])
+    denom, clauses = tholder._compiled
+    assert denom == 6
+    assert clauses[0] == (0b111111,
+                          ((1 << 3, 3),),
+                          ((2, ((1 << 0, 3), (1 << 1, 3), (1 << 2, 3))),
+                           (3, ((1 << 4, 6), (1 << 5, 6)))))
+    assert clauses[1] == (0b111000000, ((1 << 6, 3),), ((3, ((1 << 7, 6), (1 << 8, 6))),))
+    assert Tholder.Compiles[tholder.limen] is tholder._compiled
+    other = Tholder(limen=tholder.limen)
+    assert other.satisfy(indices=[0, 2, 3, 5, 6, 7])
+    assert other._compiled is tholder._compiled  # cached
+    assert not tholder.satisfy(indices=[0, 9])  # out of range
+    assert not tholder.satisfy(indices=[])
+
+    def reference(thold, indices):  # Fraction arithmetic satisfaction
+        sats = [i in indices for i in range(9)]
+        wio = 0
+        for clause in thold:
+            cw = 0
+            for e in clause:
+                if isinstance(e, tuple):
+                    vw = sum(w for w in e[1] if sats[(wio := wio + 1) - 1])
+                    cw += e[0] if vw >= 1 else 0
+                else:
+                    cw += e if sats[(wio := wio + 1) - 1] else 0
+            if cw < 1:
+                return False
+        return True
+
+    for bits in range(1 << 9):  # exhaustive against reference
+        indices = [i for i in range(9) if bits & (1 << i)]
+        assert tholder.satisfy(indices=indices) == reference(tholder.thold, indices)
+
     with pytest.raises(ValueError):
         tholder = Tholder(sith=[[{"1/3":["1/2", "1/2", "1/2"]}, "1/2", {"1/2": ["1", "1"]}], ["1/2", {"1/3": ["1", "1"]}]])
 
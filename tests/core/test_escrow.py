@@ -796,6 +796,80 @@ def test_out_of_order_escrow():
     """End Test"""
 
 
+def test_event_driven_escrow():
+    """
+    Test event driven out of order escrow reprocessing with periodic fallback
+
+    """
+    signers = coring.Salter(raw=b'0123456789abcdef').signers(count=2,
+                                                            path='edr',
+                                                            temp=True)
+    psr = parsing.Parser()
+
+    with basing.openDB(name="edr") as db:
+        kvy = eventing.Kevery(db=db, fallback=3600)
+        assert kvy.fallback == 3600
+        assert not kvy.wakes
+        assert kvy.scanned is None
+
+        # create inception and three interaction events
+        msgs = []
+        srdr = eventing.incept(keys=[signers[0].verfer.qb64],
+                               ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+        pre = srdr.pre
+        digs = [srdr.said]
+        for sn in range(4):
+            if sn:
+                srdr = eventing.interact(pre=pre, dig=digs[-1], sn=sn)
+                digs.append(srdr.said)
+            msg = bytearray(srdr.raw)
+            msg.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b)
+            msg.extend(signers[0].sign(srdr.raw, index=0).qb64b)
+            msgs.append(msg)
+
+        kvy.processEscrows()  # first call is full scan
+        assert kvy.scanned is not None
+        scanned = kvy.scanned
+
+        # escrow out of order events 2 and 3
+        psr.parse(ims=bytearray(msgs[3]), kvy=kvy)
+        psr.parse(ims=bytearray(msgs[2]), kvy=kvy)
+        assert pre not in kvy.kevers
+        assert len(kvy.db.getOoes(dbing.snKey(pre, 2))) == 1
+        assert len(kvy.db.getOoes(dbing.snKey(pre, 3))) == 1
+
+        # accepting events 0 and 1 wakes escrows at sn 1 and 2
+        psr.parse(ims=bytearray(msgs[0]), kvy=kvy)
+        psr.parse(ims=bytearray(msgs[1]), kvy=kvy)
+        assert kvy.kevers[pre].sn == 1
+        assert list(kvy.wakes) == [(pre, 0), (pre, 1)]
+
+        # fallback not due so only woken escrows reprocessed which chains
+        kvy.processEscrows()
+        assert kvy.scanned == scanned  # no full scan
+        assert not kvy.wakes
+        assert kvy.kevers[pre].sn == 3
+        assert kvy.kevers[pre].serder.said == digs[3]
+        assert not kvy.db.getOoes(dbing.snKey(pre, 2))
+        assert not kvy.db.getOoes(dbing.snKey(pre, 3))
+
+        # not woken so out of order escrow left for fallback full scan
+        srdr = eventing.interact(pre=pre, dig=digs[3], sn=4)
+        kvy.escrowOOEvent(serder=srdr, sigers=[signers[0].sign(srdr.raw, index=0)])
+        kvy.processEscrows()
+        assert len(kvy.db.getOoes(dbing.snKey(pre, 4))) == 1
+
+        kvy.scanned = scanned - datetime.timedelta(seconds=3601)  # fallback due
+        kvy.processEscrows()
+        assert kvy.scanned > scanned
+        assert kvy.kevers[pre].sn == 4
+        assert not kvy.db.getOoes(dbing.snKey(pre, 4))
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 def test_unverified_receipt_escrow():
     """
     Test unverified receipt escrow
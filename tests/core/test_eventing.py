@@ -603,6 +603,92 @@ def test_lastestloc():
     """End Test """
 
 
+def test_batcher():
+    """
+    Test Batcher batch signature verifier and verifySigs with batcher
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+    verfers = [signer.verfer for signer in signers]
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+
+    batcher = eventing.Batcher(size=2)
+    assert batcher.size == 2
+    assert batcher.pending == []
+    assert batcher.hits == batcher.misses == 0
+
+    batcher.add(raw=b'ABC', sig=sigers[0].raw, verfer=verfers[0])  # bad sig
+    for siger in sigers:
+        batcher.add(raw=ser, sig=siger.raw, verfer=verfers[siger.index])
+    assert len(batcher.pending) == 3
+    assert batcher.flush() == 3
+    assert batcher.pending == []
+    assert len(batcher.results) == 2  # least recently used evicted
+
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers,
+                                            verfers=verfers, batcher=batcher)
+    assert vindices == [0, 1]
+    assert batcher.hits == 2
+    assert batcher.misses == 0
+
+    # already memoized triples are not collected again
+    batcher.add(raw=ser, sig=sigers[1].raw, verfer=verfers[1])
+    assert batcher.pending == []
+
+    # evicted or missing results fall back to individual verification and
+    # memoized results never apply to a different serialization
+    vsigers, vindices = eventing.verifySigs(raw=b'ABC', sigers=sigers,
+                                            verfers=verfers, batcher=batcher)
+    assert vindices == []
+    assert batcher.misses == 2
+    assert len(batcher.results) == 2
+
+    """End Test """
+
+
+def test_escrow_verified_memo():
+    """
+    Test Kevery memo of verified signatures so retries of partially signed
+    escrowed events only verify newly arrived signatures
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=6, temp=True)
+    keys = [signer.verfer.qb64 for signer in signers[:3]]
+    ndigs = [Diger(ser=signer.verfer.qb64b).qb64 for signer in signers[3:]]
+    serder = incept(keys=keys, isith=["1/2", "1/2", "1/2"], ndigs=ndigs,
+                    nsith=["1/2", "1/2", "1/2"], code=MtrDex.Blake3_256)
+    sigers = [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers[:3])]
+
+    with openDB(name="verified") as db:
+        kvy = Kevery(db=db, lax=True, local=False)
+        assert kvy.batcher is None
+        assert kvy.verifier.size == Kevery.VerifiedSize
+
+        msg = eventing.messagize(serder, sigers=sigers[:1])
+        parsing.Parser(kvy=kvy).parse(ims=msg)
+        assert serder.pre not in kvy.kevers  # partially signed so escrowed
+        assert kvy.verifier.misses == 1
+        assert kvy.verifier.hits == 0
+
+        for _ in range(3):  # retries reuse verified result
+            kvy.processEscrowPartialSigs()
+        assert serder.pre not in kvy.kevers
+        assert kvy.verifier.misses == 1
+        assert kvy.verifier.hits == 3
+
+        # second sig arrives so only it is verified
+        msg = eventing.messagize(serder, sigers=sigers[1:2])
+        parsing.Parser(kvy=kvy).parse(ims=msg)
+        kvy.processEscrowPartialSigs()
+        assert serder.pre in kvy.kevers
+        assert kvy.verifier.misses == 2
+
+    with openDB(name="verified") as db:  # batch mode memo is its batcher
+        kvy = Kevery(db=db, batch=True)
+        assert kvy.verifier is kvy.batcher
+
+    """End Test """
+
+
 def test_seals_states():
     """
     Test seal and state namedtuples
@@ -2049,6 +2135,79 @@ def test_messagize_with_prior_next():
     """ Done Test """
 
 
+def test_binary_wire():
+    """
+    Test binary domain qb2 attachments on messagize, storage of signatures
+    and cloned replay
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    signers = salter.signers(count=2, path="B", temp=True)
+    wigner = salter.signer(path="W", transferable=False, temp=True)
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64],
+                    code=MtrDex.Blake3_256)
+    sigers = [signers[0].sign(serder.raw, index=0)]
+
+    text = messagize(serder, sigers=sigers, pipelined=True)
+    bny = messagize(serder, sigers=sigers, pipelined=True, binary=True)
+    tatc = text[serder.size:]
+    batc = bny[serder.size:]
+    assert len(batc) * 4 == len(tatc) * 3  # 25% smaller
+    assert bytes(batc) == coring.decodeB64(bytes(tatc))
+    assert kering.sniff(batc) == kering.Colds.bny
+
+    with openDB(name="bny", binary=True) as bdb, openDB(name="txt") as tdb:
+        assert bdb.binary and not tdb.binary
+        kvy = Kevery(db=bdb, lax=True, local=False)
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(bny))
+        assert serder.pre in kvy.kevers
+
+        dgkey = dgKey(serder.preb, serder.saidb)
+        assert bdb.getVals(bdb.sigs, dgkey) == [sigers[0].qb2]  # stored qb2
+        assert bdb.getSigs(dgkey) == [sigers[0].qb64b]  # read as qb64b
+        assert bdb.sigQb2(sigers[0].qb64b) == sigers[0].qb2
+        assert bdb.sigQb64b(sigers[0].qb2) == sigers[0].qb64b
+
+        tmsg = bdb.cloneEvtMsg(pre=serder.preb, fn=0, dig=serder.saidb)
+        bmsg = bdb.cloneEvtMsg(pre=serder.preb, fn=0, dig=serder.saidb,
+                               binary=True)
+        assert tmsg[:serder.size] == bmsg[:serder.size] == serder.raw
+        assert bytes(bmsg[serder.size:]) == coring.decodeB64(bytes(tmsg[serder.size:]))
+        assert list(bdb.clonePreIter(serder.pre, binary=True)) == [bmsg]
+
+        # binary replay accepted by text storage database
+        kvy = Kevery(db=tdb, lax=True, local=False)
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(bmsg))
+        assert serder.pre in kvy.kevers
+        assert tdb.getVals(tdb.sigs, dgkey) == [sigers[0].qb64b]  # stored qb64b
+
+        # witness signatures stored qb2 and cloned as is
+        wiger = wigner.sign(serder.raw, index=0)
+        assert bdb.addWig(dgkey, wiger)
+        assert not bdb.addWig(dgkey, wiger.qb64b)  # same sig either domain
+        assert bdb.getWigs(dgkey) == [wiger.qb64b]
+        bmsg = bdb.cloneEvtMsg(pre=serder.preb, fn=0, dig=serder.saidb,
+                               binary=True)
+        assert wiger.qb2 in bmsg
+        assert Counter(code=CtrDex.WitnessIdxSigs, count=1).qb2 in bmsg
+
+        # signatures stored in one domain not stored again after .binary changed
+        tdb.binary = True
+        assert not tdb.addSig(dgkey, sigers[0])
+        assert tdb.putSigs(dgkey, [sigers[0], sigers[0].qb2])
+        assert tdb.cntSigs(dgkey) == 1
+        assert tdb.getVals(tdb.sigs, dgkey) == [sigers[0].qb64b]
+        bdb.binary = False
+        assert bdb.putWigs(dgkey, [wiger.qb64b])
+        assert bdb.cntWigs(dgkey) == 1
+        tdb.binary = False
+
+        assert tdb.delSigs(dgkey, sigers[0].qb2)  # either domain
+        assert tdb.getSigs(dgkey) == []
+
+    """ Done Test """
+
+
 
 def test_kever(mockHelpingNowUTC):
     """
@@ -4771,10 +4930,37 @@ def test_reload_kever(mockHelpingNowUTC):
 
         # now create new Kever with state
         kever = eventing.Kever(state=state, db=natHby.db)
+        assert not hasattr(kever, "__dict__")  # slots
         assert kever.sn == 6
         assert kever.fn == 6
+        assert kever.state() == state  # from compact state
+        assert kever._serder is None  # nothing materialized yet
+        assert kever._verfers is None
+        assert kever._tholder is None
+        assert kever._prefixer is None
         assert kever.serder.ked == natHab.kever.serder.ked
         assert kever.serder.said == natHab.kever.serder.said
+        assert kever.prefixer.qb64 == natHab.pre
+        assert kever.verfers[0].qb64 == natHab.kever.verfers[0].qb64
+        assert kever.ndigs == natHab.kever.ndigs
+        assert kever.tholder.sith == '2'
+        assert kever.ntholder.sith == '2'
+        assert kever.toader.num == 0
+        assert kever.dater.dts == state.dt
+        kever.compact()  # release materialized
+        assert kever._serder is None
+        assert kever._verfers is None
+        assert kever.verfers[2].qb64 == natHab.kever.verfers[2].qb64
+
+        # current event missing from db raises instead of materializing None
+        kever.compact()
+        key = dgKey(state.i, state.d)
+        raw = natHby.db.getEvt(key)
+        assert natHby.db.delEvt(key)
+        with pytest.raises(kering.MissingEntryError):
+            _ = kever.serder
+        assert natHby.db.putEvt(key, raw)
+        assert kever.serder.said == state.d
 
         kstate = kever.state()
         assert kstate == state
@@ -4794,6 +4980,42 @@ def test_reload_kever(mockHelpingNowUTC):
     """End Test"""
 
 
+def test_kever_update_abort():
+    """
+    Test Kever key state unchanged when txn of accepted event aborts
+    """
+    with habbing.openHby(name="nat", base="test") as natHby:
+        natHab = natHby.makeHab(name="nat")
+        natHab.interact()
+        kever = natHab.kever
+        said = kever.serder.said
+        assert kever.sn == 1
+
+        def fail(keys, val):
+            raise kering.ConfigurationError("injected")
+
+        pin = natHab.db.states.pin
+        natHab.db.states.pin = fail
+        with pytest.raises(kering.ValidationError):
+            natHab.interact()
+        with pytest.raises(kering.ValidationError):
+            natHab.rotate()
+        natHab.db.states.pin = pin
+
+        # neither in memory key state nor database changed by aborted txns
+        assert kever.sn == 1
+        assert kever.serder.said == said
+        assert kever.ilk == Ilks.ixn
+        assert natHab.db.getKeLast(dbing.snKey(natHab.pre, 2)) is None
+        assert natHab.db.states.get(keys=natHab.pre).s == "1"
+
+        natHab.interact()
+        assert kever.sn == 2
+        assert natHab.db.states.get(keys=natHab.pre).s == "2"
+
+    """End Test"""
+
+
 def test_load_event(mockHelpingNowUTC):
     with habbing.openHby(name="tor", base="test") as torHby, \
          habbing.openHby(name="wil", base="test") as wilHby, \
@@ -4,6 +4,7 @@ tests.core.test_eventing module
 
 """
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 from hio.help import decking
@@ -31,7 +32,9 @@ def test_parser():
     raw = b"ABCDEFGH01234567"
     signers = Salter(raw=raw).signers(count=8, path='psr', temp=True)
 
-    with openDB(name="controller") as conDB, openDB(name="validator") as valDB:
+    with (openDB(name="controller") as conDB, openDB(name="validator") as valDB,
+          openDB(name="batcher") as batDB, openDB(name="pooler") as poolDB,
+          openDB(name="cursor") as curDB, openDB(name="streamer") as strDB):
         event_digs = []  # list of event digs in sequence
 
         # create event stream
@@ -241,6 +244,68 @@ def test_parser():
         db_digs = [bytes(val).decode("utf-8") for val in kevery.db.getKelIter(pre)]
         assert db_digs == event_digs
 
+        # batch mode extracts all then batch verifies then dispatches in order
+        bkevery = Kevery(db=batDB, batch=True)
+        assert bkevery.batcher is not None
+        parser = parsing.Parser(kvy=bkevery, batch=True)
+        assert parser.batch == True
+        parser.parse(ims=bytearray(msgs))
+        assert parser.ims == bytearray(b'')
+        bkever = bkevery.kevers[pre]
+        assert bkever.sn == kever.sn
+        assert bkever.verfers[0].qb64 == signers[4].verfer.qb64
+        db_digs = [bytes(val).decode("utf-8") for val in bkevery.db.getKelIter(pre)]
+        assert db_digs == event_digs
+        # est events carry own keys so hit batch but ixn keys come from key
+        # state not yet accepted at prefetch so ixn events 3, 4 and 6 miss
+        assert bkevery.batcher.hits == 5
+        assert bkevery.batcher.misses == 3
+        assert not bkevery.batcher.pending
+
+        # stream short of bytes dispatches extracted messages before waiting
+        skevery = Kevery(db=strDB, batch=True)
+        parser = parsing.Parser(kvy=skevery, batch=True, framed=False)
+        assert len(event_digs) < parser.BatchSize
+        parsator = parser.allParsator(ims=bytearray(msgs[:-10]))  # last msg short
+        next(parsator)  # waits for rest of last msg
+        assert skevery.kevers[pre].sn == kever.sn
+        db_digs = [bytes(val).decode("utf-8") for val in skevery.db.getKelIter(pre)]
+        assert db_digs == event_digs
+        parsator.close()
+
+        # batch mode with process pool verifies saids and sigs in parallel
+        pims = bytearray(msgs)
+        i = pims.index(b'"d":"E') + 10
+        pims[i:i+1] = b'X' if pims[i:i+1] != b'X' else b'Y'  # corrupt icp said
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pkevery = Kevery(db=poolDB, batch=True)
+            parser = parsing.Parser(kvy=pkevery, batch=True, executor=executor)
+            assert parser.executor == executor
+            parser.parse(ims=pims)  # icp dropped so nothing accepted
+            assert pre not in pkevery.kevers
+            parser.parse(ims=bytearray(msgs))
+        pkever = pkevery.kevers[pre]
+        assert pkever.sn == kever.sn
+        db_digs = [bytes(val).decode("utf-8") for val in pkevery.db.getKelIter(pre)]
+        assert db_digs == event_digs
+
+        size = msgs.index(b'-AAB')  # end of icp
+        assert parsing.verifySaid(bytes(msgs[:size])) == True
+        assert parsing.verifySaid(bytes(pims[:size])) == False
+
+        # cursor mode extracts from zero copy view then compacts when done
+        ckevery = Kevery(db=curDB)
+        parser = parsing.Parser(kvy=ckevery, cursor=True)
+        assert parser.cursor == True
+        cims = bytearray(msgs)
+        parser.parse(ims=cims)
+        assert cims == bytearray(b'')  # consumed
+        ckever = ckevery.kevers[pre]
+        assert ckever.sn == kever.sn
+        assert ckever.verfers[0].qb64 == signers[4].verfer.qb64
+        db_digs = [bytes(val).decode("utf-8") for val in ckevery.db.getKelIter(pre)]
+        assert db_digs == event_digs
+
         parser = parsing.Parser()  # no kevery so drops all messages
         parser.parse(ims=msgs)
         assert parser.ims == bytearray(b'')
@@ -251,7 +316,72 @@ def test_parser():
     """ Done Test """
 
 
+def test_cursor():
+    """
+    Test Cursor zero copy stream view
+    """
+    buf = bytearray(b'ABCDEFGHIJ')
+    cursor = parsing.Cursor(buf)
+    assert len(cursor) == 10
+    assert cursor
+    assert cursor[0] == ord('A')
+    assert cursor[-1] == ord('J')
+    assert cursor[:3] == bytearray(b'ABC')
+    assert isinstance(cursor[:3], bytearray)
+
+    del cursor[:4]  # strip only advances offset
+    assert cursor.offset == 4
+    assert len(cursor) == 6
+    assert cursor[0] == ord('E')
+    assert cursor[:2] == bytearray(b'EF')
+    assert cursor[4:] == bytearray(b'IJ')
+    assert buf == bytearray(b'ABCDEFGHIJ')  # not yet compacted
+
+    with pytest.raises(IndexError):
+        cursor[6]
+    with pytest.raises(TypeError):
+        del cursor[2:4]
+
+    with pytest.raises(BufferError):  # exported so may not be resized
+        buf.extend(b'KL')
+
+    cursor.compact()
+    assert buf == bytearray(b'EFGHIJ')
+    assert cursor.offset == 0
+    assert cursor.view is None  # released
+    buf.extend(b'KL')  # so producer may extend
+    cursor.compact()  # idempotent
+    assert buf == bytearray(b'EFGHIJKL')
+
+    cursor = parsing.Cursor(buf)
+    del cursor[:]
+    assert not cursor
+    cursor.compact()
+    assert buf == bytearray(b'')
+
+    cursor = parsing.Cursor(b'ABCDEF')  # immutable so compact keeps offset
+    del cursor[:2]
+    cursor.compact()
+    assert cursor.offset == 2
+
+    # parse compacts and releases even when parsing raises
+    def failParsator(ims, **kwa):
+        del ims[:3]
+        raise ValueError("parse failed")
+        yield
+
+    buf = bytearray(b'ABCDEF')
+    parser = parsing.Parser(cursor=True)
+    parser.allParsator = failParsator
+    with pytest.raises(ValueError):
+        parser.parse(ims=buf)
+    assert buf == bytearray(b'DEF')
+    buf.extend(b'GH')
+    assert buf == bytearray(b'DEFGH')
+
+    """ Done Test """
 
 
 if __name__ == "__main__":
     test_parser()
+    test_cursor()
@@ -12,15 +12,16 @@ import pytest
 from hio.base import doing
 
 from tests.app import openMultiSig
+from keri import kering
 from keri.kering import Versionage
 from keri.app import habbing
-from keri.core import coring, eventing, serdering
+from keri.core import coring, eventing, parsing, serdering
 from keri.core.coring import MtrDex
 from keri.core.coring import Serials, versify
 from keri.core.coring import Salter
 from keri.core.eventing import incept, rotate, interact, Kever
 from keri.db import basing
-from keri.db import dbing
+from keri.db import dbing, koming
 from keri.db.basing import openDB, Baser, KeyStateRecord
 from keri.db.dbing import (dgKey, onKey, snKey)
 from keri.db.dbing import openLMDB
@@ -1992,6 +1993,237 @@ def test_usebaser():
     """ End Test """
 
 
+def test_evt_serder_cache():
+    """
+    Test Baser LRU cache of event serders
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, path='esc', temp=True)
+
+    with openDB(name="cache") as db:
+        assert db.serders == {}
+        assert db.serdersBytes == 0
+        assert db.serderHits == 0
+        assert db.serderMisses == 0
+
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+        pre = serder.pre
+        assert db.getEvtSerder(pre, serder.said) is None  # not yet in db
+        assert db.serderMisses == 0
+
+        serders = [serder]
+        for sn in range(1, 4):
+            serders.append(interact(pre=pre, dig=serders[-1].said, sn=sn))
+        for srdr in serders:
+            assert db.putEvt(dgKey(pre, srdr.said), srdr.raw)
+
+        eserder = db.getEvtSerder(pre, serder.said)
+        assert eserder.said == serder.said
+        assert db.serderMisses == 1
+        assert db.serdersBytes == serder.size
+        cserder = db.getEvtSerder(pre.encode(), serder.saidb)  # cached
+        assert db.serderHits == 1
+        assert cserder is not eserder and cserder.raw is eserder.raw
+        assert cserder.sad == eserder.sad
+
+        # clones so changes by caller never change cache
+        cserder.keys.append(signers[1].verfer.qb64)
+        eserder.ked["a"].append(dict(i=pre))
+        assert db.getEvtSerder(pre, serder.said).sad == serder.sad
+        assert db.serderHits == 2
+
+        # size bounded evicts least recently used
+        db.SerderCacheSize = 2
+        for srdr in serders[1:]:
+            assert db.getEvtSerder(pre, srdr.said).said == srdr.said
+        assert db.serderMisses == 4
+        assert list(db.serders) == [dgKey(pre, srdr.said) for srdr in serders[2:]]
+        assert db.serdersBytes == serders[2].size + serders[3].size
+
+        # raw size bounded
+        db.SerderCacheSize = 4096
+        db.SerderCacheBytes = serders[0].size  # icp is largest
+        assert db.getEvtSerder(pre, serders[3].said).said == serders[3].said
+        assert db.serderHits == 3
+        assert db.getEvtSerder(pre, serders[0].said).said == serders[0].said
+        assert list(db.serders) == [dgKey(pre, serders[0].said)]
+        assert db.serdersBytes == serders[0].size
+        db.SerderCacheBytes = Baser.SerderCacheBytes
+
+        # invalidated on delete
+        assert db.delEvt(dgKey(pre, serders[0].said))
+        assert db.serders == {}
+        assert db.serdersBytes == 0
+        assert db.getEvtSerder(pre, serders[0].said) is None
+
+        # invalidated on overwrite
+        assert db.getEvtSerder(pre, serders[1].said).said == serders[1].said
+        assert db.setEvt(dgKey(pre, serders[1].said), serders[1].raw)
+        assert db.serders == {}
+
+        db.getEvtSerder(pre, serders[1].said)
+        db.clearEvtSerders()
+        assert db.serders == {}
+        assert db.serdersBytes == 0
+
+        # events loaded trusted so audit reverifies in bulk
+        assert list(db.getAuditIter()) == []
+        raw = bytearray(serders[2].raw)
+        i = raw.index(b'"a":[') - 3
+        raw[i:i+1] = b'1' if raw[i:i+1] != b'1' else b'2'  # corrupt sn
+        assert db.setEvt(dgKey(pre, serders[2].said), bytes(raw))
+        assert db.getEvtSerder(pre, serders[2].said).said == serders[2].said
+        audits = list(db.getAuditIter())
+        assert len(audits) == 1
+        subkey, keys, ex = audits[0]
+        assert subkey == "evts."
+        assert keys == (pre, serders[2].said)
+
+        # serders of stores verified before stored also loaded trusted
+        assert not db.rpys.verify
+        assert not db.exns.verify
+        assert db.rpys.pin(keys=serders[3].said, val=serders[3])
+        db.setVal(db.rpys.sdb, db.rpys._tokey(serders[3].said), bytes(raw))
+        assert db.rpys.get(keys=serders[3].said).said == serders[2].said
+        audits = list(db.getAuditIter())
+        assert [(subkey, keys) for subkey, keys, ex in audits] == [
+            ("evts.", (pre, serders[2].said)), ("rpys.", (serders[3].said, ))]
+
+    assert not os.path.exists(db.path)
+
+    """ End Test """
+
+
+def test_seal_index():
+    """
+    Test Baser index of anchored seals to anchoring events
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, path='anc', temp=True)
+    eseal = eventing.SealEvent(i='EBm9JqQKS4a3EYv5I7BmAPiwhdSQvFAOpqe0dgk3kgH_',
+                               s='0',
+                               d='EA3QbTpV15MvLSXHSedm4lRYdQhmYXqXafsD4i75B_yo')._asdict()
+    dseal = eventing.SealDigest(d='EJ7s1vk30hWK_l-exQtzj4P5u_wIzki1drVR4FAKDbEW')._asdict()
+    jseal = dict(d="a", e="b")  # joined fields and values same as dotted seal
+    pseal = dict(de="a.b")  # value with "." separator
+    lseal = dict(note="x" * 600)  # value longer than lmdb max key size
+
+    with openDB(name="anchors") as db:
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+        pre = serder.pre
+        serders = [serder]
+        for sn, data in ((1, []), (2, [dseal]), (3, [eseal, dseal]), (4, [jseal]),
+                         (5, [pseal, lseal])):
+            serders.append(interact(pre=pre, dig=serders[-1].said, sn=sn,
+                                    data=data))
+        for srdr in serders:
+            kvy.processEvent(serder=srdr,
+                             sigers=[signers[0].sign(srdr.raw, index=0)])
+        assert kvy.kevers[pre].sn == 5
+
+        keys = db._sealKeys(pre, eseal)
+        ser = b'{"i":"%s","s":"0","d":"%s"}' % (eseal["i"].encode(), eseal["d"].encode())
+        assert keys == (pre, coring.Diger(ser=ser).qb64)
+        dkeys = db._sealKeys(pre.encode(), dseal)
+        assert dkeys[0] == pre and len(dkeys[1]) == 44
+        assert db._sealKeys(pre, dict(d=1)) is None  # not indexable
+        assert db._sealKeys(pre, jseal) != db._sealKeys(pre, pseal)  # unambiguous
+        assert len(db._sealKeys(pre, lseal)[1]) == 44  # fixed size
+        assert [(seqner.sn, saider.qb64)
+                for seqner, saider in db.ancs.get(keys=keys)] == [(3, serders[3].said)]
+        assert len(db.ancs.get(keys=dkeys)) == 2
+        assert db.findAnchoringSeal(pre, seal=jseal).said == serders[4].said
+        assert db.findAnchoringSeal(pre, seal=pseal).said == serders[5].said
+        assert db.findAnchoringSeal(pre, seal=lseal).said == serders[5].said
+
+        assert db.findAnchoringSealEvent(pre, seal=eseal).said == serders[3].said
+        assert db.findAnchoringSealEvent(pre, seal=eseal, sn=4) is None
+        assert db.findAnchoringSealEvent(pre, seal=dseal) is None  # wrong type
+        assert db.findAnchoringSeal(pre, seal=dseal).said == serders[2].said
+        assert db.findAnchoringSeal(pre, seal=dseal, sn=3).said == serders[3].said
+        assert db.findAnchoringSeal(pre, seal=eseal).said == serders[3].said
+        assert db.findAnchoringSeal(serders[0].preb, seal=eseal).said == serders[3].said
+        other = dict(eseal, s='1')
+        assert db.findAnchoringSealEvent(pre, seal=other) is None
+        assert db.findAnchoringSeal(pre, seal=other) is None
+
+        # rebuild index of database created before index
+        db.ancs.trim()
+        assert db.findAnchoringSealEvent(pre, seal=eseal) is None
+        assert db.reindexSeals() == 6
+        assert db.findAnchoringSealEvent(pre, seal=eseal).said == serders[3].said
+        assert db.findAnchoringSeal(pre, seal=dseal).said == serders[2].said
+        assert db.findAnchoringSeal(pre, seal=lseal).said == serders[5].said
+        assert db.reindexSeals() == 6  # idempotent
+        assert len(db.ancs.get(keys=dkeys)) == 2
+        assert db.sealsIndexed
+        assert db.idxs.get(keys="ancs.") is not None
+
+        # open of database created before index without index
+        db.ancs.trim()
+        assert db.idxs.rem(keys="ancs.")
+        with basing.reopenDB(db=db, reuse=True, readonly=True):  # can not reindex
+            assert not db.sealsIndexed
+            assert not db.ancs.get(keys=keys)
+            # scans KEL on miss of incomplete index
+            assert db.findAnchoringSealEvent(pre, seal=eseal).said == serders[3].said
+            assert db.findAnchoringSeal(pre, seal=dseal).said == serders[2].said
+            assert db.findAnchoringSeal(pre, seal=other) is None
+
+        with basing.reopenDB(db=db, reuse=True):  # reindexes on open
+            assert db.sealsIndexed
+            assert db.idxs.get(keys="ancs.") is not None
+            assert [(seqner.sn, saider.qb64)
+                    for seqner, saider in db.ancs.get(keys=keys)] == [(3, serders[3].said)]
+            assert db.findAnchoringSealEvent(pre, seal=eseal).said == serders[3].said
+            assert db.findAnchoringSeal(pre, seal=dseal).said == serders[2].said
+
+    assert not os.path.exists(db.path)
+
+    """ End Test """
+
+
+def test_compact_records():
+    """
+    Test hot record sub dbs of Baser use compact positional serialization and
+    migrate online from databases written with json
+    """
+    with openDB(name="compact") as db:
+        assert db.states.kind == Serials.mgpk and db.states.positional
+        assert db.ends.kind == Serials.mgpk and db.ends.positional
+        assert db.locs.kind == Serials.mgpk and db.locs.positional
+
+        pre = "EA_SbBUZYwqLVlAAn14d6QUBQCSReJlZ755JqTgmRhXH"
+        state = KeyStateRecord(vn=[1, 0], i=pre, s="1", d=pre, k=[pre], n=[pre])
+        end = basing.EndpointRecord(allowed=True, name="wit")
+        loc = basing.LocationRecord(url="http://127.0.0.1:5642/")
+
+        # entries of database written before compact serialization
+        legacy = dict(states=koming.Komer(db=db, schema=KeyStateRecord, subkey='stts.'),
+                      ends=koming.Komer(db=db, schema=basing.EndpointRecord, subkey='ends.'),
+                      locs=koming.Komer(db=db, schema=basing.LocationRecord, subkey='locs.'))
+        legacy["states"].pin(keys=pre, val=state)
+        legacy["ends"].pin(keys=(pre, "witness", pre), val=end)
+        legacy["locs"].pin(keys=(pre, "http"), val=loc)
+        size = len(db.getVal(db.states.sdb, pre.encode()))
+
+        assert db.states.get(keys=pre) == state
+        assert db.ends.get(keys=(pre, "witness", pre)) == end
+        assert db.locs.get(keys=(pre, "http")) == loc
+
+        assert koming.migrate(db) == dict(states=1, ends=1, locs=1)
+        assert koming.migrate(db) == {}
+        raw = bytes(db.getVal(db.states.sdb, pre.encode()))
+        assert raw.startswith(b'\x00M')
+        assert len(raw) < size
+        assert db.states.get(keys=pre) == state
+        assert db.ends.get(keys=(pre, "witness", pre)) == end
+        assert db.locs.get(keys=(pre, "http")) == loc
+
+    """End Test"""
+
+
 def test_rawrecord():
     """
     Test RawRecord dataclass
@@ -2222,6 +2454,155 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_kever_cache():
+    """
+    Test bounded resident set of Baser.kevers with clock eviction
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=8, path='kvc', temp=True)
+
+    with openDB(name="kevers") as db:
+        kevers = db.kevers
+        assert kevers.cap == Baser.KeverCacheSize
+        assert kevers.resident == 0
+        assert (kevers.hits, kevers.misses, kevers.evictions) == (0, 0, 0)
+
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        pres = []
+        for i in range(0, 8, 2):
+            serder = incept(keys=[signers[i].verfer.qb64],
+                            ndigs=[coring.Diger(ser=signers[i + 1].verfer.qb64b).qb64])
+            siger = signers[i].sign(serder.raw, index=0)
+            kvy.processEvent(serder=serder, sigers=[siger])
+            pres.append(serder.pre)
+        assert kevers.resident == 4
+
+        db.prefixes.add(pres[0])  # pin local
+        kevers.cap = 2
+        kevers.refs.clear()
+        kevers.evict()
+        assert kevers.evictions == 2
+        assert list(kevers.keys()) == [pres[3], pres[0]]  # pinned second chance
+        assert kevers.pinned(pres[0])
+        assert not kevers.pinned(pres[1])
+
+        # evicted rebuilt from states on demand, referenced get second chance
+        assert kevers[pres[3]].prefixer.qb64 == pres[3]
+        assert kevers.hits == 1
+        kever = kevers[pres[1]]  # miss so rebuilt from state
+        assert kever.prefixer.qb64 == pres[1]
+        assert kever.sner.num == 0
+        assert kevers.misses == 1
+        assert kevers.evictions == 3  # sweep cleared refs then evicted pres[3]
+        assert list(kevers.keys()) == [pres[0], pres[1]]
+        assert pres[2] in kevers  # read through
+        assert kevers.misses == 2
+        assert kevers.evictions == 4  # pres[1] ref cleared by prior sweep
+        assert list(kevers.keys()) == [pres[2], pres[0]]
+        assert kevers.resident == 2
+        assert pres[0] in kevers  # pinned never evicted
+        assert kevers.get(pres[1]) is not None
+        assert kevers.get('DApYGFaqnrALTyejaJaGAVhNpSCtqyerPqWVK9ZBNZk0') is None
+
+        # reads in loop at cap evict mid iteration over snapshot of keys
+        keys = list(kevers.keys())
+        assert pres[3] not in keys
+        seen = []
+        for pre in kevers:
+            seen.append(kevers[pre].prefixer.qb64)
+            assert kevers[pres[3]].prefixer.qb64 == pres[3]  # miss evicts
+        assert seen == keys
+        assert kevers.resident == 2
+
+        kevers.cap = None  # unbounded
+        for pre in pres:
+            assert pre in kevers
+        assert kevers.resident == 4
+
+    """End Test"""
+
+
+def test_escrow_limits():
+    """
+    Test Baser escrow capacity limits with per prefix quotas and eviction
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=4, path='esc', temp=True)
+    kels = []
+    for i in range(0, 4, 2):
+        serder = incept(keys=[signers[i].verfer.qb64],
+                        ndigs=[coring.Diger(ser=signers[i + 1].verfer.qb64b).qb64])
+        kel = [serder]
+        for sn in range(1, 4):
+            kel.append(interact(pre=serder.pre, dig=kel[-1].said, sn=sn))
+        kels.append((signers[i], kel))
+
+    with openDB(name="escrows", escrowLimit=3, prefixLimit=2) as db:
+        assert (db.escrowLimit, db.prefixLimit, db.evict) == (3, 2, True)
+        assert db.escrowDrops == {name: 0 for name in Baser.Escrows}
+        assert db.escrowEvicts == {name: 0 for name in Baser.Escrows}
+        kvy = eventing.Kevery(db=db, lax=True, local=False)
+        assert not kvy.throttled(kering.Ilks.ixn, kels[0][1][0].pre)
+
+        signer, kel = kels[0]
+        for serder in kel[1:3]:  # no inception so out of order
+            with pytest.raises(kering.OutOfOrderError):
+                kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+        assert db.cnt(db.ooes) == 2
+        db.setDts(dgKey(kel[1].preb, kel[1].saidb), b'2021-01-01T00:00:00.000000+00:00')
+
+        # already escrowed always admitted so escrow processing may re-escrow
+        assert db.admitEscrow("ooes", snKey(kel[2].preb, kel[2].sn), kel[2].saidb)
+
+        # prefix at quota so evicts its oldest entry
+        serder = kel[3]
+        with pytest.raises(kering.OutOfOrderError):
+            kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+        assert db.escrowEvicts["ooes"] == 1
+        assert db.cnt(db.ooes) == 2
+        assert db.getOoes(snKey(serder.preb, 1)) == []
+        assert db.getOoes(snKey(serder.preb, 2)) == [kel[2].saidb]
+        assert db.getOoes(snKey(serder.preb, 3)) == [kel[3].saidb]
+
+        signer, kel = kels[1]
+        serder = kel[1]
+        with pytest.raises(kering.OutOfOrderError):
+            kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+        assert db.cnt(db.ooes) == 3
+        assert db.fullEscrows() == ["ooes"]
+        # only messages that may not resolve escrowed entries are throttled
+        assert db.escrowed(serder.pre)
+        assert not kvy.throttled(kering.Ilks.ixn, serder.pre)
+        stranger = incept(keys=[signers[3].verfer.qb64]).pre
+        assert not db.escrowed(stranger)
+        assert kvy.throttled(kering.Ilks.ixn, stranger)
+        assert not kvy.throttled(kering.Ilks.rct, stranger)  # receipt escrows not full
+
+        # escrow full so evicts from same prefix only
+        serder = kel[2]
+        with pytest.raises(kering.OutOfOrderError):
+            kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+        assert db.escrowEvicts["ooes"] == 2
+        assert db.getOoes(snKey(serder.preb, 1)) == []
+        assert db.getOoes(snKey(serder.preb, 2)) == [kel[2].saidb]
+        assert db.getOoes(snKey(kels[0][1][0].preb, 3)) == [kels[0][1][3].saidb]
+        assert db.escrowDrops["ooes"] == 0
+
+        # without eviction drops new entry
+        db.evict = False
+        serder = kel[3]
+        with pytest.raises(kering.EscrowCapacityError):
+            kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+        assert db.escrowDrops["ooes"] == 1
+        assert db.getOoes(snKey(serder.preb, 3)) == []
+
+        # parser drops cleanly and continues with next message
+        msg = eventing.messagize(serder, sigers=[signer.sign(serder.raw, index=0)])
+        parsing.Parser(kvy=kvy).parse(ims=msg)
+        assert db.escrowDrops["ooes"] == 2
+        assert db.cnt(db.ooes) == 3
+
     """End Test"""
 
 
@@ -2337,4 +2718,6 @@ if __name__ == "__main__":
     test_fetchkeldel()
     test_usebaser()
     test_dbdict()
+    test_kever_cache()
+    test_seal_index()
     test_baserdoer()
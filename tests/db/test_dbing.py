@@ -5,6 +5,9 @@ tests.db.dbing module
 """
 import pytest
 
+import concurrent.futures
+import time
+
 import os
 import json
 import datetime
@@ -19,6 +22,7 @@ from keri.db.dbing import clearDatabaserDir, openLMDB
 from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
                            splitKeyON, splitKeyFN, splitKeySN, splitKeyDT)
 from keri.db.dbing import LMDBer
+from keri.kering import DatabaseError
 
 
 
@@ -851,6 +855,103 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer bulk write transaction that helpers join
+    """
+    with openLMDB() as dber:
+        assert dber.txns == []
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+
+        with dber.txn() as txn:
+            assert dber.txns == [txn]
+            assert dber.putVal(db, b'a', b'A')
+            assert dber.getVal(db, b'a') == b'A'  # reads join so see own writes
+            assert dber.putIoVals(ddb, b'a', [b'z', b'y'])
+            assert dber.getIoVals(ddb, b'a') == [b'z', b'y']
+            assert [bytes(k) for k, v in dber.getTopItemIter(db)] == [b'a']
+        assert dber.txns == []
+        assert dber.getVal(db, b'a') == b'A'  # committed
+        assert dber.getIoVals(ddb, b'a') == [b'z', b'y']
+
+        # exception aborts all writes in transaction
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.putVal(db, b'b', b'B')
+                assert dber.delVal(db, b'a')
+                raise ValueError("abort")
+        assert dber.txns == []
+        assert dber.getVal(db, b'b') is None
+        assert dber.getVal(db, b'a') == b'A'
+
+        # nested failure aborts only inner transaction
+        with dber.txn():
+            assert dber.setVal(db, b'c', b'C')
+            try:
+                with dber.txn():
+                    assert len(dber.txns) == 2
+                    assert dber.setVal(db, b'd', b'D')
+                    raise ValueError("abort inner")
+            except ValueError:
+                pass
+            assert len(dber.txns) == 1
+            assert dber.getVal(db, b'd') is None
+            with dber.txn():
+                assert dber.setVal(db, b'e', b'E')
+        assert dber.getVal(db, b'c') == b'C'
+        assert dber.getVal(db, b'd') is None
+        assert dber.getVal(db, b'e') == b'E'
+
+        # other threads do not join bulk transaction of this thread
+        seen = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            with dber.txn():
+                assert dber.setVal(db, b'f', b'F')
+                seen.append(pool.submit(lambda: (list(dber.txns), dber.getVal(db, b'f'))).result())
+                writer = pool.submit(dber.setVal, db, b'g', b'G')  # waits on write lock
+                time.sleep(0.05)
+                assert not writer.done()
+            assert writer.result()
+        assert seen == [([], None)]  # own txn so not uncommitted write
+        assert dber.getVal(db, b'f') == b'F'
+        assert dber.getVal(db, b'g') == b'G'
+
+        # plain writes take no write lock unless a bulk txn is open
+        assert dber._bulk == 0
+        with dber._begin(db=db, write=True) as txn:
+            assert isinstance(txn, lmdb.Transaction)
+        with dber.txn():
+            assert dber._bulk == 1
+            with dber.txn():
+                assert dber._bulk == 1  # nested counts once
+        assert dber._bulk == 0
+
+        # iterators consumed after bulk txn exits
+        with dber.txn():
+            assert dber.setVal(db, b'h', b'H')
+            unstarted = dber.getTopItemIter(db)
+            started = dber.getTopItemIter(db)
+            assert bytes(next(started)[0]) == b'a'  # joined bulk txn
+        # first advanced after exit so reads in own read txn
+        assert [bytes(k) for k, v in unstarted] == [b'a', b'c', b'e', b'f', b'g', b'h']
+        with pytest.raises(DatabaseError):  # can not escape its bulk txn
+            next(started)
+
+        # iterator of nested txn can not escape into parent
+        with dber.txn():
+            with dber.txn():
+                started = dber.getIoValsIter(ddb, b'a')
+                assert next(started) == b'z'
+            with pytest.raises(DatabaseError):
+                next(started)
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
+    test_lmdber_txn()
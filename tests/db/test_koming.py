@@ -4,9 +4,11 @@ tests.app.apping module
 
 """
 
+import concurrent.futures
 import json
 import os
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, asdict, field
 
 import pytest
 
@@ -849,7 +851,190 @@ def test_ioset_komer():
     assert not db.opened
 
 
+def test_positional_serialization():
+    """
+    Test positional schema versioned serialization of Komer
+    """
+    @dataclass
+    class Inner:
+        x: int = 0
+        y: list = field(default_factory=list)
+
+    @dataclass
+    class Record:
+        first: str
+        zip: int = 0
+        inner: Inner = field(default_factory=Inner)
+
+    jim = Record(first="Jim", zip=84058, inner=Inner(x=1, y=["a"]))
+
+    assert koming.layout(Record) == "first,zip,inner(x,y)"
+    assert koming.layout(Record, 1) == "first"
+    assert koming.layout(Record, 4) is None
+    assert koming.tuplify(jim) == ["Jim", 84058, [1, ["a"]]]
+    assert koming.detuplify(Record, ["Jim", 84058, [1, ["a"]]]) == jim
+    assert koming.detuplify(Record, ["Jim"]) == Record(first="Jim")
+    assert koming.tuplifier(Record) is koming.tuplifier(Record)  # memoized
+    assert koming.detuplifier(Record) is koming.detuplifier(Record)
+    assert koming.tuplify(Inner(x=2)) == [2, []]
+
+    with dbing.openLMDB() as db:
+        fp = koming.fingerprint(Record, 3)
+        assert len(fp) == 4
+
+        k = koming.Komer(db=db, schema=Record, subkey='records.',
+                         kind=Serials.mgpk, positional=True)
+        assert k.positional
+        assert k._datify is helping.datifier(Record)  # shared per schema
+        assert k._detuplify is koming.detuplifier(Record)
+        ser = k.serializer(jim)
+        assert ser == b'\x00M' + fp + b'\x93\xa3Jim\xce\x00\x01HZ\x92\x01\x91\xa1a'
+        assert len(ser) < len(k._serializer(Serials.mgpk)(jim))
+        assert k.deserializer(ser) == jim
+
+        srl = k._serializer(Serials.json, positional=True)
+        assert srl(jim) == b'\x00J' + fp + b'["Jim",84058,[1,["a"]]]'
+        assert k.deserializer(srl(jim)) == jim
+        srl = k._serializer(Serials.cbor, positional=True)
+        assert srl(jim).startswith(b'\x00C' + fp)
+        assert k.deserializer(srl(jim)) == jim
+
+        keys = ("test_key", "0001")
+        assert k.put(keys=keys, val=jim)
+        assert k.get(keys=keys) == jim
+        assert db.getVal(k.sdb, k._tokey(keys)) == ser
+
+        # record written before field was appended to schema is still readable
+        @dataclass
+        class Shorter:
+            first: str
+
+        assert koming.tuplify(Shorter(first="Sue")) == ["Sue"]
+
+        short = koming.Komer(db=db, schema=Shorter, subkey='short.',
+                             kind=Serials.mgpk, positional=True)
+        short.put(keys=keys, val=Shorter(first="Sue"))
+        longer = koming.Komer(db=db, schema=Record, subkey='short.')
+        assert longer.get(keys=keys) == Record(first="Sue")
+
+        # other schema changes are detected
+        @dataclass
+        class Renamed:
+            last: str
+
+        renamed = koming.Komer(db=db, schema=Renamed, subkey='short.')
+        with pytest.raises(ValueError):
+            renamed.get(keys=keys)
+
+        with pytest.raises(ValueError):
+            k.pin(keys=keys, val=Shorter(first="Sue"))
+
+        with pytest.raises(ValueError):
+            k.deserializer(b'\x00X' + fp + b'[]')
+
+        @dataclass
+        class Custom:
+            first: str
+
+            def _ser(self):
+                return dict(name=self.first)
+
+        with pytest.raises(ValueError):
+            koming.Komer(db=db, schema=Custom, subkey='custom.', positional=True)
+
+        # schema that is not a dataclass still opens
+        plain = koming.Komer(db=db, schema=dict, subkey='plain.')
+        assert plain._dictify is helping.dictify
+
+    assert not os.path.exists(db.path)
+
+    """Done Test"""
+
+
+def test_migrate():
+    """
+    Test online migration of Komer sub dbs between serializations
+    """
+    @dataclass
+    class Record:
+        first: str
+        last: str = ""
+
+    recs = [Record(first=f"Jim{i}", last="Black") for i in range(3)]
+
+    with dbing.openLMDB() as db:
+        old = koming.Komer(db=db, schema=Record, subkey='records.')
+        for i, rec in enumerate(recs):
+            old.put(keys=(str(i), ), val=rec)
+        oldset = koming.IoSetKomer(db=db, schema=Record, subkey='sets.', kind=Serials.cbor)
+        oldset.put(keys="a", vals=recs)
+        olddup = koming.DupKomer(db=db, schema=Record, subkey='dups.', kind=Serials.mgpk)
+        olddup.put(keys="a", vals=recs)
+
+        # reopen with compact positional serialization reads old entries
+        new = koming.Komer(db=db, schema=Record, subkey='records.',
+                           kind=Serials.mgpk, positional=True)
+        newset = koming.IoSetKomer(db=db, schema=Record, subkey='sets.',
+                                   kind=Serials.mgpk, positional=True)
+        newdup = koming.DupKomer(db=db, schema=Record, subkey='dups.',
+                                 kind=Serials.mgpk, positional=True)
+        assert [val for _, val in new.getItemIter()] == recs
+        assert newset.get(keys="a") == recs
+
+        # entries written since reopen are mixed with old ones
+        new.pin(keys=("1", ), val=Record(first="Sue"))
+        assert new.get(keys=("1", )) == Record(first="Sue")
+
+        assert new.migrate() == 2
+        assert newset.migrate() == 3
+        assert newdup.migrate() == 3
+        assert new.migrate() == 0  # idempotent
+        for _, raw in db.getTopItemIter(db=new.sdb):
+            assert bytes(raw).startswith(b'\x00M')
+        for _, raw in db.getTopItemIter(db=newset.sdb):
+            assert bytes(raw).startswith(b'\x00M')
+
+        assert [val for _, val in new.getItemIter()] == [recs[0], Record(first="Sue"), recs[2]]
+        assert newset.get(keys="a") == recs  # insertion order kept
+        assert sorted(newdup.get(keys="a"), key=lambda rec: rec.first) == recs
+        assert newdup.cnt(keys="a") == 3
+        assert newset.rem(keys="a", val=recs[1])
+        assert newset.get(keys="a") == [recs[0], recs[2]]
+
+        # module migrate finds Komer attributes of database
+        db.recs = koming.Komer(db=db, schema=Record, subkey='records.')
+        db.sets = newset
+        assert koming.migrate(db) == dict(recs=3)
+        assert koming.migrate(db) == {}
+        assert new.get(keys=("0", )) == recs[0]
+
+        # write of other thread during scan waits so not overwritten by stale
+        new = koming.Komer(db=db, schema=Record, subkey='records.',
+                           kind=Serials.mgpk, positional=True)
+        deserializer = new.deserializer
+        writers = []
+
+        def deserialize(raw):
+            if not writers:
+                writers.append(pool.submit(new.pin, keys=("0", ), val=Record(first="Ann")))
+                time.sleep(0.05)
+                assert not writers[0].done()
+            return deserializer(raw)
+
+        new.deserializer = deserialize
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            assert new.migrate() == 3
+            assert writers[0].result()
+        assert new.get(keys=("0", )) == Record(first="Ann")
+
+    assert not os.path.exists(db.path)
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_dup_komer()
     test_kom_get_item_iter()
     test_ioset_komer()
+    test_positional_serialization()
+    test_migrate()
@@ -9,6 +9,7 @@ import pytest
 
 import pysodium
 
+from keri import kering
 from keri.core import coring, eventing, serdering
 from keri.db import dbing, subing
 from keri.app import keeping
@@ -678,6 +679,27 @@ def test_serder_suber():
         assert items == [(('b', '1'), srdr0.said),
                          (('b', '2'), srdr1.said)]
 
+        assert sdb.verify == True  # verified by default
+        sdb = subing.SerderSuber(db=db, subkey='pugs.', verify=False)
+
+        # trusted load does not reverify so audit finds corrupted serder
+        assert sdb.verify == False
+        assert list(sdb.getAuditIter()) == []
+        raw = bytearray(srdr1.raw)
+        i = raw.index(b'"k":["') + 8
+        raw[i:i+1] = b'X' if raw[i:i+1] != b'X' else b'Y'  # corrupt key
+        assert db.setVal(db=sdb.sdb, key=sdb._tokey(("c", "1")), val=bytes(raw))
+        assert sdb.get(keys=("c", "1")).said == srdr1.said  # trusted
+        audits = list(sdb.getAuditIter())
+        assert len(audits) == 1
+        assert audits[0][0] == ("c", "1")
+
+        vdb = subing.SerderSuber(db=db, subkey='pugs.', verify=True)
+        assert vdb.verify == True
+        assert vdb.get(keys=("a", "1")).said == srdr0.said
+        with pytest.raises(kering.ValidationError):
+            vdb.get(keys=("c", "1"))
+
     assert not os.path.exists(db.path)
     assert not db.opened
 
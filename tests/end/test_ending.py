@@ -434,6 +434,26 @@ def test_get_oobi():
         assert serder.ked['t'] == coring.Ilks.icp
         assert serder.ked['i'] == "EOaICQwhOy3wMwecjAuHQTbv_Cmuu1azTMnHi4QtUmEU"
 
+        # no replies but KEL so no witness role fallback as when KEL was in replies
+        roles = []
+
+        def replyToOobi(aid, role, eids=None, kel=True):
+            roles.append(role)
+            return bytearray()
+
+        hab.replyToOobi = replyToOobi
+        rep = client.simulate_get('/oobi', )
+        assert rep.status == falcon.HTTP_OK
+        assert serdering.SerderKERI(raw=rep.text.encode("utf-8")).ked['t'] == coring.Ilks.icp
+        assert roles == [None]
+
+        # nothing to stream so witness fallback then not found
+        roles.clear()
+        hab.replayIter = lambda pre=None, fn=0, size=None, binary=False: iter(())
+        rep = client.simulate_get('/oobi', )
+        assert rep.status == falcon.HTTP_NOT_FOUND
+        assert roles == [None, kering.Roles.witness]
+
     """Done Test"""
 
 
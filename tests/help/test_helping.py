@@ -9,7 +9,7 @@ import datetime
 import pysodium
 import fractions
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 from keri.help import helping
 from keri.help.helping import isign, sceil
@@ -131,6 +131,68 @@ def test_dictify():
     assert dictify(c) == {'area': 50.24, 'perimeter': 25.12}
 
 
+def test_dictifier_datifier():
+    """
+    Test converters built once per dataclass match dictify and datify
+    """
+    @dataclass
+    class Point:
+        x: float
+        y: float
+
+    @dataclass
+    class Line:
+        a: Point
+        b: Point
+        tags: list = field(default_factory=list)
+        name: str = ""
+
+    line = Line(Point(1, 2), Point(3, 4), tags=[Point(5, 6), "t"], name="l")
+    assert helping.dictifier(Line) is helping.dictifier(Line)  # memoized
+    assert helping.datifier(Line) is helping.datifier(Line)
+
+    d = helping.dictifier(Line)(line)
+    assert d == dictify(line) == {'a': {'x': 1, 'y': 2}, 'b': {'x': 3, 'y': 4},
+                                  'tags': [{'x': 5, 'y': 6}, 't'], 'name': 'l'}
+    assert helping.datifier(Line)(asdict(line)) == datify(Line, asdict(line))
+    assert helping.datifier(Line)(dict(a=dict(x=1, y=2), b=dict(x=3, y=4))) == Line(Point(1, 2), Point(3, 4))
+
+    # not convertible returns as is like datify
+    for bad in (dict(a=dict(x=1, y=2)), dict(a=None, b=None, z=1), None, [1, 2]):
+        assert helping.datifier(Line)(bad) == datify(Line, bad)
+        assert helping.datifier(Line)(bad) is bad
+    assert helping.datifier(Line)(dict(a=dict(z=1), b=None)) == Line(a=dict(z=1), b=None)
+    assert helping.datifier(int)(5) == datify(int, 5) == 5
+    # not a dataclass resolves per instance like dictify
+    assert helping.dictifier(dict) is dictify
+    assert helping.dictifier(dict)(line) == dictify(line)
+
+    @dataclass
+    class Circle:
+        radius: float
+
+        @staticmethod
+        def _der(d):
+            return Circle(radius=d["perimeter"] / 2 / 3.14)
+
+        def _ser(self):
+            return dict(area=self.radius**2*3.14, perimeter=2*self.radius*3.14)
+
+    @dataclass
+    class Ring:
+        inner: Circle
+
+    c = Circle(radius=4)
+    assert helping.dictifier(Circle)(c) == dictify(c) == {'area': 50.24, 'perimeter': 25.12}
+    assert helping.datifier(Circle)(dictify(c)).radius == 4
+    assert helping.datifier(Circle)(None) is None
+    # nested uses asdict so ignores _ser of nested but datify honors _der of nested
+    assert helping.dictifier(Ring)(Ring(c)) == dictify(Ring(c)) == {'inner': {'radius': 4}}
+    assert helping.datifier(Ring)(dict(inner=dictify(c))).inner.radius == 4
+
+    """End Test"""
+
+
 def test_klasify():
     """
     Test klasify utility function